@@ -13,6 +13,7 @@ typedef uint16_t _Py_CODEUNIT;
 #endif
 
 typedef struct _PyOpcache _PyOpcache;
+typedef struct _PyCodeExecStats _PyCodeExecStats;
 
 /* Bytecode object */
 struct PyCodeObject {
@@ -61,6 +62,14 @@ struct PyCodeObject {
     _PyOpcache *co_opcache;
     int co_opcache_flag;  // used to determine when create a cache.
     unsigned char co_opcache_size;  // length of co_opcache.
+
+    // Execution statistics, see sys._get_exec_stats().
+    _PyCodeExecStats *co_exec_stats;
+
+    // Marshalled body of a code object loaded lazily by marshal, or NULL.
+    // Until the body is loaded, co_code, co_names and co_lnotab are empty
+    // and co_consts only holds the first constant (the docstring).
+    PyObject *co_lazy;
 };
 
 /* Masks for co_flags above */
@@ -149,6 +149,7 @@ typedef struct {
     int tracemalloc;
 
     int import_time;        /* PYTHONPROFILEIMPORTTIME, -X importtime */
+    int lazy_code;          /* PYTHONLAZYCODE, -X lazy_code */
     int show_ref_count;     /* -X showrefcount */
     int dump_refs;          /* PYTHONDUMPREFS */
     int malloc_stats;       /* PYTHONMALLOCSTATS */
@@ -33,6 +33,10 @@ PyAPI_FUNC(void) _PyEval_SetCoroutineOriginTrackingDepth(
 
 /* Private function */
 void _PyEval_Fini(void);
+extern PyObject *_PyEval_GetOpcacheStats(void);
+extern void _PyEval_SetExecStats(PyThreadState *tstate, int enabled);
+extern PyObject *_PyEval_GetExecStats(PyThreadState *tstate, int clear);
+extern void _PyEval_ClearExecStats(PyThreadState *tstate);
 
 static inline PyObject*
 _PyEval_EvalFrame(PyThreadState *tstate, PyFrameObject *f, int throwflag)
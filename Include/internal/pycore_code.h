@@ -10,16 +10,60 @@ typedef struct {
     uint64_t builtins_ver; /* ma_version of builtin dict */
 } _PyOpcache_LoadGlobal;
 
+typedef struct {
+    PyTypeObject *type;  /* Cached type of the owner (borrowed reference) */
+    Py_ssize_t hint;     /* Index in the owner's __dict__, or ~offset of
+                            a slot if negative */
+    unsigned int tp_version_tag;  /* tp_version_tag of type */
+} _PyOpcache_LoadAttr;
+
+typedef struct {
+    PyTypeObject *type;  /* Cached type of the owner (borrowed reference) */
+    PyObject *meth;      /* Cached method descriptor (borrowed reference),
+                            or NULL if the attribute is stored at hint */
+    Py_ssize_t hint;     /* Same as _PyOpcache_LoadAttr.hint */
+    unsigned int tp_version_tag;  /* tp_version_tag of type */
+} _PyOpcache_LoadMethod;
+
 struct _PyOpcache {
     union {
         _PyOpcache_LoadGlobal lg;
+        _PyOpcache_LoadAttr la;
+        _PyOpcache_LoadMethod lm;
     } u;
     char optimized;
 };
 
+struct _PyCodeExecStats {
+    uint64_t generation;  /* Counters are stale if different from the
+                             generation of the interpreter statistics */
+    size_t entries;       /* Number of frame evaluations */
+    size_t instructions;  /* Number of executed instructions */
+};
+
 /* Private API */
 int _PyCode_InitOpcache(PyCodeObject *co);
 
+/* Code objects with a lazily loaded body, see TYPE_LAZY_CODE in marshal.c */
+PyCodeObject *_PyCode_NewLazy(
+    int argcount, int posonlyargcount, int kwonlyargcount, int nlocals,
+    int stacksize, int flags, PyObject *first_const, PyObject *varnames,
+    PyObject *freevars, PyObject *cellvars, PyObject *filename,
+    PyObject *name, int firstlineno, PyObject *body);
+int _PyCode_SetBody(PyCodeObject *co, PyObject *body, PyObject *code,
+                    PyObject *consts, PyObject *names, PyObject *lnotab);
+PyAPI_FUNC(int) _PyMarshal_LoadCodeBody(PyCodeObject *co);
+
+/* Load the body of co if it was deferred. Return -1 on error. */
+static inline int
+_PyCode_EnsureBody(PyCodeObject *co)
+{
+    if (co->co_lazy == NULL) {
+        return 0;
+    }
+    return _PyMarshal_LoadCodeBody(co);
+}
+
 
 #ifdef __cplusplus
 }
@@ -40,10 +40,20 @@ typedef struct {
 #define _PyGC_PREV_SHIFT           (2)
 #define _PyGC_PREV_MASK            (((uintptr_t) -1) << _PyGC_PREV_SHIFT)
 
-// Lowest bit of _gc_next is used for flags only in GC.
-// But it is always 0 for normal code.
-#define _PyGCHead_NEXT(g)        ((PyGC_Head*)(g)->_gc_next)
-#define _PyGCHead_SET_NEXT(g, p) ((g)->_gc_next = (uintptr_t)(p))
+/* Bit flags for _gc_next */
+/* Bit 0 is used by the collector while collecting (it is always 0 for normal
+   code).
+   Bit 1 is set for objects of the oldest generation which need no further
+   processing in the current incremental collection of that generation, and
+   for the objects in the permanent generation. */
+#define _PyGC_NEXT_MASK_VISITED    (2)
+
+// The flags of _gc_next are kept by _PyGCHead_SET_NEXT().
+#define _PyGCHead_NEXT(g) \
+    ((PyGC_Head*)((g)->_gc_next & ~(uintptr_t)_PyGC_NEXT_MASK_VISITED))
+#define _PyGCHead_SET_NEXT(g, p) \
+    ((g)->_gc_next = ((g)->_gc_next & _PyGC_NEXT_MASK_VISITED) \
+        | (uintptr_t)(p))
 
 // Lowest two bits of _gc_prev is used for _PyGC_PREV_MASK_* flags.
 #define _PyGCHead_PREV(g) ((PyGC_Head*)((g)->_gc_prev & _PyGC_PREV_MASK))
@@ -125,6 +135,26 @@ struct gc_generation_stats {
     Py_ssize_t collected;
     /* total number of uncollectable objects (put into gc.garbage) */
     Py_ssize_t uncollectable;
+    /* total number of objects examined */
+    Py_ssize_t examined;
+    /* total time spent collecting, in seconds */
+    double duration;
+};
+
+/* State of the incremental collection of the oldest generation */
+struct gc_incremental_state {
+    /* target duration of each step in seconds, 0 if incremental
+       collection is disabled */
+    double pause_budget;
+    /* estimated time to collect an object, in seconds */
+    double object_cost;
+    /* phase of the current collection, see gcmodule.c */
+    int phase;
+    /* objects reachable from the roots whose referents remain to be
+       marked */
+    PyGC_Head marking;
+    /* objects of the oldest generation done with in this collection */
+    PyGC_Head visited;
 };
 
 struct _gc_runtime_state {
@@ -159,6 +189,7 @@ struct _gc_runtime_state {
        collections, and are awaiting to undergo a full collection for
        the first time. */
     Py_ssize_t long_lived_pending;
+    struct gc_incremental_state incremental;
 };
 
 PyAPI_FUNC(void) _PyGC_InitState(struct _gc_runtime_state *);
@@ -30,13 +30,28 @@ struct _pending_calls {
     int last;
 };
 
+/* Execution statistics, see sys._set_exec_stats() */
+struct _ceval_exec_stats {
+    int enabled;
+    /* Incremented when the statistics are cleared, to reset the counters
+       of code objects lazily */
+    uint64_t generation;
+    size_t opcodes[256];
+    /* List of weak references to the code objects with counters */
+    PyObject *code_objects;
+    /* Size of code_objects at which dead references are removed */
+    Py_ssize_t prune_size;
+};
+
 struct _ceval_state {
     int recursion_limit;
     /* Records whether tracing is on for any thread.  Counts the number
        of threads for which tstate->c_tracefunc is non-NULL, so if the
        value is 0, we know we don't have to check this thread's
        c_tracefunc.  This speeds up the if statement in
-       _PyEval_EvalFrameDefault() after fast_next_opcode. */
+       _PyEval_EvalFrameDefault() after fast_next_opcode.  It is also
+       incremented while execution statistics are enabled, so that each
+       instruction goes through fast_next_opcode. */
     int tracing_possible;
     /* This single variable consolidates all requests to break out of
        the fast path in the eval loop. */
@@ -47,6 +62,7 @@ struct _ceval_state {
 #ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
     struct _gil_runtime_state gil;
 #endif
+    struct _ceval_exec_stats exec_stats;
 };
 
 /* fs_codec.encoding is initialized to NULL.
@@ -165,6 +165,20 @@ _PyObject_IS_GC(PyObject *obj)
 // Fast inlined version of PyType_IS_GC()
 #define _PyType_IS_GC(t) _PyType_HasFeature((t), Py_TPFLAGS_HAVE_GC)
 
+/* Make an object immortal, see _Py_IsImmortal().  The references to it
+   which exist are forgotten: it is never deallocated. */
+static inline void
+_Py_SetImmortal(PyObject *op)
+{
+    if (_Py_IsImmortal(op)) {
+        return;
+    }
+#ifdef Py_REF_DEBUG
+    _Py_RefTotal -= Py_REFCNT(op);
+#endif
+    Py_SET_REFCNT(op, _Py_IMMORTAL_REFCNT);
+}
+
 #ifdef __cplusplus
 }
 #endif
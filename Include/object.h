@@ -419,12 +419,39 @@ PyAPI_FUNC(void) _Py_NegativeRefcount(const char *filename, int lineno,
 
 PyAPI_FUNC(void) _Py_Dealloc(PyObject *);
 
+/* Immortal objects are never deallocated.  Py_INCREF() and Py_DECREF() leave
+their reference count alone, so that the memory holding them is not written
+to, and stays shared with the child processes after a fork() (see
+gc.freeze()).
+
+Their reference count has the _Py_IMMORTAL_BIT set.  It starts at
+_Py_IMMORTAL_REFCNT, far enough from the bit that code built without these
+checks can change it without making the object mortal again, and small
+enough for the collector to store it in the GC header.
+
+The bit is the highest one allowing this.  A mortal object reaching it would
+need 2**29 references on 32-bit platforms, which would fill half of the
+address space with pointers to it (2**61 references on 64-bit platforms).
+Debug builds check that mortal objects never reach it.
+*/
+#define _Py_IMMORTAL_BIT ((Py_ssize_t)1 << (8 * SIZEOF_SIZE_T - 3))
+#define _Py_IMMORTAL_REFCNT (_Py_IMMORTAL_BIT + (_Py_IMMORTAL_BIT >> 1))
+
+static inline int _Py_IsImmortal(const PyObject *op)
+{
+    return (op->ob_refcnt & _Py_IMMORTAL_BIT) != 0;
+}
+
 static inline void _Py_INCREF(PyObject *op)
 {
+    if (_Py_IsImmortal(op)) {
+        return;
+    }
 #ifdef Py_REF_DEBUG
     _Py_RefTotal++;
 #endif
     op->ob_refcnt++;
+    assert(op->ob_refcnt != _Py_IMMORTAL_BIT);
 }
 
 #define Py_INCREF(op) _Py_INCREF(_PyObject_CAST(op))
@@ -435,6 +462,9 @@ static inline void _Py_DECREF(
 #endif
     PyObject *op)
 {
+    if (_Py_IsImmortal(op)) {
+        return;
+    }
 #ifdef Py_REF_DEBUG
     _Py_RefTotal--;
 #endif
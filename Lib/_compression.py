@@ -150,3 +150,81 @@ class DecompressReader(io.RawIOBase):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ThreadedCompressor:
+    """Compresses data in independent blocks on a pool of threads.
+
+    Mimics the compress()/flush() interface of the compressor objects.
+    The data is cut into blocks of block_size bytes, and
+    compress_block(block, previous, final) is called in a worker thread
+    to compress each of them; previous is the preceding block (b"" for
+    the first one) and final is true for the last block.  The results
+    are returned in order, and the compression functions of zlib, bz2
+    and lzma release the GIL, so the blocks are compressed concurrently.
+    """
+
+    def __init__(self, compress_block, workers, block_size):
+        from concurrent.futures import ThreadPoolExecutor
+        self._compress_block = compress_block
+        self._block_size = block_size
+        self._executor = ThreadPoolExecutor(workers)
+        # Bound the amount of data held in memory.
+        self._max_pending = 2 * workers
+        self._pending = []      # futures of the submitted blocks, in order
+        self._buffer = bytearray()
+        self._previous = b""
+
+    def _submit(self, block, final):
+        self._pending.append(self._executor.submit(
+            self._compress_block, block, self._previous, final))
+        self._previous = block
+
+    def _collect(self, wait):
+        # Return the compressed data of the leading finished blocks, waiting
+        # for all of them if wait is true, and for enough to get under
+        # _max_pending otherwise.
+        pending = self._pending
+        count = 0
+        while count < len(pending) and (wait or pending[count].done() or
+                                        len(pending) - count >
+                                        self._max_pending):
+            count += 1
+        result = b"".join([future.result() for future in pending[:count]])
+        del pending[:count]
+        return result
+
+    def compress(self, data):
+        """Provide data to the compressor object.
+
+        Returns a chunk of compressed data if possible, or b"" otherwise.
+        """
+        self._buffer += data
+        block_size = self._block_size
+        if len(self._buffer) >= block_size:
+            buffer = self._buffer
+            end = len(buffer) - len(buffer) % block_size
+            for start in range(0, end, block_size):
+                self._submit(bytes(buffer[start:start+block_size]), False)
+            del buffer[:end]
+        return self._collect(False)
+
+    def flush(self, final=True):
+        """Compress the buffered data and wait for all the blocks.
+
+        If final is true, the last block is finished and the compressor
+        object can't be used anymore; otherwise the compressed data is
+        made complete for all the data provided so far.
+        """
+        if final or self._buffer:
+            self._submit(bytes(self._buffer), final)
+            self._buffer.clear()
+        try:
+            return self._collect(True)
+        finally:
+            if final:
+                self._executor.shutdown()
+
+    def reset(self):
+        """Don't use the data provided so far when compressing next blocks."""
+        self._previous = b""
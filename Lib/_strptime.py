@@ -14,7 +14,7 @@ import time
 import locale
 import calendar
 from re import compile as re_compile
-from re import IGNORECASE
+from re import IGNORECASE, ASCII
 from re import escape as re_escape
 from datetime import (date as datetime_date,
                       timedelta as datetime_timedelta,
@@ -306,16 +306,9 @@ def _calc_julian_from_V(iso_year, iso_week, iso_weekday):
     return iso_year, ordinal
 
 
-def _strptime(data_string, format="%a %b %d %H:%M:%S %Y"):
-    """Return a 2-tuple consisting of a time struct and an int containing
-    the number of microseconds based on the input string and the
-    format string."""
-
-    for index, arg in enumerate([data_string, format]):
-        if not isinstance(arg, str):
-            msg = "strptime() argument {} must be str, not {}"
-            raise TypeError(msg.format(index, type(arg)))
-
+def _compile_format(format):
+    """Return a 2-tuple of the compiled regex for the format string and the
+    LocaleTime instance of the current locale it was compiled for."""
     global _TimeRE_cache, _regex_cache
     with _cache_lock:
         locale_time = _TimeRE_cache.locale_time
@@ -344,6 +337,24 @@ def _strptime(data_string, format="%a %b %d %H:%M:%S %Y"):
             except IndexError:
                 raise ValueError("stray %% in format '%s'" % format) from None
             _regex_cache[format] = format_regex
+    return format_regex, locale_time
+
+def _strptime(data_string, format="%a %b %d %H:%M:%S %Y"):
+    """Return a 2-tuple consisting of a time struct and an int containing
+    the number of microseconds based on the input string and the
+    format string."""
+
+    for index, arg in enumerate([data_string, format]):
+        if not isinstance(arg, str):
+            msg = "strptime() argument {} must be str, not {}"
+            raise TypeError(msg.format(index, type(arg)))
+
+    format_regex, locale_time = _compile_format(format)
+    return _strptime_match(format_regex, locale_time, data_string, format)
+
+def _strptime_match(format_regex, locale_time, data_string, format):
+    """Return the same tuple as _strptime() for data_string, using the regex
+    and the LocaleTime instance returned by _compile_format()."""
     found = format_regex.match(data_string)
     if not found:
         raise ValueError("time data %r does not match format %r" %
@@ -565,7 +576,10 @@ def _strptime_time(data_string, format="%a %b %d %H:%M:%S %Y"):
 def _strptime_datetime(cls, data_string, format="%a %b %d %H:%M:%S %Y"):
     """Return a class cls instance based on the input string and the
     format string."""
-    tt, fraction, gmtoff_fraction = _strptime(data_string, format)
+    return _datetime_from_result(cls, *_strptime(data_string, format))
+
+def _datetime_from_result(cls, tt, fraction, gmtoff_fraction):
+    """Return a class cls instance from the tuple returned by _strptime()."""
     tzname, gmtoff = tt[-2:]
     args = tt[:6] + (fraction,)
     if gmtoff is not None:
@@ -577,3 +591,95 @@ def _strptime_datetime(cls, data_string, format="%a %b %d %H:%M:%S %Y"):
         args += (tz,)
 
     return cls(*args)
+
+# Directives that _compile_fixed_width() handles: the regex matching each one,
+# and the index of the datetime() argument it sets.
+_FIXED_WIDTH_DIRECTIVES = {
+    'Y': (r'(\d{4})', 0), 'm': (r'(\d\d)', 1), 'd': (r'(\d\d)', 2),
+    'H': (r'(\d\d)', 3), 'M': (r'(\d\d)', 4), 'S': (r'(\d\d)', 5),
+    }
+
+def _compile_fixed_width(format):
+    """Compile a format made only of %Y, %m, %d, %H, %M, %S and literal
+    characters, optionally ending with %f, into a locale-independent regex
+    matching zero-padded ASCII values only.
+
+    Return a 2-tuple of the regex and the datetime() argument index of each
+    of its groups, or None for any other format.
+    """
+    pattern = []
+    indices = []
+    i = 0
+    while i < len(format):
+        char = format[i]
+        if char == '%':
+            directive = format[i + 1:i + 2]
+            if directive in _FIXED_WIDTH_DIRECTIVES:
+                regex, index = _FIXED_WIDTH_DIRECTIVES[directive]
+                if index in indices:
+                    return None
+                pattern.append(regex)
+                indices.append(index)
+                i += 2
+                continue
+            elif directive == 'f' and i + 2 == len(format):
+                pattern.append(r'(\d{1,6})')
+                indices.append(6)
+                break
+            elif directive != '%':
+                return None
+            i += 1
+        pattern.append(re_escape(char))
+        i += 1
+    return re_compile(''.join(pattern), ASCII), tuple(indices)
+
+def _compile_datetime_parser(format):
+    """Return a function parse(cls, data_string) returning a class cls
+    instance, like _strptime_datetime(cls, data_string, format).
+
+    The format is compiled once, for the locale in effect when this function
+    is called.  Formats made only of numeric directives get a second, simpler
+    regex for zero-padded values, which skips the processing of the
+    locale-aware match.  Anything it does not match or accept, including
+    invalid values, takes the full path and gets the same result or error as
+    from _strptime_datetime().
+    """
+    if not isinstance(format, str):
+        msg = "strptime() argument 1 must be str, not {}"
+        raise TypeError(msg.format(type(format)))
+    format_regex, locale_time = _compile_format(format)
+    fixed = _compile_fixed_width(format)
+    if fixed is not None:
+        fixed_regex, indices = fixed
+        # the groups are the leading datetime() arguments, in order, from
+        # year to at least day
+        in_order = (len(indices) >= 3 and
+                    indices == tuple(range(len(indices))))
+        fraction = 6 in indices
+
+    def parse(cls, data_string):
+        if not isinstance(data_string, str):
+            msg = "strptime() argument 0 must be str, not {}"
+            raise TypeError(msg.format(type(data_string)))
+        if fixed is not None:
+            found = fixed_regex.fullmatch(data_string)
+            if found is not None:
+                values = found.groups()
+                if fraction:
+                    # %f is always the last group; pad it to microseconds
+                    values = values[:-1] + (values[-1].ljust(6, '0'),)
+                if in_order:
+                    args = map(int, values)
+                else:
+                    args = [1900, 1, 1, 0, 0, 0, 0]
+                    for index, value in zip(indices, values):
+                        args[index] = int(value)
+                try:
+                    return cls(*args)
+                except ValueError:
+                    pass
+        return _datetime_from_result(
+            cls, *_strptime_match(format_regex, locale_time,
+                                  data_string, format))
+
+    return parse
@@ -23,6 +23,10 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Amount of data compressed by each thread in multi-threaded mode, per
+# unit of compresslevel.  This is the size of the blocks of bzip2.
+_THREADED_BLOCK_SIZE = 100_000
+
 
 class BZ2File(_compression.BaseStream):
 
@@ -35,7 +39,7 @@ class BZ2File(_compression.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", *, compresslevel=9):
+    def __init__(self, filename, mode="r", *, compresslevel=9, workers=None):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -50,6 +54,10 @@ class BZ2File(_compression.BaseStream):
         and 9 specifying the level of compression: 1 produces the least
         compression, and 9 (default) produces the most compression.
 
+        If mode is 'w', 'x' or 'a' and workers is greater than 1, data
+        written is compressed in blocks by that many threads, each block
+        making a separate bzip2 stream.
+
         If mode is 'r', the input file may be the concatenation of
         multiple compressed streams.
         """
@@ -69,18 +77,27 @@ class BZ2File(_compression.BaseStream):
         elif mode in ("w", "wb"):
             mode = "wb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         elif mode in ("x", "xb"):
             mode = "xb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         elif mode in ("a", "ab"):
             mode = "ab"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         else:
             raise ValueError("Invalid mode: %r" % (mode,))
 
+        if mode_code == _MODE_WRITE:
+            if workers is not None and workers > 1:
+                def compress_block(block, previous, final):
+                    if not block and previous:
+                        return b""
+                    return compress(block, compresslevel)
+                self._compressor = _compression.ThreadedCompressor(
+                    compress_block, workers,
+                    compresslevel * _THREADED_BLOCK_SIZE)
+            else:
+                self._compressor = BZ2Compressor(compresslevel)
+
         if isinstance(filename, (str, bytes, os.PathLike)):
             self._fp = _builtin_open(filename, mode)
             self._closefp = True
@@ -276,7 +293,7 @@ class BZ2File(_compression.BaseStream):
 
 
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, workers=None):
     """Open a bzip2-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str, bytes, or
@@ -288,8 +305,9 @@ def open(filename, mode="rb", compresslevel=9,
     The default mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the BZ2File
-    constructor: BZ2File(filename, mode, compresslevel). In this case,
-    the encoding, errors and newline arguments must not be provided.
+    constructor: BZ2File(filename, mode, compresslevel, workers=workers).
+    In this case, the encoding, errors and newline arguments must not be
+    provided.
 
     For text mode, a BZ2File object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error
@@ -308,7 +326,8 @@ def open(filename, mode="rb", compresslevel=9,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel)
+    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel,
+                          workers=workers)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
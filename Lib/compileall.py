@@ -13,6 +13,7 @@ See module py_compile for details of the actual byte-compilation.
 import os
 import sys
 import importlib.util
+import marshal
 import py_compile
 import struct
 import filecmp
@@ -20,7 +21,10 @@ import filecmp
 from functools import partial
 from pathlib import Path
 
-__all__ = ["compile_dir","compile_file","compile_path"]
+__all__ = ["compile_dir","compile_file","compile_path","write_archive"]
+
+# Maximum number of files sent at once to a worker process
+_MAX_CHUNKSIZE = 64
 
 def _walk_dir(dir, maxlevels, quiet=0):
     if quiet < 2 and isinstance(dir, os.PathLike):
@@ -48,7 +52,8 @@ def _walk_dir(dir, maxlevels, quiet=0):
 def compile_dir(dir, maxlevels=None, ddir=None, force=False,
                 rx=None, quiet=0, legacy=False, optimize=-1, workers=1,
                 invalidation_mode=None, *, stripdir=None,
-                prependdir=None, limit_sl_dest=None, hardlink_dupes=False):
+                prependdir=None, limit_sl_dest=None, hardlink_dupes=False,
+                cache_dir=None):
     """Byte-compile all modules in the given directory tree.
 
     Arguments (only dir is required):
@@ -72,6 +77,7 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
     limit_sl_dest: ignore symlinks if they are pointing outside of
                    the defined path
     hardlink_dupes: hardlink duplicated pyc files
+    cache_dir: directory of a cache of compiled code shared between builds
     """
     ProcessPoolExecutor = None
     if ddir is not None and (stripdir is not None or prependdir is not None):
@@ -95,6 +101,11 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
     files = _walk_dir(dir, quiet=quiet, maxlevels=maxlevels)
     success = True
     if workers != 1 and ProcessPoolExecutor is not None:
+        # Send the files to the workers in batches to reduce the cost of
+        # the communication between processes
+        files = list(files)
+        chunksize = len(files) // (4 * (workers or os.cpu_count() or 1))
+        chunksize = max(1, min(chunksize, _MAX_CHUNKSIZE))
         # If workers == 0, let ProcessPoolExecutor choose
         workers = workers or None
         with ProcessPoolExecutor(max_workers=workers) as executor:
@@ -107,8 +118,9 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
                                            stripdir=stripdir,
                                            prependdir=prependdir,
                                            limit_sl_dest=limit_sl_dest,
-                                           hardlink_dupes=hardlink_dupes),
-                                   files)
+                                           hardlink_dupes=hardlink_dupes,
+                                           cache_dir=cache_dir),
+                                   files, chunksize=chunksize)
             success = min(results, default=True)
     else:
         for file in files:
@@ -116,14 +128,15 @@ def compile_dir(dir, maxlevels=None, ddir=None, force=False,
                                 legacy, optimize, invalidation_mode,
                                 stripdir=stripdir, prependdir=prependdir,
                                 limit_sl_dest=limit_sl_dest,
-                                hardlink_dupes=hardlink_dupes):
+                                hardlink_dupes=hardlink_dupes,
+                                cache_dir=cache_dir):
                 success = False
     return success
 
 def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                  legacy=False, optimize=-1,
                  invalidation_mode=None, *, stripdir=None, prependdir=None,
-                 limit_sl_dest=None, hardlink_dupes=False):
+                 limit_sl_dest=None, hardlink_dupes=False, cache_dir=None):
     """Byte-compile one file.
 
     Arguments (only fullname is required):
@@ -145,6 +158,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
     limit_sl_dest: ignore symlinks if they are pointing outside of
                    the defined path.
     hardlink_dupes: hardlink duplicated pyc files
+    cache_dir: directory of a cache of compiled code shared between builds
     """
 
     if ddir is not None and (stripdir is not None or prependdir is not None):
@@ -218,15 +232,8 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
         if tail == '.py':
             if not force:
                 try:
-                    mtime = int(os.stat(fullname).st_mtime)
-                    expect = struct.pack('<4sll', importlib.util.MAGIC_NUMBER,
-                                         0, mtime)
-                    for cfile in opt_cfiles.values():
-                        with open(cfile, 'rb') as chandle:
-                            actual = chandle.read(12)
-                        if expect != actual:
-                            break
-                    else:
+                    if _is_up_to_date(fullname, opt_cfiles.values(),
+                                      invalidation_mode):
                         return success
                 except OSError:
                     pass
@@ -237,7 +244,8 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                     cfile = opt_cfiles[opt_level]
                     ok = py_compile.compile(fullname, cfile, dfile, True,
                                             optimize=opt_level,
-                                            invalidation_mode=invalidation_mode)
+                                            invalidation_mode=invalidation_mode,
+                                            cache_dir=cache_dir)
                     if index > 0 and hardlink_dupes:
                         previous_cfile = opt_cfiles[optimize[index - 1]]
                         if filecmp.cmp(cfile, previous_cfile, shallow=False):
@@ -270,9 +278,39 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=0,
                     success = False
     return success
 
+def _is_up_to_date(fullname, cfiles, invalidation_mode):
+    # Timestamp-based pycs are up to date if the modification time of the
+    # source matches.  Hash-based pycs are up to date if they use the
+    # requested invalidation mode and the hash of the source matches.
+    if invalidation_mode is None:
+        invalidation_mode = py_compile._get_default_invalidation_mode()
+    mtime = int(os.stat(fullname).st_mtime)
+    expect = struct.pack('<4sll', importlib.util.MAGIC_NUMBER, 0, mtime)
+    if invalidation_mode == py_compile.PycInvalidationMode.TIMESTAMP:
+        expect_hash = None
+    else:
+        checked = (invalidation_mode ==
+                   py_compile.PycInvalidationMode.CHECKED_HASH)
+        expect_hash = struct.pack('<4sl', importlib.util.MAGIC_NUMBER,
+                                  0b1 | checked << 1)
+    source_hash = None
+    for cfile in cfiles:
+        with open(cfile, 'rb') as chandle:
+            actual = chandle.read(16)
+        if actual[:12] == expect:
+            continue
+        if expect_hash is None or actual[:8] != expect_hash:
+            return False
+        if source_hash is None:
+            with open(fullname, 'rb') as fp:
+                source_hash = importlib.util.source_hash(fp.read())
+        if actual[8:] != source_hash:
+            return False
+    return True
+
 def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
                  legacy=False, optimize=-1,
-                 invalidation_mode=None):
+                 invalidation_mode=None, cache_dir=None):
     """Byte-compile all module on sys.path.
 
     Arguments (all optional):
@@ -284,6 +322,7 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
     legacy: as for compile_dir() (default False)
     optimize: as for compile_dir() (default -1)
     invalidation_mode: as for compiler_dir()
+    cache_dir: as for compile_dir()
     """
     success = True
     for dir in sys.path:
@@ -300,9 +339,111 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
                 legacy=legacy,
                 optimize=optimize,
                 invalidation_mode=invalidation_mode,
+                cache_dir=cache_dir,
             )
     return success
 
+def write_archive(archive, paths, maxlevels=None, rx=None, quiet=0,
+                  legacy=False, optimize=-1):
+    """Write the byte-code files of modules to a code archive.
+
+    The archive is used with importlib.machinery.CodeArchiveFinder.  The
+    modules must have been byte-compiled before, for example with
+    compile_dir() and the same legacy and optimize arguments.
+
+    Arguments (only archive and paths are required):
+
+    archive:   the path of the archive to write
+    paths:     the files and the directories whose modules are archived
+    maxlevels: maximum recursion level (default `sys.getrecursionlimit()`)
+    rx:        if given, skip the files matching this regular expression
+    quiet:     as for compile_dir()
+    legacy:    if True, archive legacy pyc files, as sourceless modules
+    optimize:  as for compile_dir()
+    """
+    if maxlevels is None:
+        maxlevels = sys.getrecursionlimit()
+    if isinstance(optimize, int):
+        optimize = [optimize]
+    optimize = sorted(set(optimize))
+    directories = {}
+    files = {}
+    blobs = []
+    offset = 0
+    for path in paths:
+        path = os.path.abspath(path)
+        if os.path.isdir(path):
+            root = path
+            fullnames = _walk_dir(path, quiet=quiet, maxlevels=maxlevels)
+        else:
+            root = os.path.dirname(path)
+            fullnames = [path]
+        directories.setdefault(root, set())
+        for fullname in fullnames:
+            if not fullname.endswith('.py'):
+                continue
+            if rx is not None and rx.search(fullname):
+                continue
+            if legacy:
+                cfiles = [fullname + 'c']
+            else:
+                cfiles = []
+                for opt_level in optimize:
+                    if opt_level >= 0:
+                        opt = opt_level if opt_level >= 1 else ''
+                        cfiles.append(importlib.util.cache_from_source(
+                                      fullname, optimization=opt))
+                    else:
+                        cfiles.append(
+                            importlib.util.cache_from_source(fullname))
+            archived = False
+            for cfile in cfiles:
+                if cfile not in files:
+                    try:
+                        with open(cfile, 'rb') as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    files[cfile] = (offset, len(data))
+                    blobs.append(data)
+                    offset += len(data)
+                archived = True
+            if not archived:
+                if quiet < 2:
+                    print('No byte-code file for {!r}'.format(fullname))
+                continue
+            dirname, name = os.path.split(cfiles[0] if legacy else fullname)
+            directories.setdefault(dirname, set()).add(name)
+            # The directories between the root and the module are
+            # needed to find the packages
+            while dirname != root:
+                dirname = os.path.dirname(dirname)
+                if dirname in directories:
+                    break
+                directories[dirname] = set()
+    directories = {dirname: frozenset(names)
+                   for dirname, names in directories.items()}
+    index = marshal.dumps((directories, files))
+    if not quiet:
+        print('Writing {!r}...'.format(archive))
+    # Replace the archive atomically: processes using the current archive
+    # keep it memory mapped.
+    tmp = '{}.{}'.format(archive, os.getpid())
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(importlib._bootstrap_external._CODE_ARCHIVE_MAGIC)
+            f.write(importlib.util.MAGIC_NUMBER)
+            f.write(struct.pack('<I', len(index)))
+            f.write(index)
+            f.writelines(blobs)
+        os.replace(tmp, archive)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
 
 def main():
     """Script main program."""
@@ -374,6 +515,15 @@ def main():
     parser.add_argument('--hardlink-dupes', action='store_true',
                         dest='hardlink_dupes',
                         help='Hardlink duplicated pyc files')
+    parser.add_argument('--cache-dir', metavar='DIR', dest='cache_dir',
+                        default=None,
+                        help=('reuse the code compiled from identical sources '
+                              'by previous runs, cached in DIR'))
+    parser.add_argument('--archive', metavar='FILE', dest='archive',
+                        default=None,
+                        help=('also write the compiled files to the code '
+                              'archive FILE, for use with '
+                              'importlib.machinery.CodeArchiveFinder'))
 
     args = parser.parse_args()
     compile_dests = args.compile_dest
@@ -402,6 +552,9 @@ def main():
     ):
         parser.error("-d cannot be used in combination with -s or -p")
 
+    if args.archive is not None and not (compile_dests or args.flist):
+        parser.error("--archive requires files or directories to compile")
+
     # if flist is provided then load it
     if args.flist:
         try:
@@ -431,7 +584,8 @@ def main():
                                         prependdir=args.prependdir,
                                         optimize=args.opt_levels,
                                         limit_sl_dest=args.limit_sl_dest,
-                                        hardlink_dupes=args.hardlink_dupes):
+                                        hardlink_dupes=args.hardlink_dupes,
+                                        cache_dir=args.cache_dir):
                         success = False
                 else:
                     if not compile_dir(dest, maxlevels, args.ddir,
@@ -442,13 +596,19 @@ def main():
                                        prependdir=args.prependdir,
                                        optimize=args.opt_levels,
                                        limit_sl_dest=args.limit_sl_dest,
-                                       hardlink_dupes=args.hardlink_dupes):
+                                       hardlink_dupes=args.hardlink_dupes,
+                                       cache_dir=args.cache_dir):
                         success = False
+            if args.archive is not None:
+                write_archive(args.archive, compile_dests, maxlevels,
+                              args.rx, args.quiet, args.legacy,
+                              args.opt_levels)
             return success
         else:
             return compile_path(legacy=args.legacy, force=args.force,
                                 quiet=args.quiet,
-                                invalidation_mode=invalidation_mode)
+                                invalidation_mode=invalidation_mode,
+                                cache_dir=args.cache_dir)
     except KeyboardInterrupt:
         if args.quiet < 2:
             print("\n[interrupted]")
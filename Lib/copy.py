@@ -132,7 +132,13 @@ def deepcopy(x, memo=None, _nil=[]):
     """
 
     if memo is None:
+        cls = type(x)
+        if cls in _atomic_types:
+            return x
         memo = {}
+        if cls in _tree_types:
+            memo[id(memo)] = keep = []
+            return _deepcopy_tree(x, memo, keep)
 
     d = id(x)
     y = memo.get(d, _nil)
@@ -238,8 +244,62 @@ def _deepcopy_method(x, memo): # Copy instance methods
     return type(x)(x.__func__, deepcopy(x.__self__, memo))
 d[types.MethodType] = _deepcopy_method
 
+_atomic_types = frozenset(t for t, copier in d.items()
+                          if copier is _deepcopy_atomic)
+_tree_types = frozenset((list, tuple, dict))
+
 del d
 
+def _deepcopy_tree(x, memo, keep, _nil=[]):
+    # Fast path for trees of builtin containers, used when deepcopy()
+    # manages the memo itself.  Atomic values are never looked up in or
+    # added to the memo, and the exact list, tuple and dict types are
+    # copied inline instead of going through the dispatch table.  Any
+    # other object is handed back to deepcopy().
+    d = id(x)
+    y = memo.get(d, _nil)
+    if y is not _nil:
+        return y
+    cls = type(x)
+    if cls is list:
+        y = []
+        memo[d] = y
+        keep.append(x)
+        append = y.append
+        for a in x:
+            if type(a) not in _atomic_types:
+                a = _deepcopy_tree(a, memo, keep)
+            append(a)
+    elif cls is dict:
+        y = {}
+        memo[d] = y
+        keep.append(x)
+        for key, value in x.items():
+            if type(key) not in _atomic_types:
+                key = _deepcopy_tree(key, memo, keep)
+            if type(value) not in _atomic_types:
+                value = _deepcopy_tree(value, memo, keep)
+            y[key] = value
+    elif cls is tuple:
+        y = [a if type(a) in _atomic_types else _deepcopy_tree(a, memo, keep)
+             for a in x]
+        # See _deepcopy_tuple().
+        try:
+            return memo[d]
+        except KeyError:
+            pass
+        for k, j in zip(x, y):
+            if k is not j:
+                y = tuple(y)
+                memo[d] = y
+                keep.append(x)
+                break
+        else:
+            y = x
+    else:
+        y = deepcopy(x, memo)
+    return y
+
 def _keep_alive(x, memo):
     """Keeps a reference to the object x in the memo.
 
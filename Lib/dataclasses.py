@@ -295,15 +295,20 @@ class _DataclassParams:
                  'order',
                  'unsafe_hash',
                  'frozen',
+                 'slots',
+                 'weakref_slot',
                  )
 
-    def __init__(self, init, repr, eq, order, unsafe_hash, frozen):
+    def __init__(self, init, repr, eq, order, unsafe_hash, frozen,
+                 slots=False, weakref_slot=False):
         self.init = init
         self.repr = repr
         self.eq = eq
         self.order = order
         self.unsafe_hash = unsafe_hash
         self.frozen = frozen
+        self.slots = slots
+        self.weakref_slot = weakref_slot
 
     def __repr__(self):
         return ('_DataclassParams('
@@ -312,7 +317,9 @@ class _DataclassParams:
                 f'eq={self.eq!r},'
                 f'order={self.order!r},'
                 f'unsafe_hash={self.unsafe_hash!r},'
-                f'frozen={self.frozen!r}'
+                f'frozen={self.frozen!r},'
+                f'slots={self.slots!r},'
+                f'weakref_slot={self.weakref_slot!r}'
                 ')')
 
 
@@ -397,10 +404,45 @@ def _create_fn(name, args, body, *, globals=None, locals=None,
     txt = f"def __create_fn__({local_vars}):\n{txt}\n return {name}"
 
     ns = {}
-    exec(txt, globals, ns)
+    exec(_compile_fn(txt), globals, ns)
     return ns['__create_fn__'](**locals)
 
 
+# Classes with the same field names and options generate the same
+# source text, so cache the compiled code.  The generated functions
+# get their globals, defaults and closure values when the cached code
+# is executed, which keeps them independent of each other.
+@functools.lru_cache(maxsize=1024)
+def _compile_fn(txt):
+    return compile(txt, '<string>', 'exec')
+
+
+class _LazyMethod:
+    # Stands in for a generated method until it is first looked up.
+    # At that point, the real function is created and replaces this
+    # descriptor in the class dict.  Only used for methods that are
+    # not needed to create or introspect instances.
+    __slots__ = ('name', 'factory')
+
+    def __init__(self, name, factory):
+        self.name = name
+        self.factory = factory
+
+    def __get__(self, instance, owner=None):
+        if owner is None:
+            owner = type(instance)
+        fn = self.factory()
+        # The descriptor may have been found on a base class.
+        for cls in owner.__mro__:
+            if cls.__dict__.get(self.name) is self:
+                setattr(cls, self.name, fn)
+                break
+        return fn.__get__(instance, owner)
+
+    def __repr__(self):
+        return f'<lazy dataclass method {self.name!r}>'
+
+
 def _field_assign(frozen, name, value, self_name):
     # If we're a frozen class, then assign to our fields in __init__
     # via object.__setattr__.  Otherwise, just use a simple
@@ -413,7 +455,7 @@ def _field_assign(frozen, name, value, self_name):
     return f'{self_name}.{name}={value}'
 
 
-def _field_init(f, frozen, globals, self_name):
+def _field_init(f, frozen, globals, self_name, slots):
     # Return the text of the line in the body of __init__ that will
     # initialize this field.
 
@@ -452,6 +494,11 @@ def _field_init(f, frozen, globals, self_name):
             elif f.default is not MISSING:
                 globals[default_name] = f.default
                 value = f.name
+        elif slots and f.default is not MISSING:
+            # A slotted class has no class attribute to fall back on,
+            # so the default has to be assigned here.
+            globals[default_name] = f.default
+            value = default_name
         else:
             # This field does not need initialization.  Signify that
             # to the caller by returning None.
@@ -486,7 +533,7 @@ def _init_param(f):
     return f'{f.name}:_type_{f.name}{default}'
 
 
-def _init_fn(fields, frozen, has_post_init, self_name, globals):
+def _init_fn(fields, frozen, has_post_init, self_name, globals, slots):
     # fields contains both real fields and InitVar pseudo-fields.
 
     # Make sure we don't have fields without defaults following fields
@@ -512,7 +559,7 @@ def _init_fn(fields, frozen, has_post_init, self_name, globals):
 
     body_lines = []
     for f in fields:
-        line = _field_init(f, frozen, locals, self_name)
+        line = _field_init(f, frozen, locals, self_name, slots)
         # line is None means that this field doesn't require
         # initialization (it's a pseudo-field).  Just skip it.
         if line:
@@ -769,7 +816,7 @@ def _hash_set_none(cls, fields, globals):
 
 def _hash_add(cls, fields, globals):
     flds = [f for f in fields if (f.compare if f.hash is None else f.hash)]
-    return _hash_fn(flds, globals)
+    return _LazyMethod('__hash__', functools.partial(_hash_fn, flds, globals))
 
 def _hash_exception(cls, fields, globals):
     # Raise an exception.
@@ -806,7 +853,8 @@ _hash_action = {(False, False, False, False): None,
 # version of this table.
 
 
-def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
+def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
+                   slots=False, weakref_slot=False):
     # Now that dicts retain insertion order, there's no reason to use
     # an ordered dict.  I am leveraging that ordering here, because
     # derived class fields overwrite base class fields, but the order
@@ -823,8 +871,12 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
         # correctly.
         globals = {}
 
+    if weakref_slot and not slots:
+        raise TypeError('weakref_slot is True but slots is False')
+
     setattr(cls, _PARAMS, _DataclassParams(init, repr, eq, order,
-                                           unsafe_hash, frozen))
+                                           unsafe_hash, frozen,
+                                           slots, weakref_slot))
 
     # Find our base classes in reverse MRO order, and exclude
     # ourselves.  In reversed order so that more derived classes
@@ -933,6 +985,7 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
                                     '__dataclass_self__' if 'self' in fields
                                             else 'self',
                                     globals,
+                                    slots,
                           ))
 
     # Get the fields as a list, and include only real fields.  This is
@@ -941,7 +994,9 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
 
     if repr:
         flds = [f for f in field_list if f.repr]
-        _set_new_attribute(cls, '__repr__', _repr_fn(flds, globals))
+        _set_new_attribute(cls, '__repr__',
+                           _LazyMethod('__repr__', functools.partial(
+                               _repr_fn, flds, globals)))
 
     if eq:
         # Create _eq__ method.  There's no need for a __ne__ method,
@@ -950,9 +1005,10 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
         self_tuple = _tuple_str('self', flds)
         other_tuple = _tuple_str('other', flds)
         _set_new_attribute(cls, '__eq__',
-                           _cmp_fn('__eq__', '==',
-                                   self_tuple, other_tuple,
-                                   globals=globals))
+                           _LazyMethod('__eq__', functools.partial(
+                               _cmp_fn, '__eq__', '==',
+                               self_tuple, other_tuple,
+                               globals=globals)))
 
     if order:
         # Create and set the ordering methods.
@@ -965,8 +1021,10 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
                          ('__ge__', '>='),
                          ]:
             if _set_new_attribute(cls, name,
-                                  _cmp_fn(name, op, self_tuple, other_tuple,
-                                          globals=globals)):
+                                  _LazyMethod(name, functools.partial(
+                                      _cmp_fn, name, op,
+                                      self_tuple, other_tuple,
+                                      globals=globals))):
                 raise TypeError(f'Cannot overwrite attribute {name} '
                                 f'in class {cls.__name__}. Consider using '
                                 'functools.total_ordering')
@@ -992,11 +1050,102 @@ def _process_class(cls, init, repr, eq, order, unsafe_hash, frozen):
         cls.__doc__ = (cls.__name__ +
                        str(inspect.signature(cls)).replace(' -> None', ''))
 
+    if slots:
+        cls = _add_slots(cls, field_list, weakref_slot)
+
     return cls
 
 
+def _dataclass_getstate(self):
+    return [getattr(self, f.name) for f in fields(self)]
+
+
+def _dataclass_setstate(self, state):
+    # Use object.__setattr__, so that frozen classes can be unpickled
+    # too.
+    for field, value in zip(fields(self), state):
+        object.__setattr__(self, field.name, value)
+
+
+def _update_class_cells(func, oldcls, newcls):
+    # Functions that close over the original class (the generated
+    # __setattr__ and __delattr__ of frozen classes, and any method
+    # using zero-argument super() or __class__) must see the new class
+    # instead.
+    if isinstance(func, (classmethod, staticmethod)):
+        func = func.__func__
+    elif isinstance(func, property):
+        for accessor in (func.fget, func.fset, func.fdel):
+            _update_class_cells(accessor, oldcls, newcls)
+        return
+    if not isinstance(func, types.FunctionType):
+        return
+    func = inspect.unwrap(func)
+    for cell in func.__closure__ or ():
+        try:
+            contents = cell.cell_contents
+        except ValueError:
+            # Empty cell.
+            continue
+        if contents is oldcls:
+            cell.cell_contents = newcls
+
+
+def _add_slots(cls, field_list, weakref_slot):
+    # A class's __slots__ can't be changed after it has been created,
+    # so build a new class with the same name, bases and namespace,
+    # plus a __slots__ entry holding every field defined by this
+    # class.
+    if '__slots__' in cls.__dict__:
+        raise TypeError(f'{cls.__name__} already specifies __slots__')
+
+    cls_dict = dict(cls.__dict__)
+
+    # Slots for fields inherited from a base class already exist in
+    # that base's layout, so only add the ones that are new here.
+    inherited_slots = set()
+    for base in cls.__mro__[1:-1]:
+        inherited_slots.update(base.__dict__.get('__slots__', ()))
+    field_names = tuple(f.name for f in field_list
+                        if f.name not in inherited_slots)
+    if weakref_slot and not any(base.__weakrefoffset__
+                                for base in cls.__bases__):
+        field_names += ('__weakref__',)
+    cls_dict['__slots__'] = field_names
+
+    for field_name in field_names:
+        # Class attributes holding default values would conflict with
+        # the slot descriptors.  The defaults are still applied by
+        # __init__, which captured them when it was generated.
+        cls_dict.pop(field_name, None)
+
+    # The old __dict__ and __weakref__ descriptors refer to the old
+    # class's layout.
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    qualname = getattr(cls, '__qualname__', None)
+    newcls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    if qualname is not None:
+        newcls.__qualname__ = qualname
+
+    for value in cls_dict.values():
+        _update_class_cells(value, cls, newcls)
+
+    # Without a __dict__, the default pickling protocol can't restore
+    # the fields of a frozen class and protocols 0 and 1 refuse slotted
+    # instances altogether.  Save the field values as a list instead.
+    if '__getstate__' not in cls_dict:
+        newcls.__getstate__ = _dataclass_getstate
+    if '__setstate__' not in cls_dict:
+        newcls.__setstate__ = _dataclass_setstate
+
+    return newcls
+
+
 def dataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
-              unsafe_hash=False, frozen=False):
+              unsafe_hash=False, frozen=False, slots=False,
+              weakref_slot=False):
     """Returns the same class as was passed in, with dunder methods
     added based on the fields defined in the class.
 
@@ -1006,11 +1155,15 @@ def dataclass(cls=None, /, *, init=True, repr=True, eq=True, order=False,
     repr is true, a __repr__() method is added. If order is true, rich
     comparison dunder methods are added. If unsafe_hash is true, a
     __hash__() method function is added. If frozen is true, fields may
-    not be assigned to after instance creation.
+    not be assigned to after instance creation. If slots is true, a new
+    class with a __slots__ attribute listing the fields is returned in
+    place of the original one. If weakref_slot is also true, instances
+    can be weakly referenced.
     """
 
     def wrap(cls):
-        return _process_class(cls, init, repr, eq, order, unsafe_hash, frozen)
+        return _process_class(cls, init, repr, eq, order, unsafe_hash, frozen,
+                              slots, weakref_slot)
 
     # See if we're being called as @dataclass or @dataclass().
     if cls is None:
@@ -1169,7 +1322,7 @@ def _astuple_inner(obj, tuple_factory):
 
 def make_dataclass(cls_name, fields, *, bases=(), namespace=None, init=True,
                    repr=True, eq=True, order=False, unsafe_hash=False,
-                   frozen=False):
+                   frozen=False, slots=False, weakref_slot=False):
     """Return a new dynamically created dataclass.
 
     The dataclass name will be 'cls_name'.  'fields' is an iterable
@@ -1189,8 +1342,8 @@ def make_dataclass(cls_name, fields, *, bases=(), namespace=None, init=True,
 
     For the bases and namespace parameters, see the builtin type() function.
 
-    The parameters init, repr, eq, order, unsafe_hash, and frozen are passed to
-    dataclass().
+    The parameters init, repr, eq, order, unsafe_hash, frozen, slots and
+    weakref_slot are passed to dataclass().
     """
 
     if namespace is None:
@@ -1230,7 +1383,8 @@ def make_dataclass(cls_name, fields, *, bases=(), namespace=None, init=True,
     # of generic dataclassses.
     cls = types.new_class(cls_name, bases, {}, lambda ns: ns.update(namespace))
     return dataclass(cls, init=init, repr=repr, eq=eq, order=order,
-                     unsafe_hash=unsafe_hash, frozen=frozen)
+                     unsafe_hash=unsafe_hash, frozen=frozen, slots=slots,
+                     weakref_slot=weakref_slot)
 
 
 def replace(obj, /, **changes):
@@ -5,7 +5,7 @@ time zone and DST data sources.
 """
 
 __all__ = ("date", "datetime", "time", "timedelta", "timezone", "tzinfo",
-           "MINYEAR", "MAXYEAR")
+           "MINYEAR", "MAXYEAR", "StrptimeFormat")
 
 
 import time as _time
@@ -2304,6 +2304,46 @@ timezone.min = timezone._create(-timedelta(hours=23, minutes=59))
 timezone.max = timezone._create(timedelta(hours=23, minutes=59))
 _EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
+
+class StrptimeFormat:
+    """A compiled strptime() format for parsing many date strings.
+
+    StrptimeFormat(format) -> compiled format
+
+    The format is compiled once, for the LC_TIME locale in effect when the
+    object is created.  parse(date_string) returns the same datetime as
+    datetime.strptime(date_string, format) while skipping the per-call
+    locale check and cache lookup.
+    """
+    __slots__ = '_format', '_parse'
+
+    def __init__(self, format):
+        import _strptime
+        self._parse = _strptime._compile_datetime_parser(format)
+        self._format = format
+
+    @property
+    def format(self):
+        """The format string."""
+        return self._format
+
+    def parse(self, date_string):
+        """string -> new datetime parsed with the format."""
+        return self._parse(datetime, date_string)
+
+    def parse_many(self, date_strings):
+        """iterable of strings -> list of new datetimes parsed with the format."""
+        parse = self._parse
+        return [parse(datetime, date_string) for date_string in date_strings]
+
+    def __repr__(self):
+        return "%s.%s(%r)" % (self.__class__.__module__,
+                              self.__class__.__qualname__,
+                              self._format)
+
+    def __reduce__(self):
+        return (self.__class__, (self._format,))
+
 # Some time zone algebra.  For a datetime x, let
 #     x.n = x stripped of its timezone -- its naive time.
 #     x.o = x.utcoffset(), and assuming that doesn't raise an exception or
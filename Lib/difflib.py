@@ -19,6 +19,12 @@ Function unified_diff(a, b):
 Class SequenceMatcher:
     A flexible class for comparing pairs of sequences of any type.
 
+Class MyersSequenceMatcher:
+    A SequenceMatcher computing minimal diffs in O(ND) time.
+
+Class PatienceSequenceMatcher:
+    A SequenceMatcher anchoring diffs on unique common elements.
+
 Class Differ:
     For producing human-readable deltas from sequences of lines of text.
 
@@ -28,8 +34,10 @@ Class HtmlDiff:
 
 __all__ = ['get_close_matches', 'ndiff', 'restore', 'SequenceMatcher',
            'Differ','IS_CHARACTER_JUNK', 'IS_LINE_JUNK', 'context_diff',
-           'unified_diff', 'diff_bytes', 'HtmlDiff', 'Match']
+           'unified_diff', 'diff_bytes', 'HtmlDiff', 'Match',
+           'MyersSequenceMatcher', 'PatienceSequenceMatcher']
 
+from bisect import bisect_left as _bisect_left
 from heapq import nlargest as _nlargest
 from collections import namedtuple as _namedtuple
 from types import GenericAlias
@@ -41,6 +49,39 @@ def _calculate_ratio(matches, length):
         return 2.0 * matches / length
     return 1.0
 
+def _collapse_matching_blocks(matching_blocks, la, lb):
+    """Sort (i, j, k) triples and merge adjacent ones into Match tuples.
+
+    The result is terminated by the dummy (la, lb, 0) sentinel, as
+    documented for SequenceMatcher.get_matching_blocks().
+    """
+    matching_blocks.sort()
+
+    # It's possible that we have adjacent equal blocks in the
+    # matching_blocks list now.  Starting with 2.5, this code was added
+    # to collapse them.
+    i1 = j1 = k1 = 0
+    non_adjacent = []
+    for i2, j2, k2 in matching_blocks:
+        # Is this block adjacent to i1, j1, k1?
+        if i1 + k1 == i2 and j1 + k1 == j2:
+            # Yes, so collapse them -- this just increases the length of
+            # the first block by the length of the second, and the first
+            # block so lengthened remains the block to compare against.
+            k1 += k2
+        else:
+            # Not adjacent.  Remember the first block (k1==0 means it's
+            # the dummy we started with), and make the second block the
+            # new block to compare against.
+            if k1:
+                non_adjacent.append((i1, j1, k1))
+            i1, j1, k1 = i2, j2, k2
+    if k1:
+        non_adjacent.append((i1, j1, k1))
+
+    non_adjacent.append( (la, lb, 0) )
+    return list(map(Match._make, non_adjacent))
+
 class SequenceMatcher:
 
     """
@@ -493,32 +534,8 @@ class SequenceMatcher:
                     queue.append((alo, i, blo, j))
                 if i+k < ahi and j+k < bhi:
                     queue.append((i+k, ahi, j+k, bhi))
-        matching_blocks.sort()
-
-        # It's possible that we have adjacent equal blocks in the
-        # matching_blocks list now.  Starting with 2.5, this code was added
-        # to collapse them.
-        i1 = j1 = k1 = 0
-        non_adjacent = []
-        for i2, j2, k2 in matching_blocks:
-            # Is this block adjacent to i1, j1, k1?
-            if i1 + k1 == i2 and j1 + k1 == j2:
-                # Yes, so collapse them -- this just increases the length of
-                # the first block by the length of the second, and the first
-                # block so lengthened remains the block to compare against.
-                k1 += k2
-            else:
-                # Not adjacent.  Remember the first block (k1==0 means it's
-                # the dummy we started with), and make the second block the
-                # new block to compare against.
-                if k1:
-                    non_adjacent.append((i1, j1, k1))
-                i1, j1, k1 = i2, j2, k2
-        if k1:
-            non_adjacent.append((i1, j1, k1))
-
-        non_adjacent.append( (la, lb, 0) )
-        self.matching_blocks = list(map(Match._make, non_adjacent))
+        self.matching_blocks = _collapse_matching_blocks(matching_blocks,
+                                                         la, lb)
         return self.matching_blocks
 
     def get_opcodes(self):
@@ -695,6 +712,257 @@ class SequenceMatcher:
     __class_getitem__ = classmethod(GenericAlias)
 
 
+########################################################################
+###  Linear-time diff engines
+########################################################################
+
+def _strip_common_affixes(a, b, alo, ahi, blo, bhi, blocks):
+    """Match the common prefix and suffix of a[alo:ahi] and b[blo:bhi].
+
+    The matches are appended to blocks as (i, j, k) triples, and the
+    bounds of the remaining unmatched middle parts are returned.
+    """
+    i, j = alo, blo
+    while i < ahi and j < bhi and a[i] == b[j]:
+        i += 1
+        j += 1
+    if i > alo:
+        blocks.append((alo, blo, i - alo))
+        alo, blo = i, j
+    i, j = ahi, bhi
+    while i > alo and j > blo and a[i-1] == b[j-1]:
+        i -= 1
+        j -= 1
+    if i < ahi:
+        blocks.append((i, j, ahi - i))
+        ahi, bhi = i, j
+    return alo, ahi, blo, bhi
+
+def _myers_middle_snake(a, alo, ahi, b, blo, bhi):
+    """Return the middle snake of a shortest edit script.
+
+    a[alo:ahi] and b[blo:bhi] must be non-empty and must neither start
+    nor end with equal elements.  The result is a tuple (x1, y1, x2, y2)
+    such that a[x1:x2] == b[y1:y2] lies on a shortest path through the
+    edit graph, splitting the problem into two halves each needing about
+    half of the edits.
+    """
+    # This is the linear space refinement from E. Myers, "An O(ND)
+    # Difference Algorithm and Its Variations" (1986).  Forward paths
+    # start at (alo, blo), reverse paths start at (ahi, bhi) and are
+    # tracked in reversed coordinates; vf[k] and vb[k] hold the furthest
+    # reaching x on diagonal k (x - y == k) for the current number of
+    # edits.  Diagonal k is stored at index k + offset.
+    n = ahi - alo
+    m = bhi - blo
+    delta = n - m
+    odd = delta & 1
+    dmax = (n + m + 1) // 2
+    offset = dmax + 1
+    vf = [0] * (2 * offset + 1)
+    vb = [0] * (2 * offset + 1)
+    for d in range(dmax + 1):
+        for k in range(offset - d, offset + d + 1, 2):
+            if k == offset - d or (k != offset + d and vf[k-1] < vf[k+1]):
+                x = vf[k+1]
+            else:
+                x = vf[k-1] + 1
+            y = x - k + offset
+            x0, y0 = x, y
+            while x < n and y < m and a[alo+x] == b[blo+y]:
+                x += 1
+                y += 1
+            vf[k] = x
+            kb = delta - k + 2 * offset
+            if odd and offset - d < kb < offset + d and x + vb[kb] >= n:
+                return alo + x0, blo + y0, alo + x, blo + y
+        for k in range(offset - d, offset + d + 1, 2):
+            if k == offset - d or (k != offset + d and vb[k-1] < vb[k+1]):
+                x = vb[k+1]
+            else:
+                x = vb[k-1] + 1
+            y = x - k + offset
+            x0, y0 = x, y
+            while x < n and y < m and a[ahi-1-x] == b[bhi-1-y]:
+                x += 1
+                y += 1
+            vb[k] = x
+            kf = delta - k + 2 * offset
+            if not odd and offset - d <= kf <= offset + d and x + vf[kf] >= n:
+                return ahi - x, bhi - y, ahi - x0, bhi - y0
+    raise AssertionError('no middle snake found')
+
+def _myers_matching_blocks(a, b, alo, ahi, blo, bhi, blocks):
+    """Append a maximal set of matches of a[alo:ahi] and b[blo:bhi].
+
+    The matches are appended to blocks as (i, j, k) triples in no
+    particular order.  They describe a minimal edit script, found in
+    O((N+M)D) time and O(N+M) space.
+    """
+    # Divide and conquer on the middle snake.  As in get_matching_blocks(),
+    # an explicit queue of pending subproblems avoids recursion limits.
+    queue = [(alo, ahi, blo, bhi)]
+    while queue:
+        alo, ahi, blo, bhi = _strip_common_affixes(a, b, *queue.pop(),
+                                                   blocks)
+        if alo == ahi or blo == bhi:
+            continue
+        x1, y1, x2, y2 = _myers_middle_snake(a, alo, ahi, b, blo, bhi)
+        if x2 > x1:
+            blocks.append((x1, y1, x2 - x1))
+        queue.append((alo, x1, blo, y1))
+        queue.append((x2, ahi, y2, bhi))
+
+def _patience_matching_blocks(a, b, alo, ahi, blo, bhi, blocks):
+    """Append the matches of a[alo:ahi] and b[blo:bhi] found by patience diff.
+
+    Elements occurring exactly once in both ranges are paired up, the
+    longest increasing run of such pairs anchors the diff, and the
+    ranges between the anchors are matched the same way.  Ranges
+    without unique common elements are handed to the Myers algorithm.
+    """
+    queue = [(alo, ahi, blo, bhi)]
+    while queue:
+        alo, ahi, blo, bhi = _strip_common_affixes(a, b, *queue.pop(),
+                                                   blocks)
+        if alo == ahi or blo == bhi:
+            continue
+
+        # Map each element to its index, or to -1 if it isn't unique.
+        aindex = {}
+        for i in range(alo, ahi):
+            elt = a[i]
+            aindex[elt] = -1 if elt in aindex else i
+        bindex = {}
+        for j in range(blo, bhi):
+            elt = b[j]
+            bindex[elt] = -1 if elt in bindex else j
+        pairs = []
+        for elt, i in aindex.items():
+            if i >= 0:
+                j = bindex.get(elt, -1)
+                if j >= 0:
+                    pairs.append((i, j))
+        if not pairs:
+            _myers_matching_blocks(a, b, alo, ahi, blo, bhi, blocks)
+            continue
+        pairs.sort()
+
+        # Patience sorting:  tails[k] is the index in pairs of the smallest
+        # possible last pair of an increasing run of length k+1, and
+        # backlinks[p] the index of the pair preceding pairs[p] in its run.
+        tails = []
+        tailj = []
+        backlinks = [-1] * len(pairs)
+        for p, (i, j) in enumerate(pairs):
+            k = _bisect_left(tailj, j)
+            if k:
+                backlinks[p] = tails[k-1]
+            if k == len(tails):
+                tails.append(p)
+                tailj.append(j)
+            else:
+                tails[k] = p
+                tailj[k] = j
+        anchors = []
+        p = tails[-1]
+        while p >= 0:
+            anchors.append(pairs[p])
+            p = backlinks[p]
+        anchors.reverse()
+
+        for i, j in anchors:
+            blocks.append((i, j, 1))
+            queue.append((alo, i, blo, j))
+            alo, blo = i + 1, j + 1
+        queue.append((alo, ahi, blo, bhi))
+
+class MyersSequenceMatcher(SequenceMatcher):
+
+    """
+    MyersSequenceMatcher is a SequenceMatcher whose matching blocks
+    describe a minimal edit script, computed with the O(ND) difference
+    algorithm published by Eugene W. Myers in 1986, N being the total
+    length of the sequences and D the size of the edit script.  This is
+    the algorithm used by GNU diff and git.
+
+    Unlike SequenceMatcher, whose worst case is quadratic, the running
+    time only grows with the number of differences, and it needs no
+    "autojunk" heuristic to stay fast, so it is well suited to comparing
+    large and mostly similar sequences.  The interface and the output
+    formats are those of SequenceMatcher, and any method can be used.
+    The isjunk and autojunk arguments are accepted for compatibility;
+    they don't affect the matching blocks.
+
+    >>> s = MyersSequenceMatcher(None, "qabxcd", "abycdf")
+    >>> for opcode in s.get_opcodes():
+    ...     print("%7s a[%d:%d] b[%d:%d]" % opcode)
+     delete a[0:1] b[0:0]
+      equal a[1:3] b[0:2]
+    replace a[3:4] b[2:3]
+      equal a[4:6] b[3:5]
+     insert a[6:6] b[5:6]
+    """
+
+    _find_matching_blocks = staticmethod(_myers_matching_blocks)
+
+    def get_matching_blocks(self):
+        """Return list of triples describing matching subsequences.
+
+        See SequenceMatcher.get_matching_blocks() for the format.  The
+        total size of the matches is maximal.
+
+        >>> s = MyersSequenceMatcher(None, "abxcd", "abcd")
+        >>> list(s.get_matching_blocks())
+        [Match(a=0, b=0, size=2), Match(a=3, b=2, size=2), Match(a=5, b=4, size=0)]
+        """
+
+        if self.matching_blocks is not None:
+            return self.matching_blocks
+        la, lb = len(self.a), len(self.b)
+
+        # Comparing small ints is much cheaper than comparing e.g. long
+        # lines, so replace every element by a number identifying it.
+        ids = {}
+        a = [ids.setdefault(elt, len(ids)) for elt in self.a]
+        b = [ids.setdefault(elt, len(ids)) for elt in self.b]
+        matching_blocks = []
+        self._find_matching_blocks(a, b, 0, la, 0, lb, matching_blocks)
+        self.matching_blocks = _collapse_matching_blocks(matching_blocks,
+                                                         la, lb)
+        return self.matching_blocks
+
+class PatienceSequenceMatcher(MyersSequenceMatcher):
+
+    """
+    PatienceSequenceMatcher is a SequenceMatcher using the "patience diff"
+    algorithm popularized by Bram Cohen's Bazaar.
+
+    Elements appearing exactly once in each sequence, like the lines
+    holding function signatures in source code, are paired up first, and
+    the longest run of such pairs appearing in the same order in both
+    sequences anchors the diff.  The gaps between anchors are matched the
+    same way, falling back to the Myers algorithm (see
+    MyersSequenceMatcher) when they have no unique elements in common.
+    This tends to avoid synching up on blank lines or braces, and runs
+    in O(N log N) time in the common case.  The isjunk and autojunk
+    arguments are accepted for compatibility; they don't affect the
+    matching blocks.
+
+    >>> a = ["f() {", "    x();", "}", "g() {", "    y();", "}"]
+    >>> b = ["f() {", "    x();", "    y();", "}", "h() {", "}", "g() {",
+    ...      "    y();", "}"]
+    >>> s = PatienceSequenceMatcher(None, a, b)
+    >>> for opcode in s.get_opcodes():
+    ...     print("%7s a[%d:%d] b[%d:%d]" % opcode)
+      equal a[0:2] b[0:2]
+     insert a[2:2] b[2:5]
+      equal a[2:6] b[5:9]
+    """
+
+    _find_matching_blocks = staticmethod(_patience_matching_blocks)
+
+
 def get_close_matches(word, possibilities, n=3, cutoff=0.6):
     """Use SequenceMatcher to return list of the best "good enough" matches.
 
@@ -840,18 +1108,20 @@ class Differ:
 
     Methods:
 
-    __init__(linejunk=None, charjunk=None)
+    __init__(linejunk=None, charjunk=None, *, matcher=SequenceMatcher)
         Construct a text differencer, with optional filters.
 
     compare(a, b)
         Compare two sequences of lines; generate the resulting delta.
     """
 
-    def __init__(self, linejunk=None, charjunk=None):
+    def __init__(self, linejunk=None, charjunk=None, *,
+                 matcher=SequenceMatcher):
         """
         Construct a text differencer, with optional filters.
 
-        The two optional keyword parameters are for filter functions:
+        The two optional parameters `linejunk` and `charjunk` are for
+        filter functions:
 
         - `linejunk`: A function that should accept a single string argument,
           and return true iff the string is junk. The module-level function
@@ -865,10 +1135,17 @@ class Differ:
           module-level function `IS_CHARACTER_JUNK` may be used to filter out
           whitespace characters (a blank or tab; **note**: bad idea to include
           newline in this!).  Use of IS_CHARACTER_JUNK is recommended.
+
+        The optional keyword parameter `matcher` is the SequenceMatcher
+        class used to compare sequences of lines.  Passing
+        MyersSequenceMatcher or PatienceSequenceMatcher makes comparing
+        large inputs much faster.  Similar lines are always compared
+        character by character with SequenceMatcher.
         """
 
         self.linejunk = linejunk
         self.charjunk = charjunk
+        self.matcher = matcher
 
     def compare(self, a, b):
         r"""
@@ -896,7 +1173,7 @@ class Differ:
         + emu
         """
 
-        cruncher = SequenceMatcher(self.linejunk, a, b)
+        cruncher = self.matcher(self.linejunk, a, b)
         for tag, alo, ahi, blo, bhi in cruncher.get_opcodes():
             if tag == 'replace':
                 g = self._fancy_replace(a, alo, ahi, b, blo, bhi)
@@ -1133,7 +1410,8 @@ def _format_range_unified(start, stop):
     return '{},{}'.format(beginning, length)
 
 def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
-                 tofiledate='', n=3, lineterm='\n'):
+                 tofiledate='', n=3, lineterm='\n', *,
+                 matcher=SequenceMatcher):
     r"""
     Compare two sequences of lines; generate the delta as a unified diff.
 
@@ -1155,6 +1433,10 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
     'fromfile', 'tofile', 'fromfiledate', and 'tofiledate'.
     The modification times are normally expressed in the ISO 8601 format.
 
+    The optional keyword argument 'matcher' is the SequenceMatcher class
+    used to compare the lines.  Passing MyersSequenceMatcher or
+    PatienceSequenceMatcher makes diffs of large inputs much faster.
+
     Example:
 
     >>> for line in unified_diff('one two three four'.split(),
@@ -1175,7 +1457,7 @@ def unified_diff(a, b, fromfile='', tofile='', fromfiledate='',
 
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in matcher(None,a,b).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1218,7 +1500,8 @@ def _format_range_context(start, stop):
 
 # See http://www.unix.org/single_unix_specification/
 def context_diff(a, b, fromfile='', tofile='',
-                 fromfiledate='', tofiledate='', n=3, lineterm='\n'):
+                 fromfiledate='', tofiledate='', n=3, lineterm='\n', *,
+                 matcher=SequenceMatcher):
     r"""
     Compare two sequences of lines; generate the delta as a context diff.
 
@@ -1241,6 +1524,10 @@ def context_diff(a, b, fromfile='', tofile='',
     The modification times are normally expressed in the ISO 8601 format.
     If not specified, the strings default to blanks.
 
+    The optional keyword argument 'matcher' is the SequenceMatcher class
+    used to compare the lines.  Passing MyersSequenceMatcher or
+    PatienceSequenceMatcher makes diffs of large inputs much faster.
+
     Example:
 
     >>> print(''.join(context_diff('one\ntwo\nthree\nfour\n'.splitlines(True),
@@ -1264,7 +1551,7 @@ def context_diff(a, b, fromfile='', tofile='',
     _check_types(a, b, fromfile, tofile, fromfiledate, tofiledate, lineterm)
     prefix = dict(insert='+ ', delete='- ', replace='! ', equal='  ')
     started = False
-    for group in SequenceMatcher(None,a,b).get_grouped_opcodes(n):
+    for group in matcher(None,a,b).get_grouped_opcodes(n):
         if not started:
             started = True
             fromdate = '\t{}'.format(fromfiledate) if fromfiledate else ''
@@ -1340,7 +1627,8 @@ def diff_bytes(dfunc, a, b, fromfile=b'', tofile=b'',
     for line in lines:
         yield line.encode('ascii', 'surrogateescape')
 
-def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
+def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK, *,
+          matcher=SequenceMatcher):
     r"""
     Compare `a` and `b` (lists of strings); return a `Differ`-style delta.
 
@@ -1358,6 +1646,9 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
       whitespace characters (a blank or tab; note: it's a bad idea to
       include newline in this!).
 
+    The optional keyword parameter `matcher` is the SequenceMatcher class
+    used to compare the sequences of lines, see Differ.
+
     Tools/scripts/ndiff.py is a command-line front-end to this function.
 
     Example:
@@ -1375,7 +1666,7 @@ def ndiff(a, b, linejunk=None, charjunk=IS_CHARACTER_JUNK):
     + tree
     + emu
     """
-    return Differ(linejunk, charjunk).compare(a, b)
+    return Differ(linejunk, charjunk, matcher=matcher).compare(a, b)
 
 def _mdiff(fromlines, tolines, context=None, linejunk=None,
            charjunk=IS_CHARACTER_JUNK):
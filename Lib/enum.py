@@ -179,6 +179,8 @@ class EnumMeta(type):
 
         # Reverse value->name map for hashable values.
         enum_class._value2member_map_ = {}
+        # members whose values are not hashable, and so are not in the map
+        unhashable_members = []
 
         # If a custom type is mixed into the Enum, and it does not know how
         # to pickle itself, pickle.dumps will succeed but pickle.loads will
@@ -225,11 +227,19 @@ class EnumMeta(type):
             enum_member.__objclass__ = enum_class
             enum_member.__init__(*args)
             # If another member with the same value was already defined, the
-            # new member becomes an alias to the existing one.
-            for name, canonical_member in enum_class._member_map_.items():
-                if canonical_member._value_ == enum_member._value_:
-                    enum_member = canonical_member
-                    break
+            # new member becomes an alias to the existing one.  Look it up in
+            # the reverse mapping first; only members with unhashable values
+            # need to be compared one by one.
+            try:
+                canonical_member = enum_class._value2member_map_[value]
+            except (KeyError, TypeError):
+                for canonical_member in unhashable_members:
+                    if canonical_member._value_ == value:
+                        break
+                else:
+                    canonical_member = None
+            if canonical_member is not None:
+                enum_member = canonical_member
             else:
                 # Aliases don't appear in member names (only in __members__).
                 enum_class._member_names_.append(member_name)
@@ -245,7 +255,7 @@ class EnumMeta(type):
                 # linear.
                 enum_class._value2member_map_[value] = enum_member
             except TypeError:
-                pass
+                unhashable_members.append(enum_member)
 
         # double check that repr and friends are not the mixin's or various
         # things break (such as pickle)
@@ -306,6 +316,11 @@ class EnumMeta(type):
 
         """
         if names is None:  # simple value lookup
+            # fast path for values of existing members and cached pseudo-members
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
             return cls.__new__(cls, value)
         # otherwise, functional API: we're creating a new Enum type
         return cls._create_(value, names, module=module, qualname=qualname, type=type, start=start)
@@ -709,9 +724,10 @@ class Flag(Enum):
         pseudo_member = cls._value2member_map_.get(value, None)
         if pseudo_member is None:
             # verify all bits are accounted for
-            _, extra_flags = _decompose(cls, value)
-            if extra_flags:
-                raise ValueError("%r is not a valid %s" % (value, cls.__qualname__))
+            if value & ~_singles_mask(cls):
+                _, extra_flags = _decompose(cls, value)
+                if extra_flags:
+                    raise ValueError("%r is not a valid %s" % (value, cls.__qualname__))
             # construct a singleton enum pseudo-member
             pseudo_member = object.__new__(cls)
             pseudo_member._name_ = None
@@ -795,7 +811,10 @@ class IntFlag(int, Flag):
         if pseudo_member is None:
             need_to_create = [value]
             # get unaccounted for bits
-            _, extra_flags = _decompose(cls, value)
+            if value < 0 or value & ~_singles_mask(cls):
+                _, extra_flags = _decompose(cls, value)
+            else:
+                extra_flags = 0
             # timer = 10
             while extra_flags:
                 # timer -= 1
@@ -822,18 +841,17 @@ class IntFlag(int, Flag):
     def __or__(self, other):
         if not isinstance(other, (self.__class__, int)):
             return NotImplemented
-        result = self.__class__(self._value_ | self.__class__(other)._value_)
-        return result
+        return self.__class__(self._value_ | int(other))
 
     def __and__(self, other):
         if not isinstance(other, (self.__class__, int)):
             return NotImplemented
-        return self.__class__(self._value_ & self.__class__(other)._value_)
+        return self.__class__(self._value_ & int(other))
 
     def __xor__(self, other):
         if not isinstance(other, (self.__class__, int)):
             return NotImplemented
-        return self.__class__(self._value_ ^ self.__class__(other)._value_)
+        return self.__class__(self._value_ ^ int(other))
 
     __ror__ = __or__
     __rand__ = __and__
@@ -848,6 +866,23 @@ def _high_bit(value):
     """returns index of highest bit, or -1 if value is zero or negative"""
     return value.bit_length() - 1
 
+def _singles_mask(flag):
+    """Return the bits of the single-bit members of flag.
+
+    Any non-negative value made only of these bits is a valid composite
+    member, so it does not need to be decomposed.  The mask is computed
+    once and stored on the class.
+    """
+    mask = flag.__dict__.get('_singles_mask_')
+    if mask is None:
+        mask = 0
+        for member in flag._member_map_.values():
+            value = member._value_
+            if isinstance(value, int) and value > 0 and not value & (value - 1):
+                mask |= value
+        type.__setattr__(flag, '_singles_mask_', mask)
+    return mask
+
 def unique(enumeration):
     """Class decorator for enumerations ensuring unique member values."""
     duplicates = []
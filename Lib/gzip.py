@@ -10,6 +10,7 @@ import zlib
 import builtins
 import io
 import _compression
+from bisect import bisect_right
 
 __all__ = ["BadGzipFile", "GzipFile", "open", "compress", "decompress"]
 
@@ -21,9 +22,21 @@ _COMPRESS_LEVEL_FAST = 1
 _COMPRESS_LEVEL_TRADEOFF = 6
 _COMPRESS_LEVEL_BEST = 9
 
+# Amount of data compressed by each thread in multi-threaded mode.
+_THREADED_BLOCK_SIZE = 128 * 1024
+
+# Default amount of uncompressed data between the checkpoints of an index.
+_INDEX_SPACING = 1024 * 1024
+# Amount of uncompressed data saved at each checkpoint: the size of the
+# window in which deflate looks for back-references.
+_WINDOW_SIZE = 32 * 1024
+_INDEX_MAGIC = b"PYGZIDX\0"
+_INDEX_HEADER = struct.Struct("<8sQq")  # magic, checkpoints, data size
+_INDEX_ENTRY = struct.Struct("<QQBI")   # position, offset, bits, window size
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, workers=None):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object), or
@@ -34,8 +47,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
     "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile constructor:
-    GzipFile(filename, mode, compresslevel). In this case, the encoding, errors
-    and newline arguments must not be provided.
+    GzipFile(filename, mode, compresslevel, workers=workers). In this case, the
+    encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
     io.TextIOWrapper instance with the specified encoding, error handling
@@ -55,9 +68,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_BEST,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel)
+        binary_file = GzipFile(filename, gz_mode, compresslevel,
+                               workers=workers)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
-        binary_file = GzipFile(None, gz_mode, compresslevel, filename)
+        binary_file = GzipFile(None, gz_mode, compresslevel, filename,
+                               workers=workers)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -109,6 +124,11 @@ class _PaddedFile:
         self._buffer = None
         return self.file.seek(off)
 
+    def tell(self):
+        if self._read is None:
+            return self.file.tell()
+        return self.file.tell() - self._length + self._read
+
     def seekable(self):
         return True  # Allows fast-forwarding even in unseekable streams
 
@@ -117,6 +137,39 @@ class BadGzipFile(OSError):
     """Exception raised in some cases for invalid gzip files."""
 
 
+class _ThreadedDeflater(_compression.ThreadedCompressor):
+    """Multi-threaded compressor for the deflate data of a gzip member.
+
+    Like pigz, each block is compressed as raw deflate data, using the
+    last 32 KiB of the previous block as preset dictionary, and all
+    blocks but the last are ended with a sync flush.  Their concatenation
+    is a single deflate stream, so the file is not larger than the one
+    written by a single thread by more than a few bytes per block.
+    """
+
+    def __init__(self, compresslevel, workers):
+        super().__init__(self._deflate, workers, _THREADED_BLOCK_SIZE)
+        self._compresslevel = compresslevel
+
+    def _deflate(self, block, previous, final):
+        if previous:
+            compress = zlib.compressobj(self._compresslevel, zlib.DEFLATED,
+                                        -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                        0, previous[-32768:])
+        else:
+            compress = zlib.compressobj(self._compresslevel, zlib.DEFLATED,
+                                        -zlib.MAX_WBITS, zlib.DEF_MEM_LEVEL,
+                                        0)
+        return compress.compress(block) + compress.flush(
+            zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        data = super().flush(mode == zlib.Z_FINISH)
+        if mode == zlib.Z_FULL_FLUSH:
+            self.reset()
+        return data
+
+
 class GzipFile(_compression.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -131,7 +184,8 @@ class GzipFile(_compression.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_BEST, fileobj=None, mtime=None,
+                 *, workers=None):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -163,6 +217,10 @@ class GzipFile(_compression.BaseStream):
         to the last modification time field in the stream when compressing.
         If omitted or None, the current time is used.
 
+        If workers is greater than 1, data written is compressed in blocks
+        by that many threads.  The result is a regular gzip file, slightly
+        larger than when compressing on a single thread.
+
         """
 
         if mode and ('t' in mode or 'U' in mode):
@@ -197,11 +255,14 @@ class GzipFile(_compression.BaseStream):
                     FutureWarning, 2)
             self.mode = WRITE
             self._init_write(filename)
-            self.compress = zlib.compressobj(compresslevel,
-                                             zlib.DEFLATED,
-                                             -zlib.MAX_WBITS,
-                                             zlib.DEF_MEM_LEVEL,
-                                             0)
+            if workers is not None and workers > 1:
+                self.compress = _ThreadedDeflater(compresslevel, workers)
+            else:
+                self.compress = zlib.compressobj(compresslevel,
+                                                 zlib.DEFLATED,
+                                                 -zlib.MAX_WBITS,
+                                                 zlib.DEF_MEM_LEVEL,
+                                                 0)
             self._write_mtime = mtime
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -397,6 +458,70 @@ class GzipFile(_compression.BaseStream):
         self._check_not_closed()
         return self._buffer.readline(size)
 
+    def build_index(self, spacing=_INDEX_SPACING):
+        '''Build an index of checkpoints to make seeking fast.
+
+        The whole file is decompressed once, and the state needed to resume
+        decompressing is saved about every *spacing* bytes of uncompressed
+        data.  Afterwards, seek() only decompresses the data from the
+        nearest checkpoint.  The file position is preserved.
+        '''
+        self._check_not_closed()
+        self._check_can_read()
+        if spacing <= 0:
+            raise ValueError("spacing must be positive")
+        self._buffer.raw._build_index(spacing)
+
+    def save_index(self, file):
+        '''Write the index built by build_index() to *file*, a path or a
+        binary file object, so that it can be passed to load_index().'''
+        self._check_not_closed()
+        self._check_can_read()
+        raw = self._buffer.raw
+        entries = [_INDEX_HEADER.pack(_INDEX_MAGIC, len(raw._index),
+                                      raw._size)]
+        for pos, offset, bits, window in raw._index:
+            entries.append(_INDEX_ENTRY.pack(pos, offset, bits, len(window)))
+            entries.append(window)
+        data = b"".join(entries)
+
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, "wb") as f:
+                f.write(data)
+        else:
+            file.write(data)
+
+    def load_index(self, file):
+        '''Load an index written by save_index() from *file*, a path or a
+        binary file object.  The index must have been built from the same
+        gzip file.'''
+        self._check_not_closed()
+        self._check_can_read()
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with builtins.open(file, "rb") as f:
+                data = f.read()
+        else:
+            data = file.read()
+
+        try:
+            magic, count, size = _INDEX_HEADER.unpack_from(data)
+            if magic != _INDEX_MAGIC:
+                raise BadGzipFile("Not a gzip index file")
+            index = []
+            pos = _INDEX_HEADER.size
+            for i in range(count):
+                entry = _INDEX_ENTRY.unpack_from(data, pos)
+                pos += _INDEX_ENTRY.size
+                window = data[pos:pos + entry[3]]
+                if len(window) < entry[3]:
+                    raise struct.error
+                pos += entry[3]
+                index.append(entry[:3] + (window,))
+        except struct.error:
+            raise BadGzipFile("Truncated gzip index file") from None
+
+        self._buffer.raw._set_index(index, size)
+
 
 class _GzipReader(_compression.DecompressReader):
     def __init__(self, fp):
@@ -405,6 +530,16 @@ class _GzipReader(_compression.DecompressReader):
         # Set flag indicating start of a new member
         self._new_member = True
         self._last_mtime = None
+        # Checkpoints (pos, offset, bits, window) from which decompression
+        # can be resumed: pos is the position in the uncompressed data,
+        # offset the position in the file, bits the number of bits of the
+        # byte before offset which are still to be decompressed, and
+        # window the preceding uncompressed data, compressed with zlib.
+        self._index = []
+        self._index_pos = []
+        # Set while building the index.
+        self._index_spacing = None
+        self._window = b""
 
     def _init_read(self):
         self._crc = zlib.crc32(b"")
@@ -492,13 +627,18 @@ class _GzipReader(_compression.DecompressReader):
             # Read a chunk of data from the file
             buf = self._fp.read(io.DEFAULT_BUFFER_SIZE)
 
-            uncompress = self._decompressor.decompress(buf, size)
+            # When building the index, stop at the end of each deflate
+            # block to be able to save a checkpoint there.
+            uncompress = self._decompressor.decompress(
+                buf, size, block=self._index_spacing is not None)
             if self._decompressor.unconsumed_tail != b"":
                 self._fp.prepend(self._decompressor.unconsumed_tail)
             elif self._decompressor.unused_data != b"":
                 # Prepend the already read bytes to the fileobj so they can
                 # be seen by _read_eof() and _read_gzip_header()
                 self._fp.prepend(self._decompressor.unused_data)
+            if self._index_spacing is not None:
+                self._add_checkpoint(uncompress)
 
             if uncompress != b"":
                 break
@@ -511,7 +651,8 @@ class _GzipReader(_compression.DecompressReader):
         return uncompress
 
     def _add_read_data(self, data):
-        self._crc = zlib.crc32(data, self._crc)
+        if self._crc is not None:
+            self._crc = zlib.crc32(data, self._crc)
         self._stream_size = self._stream_size + len(data)
 
     def _read_eof(self):
@@ -520,7 +661,11 @@ class _GzipReader(_compression.DecompressReader):
         # uncompressed data matches the stored values.  Note that the size
         # stored is the true file size mod 2**32.
         crc32, isize = struct.unpack("<II", self._read_exact(8))
-        if crc32 != self._crc:
+        if self._crc is None:
+            # The member was entered at a checkpoint, the CRC and size of
+            # the data before it are unknown.
+            pass
+        elif crc32 != self._crc:
             raise BadGzipFile("CRC check failed %s != %s" % (hex(crc32),
                                                              hex(self._crc)))
         elif isize != (self._stream_size & 0xffffffff):
@@ -539,6 +684,68 @@ class _GzipReader(_compression.DecompressReader):
         super()._rewind()
         self._new_member = True
 
+    def seek(self, offset, whence=io.SEEK_SET):
+        if self._index:
+            if whence == io.SEEK_CUR:
+                offset, whence = self._pos + offset, io.SEEK_SET
+            elif whence == io.SEEK_END and self._size >= 0:
+                offset, whence = self._size + offset, io.SEEK_SET
+            if whence == io.SEEK_SET:
+                # Resume from the last checkpoint before offset, unless
+                # the current position is between them.
+                i = bisect_right(self._index_pos, offset) - 1
+                if i >= 0 and not self._index_pos[i] <= self._pos <= offset:
+                    self._restore(self._index[i])
+        return super().seek(offset, whence)
+
+    def _restore(self, checkpoint):
+        pos, offset, bits, window = checkpoint
+        self._decompressor = self._decomp_factory(
+            zdict=zlib.decompress(window), **self._decomp_args)
+        if bits:
+            # The block starts with the high bits of the previous byte.
+            self._fp.seek(offset - 1)
+            self._decompressor.prime(bits, self._fp.read(1)[0] >> (8 - bits))
+        else:
+            self._fp.seek(offset)
+        self._new_member = False
+        self._crc = None
+        self._stream_size = 0
+        self._eof = False
+        self._pos = pos
+
+    def _add_checkpoint(self, data):
+        # Called with each decompressed chunk while building the index.
+        self._window = (self._window + data)[-_WINDOW_SIZE:]
+        bits = self._decompressor.boundary_bits
+        if bits < 0 or self._decompressor.eof:
+            return
+        pos = self._pos + len(data)
+        if pos - (self._index_pos[-1] if self._index else 0) >= \
+                self._index_spacing:
+            self._index.append((pos, self._fp.tell(), bits,
+                                zlib.compress(self._window, 1)))
+            self._index_pos.append(pos)
+
+    def _build_index(self, spacing):
+        pos = self._pos
+        self._rewind()
+        self._set_index([], -1)
+        self._index_spacing = spacing
+        try:
+            while self.read(io.DEFAULT_BUFFER_SIZE):
+                pass
+        finally:
+            self._index_spacing = None
+            self._window = b""
+        self.seek(pos)
+
+    def _set_index(self, index, size):
+        self._index = index
+        self._index_pos = [checkpoint[0] for checkpoint in index]
+        if size >= 0:
+            self._size = size
+
 def compress(data, compresslevel=_COMPRESS_LEVEL_BEST, *, mtime=None):
     """Compress data in one shot and return the compressed string.
     Optional argument is the compression level, in range of 0-9.
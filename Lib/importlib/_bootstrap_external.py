@@ -277,6 +277,7 @@ _code_type = type(_write_atomic.__code__)
 #     Python 3.9a2  3423 (add IS_OP, CONTAINS_OP and JUMP_IF_NOT_EXC_MATCH bytecodes #39156)
 #     Python 3.9a2  3424 (simplify bytecodes for *value unpacking)
 #     Python 3.9a2  3425 (simplify bytecodes for **value unpacking)
+#     Python 3.10a0 3430 (marshal version 5: lazily loaded function bodies)
 
 #
 # MAGIC must change whenever the bytecode emitted by the compiler may no
@@ -286,7 +287,7 @@ _code_type = type(_write_atomic.__code__)
 # Whenever MAGIC_NUMBER is changed, the ranges in the magic_values array
 # in PC/launcher.c must also be updated.
 
-MAGIC_NUMBER = (3425).to_bytes(2, 'little') + b'\r\n'
+MAGIC_NUMBER = (3430).to_bytes(2, 'little') + b'\r\n'
 _RAW_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER, 'little')  # For import.c
 
 _PYCACHE = '__pycache__'
@@ -584,7 +585,7 @@ def _validate_hash_pyc(data, source_hash, name, exc_details):
 
 def _compile_bytecode(data, name=None, bytecode_path=None, source_path=None):
     """Compile bytecode as found in a pyc."""
-    code = marshal.loads(data)
+    code = marshal.loads(data, lazy=sys.flags.lazy_code)
     if isinstance(code, _code_type):
         _bootstrap._verbose_message('code object from {!r}', bytecode_path)
         if source_path is not None:
@@ -1514,6 +1515,209 @@ class FileFinder:
         return 'FileFinder({!r})'.format(self.path)
 
 
+# Code archives ###############################################################
+
+_CODE_ARCHIVE_MAGIC = b'PYCA'
+
+# Opened code archives, keyed by their path.  An archive is reopened when the
+# file is replaced.
+_code_archive_cache = {}
+
+
+class _CodeArchive:
+
+    """Read-only archive of bytecode files, as written by
+    compileall.write_archive().
+
+    The archive starts with _CODE_ARCHIVE_MAGIC, MAGIC_NUMBER and the size of
+    a marshalled (directories, files) tuple, which follows.  directories maps
+    each directory to the frozenset of names of the modules archived in it:
+    source file names, or bytecode file names for sourceless modules.  files
+    maps the path of each bytecode file to its offset and size in the data
+    following the index.  The file is memory mapped, so that processes using
+    the same archive share its pages.
+
+    """
+
+    def __init__(self, path, stat_key):
+        self.path = path
+        self.stat_key = stat_key
+        try:
+            import mmap
+        except ImportError:
+            mmap = None
+        with _io.open_code(path) as file:
+            header = file.read(12)
+            if (len(header) != 12 or header[:4] != _CODE_ARCHIVE_MAGIC or
+                    header[4:8] != MAGIC_NUMBER):
+                raise ImportError(f'bad code archive: {path!r}', path=path)
+            index_size = _unpack_uint32(header[8:])
+            if mmap is None:
+                data = header + file.read()
+            else:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(data)
+        try:
+            self.directories, self.files = marshal.loads(
+                data[12:12 + index_size])
+        except (EOFError, ValueError, TypeError) as exc:
+            raise ImportError(f'bad code archive: {path!r}',
+                              path=path) from exc
+        self._data = data[12 + index_size:]
+
+    def get_data(self, path):
+        """Return the archived data of path, or None if it isn't archived."""
+        try:
+            offset, size = self.files[path]
+        except KeyError:
+            return None
+        return self._data[offset:offset + size]
+
+
+def _get_code_archive(path):
+    st = _path_stat(path)
+    stat_key = st.st_ino, st.st_size, st.st_mtime
+    archive = _code_archive_cache.get(path)
+    if archive is None or archive.stat_key != stat_key:
+        archive = _code_archive_cache[path] = _CodeArchive(path, stat_key)
+    return archive
+
+
+class _CodeArchiveFileLoader:
+
+    """Mixin for file loaders reading bytecode from a code archive."""
+
+    def __init__(self, fullname, path, archive):
+        super(_CodeArchiveFileLoader, self).__init__(fullname, path)
+        self._archive = archive
+
+    def get_data(self, path):
+        """Return the data from path, from the code archive if it holds it."""
+        data = self._archive.get_data(path)
+        if data is None:
+            return super(_CodeArchiveFileLoader, self).get_data(path)
+        return bytes(data)
+
+
+class _CodeArchiveSourceLoader(_CodeArchiveFileLoader, SourceFileLoader):
+
+    """Source file loader reading the cached bytecode from a code archive."""
+
+
+class _CodeArchiveSourcelessLoader(_CodeArchiveFileLoader,
+                                   SourcelessFileLoader):
+
+    """Sourceless file loader reading the bytecode from a code archive."""
+
+
+class CodeArchiveFinder(FileFinder):
+
+    """File-based finder reading the bytecode of modules from a code archive.
+
+    Modules are looked up like FileFinder does.  The bytecode of the modules
+    stored in the archive is read from the memory mapped archive rather than
+    from the __pycache__ directories, and modules which were only archived as
+    bytecode are found even without a file.
+
+    """
+
+    def __init__(self, path, archive, *loader_details):
+        """Initialize with the path to search on, the path of the code
+        archive and the loaders used for the modules which are not in the
+        archive, defaulting to the loaders of the default FileFinder."""
+        if not loader_details:
+            loader_details = _get_supported_file_loaders()
+        super(CodeArchiveFinder, self).__init__(path, *loader_details)
+        self.archive = archive
+        self._archive = _get_code_archive(archive)
+        self._archive_loaders = (
+            [(suffix, _CodeArchiveSourceLoader) for suffix in SOURCE_SUFFIXES] +
+            [(suffix, _CodeArchiveSourcelessLoader)
+             for suffix in BYTECODE_SUFFIXES])
+
+    def invalidate_caches(self):
+        """Invalidate the directory mtime and reopen the code archive if it
+        was replaced."""
+        super(CodeArchiveFinder, self).invalidate_caches()
+        try:
+            self._archive = _get_code_archive(self.archive)
+        except (OSError, ImportError):
+            # The archive was removed or is invalid: keep the one opened
+            pass
+
+    def _get_archive_loader(self, path):
+        """Return the loader class reading path from the archive, or None if
+        it isn't archived."""
+        dirname, filename = _path_split(path)
+        if filename not in self._archive.directories.get(dirname, ()):
+            return None
+        for suffix, loader_class in self._archive_loaders:
+            if filename.endswith(suffix):
+                return loader_class
+        return None
+
+    def _get_spec(self, loader_class, fullname, path, smsl, target):
+        archive_loader = self._get_archive_loader(path)
+        if archive_loader is None:
+            return super(CodeArchiveFinder, self)._get_spec(
+                loader_class, fullname, path, smsl, target)
+        loader = archive_loader(fullname, path, self._archive)
+        return spec_from_file_location(fullname, path, loader=loader,
+                                       submodule_search_locations=smsl)
+
+    def find_spec(self, fullname, target=None):
+        """Try to find a spec for the specified module.
+
+        Returns the matching spec, or None if not found.
+        """
+        spec = super(CodeArchiveFinder, self).find_spec(fullname, target)
+        if spec is not None and spec.loader is not None:
+            return spec
+        # Fall back on the modules only archived as bytecode
+        tail_module = fullname.rpartition('.')[2]
+        base_path = _path_join(self.path, tail_module)
+        candidates = [
+            (_path_join(base_path, '__init__' + suffix), [base_path])
+            for suffix in BYTECODE_SUFFIXES]
+        candidates += [(_path_join(self.path, tail_module + suffix), None)
+                       for suffix in BYTECODE_SUFFIXES]
+        for full_path, smsl in candidates:
+            if self._get_archive_loader(full_path) is not None:
+                return self._get_spec(None, fullname, full_path, smsl,
+                                      target)
+        return spec
+
+    @classmethod
+    def path_hook(cls, archive, *loader_details):
+        """A class method which returns a closure to use on sys.path_hook
+        which will return an instance using the specified code archive and
+        loaders and the path called on the closure.
+
+        The archive is opened when the closure is created.  If the path
+        called on the closure is not a directory stored in the archive,
+        ImportError is raised.
+
+        """
+        _get_code_archive(archive)
+
+        def path_hook_for_CodeArchiveFinder(path):
+            """Path hook for importlib.machinery.CodeArchiveFinder."""
+            try:
+                directories = _get_code_archive(archive).directories
+            except OSError:
+                # The archive was removed: use the other path hooks
+                directories = ()
+            if path not in directories:
+                raise ImportError('only directories stored in the code '
+                                  'archive are supported', path=path)
+            return cls(path, archive, *loader_details)
+
+        return path_hook_for_CodeArchiveFinder
+
+    def __repr__(self):
+        return 'CodeArchiveFinder({!r}, {!r})'.format(self.path, self.archive)
+
+
 # Import setup ###############################################################
 
 def _fix_up_module(ns, name, pathname, cpathname=None):
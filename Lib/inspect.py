@@ -48,6 +48,8 @@ import types
 import warnings
 import functools
 import builtins
+import operator
+import weakref
 from operator import attrgetter
 from collections import namedtuple, OrderedDict
 
@@ -1476,6 +1478,13 @@ def getframeinfo(frame, context=1):
     the source code, and the index of the current line within that list.
     The optional second argument specifies the number of lines of context
     to return, which are centered around the current line."""
+    return _getframeinfo(frame, context, None)
+
+def _getframeinfo(frame, context, sources):
+    # sources is either None or a dict shared between the calls made for
+    # the frames of one stack.  It maps the filename of a code object to
+    # the source file name and lines, so that they are looked up once
+    # per file instead of once per frame.
     if istraceback(frame):
         lineno = frame.tb_lineno
         frame = frame.tb_frame
@@ -1484,13 +1493,23 @@ def getframeinfo(frame, context=1):
     if not isframe(frame):
         raise TypeError('{!r} is not a frame or traceback object'.format(frame))
 
-    filename = getsourcefile(frame) or getfile(frame)
+    code_filename = frame.f_code.co_filename
+    if sources is not None and code_filename in sources:
+        filename, lines = sources[code_filename]
+    else:
+        filename = getsourcefile(frame) or getfile(frame)
+        lines = None
+        if context > 0:
+            try:
+                lines, lnum = findsource(frame)
+            except OSError:
+                pass
+        if sources is not None:
+            sources[code_filename] = filename, lines
     if context > 0:
         start = lineno - 1 - context//2
-        try:
-            lines, lnum = findsource(frame)
-        except OSError:
-            lines = index = None
+        if lines is None:
+            index = None
         else:
             start = max(0, min(start, len(lines) - context))
             lines = lines[start:start+context]
@@ -1507,26 +1526,30 @@ def getlineno(frame):
 
 FrameInfo = namedtuple('FrameInfo', ('frame',) + Traceback._fields)
 
-def getouterframes(frame, context=1):
+def getouterframes(frame, context=1, *, limit=None):
     """Get a list of records for a frame and all higher (calling) frames.
 
     Each record contains a frame object, filename, line number, function
-    name, a list of lines of context, and index within the context."""
+    name, a list of lines of context, and index within the context.  If
+    limit is given, at most that many records are returned."""
     framelist = []
-    while frame:
-        frameinfo = (frame,) + getframeinfo(frame, context)
+    sources = {}
+    while frame and (limit is None or len(framelist) < limit):
+        frameinfo = (frame,) + _getframeinfo(frame, context, sources)
         framelist.append(FrameInfo(*frameinfo))
         frame = frame.f_back
     return framelist
 
-def getinnerframes(tb, context=1):
+def getinnerframes(tb, context=1, *, limit=None):
     """Get a list of records for a traceback's frame and all lower frames.
 
     Each record contains a frame object, filename, line number, function
-    name, a list of lines of context, and index within the context."""
+    name, a list of lines of context, and index within the context.  If
+    limit is given, at most that many records are returned."""
     framelist = []
-    while tb:
-        frameinfo = (tb.tb_frame,) + getframeinfo(tb, context)
+    sources = {}
+    while tb and (limit is None or len(framelist) < limit):
+        frameinfo = (tb.tb_frame,) + _getframeinfo(tb, context, sources)
         framelist.append(FrameInfo(*frameinfo))
         tb = tb.tb_next
     return framelist
@@ -1535,13 +1558,13 @@ def currentframe():
     """Return the frame of the caller or None if this is not possible."""
     return sys._getframe(1) if hasattr(sys, "_getframe") else None
 
-def stack(context=1):
+def stack(context=1, *, limit=None):
     """Return a list of records for the stack above the caller's frame."""
-    return getouterframes(sys._getframe(1), context)
+    return getouterframes(sys._getframe(1), context, limit=limit)
 
-def trace(context=1):
+def trace(context=1, *, limit=None):
     """Return a list of records for the stack below the current exception."""
-    return getinnerframes(sys.exc_info()[2], context)
+    return getinnerframes(sys.exc_info()[2], context, limit=limit)
 
 
 # ------------------------------------------------ static version of getattr
@@ -1909,6 +1932,9 @@ def _signature_get_bound_param(spec):
     return spec[2:pos]
 
 
+# Builtins share a small number of distinct text signatures, so
+# remember the result of re-rendering them.
+@functools.lru_cache(maxsize=1024)
 def _signature_strip_non_python_syntax(signature):
     """
     Private helper function. Takes a signature in Argument Clinic's
@@ -2135,9 +2161,58 @@ def _signature_from_builtin(cls, func, skip_bound_arg=True):
     return _signature_fromstr(cls, func, s, skip_bound_arg)
 
 
+# Signatures computed for pure Python functions.  Maps each function
+# to a dict mapping the Signature class to a (state, signature) pair,
+# where state is what _signature_function_state() returned when the
+# signature was computed.
+_signature_cache = weakref.WeakKeyDictionary()
+
+
+def _signature_function_state(func):
+    """Private helper: returns a list of the objects that the signature
+    of a python function depends on.
+
+    The lists are compared item by item with "is", since defaults and
+    annotations can compare equal to different values, or fail to compare.
+    The items of the dicts are included as they can be changed in place.
+    """
+    state = [func.__code__, func.__defaults__]
+    for mapping in func.__kwdefaults__, func.__annotations__:
+        state.append(mapping)
+        if mapping is not None:
+            for item in mapping.items():
+                state.extend(item)
+    return state
+
+
 def _signature_from_function(cls, func, skip_bound_arg=True):
     """Private helper: constructs Signature for the given python function."""
 
+    if not isfunction(func) or hasattr(func, "__text_signature__"):
+        return _signature_from_function_uncached(cls, func, skip_bound_arg)
+
+    # Signature and Parameter objects are immutable, so the same one can
+    # be returned for as long as the function isn't changed.
+    state = _signature_function_state(func)
+    try:
+        entries = _signature_cache[func]
+    except KeyError:
+        entries = _signature_cache[func] = {}
+    else:
+        entry = entries.get(cls)
+        if (entry is not None and len(entry[0]) == len(state) and
+            all(map(operator.is_, entry[0], state))):
+            return entry[1]
+    sig = _signature_from_function_uncached(cls, func, skip_bound_arg)
+    entries[cls] = (state, sig)
+    return sig
+
+
+def _signature_from_function_uncached(cls, func, skip_bound_arg=True):
+    """Private helper: constructs Signature for the given python function,
+    bypassing the cache.
+    """
+
     is_duck_function = False
     if not isfunction(func):
         if _signature_is_functionlike(func):
@@ -2152,6 +2227,12 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
         return _signature_fromstr(cls, func, s, skip_bound_arg)
 
     Parameter = cls._parameter_cls
+    if is_duck_function:
+        make_param = Parameter
+    else:
+        # The parameters are read from a code object, so they don't need
+        # to be validated again.
+        make_param = getattr(Parameter, '_from_code', Parameter)
 
     # Parameter information.
     func_code = func.__code__
@@ -2179,8 +2260,8 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
     for name in positional[:non_default_count]:
         kind = _POSITIONAL_ONLY if posonly_left else _POSITIONAL_OR_KEYWORD
         annotation = annotations.get(name, _empty)
-        parameters.append(Parameter(name, annotation=annotation,
-                                    kind=kind))
+        parameters.append(make_param(name, annotation=annotation,
+                                     kind=kind))
         if posonly_left:
             posonly_left -= 1
 
@@ -2188,9 +2269,9 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
     for offset, name in enumerate(positional[non_default_count:]):
         kind = _POSITIONAL_ONLY if posonly_left else _POSITIONAL_OR_KEYWORD
         annotation = annotations.get(name, _empty)
-        parameters.append(Parameter(name, annotation=annotation,
-                                    kind=kind,
-                                    default=defaults[offset]))
+        parameters.append(make_param(name, annotation=annotation,
+                                     kind=kind,
+                                     default=defaults[offset]))
         if posonly_left:
             posonly_left -= 1
 
@@ -2198,8 +2279,8 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
     if func_code.co_flags & CO_VARARGS:
         name = arg_names[pos_count + keyword_only_count]
         annotation = annotations.get(name, _empty)
-        parameters.append(Parameter(name, annotation=annotation,
-                                    kind=_VAR_POSITIONAL))
+        parameters.append(make_param(name, annotation=annotation,
+                                     kind=_VAR_POSITIONAL))
 
     # Keyword-only parameters.
     for name in keyword_only:
@@ -2208,9 +2289,9 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
             default = kwdefaults.get(name, _empty)
 
         annotation = annotations.get(name, _empty)
-        parameters.append(Parameter(name, annotation=annotation,
-                                    kind=_KEYWORD_ONLY,
-                                    default=default))
+        parameters.append(make_param(name, annotation=annotation,
+                                     kind=_KEYWORD_ONLY,
+                                     default=default))
     # **kwargs
     if func_code.co_flags & CO_VARKEYWORDS:
         index = pos_count + keyword_only_count
@@ -2219,8 +2300,8 @@ def _signature_from_function(cls, func, skip_bound_arg=True):
 
         name = arg_names[index]
         annotation = annotations.get(name, _empty)
-        parameters.append(Parameter(name, annotation=annotation,
-                                    kind=_VAR_KEYWORD))
+        parameters.append(make_param(name, annotation=annotation,
+                                     kind=_VAR_KEYWORD))
 
     # Is 'func' is a pure Python function - don't validate the
     # parameters list (for correct order and defaults), it should be OK.
@@ -2540,6 +2621,21 @@ class Parameter:
 
         self._name = name
 
+    @classmethod
+    def _from_code(cls, name, kind, *, default=_empty, annotation=_empty):
+        # Cheaper constructor for parameters known to be valid.  Falls
+        # back to full validation for subclasses that customize creation
+        # and for implicit comprehension arguments, which get renamed.
+        if (cls.__init__ is not Parameter.__init__
+                or cls.__new__ is not object.__new__ or name[0] == '.'):
+            return cls(name, kind, default=default, annotation=annotation)
+        self = object.__new__(cls)
+        self._name = name
+        self._kind = kind
+        self._default = default
+        self._annotation = annotation
+        return self
+
     def __reduce__(self):
         return (type(self),
                 (self._name, self._kind),
@@ -11,6 +11,7 @@ and networks.
 __version__ = '1.0'
 
 
+import _collections_abc
 import functools
 
 IPV4LENGTH = 32
@@ -1124,6 +1125,23 @@ class _BaseNetwork(_IPAddressBase):
         return (self.network_address.is_loopback and
                 self.broadcast_address.is_loopback)
 
+
+@functools.lru_cache(maxsize=1024)
+def _ipv4_int_from_string(ip_str):
+    """Cached helper of _BaseV4._ip_int_from_string()."""
+    if not ip_str:
+        raise AddressValueError('Address cannot be empty')
+
+    octets = ip_str.split('.')
+    if len(octets) != 4:
+        raise AddressValueError("Expected 4 octets in %r" % ip_str)
+
+    try:
+        return int.from_bytes(map(_BaseV4._parse_octet, octets), 'big')
+    except ValueError as exc:
+        raise AddressValueError("%s in %r" % (exc, ip_str)) from None
+
+
 class _BaseV4:
 
     """Base IPv4 object.
@@ -1186,17 +1204,7 @@ class _BaseV4:
             AddressValueError: if ip_str isn't a valid IPv4 Address.
 
         """
-        if not ip_str:
-            raise AddressValueError('Address cannot be empty')
-
-        octets = ip_str.split('.')
-        if len(octets) != 4:
-            raise AddressValueError("Expected 4 octets in %r" % ip_str)
-
-        try:
-            return int.from_bytes(map(cls._parse_octet, octets), 'big')
-        except ValueError as exc:
-            raise AddressValueError("%s in %r" % (exc, ip_str)) from None
+        return _ipv4_int_from_string(ip_str)
 
     @classmethod
     def _parse_octet(cls, octet_str):
@@ -1240,7 +1248,7 @@ class _BaseV4:
             The IP address as a string in dotted decimal notation.
 
         """
-        return '.'.join(map(str, ip_int.to_bytes(4, 'big')))
+        return '%d.%d.%d.%d' % tuple(ip_int.to_bytes(4, 'big'))
 
     def _reverse_pointer(self):
         """Return the reverse DNS pointer name for the IPv4 address.
@@ -1560,6 +1568,112 @@ class _IPv4Constants:
 IPv4Address._constants = _IPv4Constants
 
 
+@functools.lru_cache(maxsize=1024)
+def _ipv6_int_from_string(ip_str):
+    """Cached helper of _BaseV6._ip_int_from_string()."""
+    if not ip_str:
+        raise AddressValueError('Address cannot be empty')
+
+    parts = ip_str.split(':')
+
+    # An IPv6 address needs at least 2 colons (3 parts).
+    _min_parts = 3
+    if len(parts) < _min_parts:
+        msg = "At least %d parts expected in %r" % (_min_parts, ip_str)
+        raise AddressValueError(msg)
+
+    # If the address has an IPv4-style suffix, convert it to hexadecimal.
+    if '.' in parts[-1]:
+        try:
+            ipv4_int = IPv4Address(parts.pop())._ip
+        except AddressValueError as exc:
+            raise AddressValueError("%s in %r" % (exc, ip_str)) from None
+        parts.append('%x' % ((ipv4_int >> 16) & 0xFFFF))
+        parts.append('%x' % (ipv4_int & 0xFFFF))
+
+    # An IPv6 address can't have more than 8 colons (9 parts).
+    # The extra colon comes from using the "::" notation for a single
+    # leading or trailing zero part.
+    _max_parts = _BaseV6._HEXTET_COUNT + 1
+    if len(parts) > _max_parts:
+        msg = "At most %d colons permitted in %r" % (_max_parts-1, ip_str)
+        raise AddressValueError(msg)
+
+    # Disregarding the endpoints, find '::' with nothing in between.
+    # This indicates that a run of zeroes has been skipped.
+    skip_index = None
+    for i in range(1, len(parts) - 1):
+        if not parts[i]:
+            if skip_index is not None:
+                # Can't have more than one '::'
+                msg = "At most one '::' permitted in %r" % ip_str
+                raise AddressValueError(msg)
+            skip_index = i
+
+    # parts_hi is the number of parts to copy from above/before the '::'
+    # parts_lo is the number of parts to copy from below/after the '::'
+    if skip_index is not None:
+        # If we found a '::', then check if it also covers the endpoints.
+        parts_hi = skip_index
+        parts_lo = len(parts) - skip_index - 1
+        if not parts[0]:
+            parts_hi -= 1
+            if parts_hi:
+                msg = "Leading ':' only permitted as part of '::' in %r"
+                raise AddressValueError(msg % ip_str)  # ^: requires ^::
+        if not parts[-1]:
+            parts_lo -= 1
+            if parts_lo:
+                msg = "Trailing ':' only permitted as part of '::' in %r"
+                raise AddressValueError(msg % ip_str)  # :$ requires ::$
+        parts_skipped = _BaseV6._HEXTET_COUNT - (parts_hi + parts_lo)
+        if parts_skipped < 1:
+            msg = "Expected at most %d other parts with '::' in %r"
+            raise AddressValueError(msg % (_BaseV6._HEXTET_COUNT-1, ip_str))
+    else:
+        # Otherwise, allocate the entire address to parts_hi.  The
+        # endpoints could still be empty, but _parse_hextet() will check
+        # for that.
+        if len(parts) != _BaseV6._HEXTET_COUNT:
+            msg = "Exactly %d parts expected without '::' in %r"
+            raise AddressValueError(msg % (_BaseV6._HEXTET_COUNT, ip_str))
+        if not parts[0]:
+            msg = "Leading ':' only permitted as part of '::' in %r"
+            raise AddressValueError(msg % ip_str)  # ^: requires ^::
+        if not parts[-1]:
+            msg = "Trailing ':' only permitted as part of '::' in %r"
+            raise AddressValueError(msg % ip_str)  # :$ requires ::$
+        parts_hi = len(parts)
+        parts_lo = 0
+        parts_skipped = 0
+
+    try:
+        # Now, parse the hextets into a 128-bit integer.
+        ip_int = 0
+        for i in range(parts_hi):
+            ip_int <<= 16
+            ip_int |= _BaseV6._parse_hextet(parts[i])
+        ip_int <<= 16 * parts_skipped
+        for i in range(-parts_lo, 0):
+            ip_int <<= 16
+            ip_int |= _BaseV6._parse_hextet(parts[i])
+        return ip_int
+    except ValueError as exc:
+        raise AddressValueError("%s in %r" % (exc, ip_str)) from None
+
+
+@functools.lru_cache(maxsize=1024)
+def _ipv6_string_from_int(ip_int):
+    """Cached helper of _BaseV6._string_from_ip_int()."""
+    if ip_int > _BaseV6._ALL_ONES:
+        raise ValueError('IPv6 address is too large')
+
+    hextets = ['%x' % (ip_int >> x & 0xFFFF) for x in range(112, -1, -16)]
+
+    hextets = _BaseV6._compress_hextets(hextets)
+    return ':'.join(hextets)
+
+
 class _BaseV6:
 
     """Base IPv6 object.
@@ -1614,95 +1728,7 @@ class _BaseV6:
             AddressValueError: if ip_str isn't a valid IPv6 Address.
 
         """
-        if not ip_str:
-            raise AddressValueError('Address cannot be empty')
-
-        parts = ip_str.split(':')
-
-        # An IPv6 address needs at least 2 colons (3 parts).
-        _min_parts = 3
-        if len(parts) < _min_parts:
-            msg = "At least %d parts expected in %r" % (_min_parts, ip_str)
-            raise AddressValueError(msg)
-
-        # If the address has an IPv4-style suffix, convert it to hexadecimal.
-        if '.' in parts[-1]:
-            try:
-                ipv4_int = IPv4Address(parts.pop())._ip
-            except AddressValueError as exc:
-                raise AddressValueError("%s in %r" % (exc, ip_str)) from None
-            parts.append('%x' % ((ipv4_int >> 16) & 0xFFFF))
-            parts.append('%x' % (ipv4_int & 0xFFFF))
-
-        # An IPv6 address can't have more than 8 colons (9 parts).
-        # The extra colon comes from using the "::" notation for a single
-        # leading or trailing zero part.
-        _max_parts = cls._HEXTET_COUNT + 1
-        if len(parts) > _max_parts:
-            msg = "At most %d colons permitted in %r" % (_max_parts-1, ip_str)
-            raise AddressValueError(msg)
-
-        # Disregarding the endpoints, find '::' with nothing in between.
-        # This indicates that a run of zeroes has been skipped.
-        skip_index = None
-        for i in range(1, len(parts) - 1):
-            if not parts[i]:
-                if skip_index is not None:
-                    # Can't have more than one '::'
-                    msg = "At most one '::' permitted in %r" % ip_str
-                    raise AddressValueError(msg)
-                skip_index = i
-
-        # parts_hi is the number of parts to copy from above/before the '::'
-        # parts_lo is the number of parts to copy from below/after the '::'
-        if skip_index is not None:
-            # If we found a '::', then check if it also covers the endpoints.
-            parts_hi = skip_index
-            parts_lo = len(parts) - skip_index - 1
-            if not parts[0]:
-                parts_hi -= 1
-                if parts_hi:
-                    msg = "Leading ':' only permitted as part of '::' in %r"
-                    raise AddressValueError(msg % ip_str)  # ^: requires ^::
-            if not parts[-1]:
-                parts_lo -= 1
-                if parts_lo:
-                    msg = "Trailing ':' only permitted as part of '::' in %r"
-                    raise AddressValueError(msg % ip_str)  # :$ requires ::$
-            parts_skipped = cls._HEXTET_COUNT - (parts_hi + parts_lo)
-            if parts_skipped < 1:
-                msg = "Expected at most %d other parts with '::' in %r"
-                raise AddressValueError(msg % (cls._HEXTET_COUNT-1, ip_str))
-        else:
-            # Otherwise, allocate the entire address to parts_hi.  The
-            # endpoints could still be empty, but _parse_hextet() will check
-            # for that.
-            if len(parts) != cls._HEXTET_COUNT:
-                msg = "Exactly %d parts expected without '::' in %r"
-                raise AddressValueError(msg % (cls._HEXTET_COUNT, ip_str))
-            if not parts[0]:
-                msg = "Leading ':' only permitted as part of '::' in %r"
-                raise AddressValueError(msg % ip_str)  # ^: requires ^::
-            if not parts[-1]:
-                msg = "Trailing ':' only permitted as part of '::' in %r"
-                raise AddressValueError(msg % ip_str)  # :$ requires ::$
-            parts_hi = len(parts)
-            parts_lo = 0
-            parts_skipped = 0
-
-        try:
-            # Now, parse the hextets into a 128-bit integer.
-            ip_int = 0
-            for i in range(parts_hi):
-                ip_int <<= 16
-                ip_int |= cls._parse_hextet(parts[i])
-            ip_int <<= 16 * parts_skipped
-            for i in range(-parts_lo, 0):
-                ip_int <<= 16
-                ip_int |= cls._parse_hextet(parts[i])
-            return ip_int
-        except ValueError as exc:
-            raise AddressValueError("%s in %r" % (exc, ip_str)) from None
+        return _ipv6_int_from_string(ip_str)
 
     @classmethod
     def _parse_hextet(cls, hextet_str):
@@ -1794,15 +1820,7 @@ class _BaseV6:
         """
         if ip_int is None:
             ip_int = int(cls._ip)
-
-        if ip_int > cls._ALL_ONES:
-            raise ValueError('IPv6 address is too large')
-
-        hex_str = '%032x' % ip_int
-        hextets = ['%x' % int(hex_str[x:x+4], 16) for x in range(0, 32, 4)]
-
-        hextets = cls._compress_hextets(hextets)
-        return ':'.join(hextets)
+        return _ipv6_string_from_int(ip_int)
 
     def _explode_shorthand_ip_string(self):
         """Expand a shortened IPv6 address.
@@ -2278,3 +2296,181 @@ class _IPv6Constants:
 
 
 IPv6Address._constants = _IPv6Constants
+
+
+class NetworkTable(_collections_abc.MutableMapping):
+
+    """A mapping of IPv4 and IPv6 networks to values.
+
+    Besides exact lookups, the table finds the networks containing a
+    given address or network, most specific first with longest_match().
+    The networks are indexed by prefix length, so a query needs at most
+    one dictionary lookup per distinct prefix length in the table instead
+    of a containment test against every network.
+
+    Example:
+        table = NetworkTable({IPv4Network('10.0.0.0/8'): 'internal',
+                              IPv4Network('10.1.0.0/16'): 'lab'})
+        table.longest_match(IPv4Address('10.1.2.3')) ->
+            (IPv4Network('10.1.0.0/16'), 'lab')
+
+    """
+
+    # _masks[version][prefixlen] is the netmask of that length as an int.
+    _masks = {
+        4: tuple(IPv4Network._ip_int_from_prefix(n)
+                 for n in range(IPV4LENGTH + 1)),
+        6: tuple(IPv6Network._ip_int_from_prefix(n)
+                 for n in range(IPV6LENGTH + 1)),
+        }
+
+    def __init__(self, networks=(), /):
+        """Instantiate a new network table.
+
+        Args:
+            networks: A mapping of networks to values, or an iterable of
+              (network, value) pairs.
+
+        """
+        self._networks = {}
+        # version -> {prefixlen -> {network address int -> {network: value}}}
+        # Scoped IPv6 networks differing only by their scope id share a
+        # network address int, but are different keys.
+        self._index = {4: {}, 6: {}}
+        # version -> prefix lengths in the index, longest first
+        self._prefixlens = {4: [], 6: []}
+        self.update(networks)
+
+    @classmethod
+    def fromkeys(cls, networks, value=None):
+        """Create a table mapping each of networks to value."""
+        table = cls()
+        for network in networks:
+            table[network] = value
+        return table
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self._networks)
+
+    def __len__(self):
+        return len(self._networks)
+
+    def __iter__(self):
+        return iter(self._networks)
+
+    def __getitem__(self, network):
+        return self._networks[network]
+
+    def __setitem__(self, network, value):
+        if not isinstance(network, _BaseNetwork):
+            raise TypeError('%r is not an IPv4 or IPv6 network' % (network,))
+        version = network._version
+        tables = self._index[version]
+        table = tables.get(network._prefixlen)
+        if table is None:
+            table = tables[network._prefixlen] = {}
+            self._prefixlens[version] = sorted(tables, reverse=True)
+        table.setdefault(network.network_address._ip, {})[network] = value
+        self._networks[network] = value
+
+    def __delitem__(self, network):
+        del self._networks[network]
+        version = network._version
+        tables = self._index[version]
+        table = tables[network._prefixlen]
+        ip = network.network_address._ip
+        del table[ip][network]
+        if not table[ip]:
+            del table[ip]
+        if not table:
+            del tables[network._prefixlen]
+            self._prefixlens[version] = sorted(tables, reverse=True)
+
+    def clear(self):
+        """Remove all networks from the table."""
+        self._networks.clear()
+        for version in self._index:
+            self._index[version].clear()
+            self._prefixlens[version] = []
+
+    def _entries(self, item, reverse=False):
+        """Yield the (network, value) pairs of the networks containing item.
+
+        Args:
+            item: An IPv4 or IPv6 address or network.
+            reverse: If true, yield the least specific network first.
+
+        Raises:
+            TypeError: If item is not an address or a network.
+
+        """
+        if isinstance(item, _BaseAddress):
+            ip = item._ip
+            max_prefixlen = item._max_prefixlen
+        elif isinstance(item, _BaseNetwork):
+            ip = item.network_address._ip
+            max_prefixlen = item._prefixlen
+        else:
+            raise TypeError('%r is not an IPv4 or IPv6 address or network'
+                            % (item,))
+        masks = self._masks[item._version]
+        tables = self._index[item._version]
+        prefixlens = self._prefixlens[item._version]
+        if reverse:
+            prefixlens = reversed(prefixlens)
+        for prefixlen in prefixlens:
+            if prefixlen <= max_prefixlen:
+                networks = tables[prefixlen].get(ip & masks[prefixlen])
+                if networks is not None:
+                    yield from networks.items()
+
+    def longest_match(self, item):
+        """Find the most specific network containing item.
+
+        Args:
+            item: An IPv4 or IPv6 address or network.  A network contains
+              itself.
+
+        Returns:
+            A (network, value) tuple.
+
+        Raises:
+            KeyError: If no network in the table contains item.
+            TypeError: If item is not an address or a network.
+
+        """
+        for entry in self._entries(item):
+            return entry
+        raise KeyError(item)
+
+    def matches(self, item):
+        """Iterate over the networks containing item.
+
+        Args:
+            item: An IPv4 or IPv6 address or network.
+
+        Returns:
+            An iterator of (network, value) tuples, from the least to the
+            most specific network.
+
+        """
+        return self._entries(item, reverse=True)
+
+    def covers(self, item):
+        """Tell if any network in the table contains item."""
+        for entry in self._entries(item):
+            return True
+        return False
+
+    def aggregate(self):
+        """Collapse the networks of the table.
+
+        Returns:
+            An iterator of the collapsed IPv4 networks followed by the
+            collapsed IPv6 networks; see collapse_addresses().
+
+        """
+        for version in (4, 6):
+            yield from collapse_addresses(
+                network for network in self._networks
+                if network._version == version)
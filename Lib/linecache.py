@@ -8,19 +8,57 @@ that name.
 import functools
 import sys
 import os
+import time
 import tokenize
 
-__all__ = ["getline", "clearcache", "checkcache", "lazycache"]
+__all__ = ["getline", "clearcache", "checkcache", "lazycache",
+           "set_max_size", "set_check_interval"]
 
 
 # The cache. Maps filenames to either a thunk which will provide source code,
 # or a tuple (size, mtime, lines, fullname) once loaded.
 cache = {}
 
+# The total size of the loaded entries above which the least recently
+# used ones are discarded, or None for no limit.
+_max_size = None
+
+# The minimum number of seconds between two checks of the same file by
+# checkcache(), and the time each file was last checked.
+_check_interval = 0
+_last_checked = {}
+
+# The thunks of lazy entries that have been loaded, so that they can be
+# made lazy again instead of being lost when evicted.
+_loaders = {}
+
 
 def clearcache():
     """Clear the cache entirely."""
     cache.clear()
+    _last_checked.clear()
+    _loaders.clear()
+
+
+def set_max_size(size):
+    """Limit the total size of the cached source, in bytes.
+
+    When the limit is exceeded, the least recently used files are
+    discarded from the cache.  None removes the limit.
+    """
+    global _max_size
+    if size is not None and size < 0:
+        raise ValueError("size must be non-negative or None")
+    _max_size = size
+    _evict()
+
+
+def set_check_interval(seconds):
+    """Make checkcache() check each file at most once every 'seconds'."""
+    global _check_interval
+    if seconds < 0:
+        raise ValueError("seconds must be non-negative")
+    _check_interval = seconds
 
 
 def getline(filename, lineno, module_globals=None):
@@ -40,7 +78,11 @@ def getlines(filename, module_globals=None):
     if filename in cache:
         entry = cache[filename]
         if len(entry) != 1:
-            return cache[filename][2]
+            if _max_size is not None:
+                # Mark the entry as the most recently used one.
+                del cache[filename]
+                cache[filename] = entry
+            return entry[2]
 
     try:
         return updatecache(filename, module_globals)
@@ -60,6 +102,8 @@ def checkcache(filename=None):
     else:
         return
 
+    if _check_interval:
+        now = time.monotonic()
     for filename in filenames:
         entry = cache[filename]
         if len(entry) == 1:
@@ -68,13 +112,18 @@ def checkcache(filename=None):
         size, mtime, lines, fullname = entry
         if mtime is None:
             continue   # no-op for files loaded via a __loader__
+        if _check_interval:
+            last = _last_checked.get(filename)
+            if last is not None and now - last < _check_interval:
+                continue
+            _last_checked[filename] = now
         try:
             stat = os.stat(fullname)
         except OSError:
-            cache.pop(filename, None)
+            _discard(filename)
             continue
         if size != stat.st_size or mtime != stat.st_mtime:
-            cache.pop(filename, None)
+            _discard(filename)
 
 
 def updatecache(filename, module_globals=None):
@@ -84,7 +133,7 @@ def updatecache(filename, module_globals=None):
 
     if filename in cache:
         if len(cache[filename]) != 1:
-            cache.pop(filename, None)
+            _discard(filename)
     if not filename or (filename.startswith('<') and filename.endswith('>')):
         return []
 
@@ -97,8 +146,9 @@ def updatecache(filename, module_globals=None):
         # Realise a lazy loader based lookup if there is one
         # otherwise try to lookup right now.
         if lazycache(filename, module_globals):
+            get_lines = cache[filename][0]
             try:
-                data = cache[filename][0]()
+                data = get_lines()
             except (ImportError, OSError):
                 pass
             else:
@@ -106,13 +156,16 @@ def updatecache(filename, module_globals=None):
                     # No luck, the PEP302 loader cannot find the source
                     # for this module.
                     return []
+                lines = [line + '\n' for line in data.splitlines()]
                 cache[filename] = (
                     len(data),
                     None,
-                    [line + '\n' for line in data.splitlines()],
+                    lines,
                     fullname
                 )
-                return cache[filename][2]
+                _loaders[filename] = get_lines
+                _evict()
+                return lines
 
         # Try looking through the module search path, which is only useful
         # when handling a relative filename.
@@ -141,9 +194,54 @@ def updatecache(filename, module_globals=None):
         lines[-1] += '\n'
     size, mtime = stat.st_size, stat.st_mtime
     cache[filename] = size, mtime, lines, fullname
+    if _check_interval:
+        # The file has just been checked.
+        _last_checked[filename] = time.monotonic()
+    _evict()
     return lines
 
 
+def _discard(filename):
+    """Remove a loaded entry from the cache.
+
+    Entries loaded through a module loader become lazy again.
+    """
+    cache.pop(filename, None)
+    _last_checked.pop(filename, None)
+    get_lines = _loaders.pop(filename, None)
+    if get_lines is not None:
+        cache[filename] = (get_lines,)
+
+
+def _evictable(filename, entry):
+    """Return whether a cache entry can be read again once discarded.
+
+    Entries without a loader and an mtime of None or 0 were added to
+    the cache directly (by doctest or IDLE for example), and are kept.
+    """
+    return len(entry) != 1 and (bool(entry[1]) or filename in _loaders)
+
+
+def _evict():
+    """Discard the least recently used entries while over the size limit."""
+    if _max_size is None:
+        return
+    total = 0
+    for filename, entry in cache.items():
+        if _evictable(filename, entry):
+            total += entry[0]
+    if total <= _max_size:
+        return
+    # Dicts keep insertion order and getlines() moves the entries it
+    # uses to the end, so the least recently used entries come first.
+    for filename, entry in list(cache.items()):
+        if _evictable(filename, entry):
+            _discard(filename)
+            total -= entry[0]
+            if total <= _max_size:
+                break
+
+
 def lazycache(filename, module_globals):
     """Seed the cache for filename with module_globals.
 
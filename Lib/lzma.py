@@ -34,6 +34,9 @@ _MODE_READ     = 1
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Amount of data compressed by each thread in multi-threaded mode.
+_THREADED_BLOCK_SIZE = 8 * 1024 * 1024
+
 
 class LZMAFile(_compression.BaseStream):
 
@@ -47,7 +50,8 @@ class LZMAFile(_compression.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None,
+                 workers=None):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -89,6 +93,10 @@ class LZMAFile(_compression.BaseStream):
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        When opening a file for writing with FORMAT_XZ or FORMAT_ALONE,
+        workers can be a number greater than 1 to compress the data in
+        blocks by that many threads, each block making a separate stream.
         """
         self._fp = None
         self._closefp = False
@@ -108,8 +116,24 @@ class LZMAFile(_compression.BaseStream):
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
-            self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+            if workers is not None and workers > 1:
+                if format == FORMAT_RAW:
+                    raise ValueError("Cannot use multiple workers with "
+                                     "FORMAT_RAW")
+                # Check the compression settings now.
+                LZMACompressor(format=format, check=check, preset=preset,
+                               filters=filters)
+                def compress_block(block, previous, final):
+                    if not block and previous:
+                        return b""
+                    return compress(block, format=format, check=check,
+                                    preset=preset, filters=filters)
+                self._compressor = _compression.ThreadedCompressor(
+                    compress_block, workers, _THREADED_BLOCK_SIZE)
+            else:
+                self._compressor = LZMACompressor(format=format, check=check,
+                                                  preset=preset,
+                                                  filters=filters)
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -262,7 +286,7 @@ class LZMAFile(_compression.BaseStream):
 
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, workers=None):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str, bytes,
@@ -273,7 +297,7 @@ def open(filename, mode="rb", *,
     "a", or "ab" for binary mode, or "rt", "wt", "xt", or "at" for text
     mode.
 
-    The format, check, preset and filters arguments specify the
+    The format, check, preset, filters and workers arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
     LZMAFile.
 
@@ -299,7 +323,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, workers=workers)
 
     if "t" in mode:
         return io.TextIOWrapper(binary_file, encoding, errors, newline)
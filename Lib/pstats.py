@@ -27,7 +27,7 @@ import marshal
 import re
 
 from enum import Enum
-from functools import cmp_to_key
+from operator import itemgetter
 from dataclasses import dataclass
 from typing import Dict
 
@@ -162,35 +162,60 @@ class Stats:
             self.total_tt    += tt
             if ("jprofile", 0, "profiler") in callers:
                 self.top_level.add(func)
-            if len(func_std_string(func)) > self.max_name_len:
-                self.max_name_len = len(func_std_string(func))
+            name_len = len(func_std_string(func))
+            if name_len > self.max_name_len:
+                self.max_name_len = name_len
 
     def add(self, *arg_list):
         if not arg_list:
             return self
         for item in reversed(arg_list):
-            if type(self) != type(item):
-                item = Stats(item)
-            self.files += item.files
-            self.total_calls += item.total_calls
-            self.prim_calls += item.prim_calls
-            self.total_tt += item.total_tt
-            for func in item.top_level:
-                self.top_level.add(func)
-
-            if self.max_name_len < item.max_name_len:
-                self.max_name_len = item.max_name_len
-
-            self.fcn_list = None
-
-            for func, stat in item.stats.items():
-                if func in self.stats:
-                    old_func_stat = self.stats[func]
+            if type(self) == type(item):
+                self.files += item.files
+                self.top_level.update(item.top_level)
+                # The caller dicts of item must be left alone
+                self._add_stats(item.stats, copy=True)
+            else:
+                if isinstance(item, str):
+                    # Merge the dumps one at a time, without creating
+                    # a Stats object for each
+                    stats = Stats.__new__(Stats)
+                    stats.files = []
+                    stats.load_stats(item)
                 else:
-                    old_func_stat = (0, 0, 0, 0, {},)
-                self.stats[func] = add_func_stats(old_func_stat, stat)
+                    stats = Stats(item)
+                self.files += stats.files
+                self._add_stats(stats.stats, copy=False)
+            self.fcn_list = None
+            self.all_callees = None
         return self
 
+    def _add_stats(self, stats, copy):
+        # Add a dictionary of function stats, updating the totals.  The
+        # caller dicts of self.stats are updated in place, so those of
+        # the added stats are copied unless *copy* is false, in which case
+        # they are taken over.
+        own_stats = self.stats
+        top_level = self.top_level
+        for func, (cc, nc, tt, ct, callers) in stats.items():
+            self.total_calls += nc
+            self.prim_calls += cc
+            self.total_tt += tt
+            if ("jprofile", 0, "profiler") in callers:
+                top_level.add(func)
+            try:
+                t_cc, t_nc, t_tt, t_ct, t_callers = own_stats[func]
+            except KeyError:
+                name_len = len(func_std_string(func))
+                if name_len > self.max_name_len:
+                    self.max_name_len = name_len
+                own_stats[func] = (cc, nc, tt, ct,
+                                   dict(callers) if copy else callers)
+            else:
+                update_callers(t_callers, callers)
+                own_stats[func] = (cc+t_cc, nc+t_nc, tt+t_tt, ct+t_ct,
+                                   t_callers)
+
     def dump_stats(self, filename):
         """Write the profile data to a file we know how to load back."""
         with open(filename, 'wb') as f:
@@ -265,7 +290,10 @@ class Stats:
             stats_list.append((cc, nc, tt, ct) + func +
                               (func_std_string(func), func))
 
-        stats_list.sort(key=cmp_to_key(TupleComp(sort_tuple).compare))
+        # Sort by each key in turn, from the least significant one: this
+        # is much faster than comparing the tuples with TupleComp.
+        for index, direction in reversed(sort_tuple):
+            stats_list.sort(key=itemgetter(index), reverse=direction < 0)
 
         self.fcn_list = fcn_list = []
         for tuple in stats_list:
@@ -319,6 +347,22 @@ class Stats:
                 all_callees[func2][func]  = caller
         return
 
+    def get_callees(self, funcs):
+        """Return a dictionary mapping each function of *funcs* to
+        a dictionary of the functions it called, like the caller
+        dictionaries of the stats.
+
+        Unlike calc_callees(), only the calls made by *funcs* are
+        collected.
+        """
+        if self.all_callees:
+            return {func: self.all_callees.get(func, {}) for func in funcs}
+        result = {func: {} for func in funcs}
+        for func, (cc, nc, tt, ct, callers) in self.stats.items():
+            for caller in result.keys() & callers.keys():
+                result[caller][func] = callers[caller]
+        return result
+
     #******************************************************************
     # The following functions support actual printing of reports
     #******************************************************************
@@ -436,12 +480,16 @@ class Stats:
     def print_callees(self, *amount):
         width, list = self.get_print_list(amount)
         if list:
-            self.calc_callees()
+            if len(list) < len(self.stats):
+                all_callees = self.get_callees(list)
+            else:
+                self.calc_callees()
+                all_callees = self.all_callees
 
             self.print_call_heading(width, "called...")
             for func in list:
-                if func in self.all_callees:
-                    self.print_call_line(width, func, self.all_callees[func])
+                if func in all_callees:
+                    self.print_call_line(width, func, all_callees[func])
                 else:
                     self.print_call_line(width, func, {})
             print(file=self.stream)
@@ -576,20 +624,26 @@ def add_func_stats(target, source):
 
 def add_callers(target, source):
     """Combine two caller lists in a single list."""
-    new_callers = {}
-    for func, caller in target.items():
-        new_callers[func] = caller
+    new_callers = dict(target)
+    update_callers(new_callers, source)
+    return new_callers
+
+def update_callers(target, source):
+    """Add the caller statistics of source to the caller list target."""
     for func, caller in source.items():
-        if func in new_callers:
-            if isinstance(caller, tuple):
-                # format used by cProfile
-                new_callers[func] = tuple(i + j for i, j in zip(caller, new_callers[func]))
-            else:
-                # format used by profile
-                new_callers[func] += caller
+        try:
+            t_caller = target[func]
+        except KeyError:
+            target[func] = caller
+            continue
+        if isinstance(caller, tuple):
+            # format used by cProfile
+            nc, cc, tt, ct = caller
+            t_nc, t_cc, t_tt, t_ct = t_caller
+            target[func] = (nc+t_nc, cc+t_cc, tt+t_tt, ct+t_ct)
         else:
-            new_callers[func] = caller
-    return new_callers
+            # format used by profile
+            target[func] = t_caller + caller
 
 def count_calls(callers):
     """Sum the caller statistics to get total number of calls received."""
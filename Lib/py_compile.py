@@ -7,6 +7,7 @@ import enum
 import importlib._bootstrap_external
 import importlib.machinery
 import importlib.util
+import marshal
 import os
 import os.path
 import sys
@@ -76,8 +77,22 @@ def _get_default_invalidation_mode():
         return PycInvalidationMode.TIMESTAMP
 
 
+def _cache_path(cache_dir, source_bytes, filename, optimize):
+    # The marshalled code depends on the interpreter, the optimization level,
+    # the file name stored in the code objects and the source
+    import hashlib
+    if optimize < 0:
+        optimize = sys.flags.optimize
+    key = hashlib.sha256(importlib.util.MAGIC_NUMBER)
+    key.update(b'%d\0' % optimize)
+    key.update(os.fsencode(filename) + b'\0')
+    key.update(source_bytes)
+    key = key.hexdigest()
+    return os.path.join(cache_dir, key[:2], key[2:])
+
+
 def compile(file, cfile=None, dfile=None, doraise=False, optimize=-1,
-            invalidation_mode=None, quiet=0):
+            invalidation_mode=None, quiet=0, *, cache_dir=None):
     """Byte-compile one Python source file to Python bytecode.
 
     :param file: The source file name.
@@ -97,6 +112,10 @@ def compile(file, cfile=None, dfile=None, doraise=False, optimize=-1,
     :param invalidation_mode:
     :param quiet: Return full output with False or 0, errors only with 1,
         and no output with 2.
+    :param cache_dir: Directory of a cache of compiled code shared between
+        compilations.  Code is looked up by a hash of the source, the file
+        name stored in the code, the optimization level and the magic number
+        of the interpreter, and is only compiled on a cache miss.
 
     :return: Path to the resulting byte compiled file.
 
@@ -140,34 +159,55 @@ def compile(file, cfile=None, dfile=None, doraise=False, optimize=-1,
         raise FileExistsError(msg.format(cfile))
     loader = importlib.machinery.SourceFileLoader('<py_compile>', file)
     source_bytes = loader.get_data(file)
-    try:
-        code = loader.source_to_code(source_bytes, dfile or file,
-                                     _optimize=optimize)
-    except Exception as err:
-        py_exc = PyCompileError(err.__class__, err, dfile or file)
-        if quiet < 2:
-            if doraise:
-                raise py_exc
-            else:
-                sys.stderr.write(py_exc.msg + '\n')
-        return
+    data = None
+    if cache_dir is not None:
+        cache_path = _cache_path(cache_dir, source_bytes, dfile or file,
+                                 optimize)
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            pass
+    if data is None:
+        try:
+            code = loader.source_to_code(source_bytes, dfile or file,
+                                         _optimize=optimize)
+        except Exception as err:
+            py_exc = PyCompileError(err.__class__, err, dfile or file)
+            if quiet < 2:
+                if doraise:
+                    raise py_exc
+                else:
+                    sys.stderr.write(py_exc.msg + '\n')
+            return
+        data = marshal.dumps(code)
+        if cache_dir is not None:
+            # The cache is only an optimization: ignore errors
+            try:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                importlib._bootstrap_external._write_atomic(cache_path, data)
+            except OSError:
+                pass
     try:
         dirname = os.path.dirname(cfile)
         if dirname:
             os.makedirs(dirname)
     except FileExistsError:
         pass
+    _pack_uint32 = importlib._bootstrap_external._pack_uint32
+    bytecode = bytearray(importlib.util.MAGIC_NUMBER)
     if invalidation_mode == PycInvalidationMode.TIMESTAMP:
         source_stats = loader.path_stats(file)
-        bytecode = importlib._bootstrap_external._code_to_timestamp_pyc(
-            code, source_stats['mtime'], source_stats['size'])
+        bytecode.extend(_pack_uint32(0))
+        bytecode.extend(_pack_uint32(source_stats['mtime']))
+        bytecode.extend(_pack_uint32(source_stats['size']))
     else:
         source_hash = importlib.util.source_hash(source_bytes)
-        bytecode = importlib._bootstrap_external._code_to_hash_pyc(
-            code,
-            source_hash,
-            (invalidation_mode == PycInvalidationMode.CHECKED_HASH),
-        )
+        checked = (invalidation_mode == PycInvalidationMode.CHECKED_HASH)
+        bytecode.extend(_pack_uint32(0b1 | checked << 1))
+        assert len(source_hash) == 8
+        bytecode.extend(source_hash)
+    bytecode.extend(data)
     mode = importlib._bootstrap_external._calc_mode(file)
     importlib._bootstrap_external._write_atomic(cfile, bytecode, mode)
     return cfile
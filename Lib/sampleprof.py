@@ -0,0 +1,315 @@
+#! /usr/bin/env python3
+
+"""Statistical profiler sampling the call stacks of running threads.
+   Compatible with the 'profile' and 'cProfile' modules.
+"""
+
+__all__ = ["run", "runctx", "Profile"]
+
+import sys
+import threading
+import time
+import profile as _pyprofile
+
+# ____________________________________________________________
+# Simple interface
+
+def run(statement, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).run(statement, filename, sort)
+
+def runctx(statement, globals, locals, filename=None, sort=-1):
+    return _pyprofile._Utils(Profile).runctx(statement, globals, locals,
+                                             filename, sort)
+
+run.__doc__ = _pyprofile.run.__doc__
+runctx.__doc__ = _pyprofile.runctx.__doc__
+
+# ____________________________________________________________
+
+class Profile:
+    """Profile(interval=0.005, all_threads=True)
+
+    Builds a sampling profiler object.  While enabled, a background thread
+    wakes up every *interval* seconds and records the call stack of every
+    thread (or only of the thread which enabled the profiler if
+    *all_threads* is false).  Each sample is weighted by the wall clock
+    time elapsed since the previous one.
+
+    Unlike the deterministic profilers, no hook runs on function calls,
+    so the profiled code runs at close to full speed.  The price is that
+    the results are statistical: call counts are replaced by sample
+    counts and functions implemented in C are not seen.
+    """
+
+    def __init__(self, interval=0.005, all_threads=True):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.all_threads = all_threads
+        self._stacks = {}
+        self._thread = None
+        self._stop = None
+        self._base_frame = None
+        self._target_thread = None
+
+    def enable(self):
+        """Start sampling.
+
+        The stacks of the calling thread are recorded up to, but not
+        including, the frame which called enable().
+        """
+        self._enable(sys._getframe(1))
+
+    def _enable(self, base_frame):
+        if self._thread is not None:
+            return
+        self._base_frame = base_frame
+        self._target_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample_loop,
+                                        name='sampleprof', daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        """Stop sampling."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        if thread is not threading.current_thread():
+            thread.join()
+        self._thread = None
+        self._base_frame = None
+
+    def clear(self):
+        """Forget the samples gathered so far."""
+        # Clear in place: the sampling thread keeps a reference to the dict
+        self._stacks.clear()
+
+    def _sample_loop(self):
+        stacks = self._stacks
+        ident = threading.get_ident()
+        target = None if self.all_threads else self._target_thread
+        interval = self.interval
+        wait = self._stop.wait
+        current_frames = sys._current_frames
+        timer = time.perf_counter
+        last = timer()
+        while not wait(interval):
+            now = timer()
+            elapsed = now - last
+            last = now
+            frames = current_frames()
+            if self._stop.is_set():
+                # Don't record the thread blocked in disable()
+                break
+            for thread_id, frame in frames.items():
+                if thread_id == ident:
+                    continue
+                if thread_id == self._target_thread:
+                    base = self._base_frame
+                elif target is not None:
+                    continue
+                else:
+                    base = None
+                codes = []
+                while frame is not None and frame is not base:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                if not codes:
+                    continue
+                # Store stacks outermost frame first
+                codes.reverse()
+                key = tuple(codes)
+                try:
+                    sample = stacks[key]
+                except KeyError:
+                    stacks[key] = [1, elapsed]
+                else:
+                    sample[0] += 1
+                    sample[1] += elapsed
+            del frames, frame
+
+    def collapsed_stacks(self):
+        """Return the samples in the "collapsed stack" format.
+
+        The result maps each distinct call stack, given as a string of
+        ``function (filename:line)`` entries from the outermost to the
+        innermost frame joined by semicolons, to the number of samples
+        taken in it.  Lines of the form ``"%s %d" % item`` are accepted
+        by flame graph generators.
+        """
+        result = {}
+        for codes, (count, _) in list(self._stacks.items()):
+            key = ';'.join(['%s (%s:%d)' % (code.co_name, code.co_filename,
+                                            code.co_firstlineno)
+                            for code in codes])
+            result[key] = result.get(key, 0) + count
+        return result
+
+    def dump_collapsed(self, file):
+        """Write the collapsed stacks, one per line, to the named file."""
+        self.disable()
+        with open(file, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.collapsed_stacks().items()):
+                f.write('%s %d\n' % (stack, count))
+
+    def print_stats(self, sort=-1):
+        import pstats
+        pstats.Stats(self).strip_dirs().sort_stats(sort).print_stats()
+
+    def dump_stats(self, file):
+        import marshal
+        with open(file, 'wb') as f:
+            self.create_stats()
+            marshal.dump(self.stats, f)
+
+    def create_stats(self):
+        self.disable()
+        self.snapshot_stats()
+
+    def snapshot_stats(self):
+        # The pstats columns are derived from the samples as follows:
+        #   ncalls  number of frames of the function in all samples /
+        #           number of samples in which the function appears
+        #   tottime time of the samples with the function innermost
+        #   cumtime time of the samples in which the function appears
+        # and likewise for each caller of a function.
+        self.stats = {}
+        for codes, (count, elapsed) in list(self._stacks.items()):
+            funcs = [label(code) for code in codes]
+            leaf = len(funcs) - 1
+            seen = set()
+            seen_calls = set()
+            for i, func in enumerate(funcs):
+                try:
+                    cc, nc, tt, ct, callers = self.stats[func]
+                except KeyError:
+                    cc = nc = tt = ct = 0
+                    callers = {}
+                nc += count
+                if i == leaf:
+                    tt += elapsed
+                if func not in seen:
+                    seen.add(func)
+                    cc += count
+                    ct += elapsed
+                if i:
+                    caller = funcs[i - 1]
+                    c_nc, c_cc, c_tt, c_ct = callers.get(caller, (0, 0, 0, 0))
+                    c_nc += count
+                    if i == leaf:
+                        c_tt += elapsed
+                    if (caller, func) not in seen_calls:
+                        seen_calls.add((caller, func))
+                        c_cc += count
+                        c_ct += elapsed
+                    callers[caller] = c_nc, c_cc, c_tt, c_ct
+                self.stats[func] = cc, nc, tt, ct, callers
+
+    # The following two methods can be called by clients to use
+    # a profiler to profile a statement, given as a string.
+
+    def run(self, cmd):
+        import __main__
+        dict = __main__.__dict__
+        return self.runctx(cmd, dict, dict)
+
+    def runctx(self, cmd, globals, locals):
+        self._enable(sys._getframe())
+        try:
+            exec(cmd, globals, locals)
+        finally:
+            self.disable()
+        return self
+
+    # This method is more useful to profile a single function call.
+    def runcall(self, func, /, *args, **kw):
+        self._enable(sys._getframe())
+        try:
+            return func(*args, **kw)
+        finally:
+            self.disable()
+
+    def __enter__(self):
+        self._enable(sys._getframe(1))
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+# ____________________________________________________________
+
+def label(code):
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+# ____________________________________________________________
+
+def main():
+    import os
+    import runpy
+    import pstats
+    from optparse import OptionParser
+    usage = ("sampleprof.py [-o output_file_path] [-s sort] [-i interval] "
+             "[-c collapsed_file_path] [-m module | scriptfile] [arg] ...")
+    parser = OptionParser(usage=usage)
+    parser.allow_interspersed_args = False
+    parser.add_option('-o', '--outfile', dest="outfile",
+        help="Save stats to <outfile>", default=None)
+    parser.add_option('-s', '--sort', dest="sort",
+        help="Sort order when printing to stdout, based on pstats.Stats class",
+        default=-1,
+        choices=sorted(pstats.Stats.sort_arg_dict_default))
+    parser.add_option('-i', '--interval', dest="interval", type="float",
+        help="Sampling interval in seconds (default: %default)",
+        default=0.005)
+    parser.add_option('-c', '--collapsed', dest="collapsed",
+        help="Save collapsed stacks (for flame graphs) to <collapsed>",
+        default=None)
+    parser.add_option('-m', dest="module", action="store_true",
+        help="Profile a library module", default=False)
+
+    if not sys.argv[1:]:
+        parser.print_usage()
+        sys.exit(2)
+
+    (options, args) = parser.parse_args()
+    sys.argv[:] = args
+
+    if len(args) > 0:
+        if options.module:
+            code = "run_module(modname, run_name='__main__')"
+            globs = {
+                'run_module': runpy.run_module,
+                'modname': args[0]
+            }
+        else:
+            progname = args[0]
+            sys.path.insert(0, os.path.dirname(progname))
+            with open(progname, 'rb') as fp:
+                code = compile(fp.read(), progname, 'exec')
+            globs = {
+                '__file__': progname,
+                '__name__': '__main__',
+                '__package__': None,
+                '__cached__': None,
+            }
+        prof = Profile(options.interval)
+        try:
+            prof.runctx(code, globs, None)
+        except SystemExit:
+            pass
+        finally:
+            if options.collapsed is not None:
+                prof.dump_collapsed(options.collapsed)
+            if options.outfile is not None:
+                prof.dump_stats(options.outfile)
+            elif options.collapsed is None:
+                prof.print_stats(options.sort)
+    else:
+        parser.print_usage()
+    return parser
+
+# When invoked as main program, invoke the profiler on a script
+if __name__ == '__main__':
+    main()
@@ -110,6 +110,13 @@ DEFAULT_FORMAT = PAX_FORMAT
 #---------------------------------------------------------
 # tarfile constants
 #---------------------------------------------------------
+# Magic string and structures of the member index files written by
+# TarFile.save_index().
+INDEX_MAGIC = b"PYTARIDX"
+INDEX_HEADER = struct.Struct("!8sQ")        # magic, number of entries
+INDEX_ENTRY = struct.Struct("!QQQI")        # offset, offset_data, size,
+                                            # length of the utf-8 name
+
 # File types that tarfile supports:
 SUPPORTED_TYPES = (REGTYPE, AREGTYPE, LNKTYPE,
                    SYMTYPE, DIRTYPE, FIFOTYPE,
@@ -1449,7 +1456,7 @@ class TarFile(object):
     def __init__(self, name=None, mode="r", fileobj=None, format=None,
             tarinfo=None, dereference=None, ignore_zeros=None, encoding=None,
             errors="surrogateescape", pax_headers=None, debug=None,
-            errorlevel=None, copybufsize=None):
+            errorlevel=None, copybufsize=None, index=None):
         """Open an (uncompressed) tar archive `name'. `mode' is either 'r' to
            read from an existing archive, 'a' to append data to an existing
            file or 'w' to create a new file overwriting an existing one. `mode'
@@ -1457,10 +1464,14 @@ class TarFile(object):
            If `fileobj' is given, it is used for reading or writing data. If it
            can be determined, `mode' is overridden by `fileobj's mode.
            `fileobj' is not closed, when TarFile is closed.
+           If `index' is given, it is a member index written by save_index()
+           which is loaded with load_index().
         """
         modes = {"r": "rb", "a": "r+b", "w": "wb", "x": "xb"}
         if mode not in modes:
             raise ValueError("mode must be 'r', 'a', 'w' or 'x'")
+        if index is not None and mode != "r":
+            raise ValueError("index can only be used in mode 'r'")
         self.mode = mode
         self._mode = modes[mode]
 
@@ -1513,11 +1524,18 @@ class TarFile(object):
                                 # current position in the archive file
         self.inodes = {}        # dictionary caching the inodes of
                                 # archive members already added
+        self._index = None      # dictionary mapping member names to lists
+                                # of (offset, offset_data, size) tuples
+        self._normindex = None  # the same with normalized member names
+        self._indexed = {}      # TarInfo objects read using the index,
+                                # by offset
 
         try:
             if self.mode == "r":
                 self.firstmember = None
                 self.firstmember = self.next()
+                if index is not None:
+                    self.load_index(index)
 
             if self.mode == "a":
                 # Move to the end of the archive,
@@ -1597,6 +1615,9 @@ class TarFile(object):
         if not name and not fileobj:
             raise ValueError("nothing to open")
 
+        if kwargs.get("index") is not None and not mode.startswith("r"):
+            raise ValueError("index can only be used in mode 'r'")
+
         if mode in ("r", "r:*"):
             # Find out which *open() is appropriate for opening the file.
             def not_compressed(comptype):
@@ -1781,7 +1802,8 @@ class TarFile(object):
         """Return a TarInfo object for member `name'. If `name' can not be
            found in the archive, KeyError is raised. If a member occurs more
            than once in the archive, its last occurrence is assumed to be the
-           most up-to-date version.
+           most up-to-date version. If an index has been loaded, the member's
+           header is read directly instead of scanning the archive.
         """
         tarinfo = self._getmember(name)
         if tarinfo is None:
@@ -1804,6 +1826,68 @@ class TarFile(object):
         """
         return [tarinfo.name for tarinfo in self.getmembers()]
 
+    def save_index(self, file):
+        """Write an index of the archive members to `file', a path or a
+           binary file object. The index maps each member name to the
+           offsets of its header and data and the size of its data. It can be
+           passed to load_index() or the `index' argument of the constructor
+           to look up members without scanning the archive.
+        """
+        self._check("r")
+        entries = []
+        for tarinfo in self.getmembers():
+            name = tarinfo.name.encode("utf-8", "surrogateescape")
+            entries.append(INDEX_ENTRY.pack(tarinfo.offset,
+                                            tarinfo.offset_data,
+                                            tarinfo.size, len(name)))
+            entries.append(name)
+        data = INDEX_HEADER.pack(INDEX_MAGIC, len(self.members))
+        data += b"".join(entries)
+
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "wb") as f:
+                f.write(data)
+        else:
+            file.write(data)
+
+    def load_index(self, file):
+        """Load an index written by save_index() from `file', a path or a
+           binary file object. getmember(), extract() and extractfile() then
+           seek directly to the header of the requested member, without
+           reading the members in front of it. The index must have been
+           created from the same archive.
+        """
+        self._check("r")
+        if isinstance(self.fileobj, _Stream):
+            raise StreamError("cannot use an index with a stream")
+
+        if isinstance(file, (str, bytes, os.PathLike)):
+            with bltn_open(file, "rb") as f:
+                data = f.read()
+        else:
+            data = file.read()
+
+        try:
+            magic, count = INDEX_HEADER.unpack_from(data)
+            if magic != INDEX_MAGIC:
+                raise ReadError("not a tar index file")
+            index = {}
+            pos = INDEX_HEADER.size
+            for i in range(count):
+                offset, offset_data, size, length = \
+                    INDEX_ENTRY.unpack_from(data, pos)
+                pos += INDEX_ENTRY.size
+                name = data[pos:pos + length].decode("utf-8",
+                                                     "surrogateescape")
+                pos += length
+                index.setdefault(name, []).append((offset, offset_data, size))
+        except struct.error:
+            raise ReadError("truncated tar index file") from None
+
+        self._index = index
+        self._normindex = None
+        self._indexed = {}
+
     def gettarinfo(self, name=None, arcname=None, fileobj=None):
         """Create a TarInfo object from the result of os.stat or equivalent
            on an existing file. The file is either named by `name', or
@@ -2011,28 +2095,48 @@ class TarFile(object):
 
         self.members.append(tarinfo)
 
-    def extractall(self, path=".", members=None, *, numeric_owner=False):
+    def extractall(self, path=".", members=None, *, numeric_owner=False,
+                   workers=None):
         """Extract all members from the archive to the current working
            directory and set owner, modification time and permissions on
            directories afterwards. `path' specifies a different directory
            to extract to. `members' is optional and must be a subset of the
            list returned by getmembers(). If `numeric_owner` is True, only
            the numbers for user/group names are used and not the names.
+           If `workers' is greater than 1, up to that many regular files
+           are extracted concurrently, each thread reading the archive
+           through its own file object. This requires an uncompressed
+           archive that can be reopened by name; otherwise the members are
+           extracted one at a time.
         """
         directories = []
 
         if members is None:
             members = self
 
-        for tarinfo in members:
-            if tarinfo.isdir():
-                # Extract directories with a safe mode.
-                directories.append(tarinfo)
-                tarinfo = copy.copy(tarinfo)
-                tarinfo.mode = 0o700
-            # Do not set_attrs directories, as we will do that further down
-            self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
-                         numeric_owner=numeric_owner)
+        if workers is not None and workers > 1 and self._can_reopen():
+            extract = self._parallel_extractor(path, numeric_owner, workers)
+            next(extract)
+        else:
+            extract = None
+
+        try:
+            for tarinfo in members:
+                if tarinfo.isdir():
+                    # Extract directories with a safe mode.
+                    directories.append(tarinfo)
+                    tarinfo = copy.copy(tarinfo)
+                    tarinfo.mode = 0o700
+                if extract is not None:
+                    extract.send(tarinfo)
+                    continue
+                # Do not set_attrs directories, as we will do that further
+                # down
+                self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                             numeric_owner=numeric_owner)
+        finally:
+            if extract is not None:
+                extract.close()
 
         # Reverse sort directories.
         directories.sort(key=lambda a: a.name)
@@ -2051,6 +2155,69 @@ class TarFile(object):
                 else:
                     self._dbg(1, "tarfile: %s" % e)
 
+    def _can_reopen(self):
+        """Return True if the archive can be read through independent file
+           objects, opened by name.
+        """
+        return (self.mode == "r" and isinstance(self.name, str) and
+                type(self.fileobj) is io.BufferedReader)
+
+    def _parallel_extractor(self, path, numeric_owner, workers):
+        """A generator extracting the TarInfo objects sent to it, handing
+           regular files to a pool of `workers' threads. Each thread uses a
+           shallow copy of the TarFile with its own file object. Members are
+           still extracted in archive order where it matters: before
+           extracting a link or special file, or a file whose name is already
+           being extracted, all pending files are waited for.
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        local = threading.local()
+        copies = []
+        lock = threading.Lock()
+
+        def extract(tarinfo):
+            tar = getattr(local, "tar", None)
+            if tar is None:
+                tar = local.tar = copy.copy(self)
+                tar.fileobj = bltn_open(self.name, "rb")
+                with lock:
+                    copies.append(tar)
+            tar.extract(tarinfo, path, numeric_owner=numeric_owner)
+
+        pending = {}
+        def wait():
+            futures = list(pending.values())
+            pending.clear()
+            for future in futures:
+                future.result()
+
+        executor = ThreadPoolExecutor(workers)
+        try:
+            while True:
+                tarinfo = yield
+                targetpath = os.path.join(path, tarinfo.name).rstrip("/")
+                if targetpath in pending or not (tarinfo.isreg() or
+                                                 tarinfo.isdir()):
+                    wait()
+                if tarinfo.isreg():
+                    # Create missing parent directories here rather than in
+                    # concurrent threads.
+                    upperdirs = os.path.dirname(targetpath)
+                    if upperdirs:
+                        os.makedirs(upperdirs, exist_ok=True)
+                    pending[targetpath] = executor.submit(extract, tarinfo)
+                else:
+                    self.extract(tarinfo, path, set_attrs=not tarinfo.isdir(),
+                                 numeric_owner=numeric_owner)
+        except GeneratorExit:
+            wait()
+        finally:
+            executor.shutdown()
+            for tar in copies:
+                tar.fileobj.close()
+
     def extract(self, member, path="", set_attrs=True, *, numeric_owner=False):
         """Extract a member from the archive to the current working directory,
            using its full name. Its file information is extracted as accurately
@@ -2355,6 +2522,9 @@ class TarFile(object):
         """Find an archive member by name from bottom to top.
            If tarinfo is given, it is used as the starting point.
         """
+        if self._index is not None and not self._loaded:
+            return self._getindexedmember(name, tarinfo, normalize)
+
         # Ensure that all members have been loaded.
         members = self.getmembers()
 
@@ -2374,6 +2544,47 @@ class TarFile(object):
             if name == member_name:
                 return member
 
+    def _getindexedmember(self, name, tarinfo=None, normalize=False):
+        """Find an archive member by name using the index, reading only its
+           header. If tarinfo is given, only members before it are searched.
+        """
+        if normalize:
+            if self._normindex is None:
+                self._normindex = {}
+                for member_name, entries in self._index.items():
+                    self._normindex.setdefault(
+                        os.path.normpath(member_name), []).extend(entries)
+                for entries in self._normindex.values():
+                    entries.sort()
+            entries = self._normindex.get(os.path.normpath(name), ())
+        else:
+            entries = self._index.get(name, ())
+
+        for offset, offset_data, size in reversed(entries):
+            if tarinfo is None or offset < tarinfo.offset:
+                break
+        else:
+            return None
+
+        member = self._indexed.get(offset)
+        if member is not None:
+            return member
+
+        # Read the header and restore the position of the next member,
+        # which is used by next().
+        saved_offset = self.offset
+        try:
+            self.fileobj.seek(offset)
+            member = self.tarinfo.fromtarfile(self)
+        except HeaderError as e:
+            raise ReadError(str(e)) from None
+        finally:
+            self.offset = saved_offset
+        if member.offset_data != offset_data or member.size != size:
+            raise ReadError("index does not match the archive")
+        self._indexed[offset] = member
+        return member
+
     def _load(self):
         """Read through the entire archive file and look for readable
            members.
@@ -78,7 +78,7 @@ class TestModule(unittest.TestCase):
                     if not name.startswith('__') and not name.endswith('__'))
         allowed = set(['MAXYEAR', 'MINYEAR', 'date', 'datetime',
                        'datetime_CAPI', 'time', 'timedelta', 'timezone',
-                       'tzinfo', 'sys'])
+                       'tzinfo', 'sys', 'StrptimeFormat'])
         self.assertEqual(names - allowed, set([]))
 
     def test_divide_and_round(self):
@@ -3063,6 +3063,75 @@ class TestSubclassDateTime(TestDateTime):
     def test_roundtrip(self):
         pass
 
+class TestStrptimeFormat(unittest.TestCase):
+
+    def assertParsesLikeStrptime(self, format, strings):
+        compiled = datetime_module.StrptimeFormat(format)
+        for string in strings:
+            with self.subTest(format=format, string=string):
+                try:
+                    expected = datetime.strptime(string, format)
+                except ValueError as exc:
+                    with self.assertRaisesRegex(ValueError, re.escape(str(exc))):
+                        compiled.parse(string)
+                else:
+                    got = compiled.parse(string)
+                    self.assertEqual(got, expected)
+                    self.assertEqual(got.tzinfo, expected.tzinfo)
+                    self.assertIs(type(got), datetime)
+
+    def test_fixed_width_formats(self):
+        self.assertParsesLikeStrptime('%Y-%m-%d %H:%M:%S', [
+            '2004-12-01 13:02:47', '2004-12-01 3:2:7', '2004-12-01  13:02:47',
+            '2004-12-01\t13:02:47', '2004-13-01 13:02:47',
+            '2004-02-30 13:02:47', '2004-12-01 24:00:00',
+            '2004-12-01 13:02:60', '2004-12-01 13:02:47 ', '0000-01-01 00:00:00',
+            '\uff12004-12-01 13:02:47', '', '2004-12-01'])
+        self.assertParsesLikeStrptime('%Y-%m-%dT%H:%M:%S.%f', [
+            '2004-12-01T13:02:47.1', '2004-12-01T13:02:47.000197',
+            '2004-12-01t13:02:47.197', '2004-12-01T13:02:47.',
+            '2004-12-01T13:02:47', '2004-12-01T13:02:47.1234567'])
+        self.assertParsesLikeStrptime('%d/%m/%Y', [
+            '01/12/2004', '1/12/2004', '31/12/2004', '29/02/1900'])
+        self.assertParsesLikeStrptime('%H%M%S', ['130247', '240000'])
+        self.assertParsesLikeStrptime('%m-%d', ['02-29', '12-01'])
+        self.assertParsesLikeStrptime('%Y%%%m', ['2004%12', '2004%%12'])
+
+    def test_other_formats(self):
+        self.assertParsesLikeStrptime('%d/%b/%Y:%H:%M:%S %z', [
+            '01/Dec/2004:13:02:47 +0200', '01/dec/2004:13:02:47 -02:30',
+            '01/Dec/2004:13:02:47', '01/Foo/2004:13:02:47 +0200'])
+        self.assertParsesLikeStrptime('%y %j %I%p', ['04 336 1pm', '04 336 12AM'])
+
+    def test_parse_many(self):
+        compiled = datetime_module.StrptimeFormat('%Y-%m-%d')
+        self.assertEqual(compiled.parse_many(['2004-12-01', '2004-1-2']),
+                         [datetime(2004, 12, 1), datetime(2004, 1, 2)])
+        self.assertEqual(compiled.parse_many(iter([])), [])
+        with self.assertRaises(ValueError):
+            compiled.parse_many(['2004-12-01', '2004/12/01'])
+
+    def test_attributes(self):
+        compiled = datetime_module.StrptimeFormat('%Y-%m-%d')
+        self.assertEqual(compiled.format, '%Y-%m-%d')
+        self.assertEqual(repr(compiled), "datetime.StrptimeFormat('%Y-%m-%d')")
+        for pickler, unpickler, proto in pickle_choices:
+            copied = unpickler.loads(pickler.dumps(compiled, proto))
+            self.assertEqual(copied.format, compiled.format)
+            self.assertEqual(copied.parse('2004-12-01'), datetime(2004, 12, 1))
+
+    def test_errors(self):
+        StrptimeFormat = datetime_module.StrptimeFormat
+        with self.assertRaises(TypeError):
+            StrptimeFormat(b'%Y')
+        with self.assertRaisesRegex(ValueError, "'q' is a bad directive"):
+            StrptimeFormat('%Y %q')
+        with self.assertRaisesRegex(ValueError, 'stray %'):
+            StrptimeFormat('%')
+        with self.assertRaises(TypeError):
+            StrptimeFormat('%Y').parse(b'2004')
+
+
 class SubclassTime(time):
     sub_var = 1
 
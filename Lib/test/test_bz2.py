@@ -269,6 +269,18 @@ class BZ2FileTest(BaseTest):
         with open(self.filename, "rb") as f:
             self.assertEqual(f.read(), expected)
 
+    def testWriteWorkers(self):
+        data = self.TEXT * 1000
+        with BZ2File(self.filename, "w", compresslevel=1, workers=4) as bz2f:
+            bz2f.write(data[:100])
+            bz2f.write(data[100:])
+        with open(self.filename, "rb") as f:
+            self.assertEqual(ext_decompress(f.read()), data)
+        with BZ2File(self.filename, "w", workers=2) as bz2f:
+            pass
+        with BZ2File(self.filename) as bz2f:
+            self.assertEqual(bz2f.read(), b"")
+
     def testWriteLines(self):
         with BZ2File(self.filename, "w") as bz2f:
             self.assertRaises(TypeError, bz2f.writelines)
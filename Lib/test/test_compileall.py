@@ -104,6 +104,67 @@ class CompileallTestsBase:
         # Test a change in mtime leads to a new .pyc.
         self.recreation_check(b'\0\0\0\0')
 
+    def test_hash_based_pyc_up_to_date(self):
+        # A hash-based pyc matching the source isn't recompiled, whatever
+        # the modification time of the source
+        checked = py_compile.PycInvalidationMode.CHECKED_HASH
+        unchecked = py_compile.PycInvalidationMode.UNCHECKED_HASH
+        self.assertTrue(compileall.compile_file(
+            self.source_path, quiet=True, invalidation_mode=checked))
+        os.utime(self.source_path, (1, 1))
+        with mock.patch('py_compile.compile') as compile_mock:
+            self.assertTrue(compileall.compile_file(
+                self.source_path, quiet=True, invalidation_mode=checked))
+            self.assertFalse(compile_mock.called)
+
+        # The pyc must use the requested invalidation mode
+        self.assertTrue(compileall.compile_file(
+            self.source_path, quiet=True, invalidation_mode=unchecked))
+        with open(self.bc_path, 'rb') as file:
+            self.assertEqual(int.from_bytes(file.read(8)[4:], 'little'),
+                             0b01)
+
+        # The pyc is recompiled if the source changed
+        with open(self.source_path, 'w') as file:
+            file.write('x = 456\n')
+        self.assertTrue(compileall.compile_file(
+            self.source_path, quiet=True, invalidation_mode=unchecked))
+        with open(self.bc_path, 'rb') as file:
+            data = file.read()
+        with open(self.source_path, 'rb') as file:
+            source_hash = importlib.util.source_hash(file.read())
+        self.assertEqual(data[8:16], source_hash)
+
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.directory, '_cache')
+        self.assertTrue(compileall.compile_dir(self.directory, quiet=True,
+                                               cache_dir=cache_dir))
+        with open(self.bc_path, 'rb') as file:
+            expected = file.read()
+        entries = [os.path.join(root, name)
+                   for root, dirs, files in os.walk(cache_dir)
+                   for name in files]
+        # The code objects of identical sources differ by their filename
+        self.assertEqual(len(entries), 3)
+
+        # Code is reused from the cache instead of being compiled
+        shutil.rmtree(os.path.dirname(self.bc_path))
+        with mock.patch('importlib.machinery.SourceFileLoader.source_to_code',
+                        side_effect=AssertionError):
+            self.assertTrue(compileall.compile_dir(self.directory,
+                                                   quiet=True,
+                                                   cache_dir=cache_dir))
+        with open(self.bc_path, 'rb') as file:
+            self.assertEqual(file.read(), expected)
+
+        # The code is cached for each optimization level
+        self.assertTrue(compileall.compile_file(self.source_path, quiet=True,
+                                                optimize=2,
+                                                cache_dir=cache_dir))
+        entries = [name for root, dirs, files in os.walk(cache_dir)
+                   for name in files]
+        self.assertEqual(len(entries), 4)
+
     def test_compile_files(self):
         # Test compiling a single file, and complete directory
         for fn in (self.bc_path, self.bc_path2):
@@ -193,6 +254,16 @@ class CompileallTestsBase:
         compileall.compile_dir(self.directory, quiet=True, workers=5)
         self.assertTrue(pool_mock.called)
 
+    @mock.patch('concurrent.futures.ProcessPoolExecutor')
+    def test_compile_pool_chunksize(self, pool_mock):
+        for index in range(200):
+            script_helper.make_script(self.directory, '_test_%d' % index, '')
+        compileall.compile_dir(self.directory, quiet=True, workers=2)
+        executor = pool_mock.return_value.__enter__.return_value
+        files, = executor.map.call_args[0][1:]
+        self.assertEqual(len(files), 203)
+        self.assertEqual(executor.map.call_args[1]['chunksize'], 25)
+
     def test_compile_workers_non_positive(self):
         with self.assertRaisesRegex(ValueError,
                                     "workers must be greater or equal to 0"):
@@ -758,6 +829,36 @@ class CommandLineTestsBase:
             data = fp.read()
         self.assertEqual(int.from_bytes(data[4:8], 'little'), 0b01)
 
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.directory, 'cache')
+        self.assertRunOK('--cache-dir', cache_dir, self.pkgdir)
+        self.assertCompiled(self.initfn)
+        self.assertTrue(os.listdir(cache_dir))
+
+    def test_archive(self):
+        archive = os.path.join(self.directory, 'code.pyca')
+        self.assertRunOK('-q', '--archive', archive, self.directory)
+        self.assertCompiled(self.barfn)
+        shutil.rmtree(self.pkgdir_cachedir)
+        code = """if 1:
+            import sys
+            from importlib.machinery import CodeArchiveFinder
+            sys.path_hooks.insert(0, CodeArchiveFinder.path_hook(sys.argv[1]))
+            sys.path_importer_cache.clear()
+            sys.path.insert(0, sys.argv[2])
+            import foo.bar
+            print(type(foo.bar.__loader__).__name__)
+            """
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, archive, self.directory)
+        self.assertEqual(out.strip(), b'_CodeArchiveSourceLoader')
+        # The bytecode was read from the archive
+        self.assertFalse(os.path.exists(self.pkgdir_cachedir))
+
+    def test_archive_without_dests(self):
+        rc, out, err = self.assertRunNotOK('--archive', 'code.pyca')
+        self.assertIn(b'--archive requires', err)
+
     @skipUnless(_have_multiprocessing, "requires multiprocessing")
     def test_workers(self):
         bar2fn = script_helper.make_script(self.directory, 'bar2', '')
@@ -445,6 +445,32 @@ class TestCopy(unittest.TestCase):
         # Tuples with immutable contents are immutable for deepcopy.
         self.assertEqual(len(memo), 2)
 
+    def test_deepcopy_tree(self):
+        class C:
+            def __init__(self, items):
+                self.items = items
+            def __deepcopy__(self, memo):
+                return C(copy.deepcopy(self.items, memo))
+
+        shared = [1.5, 'a']
+        inner = (shared, 2)
+        x = {'a': [shared, inner, None, True],
+             ('k', 1): {'b': shared, 'c': (1, 'z')},
+             'inst': C(shared)}
+        x['a'].append(x)
+        y = copy.deepcopy(x)
+        self.assertIsNot(y, x)
+        self.assertIs(y['a'][4], y)
+        copied = y['a'][0]
+        self.assertEqual(copied, shared)
+        self.assertIsNot(copied, shared)
+        self.assertIs(y['a'][1][0], copied)
+        self.assertIs(y[('k', 1)]['b'], copied)
+        self.assertIs(y['inst'].items, copied)
+        self.assertIs(y[('k', 1)]['c'], x[('k', 1)]['c'])
+        self.assertIs(y['a'][3], True)
+        self.assertIs(copy.deepcopy('abc'), 'abc')
+
     def test_deepcopy_inst_vanilla(self):
         class C:
             def __init__(self, foo):
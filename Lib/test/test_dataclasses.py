@@ -4,8 +4,10 @@
 
 from dataclasses import *
 
+import types
 import pickle
 import inspect
+import weakref
 import builtins
 import unittest
 from unittest.mock import Mock
@@ -1934,6 +1936,49 @@ class TestCase(unittest.TestCase):
                     self.assertEqual(new_sample.x, another_new_sample.x)
                     self.assertEqual(sample.y, another_new_sample.y)
 
+    def test_identical_layouts(self):
+        # Classes with the same fields share compiled code, but each
+        # gets its own functions and defaults.
+        def make(default):
+            @dataclass(order=True, frozen=True)
+            class C:
+                x: int
+                y: int = default
+            return C
+
+        C1 = make(1)
+        C2 = make(2)
+        self.assertEqual(C1(0), C1(0, 1))
+        self.assertEqual(C2(0), C2(0, 2))
+        self.assertNotEqual(C1(0), C2(0, 1))
+        self.assertLess(C1(0), C1(1))
+        self.assertEqual(hash(C1(0)), hash(C1(0, 1)))
+        self.assertIsNot(C1.__init__, C2.__init__)
+        self.assertIsNot(C1.__eq__, C2.__eq__)
+        self.assertIs(C1.__init__.__code__, C2.__init__.__code__)
+
+    def test_lazy_methods(self):
+        @dataclass(order=True, unsafe_hash=True)
+        class Base:
+            x: int
+
+        class Derived(Base):
+            pass
+
+        # Methods are generated on first use, even through a subclass.
+        self.assertEqual(repr(Derived(1)),
+                         'TestCase.test_lazy_methods.<locals>.Derived(x=1)')
+        self.assertIsInstance(Base.__dict__['__repr__'], types.FunctionType)
+        self.assertEqual(Derived(1), Derived(1))
+        self.assertGreater(Derived(2), Derived(1))
+        self.assertEqual(hash(Derived(1)), hash(Base(1)))
+        for name in '__eq__', '__gt__', '__hash__':
+            with self.subTest(name=name):
+                self.assertIsInstance(Base.__dict__[name], types.FunctionType)
+        self.assertNotIsInstance(Base.__dict__['__le__'], types.FunctionType)
+        self.assertIsInstance(Base.__le__, types.FunctionType)
+        self.assertEqual(Base.__le__.__name__, '__le__')
+
 
 class TestFieldNoAnnotation(unittest.TestCase):
     def test_field_without_annotation(self):
@@ -2731,6 +2776,122 @@ class TestSlots(unittest.TestCase):
         # We can add a new field to the derived instance.
         d.z = 10
 
+    def test_generated_slots(self):
+        @dataclass(slots=True)
+        class C:
+            x: int
+            y: int = 5
+
+        self.assertEqual(C.__slots__, ('x', 'y'))
+        self.assertEqual(C.__qualname__,
+                         'TestSlots.test_generated_slots.<locals>.C')
+        self.assertTrue(C.__dataclass_params__.slots)
+        c = C(1)
+        self.assertEqual((c.x, c.y), (1, 5))
+        self.assertEqual(C(1, 2), C(1, 2))
+        self.assertFalse(hasattr(c, '__dict__'))
+        with self.assertRaisesRegex(AttributeError,
+                                    "'C' object has no attribute 'z'"):
+            c.z = 5
+        with self.assertRaises(TypeError):
+            weakref.ref(c)
+        self.assertEqual(C.__init__.__defaults__, (5,))
+
+    def test_generated_slots_defaults(self):
+        @dataclass(slots=True)
+        class C:
+            x: list = field(default_factory=list)
+            y: int = field(default=3, init=False)
+
+        a = C()
+        b = C()
+        self.assertEqual((a.x, a.y), ([], 3))
+        self.assertIsNot(a.x, b.x)
+
+    def test_generated_slots_frozen(self):
+        @dataclass(slots=True, frozen=True)
+        class C:
+            x: int
+
+        c = C(1)
+        with self.assertRaises(FrozenInstanceError):
+            c.x = 2
+        with self.assertRaises(FrozenInstanceError):
+            del c.x
+        with self.assertRaises(AttributeError):
+            c.y = 2
+        self.assertEqual(hash(c), hash(C(1)))
+
+    def test_generated_slots_inheritance(self):
+        @dataclass(slots=True)
+        class Base:
+            x: int
+
+        @dataclass(slots=True)
+        class Derived(Base):
+            y: int
+
+            def total(self):
+                return super().total_base() + self.y
+
+        Base.total_base = lambda self: self.x
+        self.assertEqual(Derived.__slots__, ('y',))
+        d = Derived(1, 2)
+        self.assertEqual((d.x, d.y), (1, 2))
+        self.assertEqual(d.total(), 3)
+        self.assertFalse(hasattr(d, '__dict__'))
+
+    def test_generated_slots_pickle(self):
+        global PickleSlots, FrozenPickleSlots
+        @dataclass(slots=True)
+        class PickleSlots:
+            x: int
+            y: str = 'y'
+
+        @dataclass(slots=True, frozen=True)
+        class FrozenPickleSlots:
+            x: int
+            y: str = 'y'
+
+        for cls in PickleSlots, FrozenPickleSlots:
+            cls.__qualname__ = cls.__name__
+            obj = cls(1)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(cls=cls.__name__, proto=proto):
+                    self.assertEqual(pickle.loads(pickle.dumps(obj, proto)),
+                                     obj)
+        del PickleSlots, FrozenPickleSlots
+
+    def test_weakref_slot(self):
+        @dataclass(slots=True, weakref_slot=True)
+        class C:
+            x: int
+
+        self.assertEqual(C.__slots__, ('x', '__weakref__'))
+        c = C(1)
+        self.assertIs(weakref.ref(c)(), c)
+        self.assertFalse(hasattr(c, '__dict__'))
+
+        with self.assertRaisesRegex(TypeError,
+                                    'weakref_slot is True but slots is False'):
+            @dataclass(weakref_slot=True)
+            class D:
+                x: int
+
+    def test_slots_already_defined(self):
+        with self.assertRaisesRegex(TypeError,
+                                    'C already specifies __slots__'):
+            @dataclass(slots=True)
+            class C:
+                __slots__ = ('x',)
+                x: int
+
+    def test_make_dataclass_slots(self):
+        C = make_dataclass('C', [('x', int), ('y', int, field(default=0))],
+                           slots=True)
+        self.assertEqual(C.__slots__, ('x', 'y'))
+        self.assertEqual(C(1), C(1, 0))
+
 class TestDescriptors(unittest.TestCase):
     def test_set_name(self):
         # See bpo-33141.
@@ -61,6 +61,123 @@ class TestAutojunk(unittest.TestCase):
         self.assertEqual(sm.bpopular, set())
 
 
+class LinearMatcherTests:
+    # Mixin for the SequenceMatcher subclasses with linear-time algorithms.
+    matcher = None
+
+    def check_blocks(self, a, b):
+        blocks = self.matcher(None, a, b).get_matching_blocks()
+        self.assertEqual(blocks[-1], (len(a), len(b), 0))
+        i1 = j1 = 0
+        for i, j, k in blocks[:-1]:
+            self.assertGreater(k, 0)
+            self.assertEqual(a[i:i+k], b[j:j+k])
+            # Ascending, non-overlapping and non-adjacent.
+            self.assertGreaterEqual(i, i1)
+            self.assertGreaterEqual(j, j1)
+            self.assertFalse(i == i1 and j == j1 and (i, j) != (0, 0))
+            i1, j1 = i + k, j + k
+        return sum(k for i, j, k in blocks)
+
+    def test_opcodes(self):
+        sm = self.matcher(None, 'b' * 100, 'b' * 50 + 'a' + 'b' * 50)
+        self.assertAlmostEqual(sm.ratio(), 0.995, places=3)
+        self.assertEqual(sm.get_opcodes(),
+            [   ('equal', 0, 50, 0, 50),
+                ('insert', 50, 50, 50, 51),
+                ('equal', 50, 100, 51, 101)])
+        sm = self.matcher(None, 'qabxcd', 'abycdf')
+        self.assertEqual(sm.get_opcodes(),
+            [   ('delete', 0, 1, 0, 0),
+                ('equal', 1, 3, 0, 2),
+                ('replace', 3, 4, 2, 3),
+                ('equal', 4, 6, 3, 5),
+                ('insert', 6, 6, 5, 6)])
+
+    def test_empty(self):
+        self.assertEqual(self.matcher(None, '', '').get_opcodes(), [])
+        self.assertEqual(self.matcher(None, 'ab', '').get_opcodes(),
+                         [('delete', 0, 2, 0, 0)])
+        self.assertEqual(self.matcher(None, '', 'ab').get_opcodes(),
+                         [('insert', 0, 0, 0, 2)])
+        self.assertEqual(self.matcher(None, [], []).ratio(), 1.0)
+
+    def test_no_autojunk(self):
+        # The popular element heuristic of SequenceMatcher doesn't apply.
+        sm = self.matcher(None, 'b' * 200, 'a' + 'b' * 200)
+        self.assertAlmostEqual(sm.ratio(), 0.9975, places=3)
+
+    def test_random(self):
+        import random
+        rnd = random.Random(42)
+        for n in range(500):
+            a = [rnd.choice('abc') for _ in range(rnd.randrange(20))]
+            b = [rnd.choice('abcd') for _ in range(rnd.randrange(20))]
+            self.check_blocks(a, b)
+
+    def test_large(self):
+        a = ['line %d\n' % i for i in range(20000)]
+        b = a[:]
+        del b[500:600]
+        b[5000:5000] = ['new\n'] * 10
+        for i in range(0, len(b), 1000):
+            b[i] = 'changed\n'
+        self.assertEqual(self.check_blocks(a, b), 19881)
+
+    def test_diff_functions(self):
+        a = ['one\n', 'two\n', 'three\n', 'four\n']
+        b = ['zero\n', 'one\n', 'tree\n', 'four\n']
+        self.assertEqual(
+            list(difflib.unified_diff(a, b, matcher=self.matcher)),
+            list(difflib.unified_diff(a, b)))
+        self.assertEqual(
+            list(difflib.context_diff(a, b, matcher=self.matcher)),
+            list(difflib.context_diff(a, b)))
+        self.assertEqual(list(difflib.ndiff(a, b, matcher=self.matcher)),
+                         list(difflib.ndiff(a, b)))
+        self.assertEqual(
+            list(difflib.Differ(matcher=self.matcher).compare(a, b)),
+            list(difflib.Differ().compare(a, b)))
+
+
+class TestMyers(LinearMatcherTests, unittest.TestCase):
+    matcher = difflib.MyersSequenceMatcher
+
+    def test_minimal(self):
+        # The matches found are a longest common subsequence.
+        import random
+        def lcs_length(a, b):
+            prev = [0] * (len(b) + 1)
+            for x in a:
+                cur = [0]
+                for j, y in enumerate(b):
+                    cur.append(prev[j] + 1 if x == y else max(prev[j+1], cur[j]))
+                prev = cur
+            return prev[-1]
+        rnd = random.Random(42)
+        for n in range(500):
+            a = [rnd.choice('abc') for _ in range(rnd.randrange(20))]
+            b = [rnd.choice('abcd') for _ in range(rnd.randrange(20))]
+            self.assertEqual(self.check_blocks(a, b), lcs_length(a, b))
+
+
+class TestPatience(LinearMatcherTests, unittest.TestCase):
+    matcher = difflib.PatienceSequenceMatcher
+
+    def test_unique_anchors(self):
+        a = ['{', 'f', '}', '{', 'g', '}']
+        b = ['{', 'g', '}', '{', 'h', '}', '{', 'f', '}']
+        # Only 'f', 'g' and 'h' are unique, and only one of 'f' and 'g' can
+        # be matched.  The braces are never used as anchors.
+        sm = self.matcher(None, a, b)
+        self.assertEqual(sm.get_opcodes(),
+            [   ('equal', 0, 1, 0, 1),
+                ('delete', 1, 4, 1, 1),
+                ('equal', 4, 5, 1, 2),
+                ('insert', 5, 5, 2, 8),
+                ('equal', 5, 6, 8, 9)])
+
+
 class TestSFbugs(unittest.TestCase):
     def test_ratio_for_null_seqn(self):
         # Check clearing of SF bug 763023
@@ -551,7 +668,8 @@ def test_main():
     difflib.HtmlDiff._default_prefix = 0
     Doctests = doctest.DocTestSuite(difflib)
     run_unittest(
-        TestWithAscii, TestAutojunk, TestSFpatches, TestSFbugs,
+        TestWithAscii, TestAutojunk, TestMyers, TestPatience,
+        TestSFpatches, TestSFbugs,
         TestOutputFormat, TestBytes, TestJunkAPIs, TestFindLongest, Doctests)
 
 if __name__ == '__main__':
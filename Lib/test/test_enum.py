@@ -1680,6 +1680,20 @@ class TestEnum(unittest.TestCase):
             self.assertEqual(enum.value, [value])
             self.assertIs(ColorInAList([value]), enum)
 
+    def test_nonhash_value_aliases(self):
+        class Coordinate(Enum):
+            origin = [0, 0]
+            x = 1
+            zero = [0, 0]
+            one = 1
+            unit = 1.0
+        self.assertEqual(list(Coordinate), [Coordinate.origin, Coordinate.x])
+        self.assertIs(Coordinate.zero, Coordinate.origin)
+        self.assertIs(Coordinate.one, Coordinate.x)
+        self.assertIs(Coordinate.unit, Coordinate.x)
+        self.assertIs(Coordinate([0, 0]), Coordinate.origin)
+        self.assertIs(Coordinate(1.0), Coordinate.x)
+
     def test_conflicting_types_resolved_in_new(self):
         class LabelledIntEnum(int, Enum):
             def __new__(cls, *args):
@@ -2131,6 +2145,25 @@ class TestFlag(unittest.TestCase):
         for f in Open:
             self.assertEqual(bool(f.value), bool(f))
 
+    def test_pseudo_members(self):
+        class Mode(Flag):
+            A = 1
+            B = 2
+            AB = 3
+            D = 8
+            CD = 12
+        self.assertIs(Mode(11), Mode(11))
+        self.assertEqual(Mode(11).value, 11)
+        self.assertIs(Mode.A | Mode.D, Mode(9))
+        # bit 4 is only part of a multi-bit member
+        with self.assertRaises(ValueError):
+            Mode(4)
+        with self.assertRaises(ValueError):
+            Mode(5)
+        with self.assertRaises(ValueError):
+            Mode(16)
+        self.assertIs(Mode(12), Mode.CD)
+
     def test_programatic_function_string(self):
         Perm = Flag('Perm', 'R W X')
         lst = list(Perm)
@@ -2709,6 +2742,19 @@ class TestIntFlag(unittest.TestCase):
         for f in Open:
             self.assertEqual(bool(f.value), bool(f))
 
+    def test_pseudo_members(self):
+        Perm = self.Perm
+        self.assertIs(Perm(7), Perm.R | Perm.W | Perm.X)
+        self.assertIs(Perm(5), Perm(5))
+        self.assertEqual(Perm(9).value, 9)
+        self.assertIs(type(Perm(8)), Perm)
+        self.assertIs(Perm(9), Perm.X | Perm(8))
+        self.assertIs(Perm(-1), ~Perm(0))
+        Open = self.Open
+        self.assertIs(Open.WO | Open.RW, Open.AC)
+        self.assertIs(Open.CE | Perm.R, Open(4 | 1<<19))
+        self.assertIs(Perm.R | Open.CE, Perm(4 | 1<<19))
+
     def test_multiple_mixin(self):
         class AllMixin:
             @classproperty
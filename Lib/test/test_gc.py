@@ -761,10 +761,13 @@ class GCTests(unittest.TestCase):
         for st in stats:
             self.assertIsInstance(st, dict)
             self.assertEqual(set(st),
-                             {"collected", "collections", "uncollectable"})
+                             {"collected", "collections", "uncollectable",
+                              "examined", "duration"})
             self.assertGreaterEqual(st["collected"], 0)
             self.assertGreaterEqual(st["collections"], 0)
             self.assertGreaterEqual(st["uncollectable"], 0)
+            self.assertGreaterEqual(st["examined"], 0)
+            self.assertGreaterEqual(st["duration"], 0.0)
         # Check that collection counts are incremented correctly
         if gc.isenabled():
             self.addCleanup(gc.enable)
@@ -780,6 +783,8 @@ class GCTests(unittest.TestCase):
         self.assertEqual(new[0]["collections"], old[0]["collections"] + 1)
         self.assertEqual(new[1]["collections"], old[1]["collections"])
         self.assertEqual(new[2]["collections"], old[2]["collections"] + 1)
+        self.assertGreater(new[2]["examined"], old[2]["examined"])
+        self.assertGreater(new[2]["duration"], old[2]["duration"])
 
     def test_freeze(self):
         gc.freeze()
@@ -787,6 +792,148 @@ class GCTests(unittest.TestCase):
         gc.unfreeze()
         self.assertEqual(gc.get_freeze_count(), 0)
 
+    @cpython_only
+    def test_freeze_immortalize(self):
+        # Immortal objects are never freed: use a child process
+        code = """if 1:
+            import gc, sys, weakref
+
+            class A:
+                pass
+
+            a = A()
+            a.attr = ('%s%d' % ('spam', 42), 1.5)
+            a.dict = {'%s%d' % ('key', 42): None}
+            assert sys.getrefcount(a.attr[0]) < 100
+            wr = weakref.ref(a)
+            gc.freeze(immortalize=True)
+            frozen = gc.get_freeze_count()
+
+            # The reference counts of the frozen objects, and of the
+            # objects they refer to, don't change anymore
+            key = next(iter(a.dict))
+            for obj in (a, a.attr, a.attr[0], a.attr[1], key, A, None):
+                count = sys.getrefcount(obj)
+                refs = [obj] * 10
+                assert sys.getrefcount(obj) == count, obj
+                del refs
+                assert sys.getrefcount(obj) == count, obj
+            del a
+            gc.collect()
+            assert wr() is not None
+
+            # New objects are still freed
+            b = A()
+            count = sys.getrefcount(b)
+            refs = [b] * 10
+            assert sys.getrefcount(b) == count + 10
+            wr = weakref.ref(b)
+            del b, refs
+            assert wr() is None
+
+            # Immortal objects stay frozen
+            gc.unfreeze()
+            assert gc.get_freeze_count() == frozen
+            gc.freeze()
+            gc.unfreeze()
+            assert gc.get_freeze_count() == frozen
+            print('ok')
+            """
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertEqual(out.strip(), b'ok')
+
+    def test_pause_budget(self):
+        self.addCleanup(gc.set_pause_budget, gc.get_pause_budget())
+        gc.set_pause_budget(0.01)
+        self.assertEqual(gc.get_pause_budget(), 0.01)
+        gc.set_pause_budget(0)
+        self.assertEqual(gc.get_pause_budget(), 0.0)
+        self.assertRaises(ValueError, gc.set_pause_budget, -1)
+        self.assertRaises(ValueError, gc.set_pause_budget, float('nan'))
+        self.assertRaises(OverflowError, gc.set_pause_budget, float('inf'))
+        self.assertRaises(TypeError, gc.set_pause_budget, '1')
+        self.assertEqual(gc.get_pause_budget(), 0.0)
+
+    def run_incremental(self, until, budget=1e-4):
+        # Let automatic collections run with a pause budget until until()
+        # is true, and return the number of collections of the oldest
+        # generation done meanwhile.
+        self.addCleanup(gc.set_pause_budget, gc.get_pause_budget())
+        self.addCleanup(gc.set_threshold, *gc.get_threshold())
+        if not gc.isenabled():
+            self.addCleanup(gc.disable)
+            gc.enable()
+        gc.set_pause_budget(budget)
+        gc.set_threshold(100, 1, 1)
+        start = gc.get_stats()[2]["collections"]
+        for i in range(100000):
+            if until():
+                break
+            # Allocate a few long-lived objects so that collections of the
+            # oldest generation are triggered.
+            self.long_lived.append([])
+        else:
+            self.fail("incremental collection did not complete")
+        return gc.get_stats()[2]["collections"] - start
+
+    @cpython_only
+    def test_incremental_collection(self):
+        class A:
+            pass
+        gc.collect()
+        self.long_lived = [[] for _ in range(5000)]
+        a = A()
+        a.a = a
+        wr = weakref.ref(a)
+        gc.collect(1)
+        # The cycle is in the oldest generation now
+        del a
+        self.assertIsNotNone(wr())
+        self.assertTrue(any(o is self.long_lived
+                            for o in gc.get_objects(generation=2)))
+        collections = self.run_incremental(lambda: wr() is None)
+        # More than one step was needed
+        self.assertGreater(collections, 1)
+        # Objects of the oldest generation are still found while an
+        # incremental collection is in progress
+        objects = gc.get_objects(generation=2)
+        self.assertTrue(any(o is self.long_lived for o in objects))
+        self.assertIn(self.long_lived, gc.get_referrers(self.long_lived[0]))
+
+        # Disabling incremental collection stops the one in progress
+        gc.set_pause_budget(0)
+        self.assertTrue(any(o is self.long_lived
+                            for o in gc.get_objects(generation=2)))
+        del self.long_lived
+
+    @cpython_only
+    def test_incremental_collection_freeze(self):
+        class A:
+            pass
+        gc.collect()
+        self.long_lived = [[] for _ in range(5000)]
+        refs = []
+        frozen = []
+
+        def until():
+            # Create cycles and freeze while a collection is in progress
+            a = A()
+            a.a = a
+            refs.append(weakref.ref(a))
+            if len(refs) == 1000:
+                gc.freeze()
+                frozen.append(gc.get_freeze_count())
+                gc.unfreeze()
+            return len(refs) > 2000
+
+        self.addCleanup(gc.unfreeze)
+        self.run_incremental(until)
+        self.assertGreater(frozen[0], len(self.long_lived))
+        self.assertEqual(gc.get_freeze_count(), 0)
+        del self.long_lived
+        gc.collect()
+        self.assertEqual([r for r in refs if r() is not None], [])
+
     def test_get_objects(self):
         gc.collect()
         l = []
@@ -1117,6 +1264,8 @@ class GCCallbackTests(unittest.TestCase):
             self.assertTrue("generation" in info)
             self.assertTrue("collected" in info)
             self.assertTrue("uncollectable" in info)
+            self.assertTrue("examined" in info)
+            self.assertTrue("duration" in info)
 
     def test_collect_generation(self):
         self.preclean()
@@ -118,6 +118,29 @@ class TestGzip(BaseTest):
         with gzip.GzipFile(self.filename, 'rb') as f:
             self.assertEqual(f.read(), data1)
 
+    def test_write_workers(self):
+        data = b''.join(data1 + str(i).encode() for i in range(20000))
+        with gzip.GzipFile(self.filename, 'wb', workers=4) as f:
+            f.write(data[:1000])
+            f.flush()
+            f.write(data[1000:])
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), data)
+
+    def test_write_workers_empty(self):
+        with gzip.GzipFile(self.filename, 'wb', workers=2):
+            pass
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), b'')
+
+    def test_write_workers_full_flush(self):
+        with gzip.GzipFile(self.filename, 'wb', workers=2) as f:
+            f.write(data1 * 50)
+            f.flush(gzip.zlib.Z_FULL_FLUSH)
+            f.write(data2 * 50)
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), data1 * 50 + data2 * 50)
+
     def test_read(self):
         self.test_write()
         # Try reading.
@@ -284,6 +307,56 @@ class TestGzip(BaseTest):
                 f.seek(pos)
                 f.write(b'GZ\n')
 
+    def test_index(self):
+        data = b''.join(b'%d %x\n' % (i, i * i * 7919) for i in range(20000))
+        half = len(data) // 2
+        # Two members, to check that checkpoints work in both.
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.write(data[:half])
+        with gzip.GzipFile(self.filename, 'ab') as f:
+            f.write(data[half:])
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            f.read(100)
+            f.build_index(4096)
+            self.assertEqual(f.tell(), 100)
+            self.assertEqual(f.read(100), data[100:200])
+            index = f._buffer.raw._index
+            self.assertGreater(len(index), 5)
+            self.assertTrue(any(pos > half for pos, *_ in index))
+            for pos in (len(data) - 1, 5000, half - 10, 0, 3 * half // 2):
+                self.assertEqual(f.seek(pos), pos)
+                self.assertEqual(f.read(5000), data[pos:pos + 5000])
+            self.assertEqual(f.seek(-10, io.SEEK_END), len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            index_file = io.BytesIO()
+            f.save_index(index_file)
+
+        index_file.seek(0)
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            f.load_index(index_file)
+            self.assertEqual(f._buffer.raw._index, index)
+            self.assertEqual(f.seek(-10, io.SEEK_END), len(data) - 10)
+            self.assertEqual(f.read(), data[-10:])
+            self.assertEqual(f.seek(half + 10), half + 10)
+            self.assertEqual(f.read(), data[half + 10:])
+            f.seek(0)
+            self.assertEqual(f.read(), data)
+
+    def test_index_bad(self):
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            f.write(data1 * 50)
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertRaises(ValueError, f.build_index, 0)
+            self.assertRaises(gzip.BadGzipFile, f.load_index,
+                              io.BytesIO(b'not an index'))
+            f.build_index(1000)
+            index_file = io.BytesIO()
+            f.save_index(index_file)
+            self.assertRaises(gzip.BadGzipFile, f.load_index,
+                              io.BytesIO(index_file.getvalue()[:-1]))
+        with gzip.GzipFile(self.filename, 'wb') as f:
+            self.assertRaises(io.UnsupportedOperation, f.build_index)
+
     def test_mode(self):
         self.test_write()
         with gzip.GzipFile(self.filename, 'r') as f:
@@ -657,6 +730,13 @@ class TestOpen(BaseTest):
             file_data = gzip.decompress(f.read())
             self.assertEqual(file_data, uncompressed)
 
+    def test_workers(self):
+        uncompressed = data1.decode("ascii") * 5000
+        with gzip.open(self.filename, "wt", workers=2) as f:
+            f.write(uncompressed)
+        with gzip.open(self.filename, "rt") as f:
+            self.assertEqual(f.read(), uncompressed)
+
     def test_text_modes(self):
         uncompressed = data1.decode("ascii") * 50
         uncompressed_raw = uncompressed.replace("\n", os.linesep)
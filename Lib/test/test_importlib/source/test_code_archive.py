@@ -0,0 +1,207 @@
+from .. import util
+
+machinery = util.import_importlib('importlib.machinery')
+
+import compileall
+import importlib.util
+import os
+import py_compile
+import shutil
+import tempfile
+import unittest
+from test.support import os_helper
+
+
+class CodeArchiveFinderTests:
+
+    """Test CodeArchiveFinder and the code archives of compileall."""
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(os_helper.rmtree, self.root)
+        self.archive = os.path.join(self.root, 'code.pyca')
+        self.dir = os.path.join(self.root, 'lib')
+        self.write_source('mod.py', 'attr = "module"\n')
+        self.write_source('pkg/__init__.py', 'attr = "package"\n')
+        self.write_source('pkg/sub.py', 'attr = "submodule"\n')
+
+    def tearDown(self):
+        # Unmap the archive, for it to be removed on Windows
+        cache = self.machinery.CodeArchiveFinder.__init__.__globals__
+        cache['_code_archive_cache'].pop(self.archive, None)
+
+    def write_source(self, name, source):
+        path = os.path.join(self.dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(source)
+        return path
+
+    def write_archive(self, **kwargs):
+        self.assertTrue(compileall.compile_dir(self.dir, quiet=2, **kwargs))
+        kwargs.pop('invalidation_mode', None)
+        compileall.write_archive(self.archive, [self.dir], quiet=2, **kwargs)
+        # Make sure that the bytecode is read from the archive
+        for dirpath, dirnames, filenames in os.walk(self.dir):
+            if '__pycache__' in dirnames:
+                shutil.rmtree(os.path.join(dirpath, '__pycache__'))
+
+    def finder(self, path=None):
+        hook = self.machinery.CodeArchiveFinder.path_hook(self.archive)
+        return hook(path or self.dir)
+
+    def load(self, spec):
+        namespace = {}
+        exec(spec.loader.get_code(spec.name), namespace)
+        return namespace['attr']
+
+    def test_module(self):
+        self.write_archive(
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        # The unchecked bytecode of the archive is used
+        self.write_source('mod.py', 'attr = "changed"\n')
+        spec = self.finder().find_spec('mod')
+        self.assertIsInstance(spec.loader, self.machinery.SourceFileLoader)
+        self.assertEqual(spec.origin, os.path.join(self.dir, 'mod.py'))
+        self.assertIsNone(spec.submodule_search_locations)
+        self.assertEqual(self.load(spec), 'module')
+        self.assertFalse(os.path.exists(os.path.dirname(spec.cached)))
+
+    def test_stale_module(self):
+        self.write_archive()
+        spec = self.finder().find_spec('mod')
+        self.assertEqual(self.load(spec), 'module')
+        self.assertFalse(os.path.exists(os.path.dirname(spec.cached)))
+        path = self.write_source('mod.py', 'attr = "changed!"\n')
+        os.utime(path, (0, 0))
+        spec = self.finder().find_spec('mod')
+        self.assertEqual(self.load(spec), 'changed!')
+
+    def test_package(self):
+        self.write_archive()
+        spec = self.finder().find_spec('pkg')
+        pkg_dir = os.path.join(self.dir, 'pkg')
+        self.assertEqual(spec.origin, os.path.join(pkg_dir, '__init__.py'))
+        self.assertEqual(spec.submodule_search_locations, [pkg_dir])
+        self.assertEqual(self.load(spec), 'package')
+        spec = self.finder(pkg_dir).find_spec('pkg.sub')
+        self.assertEqual(self.load(spec), 'submodule')
+
+    def test_sourceless(self):
+        self.write_archive(legacy=True)
+        os.unlink(os.path.join(self.dir, 'mod.py'))
+        os.unlink(os.path.join(self.dir, 'mod.pyc'))
+        spec = self.finder().find_spec('mod')
+        self.assertIsInstance(spec.loader,
+                              self.machinery.SourcelessFileLoader)
+        self.assertEqual(spec.origin, os.path.join(self.dir, 'mod.pyc'))
+        self.assertEqual(self.load(spec), 'module')
+
+    def test_removed_source(self):
+        self.write_archive()
+        finder = self.finder()
+        os.unlink(os.path.join(self.dir, 'mod.py'))
+        finder.invalidate_caches()
+        self.assertIsNone(finder.find_spec('mod'))
+        hooks = [self.machinery.CodeArchiveFinder.path_hook(self.archive)]
+        with util.import_state(meta_path=[self.machinery.PathFinder],
+                               path=[self.dir], path_hooks=hooks), \
+             util.uncache('mod'):
+            with self.assertRaises(ModuleNotFoundError):
+                self.__import__('mod')
+
+    def test_shadowing_package(self):
+        # A package takes precedence over an archived module, as for
+        # FileFinder.
+        self.write_archive()
+        finder = self.finder()
+        self.write_source('mod/__init__.py', 'attr = "package"\n')
+        finder.invalidate_caches()
+        spec = finder.find_spec('mod')
+        self.assertIs(type(spec.loader), self.machinery.SourceFileLoader)
+        self.assertEqual(spec.origin,
+                         os.path.join(self.dir, 'mod', '__init__.py'))
+        self.assertEqual(self.load(spec), 'package')
+
+    def test_get_data(self):
+        self.write_archive()
+        spec = self.finder().find_spec('mod')
+        data = spec.loader.get_data(spec.cached)
+        self.assertIs(type(data), bytes)
+        self.assertEqual(data[:4], importlib.util.MAGIC_NUMBER)
+
+    def test_not_archived(self):
+        self.write_archive()
+        self.write_source('new.py', 'attr = "new"\n')
+        finder = self.finder()
+        spec = finder.find_spec('new')
+        self.assertIs(type(spec.loader), self.machinery.SourceFileLoader)
+        self.assertEqual(self.load(spec), 'new')
+        self.assertIsNone(finder.find_spec('missing'))
+
+    def test_import(self):
+        self.write_archive()
+        hooks = [self.machinery.CodeArchiveFinder.path_hook(self.archive)]
+        with util.import_state(meta_path=[self.machinery.PathFinder],
+                               path=[self.dir], path_hooks=hooks), \
+             util.uncache('pkg', 'pkg.sub'):
+            module = self.__import__('pkg.sub', fromlist=['attr'])
+            self.assertEqual(module.attr, 'submodule')
+            self.assertIsInstance(module.__loader__,
+                                  self.machinery.SourceFileLoader)
+
+    def test_replaced_archive(self):
+        self.write_archive()
+        self.assertIsNone(self.finder().find_spec('new'))
+        self.write_source('new.py', 'attr = "new"\n')
+        self.write_archive()
+        finder = self.finder()
+        self.assertEqual(self.load(finder.find_spec('new')), 'new')
+        self.assertIsInstance(finder.find_spec('new').loader,
+                              self.machinery.SourceFileLoader)
+
+    def test_invalidate_caches(self):
+        # Finders already created use the replacing archive once the
+        # caches are invalidated.
+        self.write_archive()
+        finder = self.finder()
+        self.write_source('new.py', 'attr = "new"\n')
+        self.write_archive()
+        finder.invalidate_caches()
+        spec = finder.find_spec('new')
+        self.assertFalse(os.path.exists(spec.cached))
+        self.assertTrue(spec.loader.get_data(spec.cached))
+        self.assertEqual(self.load(spec), 'new')
+
+    def test_path_hook(self):
+        self.write_archive()
+        hook = self.machinery.CodeArchiveFinder.path_hook(self.archive)
+        finder = hook(self.dir)
+        self.assertEqual(finder.path, self.dir)
+        self.assertEqual(finder.archive, self.archive)
+        with self.assertRaises(ImportError):
+            hook(self.root)
+        with self.assertRaises(ImportError):
+            hook('')
+        # Without the archive, the directories are left to other hooks
+        os.unlink(self.archive)
+        with self.assertRaises(ImportError):
+            hook(self.dir)
+
+    def test_bad_archive(self):
+        with self.assertRaises(FileNotFoundError):
+            self.finder()
+        with open(self.archive, 'wb') as file:
+            file.write(b'PYCA')
+        with self.assertRaises(ImportError):
+            self.finder()
+
+
+(Frozen_CodeArchiveFinderTests,
+ Source_CodeArchiveFinderTests
+ ) = util.test_both(CodeArchiveFinderTests, machinery=machinery,
+                    __import__=util.__import__)
+
+
+if __name__ == '__main__':
+    unittest.main()
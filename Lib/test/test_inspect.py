@@ -332,6 +332,22 @@ class TestInterpreterStack(IsTestBase):
         self.assertIn('inspect.stack()', record.code_context[0])
         self.assertEqual(record.index, 0)
 
+    def test_stack_limit(self):
+        def nested(depth, **kwargs):
+            if depth:
+                return nested(depth - 1, **kwargs)
+            return inspect.stack(**kwargs)
+        full = [r[1:] for r in nested(3)]
+        self.assertEqual([r[1:] for r in nested(3, limit=2)], full[:2])
+        self.assertEqual(len(nested(3, limit=4)), 4)
+        self.assertEqual(nested(3, limit=0), [])
+        records = nested(3, context=0, limit=3)
+        self.assertEqual([r.function for r in records], ['nested'] * 3)
+        self.assertEqual([r.filename for r in records], [__file__] * 3)
+        self.assertIsNone(records[0].code_context)
+        self.assertEqual(inspect.getinnerframes(git.ex[2], limit=2),
+                         inspect.getinnerframes(git.ex[2])[:2])
+
     def test_trace(self):
         self.assertEqual(len(git.tr), 3)
         self.assertEqual(revise(*git.tr[0][1:]),
@@ -3013,6 +3029,66 @@ class TestSignatureObject(unittest.TestCase):
                          ((('a', 10, ..., "positional_or_keyword"),),
                           ...))
 
+    def test_signature_cache(self):
+        def foo(a, b=1, *, c=2) -> int: pass
+        sig = inspect.signature(foo)
+        self.assertIs(inspect.signature(foo), sig)
+        self.assertEqual(self.signature(foo),
+                         ((('a', ..., ..., "positional_or_keyword"),
+                           ('b', 1, ..., "positional_or_keyword"),
+                           ('c', 2, ..., "keyword_only")),
+                          int))
+
+        # Changing the function invalidates the cached signature.
+        foo.__defaults__ = (10,)
+        self.assertEqual(inspect.signature(foo).parameters['b'].default, 10)
+        foo.__kwdefaults__['c'] = 20
+        self.assertEqual(inspect.signature(foo).parameters['c'].default, 20)
+        foo.__annotations__['a'] = str
+        self.assertEqual(inspect.signature(foo).parameters['a'].annotation,
+                         str)
+
+        # Values equal to the previous ones are not confused with them.
+        foo.__defaults__ = (10.0,)
+        self.assertIs(type(inspect.signature(foo).parameters['b'].default),
+                      float)
+        foo.__defaults__ = (True,)
+        self.assertIs(inspect.signature(foo).parameters['b'].default, True)
+        foo.__kwdefaults__['c'] = 20.0
+        self.assertIs(type(inspect.signature(foo).parameters['c'].default),
+                      float)
+
+        # Defaults are not compared.
+        class Uncomparable:
+            def __eq__(self, other):
+                raise TypeError('cannot compare')
+            __hash__ = object.__hash__
+        default = Uncomparable()
+        foo.__defaults__ = (default,)
+        self.assertIs(inspect.signature(foo).parameters['b'].default, default)
+        self.assertIs(inspect.signature(foo), inspect.signature(foo))
+        foo.__defaults__ = (Uncomparable(),)
+        self.assertIsNot(inspect.signature(foo).parameters['b'].default,
+                         default)
+
+        foo.__code__ = (lambda x, *args: None).__code__
+        foo.__defaults__ = None
+        foo.__kwdefaults__ = None
+        self.assertEqual(self.signature(foo),
+                         ((('x', ..., ..., "positional_or_keyword"),
+                           ('args', ..., ..., "var_positional")),
+                          int))
+        foo.__signature__ = sig
+        self.assertIs(inspect.signature(foo), sig)
+        del foo.__signature__
+        self.assertIsNot(inspect.signature(foo), sig)
+
+        # Subclasses of Signature get their own instances.
+        class MySignature(inspect.Signature):
+            pass
+        self.assertIsInstance(MySignature.from_callable(foo), MySignature)
+        self.assertNotIsInstance(inspect.signature(foo), MySignature)
+
     def test_signature_equality(self):
         def foo(a, *, b:int) -> float: pass
         self.assertFalse(inspect.signature(foo) == 42)
@@ -11,6 +11,7 @@ import operator
 import pickle
 import ipaddress
 import weakref
+from test import support
 from test.support import LARGEST, SMALLEST
 
 
@@ -2549,6 +2550,19 @@ class IpaddrUnitTest(unittest.TestCase):
         self.assertFalse(bad_addr.sixtofour)
 
     # issue41004 Hash collisions in IPv4Interface and IPv6Interface
+    def testSubclassNotKeptAlive(self):
+        # The caches of parsed and formatted addresses don't keep
+        # references to the classes using them.
+        for base in ipaddress.IPv4Address, ipaddress.IPv6Address:
+            class Address(base):
+                pass
+            Address('1.2.3.4' if base is ipaddress.IPv4Address
+                    else '2001:db8::5').compressed
+            ref = weakref.ref(Address)
+            del Address
+            support.gc_collect()
+            self.assertIsNone(ref())
+
     def testV4HashIsNotConstant(self):
         ipv4_address1 = ipaddress.IPv4Interface("1.2.3.4")
         ipv4_address2 = ipaddress.IPv4Interface("2.3.4.5")
@@ -2561,5 +2575,140 @@ class IpaddrUnitTest(unittest.TestCase):
         self.assertNotEqual(ipv6_address1.__hash__(), ipv6_address2.__hash__())
 
 
+
+class NetworkTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.table = ipaddress.NetworkTable({
+            ipaddress.ip_network('10.0.0.0/8'): 'internal',
+            ipaddress.ip_network('10.1.0.0/16'): 'lab',
+            ipaddress.ip_network('10.1.2.0/24'): 'bench',
+            ipaddress.ip_network('192.0.2.0/24'): 'doc',
+            ipaddress.ip_network('2001:db8::/32'): 'doc6',
+            ipaddress.ip_network('::/0'): 'any6',
+            })
+
+    def test_mapping(self):
+        table = self.table
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table[ipaddress.ip_network('10.1.0.0/16')], 'lab')
+        self.assertIn(ipaddress.ip_network('::/0'), table)
+        self.assertNotIn(ipaddress.ip_network('10.1.0.0/17'), table)
+        self.assertNotIn(ipaddress.ip_address('10.1.0.0'), table)
+        self.assertEqual(list(table)[:2], [ipaddress.ip_network('10.0.0.0/8'),
+                                           ipaddress.ip_network('10.1.0.0/16')])
+        with self.assertRaises(KeyError):
+            table[ipaddress.ip_network('10.0.0.0/9')]
+        with self.assertRaises(TypeError):
+            table['10.0.0.0/9'] = 'str'
+        with self.assertRaises(TypeError):
+            table[ipaddress.ip_address('10.0.0.1')] = 'address'
+        self.assertEqual(eval(repr(table), vars(ipaddress)), table)
+
+    def test_longest_match(self):
+        table = self.table
+        ip_address = ipaddress.ip_address
+        ip_network = ipaddress.ip_network
+        self.assertEqual(table.longest_match(ip_address('10.1.2.3')),
+                         (ip_network('10.1.2.0/24'), 'bench'))
+        self.assertEqual(table.longest_match(ip_address('10.1.3.3')),
+                         (ip_network('10.1.0.0/16'), 'lab'))
+        self.assertEqual(table.longest_match(ip_address('10.200.0.1')),
+                         (ip_network('10.0.0.0/8'), 'internal'))
+        self.assertEqual(table.longest_match(ip_address('2001:db8::1')),
+                         (ip_network('2001:db8::/32'), 'doc6'))
+        self.assertEqual(table.longest_match(ip_address('::1')),
+                         (ip_network('::/0'), 'any6'))
+        self.assertEqual(table.longest_match(ipaddress.ip_interface('10.1.2.3/8')),
+                         (ip_network('10.1.2.0/24'), 'bench'))
+        # a network contains itself but not its supernets
+        self.assertEqual(table.longest_match(ip_network('10.1.0.0/16')),
+                         (ip_network('10.1.0.0/16'), 'lab'))
+        self.assertEqual(table.longest_match(ip_network('10.0.0.0/15')),
+                         (ip_network('10.0.0.0/8'), 'internal'))
+        with self.assertRaises(KeyError):
+            table.longest_match(ip_address('192.0.3.1'))
+        with self.assertRaises(KeyError):
+            table.longest_match(ip_network('0.0.0.0/0'))
+        with self.assertRaises(TypeError):
+            table.longest_match('10.1.2.3')
+
+    def test_matches_and_covers(self):
+        table = self.table
+        ip_address = ipaddress.ip_address
+        ip_network = ipaddress.ip_network
+        self.assertEqual(list(table.matches(ip_address('10.1.2.3'))),
+                         [(ip_network('10.0.0.0/8'), 'internal'),
+                          (ip_network('10.1.0.0/16'), 'lab'),
+                          (ip_network('10.1.2.0/24'), 'bench')])
+        self.assertEqual(list(table.matches(ip_address('11.0.0.1'))), [])
+        self.assertTrue(table.covers(ip_address('192.0.2.255')))
+        self.assertTrue(table.covers(ip_network('192.0.2.128/25')))
+        self.assertFalse(table.covers(ip_address('192.0.3.0')))
+        self.assertFalse(table.covers(ip_network('192.0.2.0/23')))
+        self.assertTrue(table.covers(ip_address('fe80::1')))
+        with self.assertRaises(TypeError):
+            table.covers(None)
+
+    def test_update_and_delete(self):
+        table = self.table
+        ip_address = ipaddress.ip_address
+        ip_network = ipaddress.ip_network
+        table[ip_network('10.1.0.0/16')] = 'lab2'
+        self.assertEqual(table.longest_match(ip_address('10.1.3.3')),
+                         (ip_network('10.1.0.0/16'), 'lab2'))
+        del table[ip_network('10.1.2.0/24')]
+        del table[ip_network('10.1.0.0/16')]
+        self.assertEqual(table.longest_match(ip_address('10.1.2.3')),
+                         (ip_network('10.0.0.0/8'), 'internal'))
+        with self.assertRaises(KeyError):
+            del table[ip_network('10.1.0.0/16')]
+        self.assertEqual(len(table), 4)
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertFalse(table.covers(ip_address('10.1.2.3')))
+
+    def test_scoped_networks(self):
+        # Networks differing only by their scope id are different keys.
+        table = ipaddress.NetworkTable()
+        unscoped = ipaddress.IPv6Network('fe80::/64')
+        scoped = ipaddress.IPv6Network('fe80::%eth0/64')
+        table[unscoped] = 1
+        table[scoped] = 2
+        self.assertEqual(len(table), 2)
+        address = ipaddress.ip_address('fe80::1')
+        self.assertEqual(sorted(value for network, value
+                                in table.matches(address)), [1, 2])
+        del table[unscoped]
+        self.assertEqual(len(table), 1)
+        self.assertTrue(table.covers(address))
+        self.assertEqual(table.longest_match(address), (scoped, 2))
+        del table[scoped]
+        self.assertFalse(table.covers(address))
+
+    def test_fromkeys(self):
+        networks = [ipaddress.ip_network('192.0.2.%d/32' % i)
+                    for i in range(256)]
+        table = ipaddress.NetworkTable.fromkeys(networks)
+        self.assertEqual(len(table), 256)
+        self.assertIsNone(table[networks[5]])
+        self.assertEqual(table.longest_match(ipaddress.ip_address('192.0.2.5')),
+                         (networks[5], None))
+
+    def test_aggregate(self):
+        table = self.table
+        self.assertEqual(list(table.aggregate()),
+                         [ipaddress.ip_network('10.0.0.0/8'),
+                          ipaddress.ip_network('192.0.2.0/24'),
+                          ipaddress.ip_network('::/0')])
+        networks = [ipaddress.ip_network('192.0.2.%d/32' % i)
+                    for i in range(256)]
+        table = ipaddress.NetworkTable.fromkeys(networks)
+        self.assertEqual(list(table.aggregate()),
+                         [ipaddress.ip_network('192.0.2.0/24')])
+        self.assertEqual(list(ipaddress.NetworkTable().aggregate()), [])
+
+
+
 if __name__ == '__main__':
     unittest.main()
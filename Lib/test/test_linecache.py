@@ -239,5 +239,78 @@ class LineCacheTests(unittest.TestCase):
         self.assertEqual(linecache.getlines(FILENAME), lines)
 
 
+class LimitTests(unittest.TestCase):
+
+    def setUp(self):
+        linecache.clearcache()
+        self.addCleanup(linecache.clearcache)
+        self.addCleanup(linecache.set_max_size, None)
+        self.addCleanup(linecache.set_check_interval, 0)
+
+    def test_max_size(self):
+        names = [os.path.join(MODULE_PATH, name + '.py')
+                 for name in ('abc', 'bisect', 'keyword')]
+        sizes = [os.stat(name).st_size for name in names]
+        linecache.set_max_size(sizes[0] + sizes[1])
+        lines = [linecache.getlines(name) for name in names[:2]]
+        self.assertEqual(list(linecache.cache), names[:2])
+        # Using the first file makes the second the least recently used.
+        self.assertEqual(linecache.getlines(names[0]), lines[0])
+        keyword_lines = linecache.getlines(names[2])
+        self.assertTrue(keyword_lines)
+        self.assertIn(names[0], linecache.cache)
+        self.assertNotIn(names[1], linecache.cache)
+        self.assertIn(names[2], linecache.cache)
+        # Evicted files are read again when needed.
+        self.assertEqual(linecache.getlines(names[1]), lines[1])
+
+        linecache.set_max_size(0)
+        self.assertEqual(linecache.cache, {})
+        self.assertEqual(linecache.getlines(names[2]), keyword_lines)
+        self.assertRaises(ValueError, linecache.set_max_size, -1)
+
+    def test_max_size_lazy(self):
+        lines = linecache.getlines(NONEXISTENT_FILENAME, globals())
+        self.assertTrue(lines)
+        linecache.set_max_size(0)
+        # The entry goes back to being lazy rather than being lost.
+        self.assertEqual(1, len(linecache.cache[NONEXISTENT_FILENAME]))
+        self.assertEqual(lines, linecache.getlines(NONEXISTENT_FILENAME))
+
+    def test_max_size_direct_entries(self):
+        # Entries added directly to the cache cannot be read again, so
+        # they are kept.
+        name = os.path.join(MODULE_PATH, 'abc.py')
+        lines = ['x = 1\n']
+        linecache.cache['<doctest>'] = (6, None, lines, '<doctest>')
+        linecache.cache['<pyshell#0>'] = (6, 0, lines, '<pyshell#0>')
+        self.assertTrue(linecache.getlines(name))
+        linecache.set_max_size(0)
+        self.assertEqual(list(linecache.cache), ['<doctest>', '<pyshell#0>'])
+        self.assertEqual(linecache.getlines('<doctest>'), lines)
+        self.assertEqual(linecache.getlines('<pyshell#0>'), lines)
+
+    def test_check_interval(self):
+        source_name = os_helper.TESTFN + '.py'
+        self.addCleanup(os_helper.unlink, source_name)
+        with open(source_name, 'w') as source:
+            source.write(SOURCE_1)
+        linecache.set_check_interval(3600)
+        old_lines = linecache.getlines(source_name)
+        with open(source_name, 'w') as source:
+            source.write(SOURCE_2)
+
+        # The file was checked when it was loaded, so this check is
+        # skipped.
+        linecache.checkcache(source_name)
+        linecache.checkcache()
+        self.assertEqual(linecache.getlines(source_name), old_lines)
+
+        linecache.set_check_interval(0)
+        linecache.checkcache(source_name)
+        self.assertEqual(''.join(linecache.getlines(source_name)), SOURCE_2)
+        self.assertRaises(ValueError, linecache.set_check_interval, -1)
+
+
 if __name__ == "__main__":
     unittest.main()
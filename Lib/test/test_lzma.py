@@ -1042,6 +1042,19 @@ class FileTestCase(unittest.TestCase):
             expected = lzma.compress(INPUT)
             self.assertEqual(dst.getvalue(), expected)
 
+    def test_write_workers(self):
+        data = INPUT * 20
+        with support.swap_attr(lzma, "_THREADED_BLOCK_SIZE", 4096):
+            for format in (lzma.FORMAT_XZ, lzma.FORMAT_ALONE):
+                with BytesIO() as dst:
+                    with LZMAFile(dst, "w", format=format, workers=3) as f:
+                        f.write(data[:100])
+                        f.write(data[100:])
+                    self.assertEqual(lzma.decompress(dst.getvalue()), data)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", format=lzma.FORMAT_RAW,
+                     filters=FILTERS_RAW_1, workers=2)
+
     def test_write_append(self):
         part1 = INPUT[:1024]
         part2 = INPUT[1024:1536]
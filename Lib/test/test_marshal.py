@@ -1,5 +1,6 @@
 from test import support
 from test.support import os_helper
+from test.support.script_helper import assert_python_ok
 import array
 import io
 import marshal
@@ -135,6 +136,133 @@ class CodeTestCase(unittest.TestCase):
             if isinstance(obj, types.CodeType):
                 self.assertIs(co.co_filename, obj.co_filename)
 
+LAZY_SOURCE = """\
+def f(a, b=2):
+    "Docstring of f."
+    def g(x):
+        return x + a + xyzzy_marker
+    return g(b)
+
+class C:
+    def m(self):
+        return [i * 2 for i in range(3)]
+
+lam = lambda: 'lambda'
+xyzzy_marker = 1
+"""
+
+class LazyCodeTestCase(unittest.TestCase):
+    def codes(self, co):
+        yield co
+        for const in co.co_consts:
+            if isinstance(const, types.CodeType):
+                yield from self.codes(const)
+
+    def assertSameCode(self, co1, co2):
+        self.assertEqual(co1, co2)
+        for attr in ('co_code', 'co_consts', 'co_names', 'co_varnames',
+                     'co_filename', 'co_name', 'co_firstlineno',
+                     'co_lnotab'):
+            self.assertEqual(getattr(co1, attr), getattr(co2, attr), attr)
+
+    def test_lazy_code(self):
+        co = compile(LAZY_SOURCE, 'lazy.py', 'exec')
+        data = marshal.dumps(co)
+        lazy = marshal.loads(data, lazy=True)
+        for co1, co2 in zip(self.codes(co), self.codes(lazy), strict=True):
+            self.assertSameCode(co1, co2)
+
+        ns = {}
+        exec(marshal.loads(data, lazy=True), ns)
+        self.assertEqual(ns['f'].__doc__, 'Docstring of f.')
+        self.assertEqual(ns['f'](1), 4)
+        self.assertEqual(ns['C']().m(), [0, 2, 4])
+        self.assertEqual(ns['lam'](), 'lambda')
+
+    def test_dumps_lazy_code(self):
+        co = compile(LAZY_SOURCE, 'lazy.py', 'exec')
+        data = marshal.dumps(co)
+        for version in range(marshal.version + 1):
+            with self.subTest(version=version):
+                lazy = marshal.loads(data, lazy=True)
+                new = marshal.loads(marshal.dumps(lazy, version), lazy=True)
+                for co1, co2 in zip(self.codes(co), self.codes(new),
+                                    strict=True):
+                    self.assertSameCode(co1, co2)
+
+    def test_load_lazy_code(self):
+        co = compile(LAZY_SOURCE, 'lazy.py', 'exec')
+        try:
+            with open(os_helper.TESTFN, 'wb') as f:
+                marshal.dump(co, f)
+            with open(os_helper.TESTFN, 'rb') as f:
+                new = marshal.load(f, lazy=True)
+        finally:
+            os_helper.unlink(os_helper.TESTFN)
+        for co1, co2 in zip(self.codes(co), self.codes(new), strict=True):
+            self.assertSameCode(co1, co2)
+
+    def test_lazy_body_errors(self):
+        # Errors in the body of a function are only reported when it is used
+        co = compile(LAZY_SOURCE, 'lazy.py', 'exec')
+        data = bytearray(marshal.dumps(co))
+        i = data.index(b'\x0cxyzzy_marker')
+        data[i - 1] = ord('?')
+        self.assertRaises(ValueError, marshal.loads, data)
+        new = marshal.loads(data, lazy=True)
+        ns = {}
+        exec(new, ns)
+        f = ns['f']
+        self.assertEqual(f.__doc__, 'Docstring of f.')
+        self.assertEqual(f.__code__.co_name, 'f')
+        self.assertEqual(f.__code__.co_varnames, ('a', 'b', 'g'))
+        # The body of the nested function g() is only read when it is called
+        self.assertRaises(ValueError, f, 1)
+        g = [c for c in f.__code__.co_consts if isinstance(c, types.CodeType)]
+        self.assertEqual(g[0].co_name, 'g')
+        self.assertRaises(ValueError, getattr, g[0], 'co_code')
+        self.assertEqual(ns['C']().m(), [0, 2, 4])
+
+    def test_version_4(self):
+        co = compile(LAZY_SOURCE, 'lazy.py', 'exec')
+        data = marshal.dumps(co, 4)
+        for lazy in (False, True):
+            new = marshal.loads(data, lazy=lazy)
+            for co1, co2 in zip(self.codes(co), self.codes(new),
+                                strict=True):
+                self.assertSameCode(co1, co2)
+
+    def test_lazy_code_flag(self):
+        code = """if 1:
+            import sys, textwrap
+            assert sys.flags.lazy_code
+            assert textwrap.dedent('  a') == 'a'
+            """
+        assert_python_ok('-X', 'lazy_code', '-c', code)
+        assert_python_ok('-c', code, PYTHONLAZYCODE='1')
+
+    def test_lazy_audit_hook(self):
+        # Loading the body of a lazy audit hook doesn't call the hooks again
+        code = """if 1:
+            import marshal, sys
+            src = '''if 1:
+                events = []
+                def hook(event, args):
+                    if event == 'code.__new__':
+                        events.append(args[2])
+                def f():
+                    return 42
+                '''
+            ns = {}
+            exec(marshal.loads(marshal.dumps(compile(src, '', 'exec')),
+                               lazy=True), ns)
+            sys.addaudithook(ns['hook'])
+            f = marshal.loads(marshal.dumps(ns['f'].__code__), lazy=True)
+            assert eval(f) == 42
+            assert ns['events'] == ['f'], ns['events']
+            """
+        assert_python_ok('-c', code)
+
 class ContainerTestCase(unittest.TestCase, HelperMixin):
     d = {'astring': 'foo@bar.baz.spam',
          'afloat': 7283.43,
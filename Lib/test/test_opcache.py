@@ -0,0 +1,328 @@
+import sys
+import types
+import unittest
+
+# Code objects get an opcode cache after this many runs
+# (OPCACHE_MIN_RUNS in Python/ceval.c)
+WARMUP = 1100
+
+
+def warmup(func, *args):
+    for _ in range(WARMUP):
+        func(*args)
+
+
+class TestLoadAttrCache(unittest.TestCase):
+
+    def test_descriptor_added_after_optimization(self):
+        class Descriptor:
+            pass
+
+        class C:
+            def __init__(self):
+                self.x = 1
+            x = Descriptor()
+
+        def f(o):
+            return o.x
+
+        o = C()
+        warmup(f, o)
+        self.assertEqual(f(o), 1)
+
+        Descriptor.__get__ = lambda self, instance, value: 2
+        Descriptor.__set__ = lambda *args: None
+        self.assertEqual(f(o), 2)
+
+    def test_class_attribute_changes(self):
+        class C:
+            pass
+
+        def f(o):
+            return o.attr
+
+        o = C()
+        o.attr = 'instance'
+        warmup(f, o)
+        self.assertEqual(f(o), 'instance')
+
+        C.attr = property(lambda self: 'property')
+        self.assertEqual(f(o), 'property')
+        del C.attr
+        self.assertEqual(f(o), 'instance')
+        del o.attr
+        self.assertRaises(AttributeError, f, o)
+
+    def test_instance_dicts(self):
+        class C:
+            pass
+
+        def f(o):
+            return o.b
+
+        objs = []
+        for i in range(10):
+            o = C()
+            # Vary the position of the key in the instance __dict__
+            if i % 2:
+                o.a = None
+            o.b = i
+            objs.append(o)
+        for _ in range(WARMUP // 10):
+            for o in objs:
+                f(o)
+        self.assertEqual([f(o) for o in objs], list(range(10)))
+
+        objs[3].__dict__ = {'b': 'new'}
+        self.assertEqual(f(objs[3]), 'new')
+        del objs[4].b
+        self.assertRaises(AttributeError, f, objs[4])
+
+    def test_slots(self):
+        class C:
+            __slots__ = ('a', 'b')
+
+        def f(o):
+            return o.b
+
+        o = C()
+        o.b = 1
+        warmup(f, o)
+        self.assertEqual(f(o), 1)
+        del o.b
+        self.assertRaises(AttributeError, f, o)
+        C.b = 'class'
+        self.assertEqual(f(o), 'class')
+
+    def test_getattr(self):
+        class C:
+            def __init__(self):
+                self.x = 1
+
+        def f(o):
+            return o.x
+
+        o = C()
+        warmup(f, o)
+        C.__getattribute__ = lambda self, name: 'getattribute'
+        self.assertEqual(f(o), 'getattribute')
+        del C.__getattribute__
+        self.assertEqual(f(o), 1)
+        del o.x
+        C.__getattr__ = lambda self, name: 'getattr'
+        self.assertEqual(f(o), 'getattr')
+
+    def test_polymorphic(self):
+        classes = [type('C%d' % i, (), {'x': i}) for i in range(30)]
+
+        def f(o):
+            return o.x
+
+        objs = [cls() for cls in classes]
+        for _ in range(WARMUP // 10):
+            for o in objs:
+                f(o)
+        self.assertEqual([f(o) for o in objs], list(range(30)))
+
+    def test_modules(self):
+        module = types.ModuleType('module')
+        module.x = 1
+
+        def f(m):
+            return m.x
+
+        warmup(f, module)
+        self.assertEqual(f(module), 1)
+        module.x = 2
+        self.assertEqual(f(module), 2)
+        del module.x
+        module.__getattr__ = lambda name: 'getattr'
+        self.assertEqual(f(module), 'getattr')
+
+    def test_unusual_dict_keys(self):
+        class Key(str):
+            def __eq__(self, other):
+                raise ZeroDivisionError
+            def __hash__(self):
+                return hash('x')
+
+        class C:
+            pass
+
+        def f(o):
+            return o.x
+
+        o = C()
+        o.x = 1
+        warmup(f, o)
+        o.__dict__ = {Key('y'): 2}
+        self.assertRaises(ZeroDivisionError, f, o)
+
+
+class TestStoreAttrCache(unittest.TestCase):
+
+    def test_instance_dicts(self):
+        class C:
+            def __init__(self, a):
+                self.a = a
+                self.b = a + 1
+
+        objs = [C(i) for i in range(WARMUP)]
+        self.assertEqual([(o.a, o.b) for o in objs[-3:]],
+                         [(WARMUP - 3, WARMUP - 2), (WARMUP - 2, WARMUP - 1),
+                          (WARMUP - 1, WARMUP)])
+        self.assertEqual(list(vars(objs[-1])), ['a', 'b'])
+
+    def test_set_after_change(self):
+        class C:
+            pass
+
+        def f(o, value):
+            o.x = value
+
+        o = C()
+        warmup(f, o, 1)
+        self.assertEqual(o.x, 1)
+
+        log = []
+        C.x = property(lambda self: 'property', lambda self, v: log.append(v))
+        f(o, 2)
+        self.assertEqual(log, [2])
+        self.assertEqual(o.__dict__, {'x': 1})
+        del C.x
+        f(o, 3)
+        self.assertEqual(o.x, 3)
+
+    def test_slots(self):
+        class C:
+            __slots__ = ('a',)
+
+        def f(o, value):
+            o.a = value
+
+        o = C()
+        warmup(f, o, 1)
+        self.assertEqual(o.a, 1)
+        del o.a
+        f(o, 2)
+        self.assertEqual(o.a, 2)
+
+    def test_gc_tracking(self):
+        import gc
+
+        class C:
+            pass
+
+        def f(o, value):
+            o.x = value
+
+        o = C()
+        warmup(f, o, 1)
+        # An instance __dict__ only holding atomic values is not tracked
+        o.__dict__ = {'x': 0}
+        self.assertFalse(gc.is_tracked(o.__dict__))
+        f(o, [])
+        self.assertTrue(gc.is_tracked(o.__dict__))
+
+
+class TestLoadMethodCache(unittest.TestCase):
+
+    def test_method_changes(self):
+        class C:
+            def m(self):
+                return 'method'
+
+        def f(o):
+            return o.m()
+
+        o = C()
+        warmup(f, o)
+        self.assertEqual(f(o), 'method')
+
+        o.m = lambda: 'instance'
+        self.assertEqual(f(o), 'instance')
+        del o.m
+        self.assertEqual(f(o), 'method')
+        C.m = lambda self: 'new'
+        self.assertEqual(f(o), 'new')
+
+    def test_subclass_changes(self):
+        class Base:
+            def m(self):
+                return 'base'
+
+        class C(Base):
+            pass
+
+        def f(o):
+            return o.m()
+
+        o = C()
+        warmup(f, o)
+        Base.m = lambda self: 'new base'
+        self.assertEqual(f(o), 'new base')
+        C.m = lambda self: 'subclass'
+        self.assertEqual(f(o), 'subclass')
+
+    def test_modules(self):
+        module = types.ModuleType('module')
+        module.func = lambda: 1
+
+        def f(m):
+            return m.func()
+
+        warmup(f, module)
+        self.assertEqual(f(module), 1)
+        module.func = lambda: 2
+        self.assertEqual(f(module), 2)
+
+    def test_attributes(self):
+        class C:
+            __slots__ = ('callback', '__dict__')
+
+        def f(o):
+            return o.callback(), o.other()
+
+        o = C()
+        o.callback = lambda: 'slot'
+        o.other = lambda: 'dict'
+        warmup(f, o)
+        self.assertEqual(f(o), ('slot', 'dict'))
+
+
+class TestStats(unittest.TestCase):
+
+    def test_opcache_stats(self):
+        class C:
+            def __init__(self):
+                self.x = 1
+
+            def m(self):
+                return self.x
+
+        def f(o):
+            o.x = o.m()
+            return o.x
+
+        before = sys._opcache_stats()
+        warmup(f, C())
+        after = sys._opcache_stats()
+
+        opnames = ['LOAD_GLOBAL', 'LOAD_ATTR', 'STORE_ATTR', 'LOAD_METHOD']
+        self.assertEqual(set(after),
+                         {'code_objects', 'extra_mem', *opnames})
+        for name in opnames:
+            self.assertEqual(set(after[name]),
+                             {'opts', 'hits', 'misses', 'deopts'})
+            for counter, value in after[name].items():
+                self.assertGreaterEqual(value, before[name][counter])
+        if not hasattr(sys, 'gettotalrefcount'):
+            # The opcode cache is disabled in debug builds
+            self.assertGreater(after['code_objects'], before['code_objects'])
+            for name in opnames[1:]:
+                self.assertGreater(after[name]['hits'],
+                                   before[name]['hits'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from test import support
 from io import StringIO
+from functools import cmp_to_key
 from pstats import SortKey
 
 import pstats
@@ -24,6 +25,13 @@ class AddCallersTestCase(unittest.TestCase):
         new_callers = pstats.add_callers(target, source)
         self.assertEqual(new_callers, {'a': 2, 'b': 5})
 
+    def test_update_callers(self):
+        target = {"a": (1, 2, 3, 4)}
+        source = {"a": (1, 2, 3, 4), "b": (5, 6, 7, 8)}
+        pstats.update_callers(target, source)
+        self.assertEqual(target, {'a': (2, 4, 6, 8), 'b': (5, 6, 7, 8)})
+        self.assertEqual(source, {"a": (1, 2, 3, 4), "b": (5, 6, 7, 8)})
+
 
 class StatsTestCase(unittest.TestCase):
     def setUp(self):
@@ -35,6 +43,28 @@ class StatsTestCase(unittest.TestCase):
         stats = pstats.Stats(stream=stream)
         stats.add(self.stats, self.stats)
 
+    def test_add_merges(self):
+        stats_file = support.findfile('pstats.pck')
+        orig = pstats.Stats(stats_file).stats
+        for args in [(stats_file, stats_file),
+                     (stats_file, self.stats),
+                     (self.stats, self.stats)]:
+            stats = pstats.Stats(stats_file).add(*args)
+            self.assertEqual(stats.total_calls, 3 * self.stats.total_calls)
+            self.assertEqual(stats.prim_calls, 3 * self.stats.prim_calls)
+            self.assertEqual(stats.max_name_len, self.stats.max_name_len)
+            self.assertEqual(stats.stats.keys(), orig.keys())
+            for func, (cc, nc, tt, ct, callers) in orig.items():
+                m_cc, m_nc, m_tt, m_ct, m_callers = stats.stats[func]
+                self.assertEqual((m_cc, m_nc), (3 * cc, 3 * nc))
+                self.assertAlmostEqual(m_ct, 3 * ct)
+                self.assertEqual(m_callers.keys(), callers.keys())
+                for caller, value in callers.items():
+                    self.assertEqual(m_callers[caller][:2],
+                                     (3 * value[0], 3 * value[1]))
+            # The added Stats objects are left alone
+            self.assertEqual(self.stats.stats, orig)
+
     def test_sort_stats_int(self):
         valid_args = {-1: 'stdname',
                       0: 'calls',
@@ -68,6 +98,39 @@ class StatsTestCase(unittest.TestCase):
                     self.stats.sort_type,
                     self.stats.sort_arg_dict_default[member.value][-1])
 
+    def test_sort_stats_order(self):
+        for fields in [('calls', 'name'), ('cumulative',),
+                       ('filename', 'line'), ('nfl',),
+                       ('pcalls', 'stdname'), ('time', 'module', 'line')]:
+            self.stats.sort_stats(*fields)
+            sort_tuple = ()
+            for field in fields:
+                sort_tuple += self.stats.sort_arg_dict_default[field][0]
+            stats_list = [(cc, nc, tt, ct) + func +
+                          (pstats.func_std_string(func), func)
+                          for func, (cc, nc, tt, ct, callers)
+                          in self.stats.stats.items()]
+            stats_list.sort(
+                key=cmp_to_key(pstats.TupleComp(sort_tuple).compare))
+            self.assertEqual(self.stats.fcn_list,
+                             [item[-1] for item in stats_list])
+
+    def test_print_callees(self):
+        self.stats.sort_stats('cumulative')
+        self.stats.stream = StringIO()
+        self.stats.print_callees(5)
+        selected = self.stats.stream.getvalue()
+
+        self.stats.calc_callees()
+        self.stats.stream = StringIO()
+        self.stats.print_callees(5)
+        self.assertEqual(self.stats.stream.getvalue(), selected)
+        self.assertIn('List reduced from', selected)
+
+        func = self.stats.fcn_list[0]
+        self.assertEqual(self.stats.get_callees([func]),
+                         {func: self.stats.all_callees[func]})
+
     def test_sort_starts_mix(self):
         self.assertRaises(TypeError, self.stats.sort_stats,
                           'calls',
@@ -8,6 +8,7 @@ import subprocess
 import sys
 import tempfile
 import unittest
+import unittest.mock
 
 from test import support
 from test.support import os_helper, script_helper
@@ -194,6 +195,30 @@ class PyCompileTestsBase:
                 fp.read(), 'test', {})
         self.assertEqual(flags, 0b1)
 
+    def test_cache_dir(self):
+        cache_dir = os.path.join(self.directory, 'cache')
+        py_compile.compile(self.source_path, self.pyc_path,
+                           cache_dir=cache_dir)
+        with open(self.pyc_path, 'rb') as fp:
+            expected = fp.read()
+        os.unlink(self.pyc_path)
+        # A cache hit doesn't compile the source
+        with unittest.mock.patch(
+                'importlib.machinery.SourceFileLoader.source_to_code',
+                side_effect=AssertionError):
+            py_compile.compile(self.source_path, self.pyc_path,
+                               cache_dir=cache_dir)
+        with open(self.pyc_path, 'rb') as fp:
+            self.assertEqual(fp.read(), expected)
+
+        # The cached code depends on the source
+        with open(self.source_path, 'w') as file:
+            file.write('x = 456\n')
+        py_compile.compile(self.source_path, self.pyc_path,
+                           cache_dir=cache_dir)
+        with open(self.pyc_path, 'rb') as fp:
+            self.assertNotEqual(fp.read()[16:], expected[16:])
+
     def test_quiet(self):
         bad_coding = os.path.join(os.path.dirname(__file__), 'bad_coding2.py')
         with support.captured_stderr() as stderr:
@@ -0,0 +1,180 @@
+"""Test suite for the sampleprof module."""
+
+import marshal
+import pstats
+import threading
+import time
+import unittest
+from io import StringIO
+from test.support.os_helper import TESTFN, unlink
+from test.support.script_helper import assert_python_ok
+
+import sampleprof
+
+
+def busy(seconds=0.2):
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        pass
+
+
+def outer():
+    busy()
+
+
+def recursive(n):
+    if n:
+        recursive(n - 1)
+    else:
+        busy()
+
+
+def label(func):
+    code = func.__code__
+    return (code.co_filename, code.co_firstlineno, code.co_name)
+
+
+class SampleProfTest(unittest.TestCase):
+
+    def tearDown(self):
+        unlink(TESTFN)
+
+    def profile(self, func, *args, **kwargs):
+        prof = sampleprof.Profile(0.001, **kwargs)
+        prof.runcall(func, *args)
+        return prof
+
+    def test_interval(self):
+        self.assertRaises(ValueError, sampleprof.Profile, 0)
+        self.assertRaises(ValueError, sampleprof.Profile, -1.0)
+
+    def test_stats(self):
+        prof = self.profile(outer)
+        stats = pstats.Stats(prof).stats
+        cc, nc, tt, ct, callers = stats[label(outer)]
+        self.assertGreater(cc, 0)
+        self.assertEqual(cc, nc)
+        self.assertEqual(callers, {})
+        self.assertGreater(ct, 0)
+        b_cc, b_nc, b_tt, b_ct, b_callers = stats[label(busy)]
+        self.assertGreater(b_cc, 0)
+        self.assertLessEqual(b_cc, cc)
+        self.assertEqual(b_tt, b_ct)
+        self.assertLessEqual(b_ct, ct)
+        self.assertEqual(b_callers, {label(outer): (b_cc, b_cc, b_tt, b_ct)})
+        # Frames outside of the profiled call aren't recorded
+        self.assertNotIn(label(self.profile.__func__), stats)
+        self.assertNotIn(label(sampleprof.Profile.runcall), stats)
+
+        s = StringIO()
+        pstats.Stats(prof, stream=s).sort_stats('cumulative').print_stats()
+        self.assertIn('(outer)', s.getvalue())
+
+    def test_recursion(self):
+        prof = self.profile(recursive, 4)
+        stats = pstats.Stats(prof).stats
+        cc, nc, tt, ct, callers = stats[label(recursive)]
+        self.assertGreater(cc, 0)
+        self.assertGreater(nc, cc)
+        # Each sample has one outermost call and recursive calls
+        r_nc, r_cc, r_tt, r_ct = callers[label(recursive)]
+        self.assertEqual(nc, cc + r_nc)
+        self.assertLessEqual(r_cc, cc)
+        self.assertGreaterEqual(ct, stats[label(busy)][3])
+
+    def test_collapsed_stacks(self):
+        prof = self.profile(outer)
+        stacks = prof.collapsed_stacks()
+        frame = '%s (%s:%d)'
+        expected = ';'.join([frame % (name, filename, lineno)
+                             for filename, lineno, name
+                             in (label(outer), label(busy))])
+        self.assertIn(expected, stacks)
+        self.assertEqual(sum(stacks.values()),
+                         pstats.Stats(prof).stats[label(outer)][0])
+
+        prof.dump_collapsed(TESTFN)
+        with open(TESTFN, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertIn('%s %d' % (expected, stacks[expected]), lines)
+
+    def test_context_manager(self):
+        with sampleprof.Profile(0.001) as prof:
+            busy()
+        stats = pstats.Stats(prof).stats
+        self.assertIn(label(busy), stats)
+        self.assertNotIn(label(self.test_context_manager.__func__), stats)
+        self.assertNotIn(label(sampleprof.Profile.__exit__), stats)
+
+    def test_enable_disable(self):
+        prof = sampleprof.Profile(0.001)
+        self.addCleanup(prof.disable)
+        prof.enable()
+        prof.enable()
+        busy()
+        prof.disable()
+        prof.disable()
+        stats = pstats.Stats(prof).stats
+        self.assertIn(label(busy), stats)
+        prof.clear()
+        self.assertEqual(prof.collapsed_stacks(), {})
+
+    def test_clear_while_enabled(self):
+        prof = sampleprof.Profile(0.001)
+        self.addCleanup(prof.disable)
+        prof.enable()
+        busy()
+        prof.clear()
+        # Samples taken after clear() are kept
+        outer()
+        prof.disable()
+        stats = pstats.Stats(prof).stats
+        self.assertIn(label(outer), stats)
+        # The samples of the direct call to busy() were discarded
+        self.assertEqual(list(stats[label(busy)][4]), [label(outer)])
+
+    def test_threads(self):
+        done = threading.Event()
+
+        def waiter():
+            done.wait()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        try:
+            prof = self.profile(outer)
+            one_thread = self.profile(outer, all_threads=False)
+        finally:
+            done.set()
+            thread.join()
+        self.assertIn(label(waiter), pstats.Stats(prof).stats)
+        self.assertNotIn(label(waiter), pstats.Stats(one_thread).stats)
+        self.assertIn(label(outer), pstats.Stats(one_thread).stats)
+
+    def test_run(self):
+        with open(TESTFN, 'w', encoding='utf-8') as f:
+            f.write('def f():\n'
+                    '    import time\n'
+                    '    deadline = time.monotonic() + 0.2\n'
+                    '    while time.monotonic() < deadline:\n'
+                    '        pass\n'
+                    'f()\n')
+        rc, out, err = assert_python_ok('-m', 'sampleprof', '-i', '0.001',
+                                        TESTFN)
+        self.assertIn(b'(f)', out)
+
+        outfile = TESTFN + '.prof'
+        self.addCleanup(unlink, outfile)
+        collapsed = TESTFN + '.txt'
+        self.addCleanup(unlink, collapsed)
+        assert_python_ok('-m', 'sampleprof', '-i', '0.001', '-o', outfile,
+                         '-c', collapsed, TESTFN)
+        with open(outfile, 'rb') as f:
+            stats = marshal.load(f)
+        self.assertIn('f', {name for _, _, name in stats})
+        with open(collapsed, encoding='utf-8') as f:
+            self.assertIn(';f (', f.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
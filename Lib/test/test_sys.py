@@ -556,7 +556,8 @@ class SysModuleTest(unittest.TestCase):
                  "inspect", "interactive", "optimize",
                  "dont_write_bytecode", "no_user_site", "no_site",
                  "ignore_environment", "verbose", "bytes_warning", "quiet",
-                 "hash_randomization", "isolated", "dev_mode", "utf8_mode")
+                 "hash_randomization", "isolated", "dev_mode", "utf8_mode",
+                 "lazy_code")
         for attr in attrs:
             self.assertTrue(hasattr(sys.flags, attr), attr)
             attr_type = bool if attr == "dev_mode" else int
@@ -590,6 +591,80 @@ class SysModuleTest(unittest.TestCase):
     def test_clear_type_cache(self):
         sys._clear_type_cache()
 
+    @test.support.cpython_only
+    def test_exec_stats(self):
+        import opcode
+
+        def func(n):
+            total = 0
+            for i in range(n):
+                total += i
+            return total
+
+        def counts():
+            stats = sys._get_exec_stats()
+            for code, entries, instructions in stats['code_objects']:
+                if code is func.__code__:
+                    return stats, entries, instructions
+            return stats, 0, 0
+
+        sys._get_exec_stats(clear=True)
+        self.addCleanup(sys._set_exec_stats, False)
+        func(10)
+        stats, entries, instructions = counts()
+        self.assertIs(stats['enabled'], False)
+        self.assertEqual((entries, instructions), (0, 0))
+
+        sys._set_exec_stats(True)
+        func(10)
+        func(100)
+        sys._set_exec_stats(False)
+        stats, entries, instructions = counts()
+        self.assertIs(stats['enabled'], False)
+        self.assertEqual(entries, 2)
+        self.assertGreater(instructions, 110 * 4)
+        self.assertEqual(len(stats['opcodes']), 256)
+        self.assertGreaterEqual(stats['opcodes'][opcode.opmap['INPLACE_ADD']],
+                                110)
+        self.assertGreaterEqual(sum(stats['opcodes']), instructions)
+
+        # Counters are kept while disabled, and reset by clear
+        func(10)
+        self.assertEqual(counts()[1:], (entries, instructions))
+        sys._get_exec_stats(clear=True)
+        stats, entries, instructions = counts()
+        self.assertEqual((entries, instructions), (0, 0))
+        self.assertEqual(sum(stats['opcodes']), 0)
+
+        sys._set_exec_stats(True)
+        self.assertIs(sys._get_exec_stats()['enabled'], True)
+        func(10)
+        sys._set_exec_stats(False)
+        self.assertEqual(counts()[1], 1)
+
+    @test.support.cpython_only
+    def test_exec_stats_with_tracing(self):
+        def func():
+            return 1
+
+        events = []
+        def tracer(frame, event, arg):
+            if frame.f_code is func.__code__:
+                events.append(event)
+            return tracer
+
+        self.addCleanup(sys._set_exec_stats, False)
+        old_trace = sys.gettrace()
+        sys._set_exec_stats(True)
+        sys.settrace(tracer)
+        try:
+            func()
+            sys._set_exec_stats(False)
+            func()
+        finally:
+            sys.settrace(old_trace)
+        self.assertEqual(events, ['call', 'line', 'return'] * 2)
+
     def test_ioencoding(self):
         env = dict(os.environ)
 
@@ -625,6 +625,26 @@ class MiscReadTestBase(CommonReadTest):
             tar.close()
             os_helper.rmtree(DIR)
 
+    def test_extractall_workers(self):
+        serial = os.path.join(TEMPDIR, "serial")
+        parallel = os.path.join(TEMPDIR, "parallel")
+        self.addCleanup(os_helper.rmtree, serial)
+        self.addCleanup(os_helper.rmtree, parallel)
+        with tarfile.open(tarname, encoding="iso8859-1") as tar:
+            tar.extractall(serial)
+        with tarfile.open(tarname, encoding="iso8859-1") as tar:
+            tar.extractall(parallel, workers=4)
+            members = tar.getmembers()
+        for tarinfo in members:
+            path1 = os.path.join(serial, tarinfo.name)
+            path2 = os.path.join(parallel, tarinfo.name)
+            self.assertEqual(os.path.lexists(path1), os.path.lexists(path2))
+            if tarinfo.isreg():
+                with open(path1, "rb") as f1, open(path2, "rb") as f2:
+                    self.assertEqual(f1.read(), f2.read(), tarinfo.name)
+                self.assertEqual(os.path.getmtime(path1),
+                                 os.path.getmtime(path2))
+
     def test_extract_directory(self):
         dirtype = "ustar/dirtype"
         DIR = os.path.join(TEMPDIR, "extractdir")
@@ -932,6 +952,89 @@ class MemberReadTest(ReadTest, unittest.TestCase):
         self._test_member(tarinfo, size=7011, chksum=sha256_regtype)
 
 
+class IndexedMemberReadTest(MemberReadTest):
+    # Look up the members using a member index.
+
+    def setUp(self):
+        indexname = os.path.join(TEMPDIR, "testtar.idx")
+        with tarfile.open(self.tarname, mode=self.mode,
+                          encoding="iso8859-1") as tar:
+            tar.save_index(indexname)
+        self.addCleanup(os_helper.unlink, indexname)
+        self.tar = tarfile.open(self.tarname, mode=self.mode,
+                                encoding="iso8859-1", index=indexname)
+
+    def test_no_scan(self):
+        names = ["gnu/sparse", "ustar/regtype", "misc/regtype-old-v7"]
+        for name in names:
+            self.assertEqual(self.tar.getmember(name).name, name)
+        self.assertIs(self.tar.getmember(names[0]),
+                      self.tar.getmember(names[0]))
+        self.assertFalse(self.tar._loaded)
+        self.assertEqual(len(self.tar.members), 1)
+        # Sequential access is not disturbed.
+        first, second = self.tar.next(), self.tar.next()
+        self.assertEqual([first.name, second.name], self.tar.getnames()[:2])
+
+    def test_missing_member(self):
+        self.assertRaises(KeyError, self.tar.getmember, "ustar/missing")
+        self.assertFalse(self.tar._loaded)
+
+    def test_find_link_target(self):
+        for name in "ustar/lnktype", "./ustar/linktest2/symtype":
+            with self.tar.extractfile(name) as f:
+                self.assertEqual(sha256sum(f.read()), sha256_regtype)
+
+    def test_index_file_object(self):
+        fobj = io.BytesIO()
+        self.tar.save_index(fobj)
+        fobj.seek(0)
+        with tarfile.open(self.tarname, mode=self.mode) as tar:
+            tar.load_index(fobj)
+            tarinfo = tar.getmember("ustar/regtype")
+            self._test_member(tarinfo, size=7011, chksum=sha256_regtype)
+
+    def test_bad_index(self):
+        self.assertRaises(tarfile.ReadError, self.tar.load_index,
+                          io.BytesIO(b"not an index"))
+        self.assertRaises(tarfile.ReadError, self.tar.load_index,
+                          io.BytesIO(b"PYTARIDX" + bytes(7)))
+        # An index created from a different archive.
+        fobj = io.BytesIO()
+        with tarfile.open(fileobj=fobj, mode="w") as tar:
+            tarinfo = tarfile.TarInfo("ustar/regtype")
+            tarinfo.size = 5
+            tar.addfile(tarinfo, io.BytesIO(b"abcde"))
+        fobj.seek(0)
+        index = io.BytesIO()
+        with tarfile.open(fileobj=fobj) as tar:
+            tar.save_index(index)
+        index.seek(0)
+        self.tar.load_index(index)
+        self.assertRaises(tarfile.ReadError, self.tar.getmember,
+                          "ustar/regtype")
+
+    def test_index_write_mode(self):
+        indexname = os.path.join(TEMPDIR, "index")
+        name = os.path.join(TEMPDIR, "index-write.tar")
+        for mode in "w", "a", "x", "w:gz", "w|":
+            with self.subTest(mode=mode):
+                with self.assertRaises(ValueError):
+                    tarfile.open(name, mode, index=indexname)
+                self.assertFalse(os.path.exists(name))
+        with self.assertRaises(ValueError):
+            tarfile.TarFile(name, "w", index=indexname)
+        self.assertFalse(os.path.exists(name))
+
+    def test_stream(self):
+        with tarfile.open(self.tarname, mode="r|" + self.suffix) as tar:
+            self.assertRaises(tarfile.StreamError, tar.load_index,
+                              io.BytesIO())
+
+class GzipIndexedMemberReadTest(GzipTest, IndexedMemberReadTest):
+    pass
+
+
 class LongnameTest:
 
     def test_read_longname(self):
@@ -2266,7 +2369,7 @@ class MiscTest(unittest.TestCase):
                      'GNUTYPE_SPARSE', 'XHDTYPE', 'XGLTYPE', 'SOLARIS_XHDTYPE',
                      'SUPPORTED_TYPES', 'REGULAR_TYPES', 'GNU_TYPES',
                      'PAX_FIELDS', 'PAX_NAME_FIELDS', 'PAX_NUMBER_FIELDS',
-                     'stn', 'nts', 'nti', 'itn', 'calc_chksums', 'copyfileobj',
+                     'INDEX_MAGIC', 'stn', 'nts', 'nti', 'itn', 'calc_chksums', 'copyfileobj',
                      'filemode',
                      'EmptyHeaderError', 'TruncatedHeaderError',
                      'EOFHeaderError', 'InvalidHeaderError',
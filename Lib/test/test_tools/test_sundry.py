@@ -53,6 +53,18 @@ class TestSundryScripts(unittest.TestCase):
     def test_analyze_dxp_import(self):
         if hasattr(sys, 'getdxp'):
             import_tool('analyze_dxp')
+        elif hasattr(sys, '_get_exec_stats'):
+            # Falls back to the execution statistics, which are only
+            # enabled on request
+            analyze_dxp = import_tool('analyze_dxp')
+            self.assertFalse(sys._get_exec_stats()['enabled'])
+            analyze_dxp.enable()
+            try:
+                self.assertTrue(sys._get_exec_stats()['enabled'])
+                self.assertIsInstance(analyze_dxp.hot_code(), list)
+            finally:
+                analyze_dxp.disable()
+            self.assertFalse(sys._get_exec_stats()['enabled'])
         else:
             with self.assertRaises(RuntimeError):
                 import_tool('analyze_dxp')
@@ -888,6 +888,19 @@ class MiscTracebackCases(unittest.TestCase):
             ])
         self.assertEqual(len(result[0]), 4)
 
+    def test_extract_stack_deferred_lookup_lines(self):
+        def extract():
+            return traceback.extract_stack(lookup_lines=False)
+        result = extract()
+        lineno = extract.__code__.co_firstlineno
+        self.assertIsNone(result[-1]._line)
+        self.assertEqual(result[-2:], [
+            (__file__, lineno+2, 'test_extract_stack_deferred_lookup_lines',
+             'result = extract()'),
+            (__file__, lineno+1, 'extract',
+             'return traceback.extract_stack(lookup_lines=False)'),
+            ])
+
 
 class TestFrame(unittest.TestCase):
 
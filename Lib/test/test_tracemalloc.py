@@ -1,4 +1,6 @@
 import contextlib
+import io
+import math
 import os
 import sys
 import tracemalloc
@@ -314,6 +316,79 @@ class TestTracemallocEnabled(unittest.TestCase):
         snapshot2 = tracemalloc.Snapshot.load(os_helper.TESTFN)
         self.assertEqual(snapshot2.test_attr, "new")
 
+    def test_sampling(self):
+        self.assertEqual(tracemalloc.get_sampling_interval(), 0)
+        tracemalloc.stop()
+        for interval in (-1, -2**20):
+            with self.assertRaises(ValueError):
+                tracemalloc.start(1, sampling_interval=interval)
+            self.assertFalse(tracemalloc.is_tracing())
+
+        tracemalloc.start(1, sampling_interval=4096)
+        self.assertEqual(tracemalloc.get_sampling_interval(), 4096)
+        obj_size = 1000
+        data = [allocate_bytes(obj_size) for count in range(2000)]
+        lineno = allocate_bytes.__code__.co_firstlineno + 4
+        snapshot = tracemalloc.take_snapshot()
+        self.assertEqual(snapshot.sampling_interval, 4096)
+        self.assertLess(len(snapshot.traces), len(data))
+
+        # Statistics are scaled estimates of all allocations
+        stats = snapshot.statistics('lineno')
+        stat = [stat for stat in stats
+                if stat.traceback[0].lineno == lineno][0]
+        self.assertAlmostEqual(stat.size, obj_size * len(data),
+                               delta=obj_size * len(data) * 0.3)
+        self.assertAlmostEqual(stat.count, len(data),
+                               delta=len(data) * 0.3)
+        size, peak_size = tracemalloc.get_traced_memory()
+        self.assertGreaterEqual(size, obj_size * len(data) * 0.7)
+
+        # The sampling interval is reset by the next start()
+        tracemalloc.stop()
+        tracemalloc.start(1)
+        self.assertEqual(tracemalloc.get_sampling_interval(), 0)
+
+    def test_snapshot_exporter(self):
+        obj, source = allocate_bytes(123)
+        out = io.StringIO()
+        exporter = tracemalloc.SnapshotExporter(60, out)
+        self.assertEqual(exporter.take_snapshot().traces,
+                         exporter.previous.traces)
+        data = [allocate_bytes(1000) for count in range(100)]
+        exporter.take_snapshot()
+        self.assertEqual(exporter.count, 2)
+        report = out.getvalue().splitlines()
+        headers = [index for index, line in enumerate(report)
+                   if not line.startswith('  ')]
+        self.assertEqual(len(headers), 2)
+        self.assertEqual(headers[0], 0)
+        self.assertIn('snapshot #1: traced memory', report[0])
+        self.assertIn('snapshot #2: traced memory', report[headers[1]])
+        # At most limit statistics per snapshot, the largest first
+        self.assertLessEqual(headers[1] - 1, exporter.limit)
+        self.assertLessEqual(len(report) - headers[1] - 1, exporter.limit)
+        self.assertIn(__file__, report[headers[1] + 1])
+        # Allocations of the exported snapshots are ignored
+        self.assertNotIn(tracemalloc.__file__, out.getvalue())
+
+        with os_helper.temp_dir() as directory:
+            exporter = tracemalloc.SnapshotExporter(0.001, directory=directory)
+            with exporter:
+                while not exporter.count:
+                    exporter._stop.wait(0.01)
+            self.assertIsNone(exporter._thread)
+            filenames = sorted(os.listdir(directory))
+            self.assertEqual(len(filenames), exporter.count)
+            snapshot = tracemalloc.Snapshot.load(
+                os.path.join(directory, filenames[0]))
+            self.assertGreater(len(snapshot.traces), 0)
+
+        self.assertRaises(ValueError, tracemalloc.SnapshotExporter, 0)
+        tracemalloc.stop()
+        with self.assertRaises(RuntimeError):
+            tracemalloc.SnapshotExporter(1.0).start()
+
     def fork_child(self):
         if not tracemalloc.is_tracing():
             return 2
@@ -366,6 +441,42 @@ class TestSnapshot(unittest.TestCase):
             self.assertEqual(trace.traceback[0].filename, 'a.py')
             self.assertEqual(trace.traceback[0].lineno, 2)
 
+    def test_sampled_statistics(self):
+        raw_traces = [
+            (0, 10, (('a.py', 2), ('b.py', 4)), 3),
+            (0, 10, (('a.py', 2), ('b.py', 4)), 3),
+            (0, 2000, (('a.py', 5), ('b.py', 4)), 3),
+        ]
+        snapshot = tracemalloc.Snapshot(raw_traces, 2, sampling_interval=100)
+        weight = 1 / -math.expm1(-10 / 100)
+        large_weight = 1 / -math.expm1(-2000 / 100)
+
+        stats = snapshot.statistics('lineno')
+        self.assertEqual(stats, [
+            tracemalloc.Statistic(traceback_lineno('a.py', 5),
+                                  round(2000 * large_weight),
+                                  round(large_weight)),
+            tracemalloc.Statistic(traceback_lineno('a.py', 2),
+                                  round(2 * 10 * weight),
+                                  round(2 * weight)),
+        ])
+        stats = snapshot.statistics('filename', cumulative=True)
+        self.assertEqual(stats[0],
+            tracemalloc.Statistic(traceback_filename('b.py'),
+                                  round(2 * 10 * weight + 2000 * large_weight),
+                                  round(2 * weight + large_weight)))
+
+        snapshot2 = snapshot.filter_traces([])
+        self.assertEqual(snapshot2.sampling_interval, 100)
+        self.assertEqual(snapshot2.statistics('lineno'),
+                         snapshot.statistics('lineno'))
+
+        # a snapshot without a sampling interval, as dumped by
+        # Python 3.9 and older
+        del snapshot2.sampling_interval
+        self.assertEqual(snapshot2.sampling_interval, 0)
+        self.assertEqual(snapshot2.statistics('lineno')[0].count, 1)
+
     def test_filter_traces(self):
         snapshot, snapshot2 = create_snapshots()
         filter1 = tracemalloc.Filter(False, "b.py")
@@ -912,6 +912,39 @@ class ProtocolTests(BaseTestCase):
         with self.assertRaises(TypeError):
             isinstance(C(), BadPG)
 
+    def test_protocols_isinstance_members_changed(self):
+        @runtime_checkable
+        class P(Protocol):
+            def meth(self): ...
+
+        @runtime_checkable
+        class Q(P, Protocol):
+            pass
+
+        class C:
+            def meth(self): ...
+
+        class D:
+            def meth(self): ...
+            x = 1
+
+        self.assertIsInstance(D(), P)
+        self.assertIsInstance(D(), Q)
+        # The cached members of the protocol and its subclasses are
+        # updated when a member is added or removed.  C has not been
+        # checked before, so it is not in the ABC caches.
+        P.x = 0
+        self.assertNotIsInstance(C(), P)
+        self.assertNotIsInstance(C(), Q)
+        self.assertIsInstance(D(), Q)
+        class E:
+            def meth(self): ...
+        with self.assertRaises(TypeError):
+            issubclass(E, Q)
+        del P.x
+        self.assertIsInstance(C(), Q)
+        self.assertTrue(issubclass(D, Q))
+
     def test_protocols_isinstance_py36(self):
         class APoint:
             def __init__(self, x, y, label):
@@ -1397,6 +1430,17 @@ class ProtocolTests(BaseTestCase):
 
 class GenericTests(BaseTestCase):
 
+    def test_alias_hash(self):
+        self.assertEqual(hash(Dict[str, List[int]]),
+                         hash(Dict[str, List[int]]))
+        alias = Tuple[int, str]
+        self.assertEqual(hash(alias), hash((tuple, (int, str))))
+        self.assertEqual(hash(alias), hash(alias))
+        self.assertEqual(repr(alias), 'typing.Tuple[int, str]')
+        self.assertEqual(copy(alias), alias)
+        self.assertEqual(pickle.loads(pickle.dumps(alias)), alias)
+        self.assertNotIn('_hash', dir(alias.__origin__))
+
     def test_basics(self):
         X = SimpleMapping[str, Any]
         self.assertEqual(X.__parameters__, ())
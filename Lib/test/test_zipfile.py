@@ -405,6 +405,79 @@ class AbstractTestsWithSourceFile:
             self.assertEqual(one_info._compresslevel, 1)
             self.assertEqual(nine_info._compresslevel, 9)
 
+    def test_workers(self):
+        # Members compressed in worker threads are written in order, and
+        # the archive is the same as when compressing them in turn.
+        def make_archive(wrapper, workers):
+            f = io.BytesIO()
+            with zipfile.ZipFile(wrapper(f), "w", self.compression,
+                                 workers=workers) as zipfp:
+                for i in range(10):
+                    zipfp.write(TESTFN, "file%d" % i)
+                    zinfo = zipfile.ZipInfo("str%d" % i,
+                                            date_time=(2020, 1, 1, 0, 0, 0))
+                    zinfo.compress_type = self.compression
+                    zipfp.writestr(zinfo, self.data[:i * 1000])
+                    if i == 5:
+                        with zipfp.open("open", "w") as dest:
+                            dest.write(self.data)
+                        self.assertIn("file5", zipfp.namelist())
+            return f
+
+        for wrapper in Unseekable, lambda f: f:
+            with self.subTest(wrapper=wrapper):
+                expected = make_archive(wrapper, None).getvalue()
+                f = make_archive(wrapper, 3)
+                self.assertEqual(f.getvalue(), expected)
+        with zipfile.ZipFile(f) as zipfp:
+            self.assertEqual(zipfp.read("file9"), self.data)
+            self.assertEqual(zipfp.read("str9"), self.data[:9000])
+            self.assertIsNone(zipfp.testzip())
+
+    def test_workers_pending_members(self):
+        # Members still being compressed are listed.
+        with zipfile.ZipFile(io.BytesIO(), "w", self.compression,
+                             workers=2) as zipfp:
+            zipfp.writestr("str1", self.data)
+            zipfp.writestr("str2", self.data)
+            self.assertEqual(zipfp.namelist(), ["str1", "str2"])
+            self.assertEqual([zinfo.filename for zinfo in zipfp.infolist()],
+                             ["str1", "str2"])
+            zipfp.writestr("str3", self.data)
+            self.assertEqual(zipfp.getinfo("str3").file_size, len(self.data))
+
+    def test_workers_errors(self):
+        # Errors are raised by the call adding the member.
+        f = io.BytesIO()
+        with zipfile.ZipFile(f, "w", self.compression, workers=2) as zipfp:
+            zipfp.writestr("str1", b"data1")
+            with self.assertRaises(FileNotFoundError):
+                zipfp.write(TESTFN + "-missing", "missing")
+            with self.assertRaises(NotImplementedError):
+                zipfp.writestr("bad", b"data", compress_type=-1)
+            with self.assertWarns(UserWarning):
+                zipfp.writestr("str1", b"data1")
+        with zipfile.ZipFile(f) as zipfp:
+            self.assertEqual(zipfp.namelist(), ["str1", "str1"])
+
+        # Errors in the worker threads.  The members written before are kept.
+        def compress_member(compressor, src):
+            if src.getvalue() == b"broken":
+                raise OSError("broken")
+            return compress(compressor, src)
+        compress = zipfile._compress_member
+        f = io.BytesIO()
+        with mock.patch("zipfile._compress_member", compress_member):
+            zipfp = zipfile.ZipFile(f, "w", self.compression, workers=2)
+            with self.assertRaisesRegex(OSError, "broken"):
+                zipfp.writestr("str1", b"data1")
+                zipfp.writestr("broken", b"broken")
+                zipfp.close()
+            zipfp.close()
+        with zipfile.ZipFile(f) as zipfp:
+            self.assertEqual(zipfp.namelist(), ["str1"])
+            self.assertEqual(zipfp.read("str1"), b"data1")
+
     def test_writing_errors(self):
         class BrokenFile(io.BytesIO):
             def write(self, data):
@@ -1415,6 +1488,25 @@ class ExtractTests(unittest.TestCase):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(pathlib.Path(extdir))
 
+    def test_extract_all_workers(self):
+        with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+            zipfp.writestr("dir/", b"")
+            for i in range(50):
+                zipfp.writestr("dir%d/sub/file%d" % (i % 3, i), b"data%d" % i)
+            # A duplicate name is extracted after the first one.
+            with self.assertWarns(UserWarning):
+                zipfp.writestr("dir1/sub/file1", b"new")
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(TESTFN2) as zipfp:
+                zipfp.extractall(extdir, workers=4)
+            self.assertTrue(os.path.isdir(os.path.join(extdir, "dir")))
+            for i in range(50):
+                self.check_file(
+                    os.path.join(extdir, "dir%d" % (i % 3), "sub",
+                                 "file%d" % i),
+                    b"new" if i == 1 else b"data%d" % i)
+        unlink(TESTFN2)
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -606,6 +606,50 @@ class CompressObjectTestCase(BaseCompressTestCase, unittest.TestCase):
         uncomp = dco.decompress(comp) + dco.flush()
         self.assertEqual(zdict, uncomp)
 
+    def test_decompress_block(self):
+        # Stop at each block boundary, and resume decompression there with
+        # a fresh object, the preceding data as dictionary and the unused
+        # bits of the last consumed byte.
+        source = HAMLET_SCENE * 64
+        co = zlib.compressobj(wbits=-zlib.MAX_WBITS)
+        pieces = []
+        for i in range(0, len(source), 1000):
+            pieces.append(co.compress(source[i:i + 1000]))
+            if i % 3000 == 0:
+                # Start a new block, at any bit position.
+                pieces.append(co.flush(zlib.Z_BLOCK))
+        pieces.append(co.flush())
+        comp = b''.join(pieces)
+
+        dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        self.assertEqual(dco.boundary_bits, -1)
+        data = b''
+        tail = comp
+        boundaries = []
+        while not dco.eof:
+            data += dco.decompress(tail, block=True)
+            tail = dco.unconsumed_tail
+            if dco.boundary_bits >= 0 and not dco.eof:
+                boundaries.append((len(data), len(comp) - len(tail),
+                                   dco.boundary_bits))
+        self.assertEqual(data, source)
+        self.assertGreater(len(boundaries), 10)
+        self.assertGreater(len({bits for _, _, bits in boundaries}), 1)
+
+        for pos, offset, bits in boundaries:
+            dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS,
+                                     zdict=source[max(pos - 32768, 0):pos])
+            if bits:
+                dco.prime(bits, comp[offset - 1] >> (8 - bits))
+            self.assertEqual(dco.decompress(comp[offset:]), source[pos:])
+            self.assertTrue(dco.eof)
+
+    def test_prime_bad_args(self):
+        dco = zlib.decompressobj(wbits=-zlib.MAX_WBITS)
+        self.assertRaises(ValueError, dco.prime, -1, 0)
+        self.assertRaises(ValueError, dco.prime, 17, 0)
+        self.assertRaises(TypeError, dco.prime, 1)
+
     def test_flush_with_freed_input(self):
         # Issue #16411: decompressor accesses input to last decompress() call
         # in flush(), even if this object has been freed in the meanwhile.
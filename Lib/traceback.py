@@ -197,18 +197,20 @@ def format_stack(f=None, limit=None):
     return format_list(extract_stack(f, limit=limit))
 
 
-def extract_stack(f=None, limit=None):
+def extract_stack(f=None, limit=None, *, lookup_lines=True):
     """Extract the raw traceback from the current stack frame.
 
     The return value has the same format as for extract_tb().  The
     optional 'f' and 'limit' arguments have the same meaning as for
     print_stack().  Each item in the list is a quadruple (filename,
     line number, function name, text), and the entries are in order
-    from oldest to newest stack frame.
+    from oldest to newest stack frame.  If 'lookup_lines' is false,
+    source lines are only read when the text is first accessed.
     """
     if f is None:
         f = sys._getframe().f_back
-    stack = StackSummary.extract(walk_stack(f), limit=limit)
+    stack = StackSummary.extract(walk_stack(f), limit=limit,
+                                 lookup_lines=lookup_lines)
     stack.reverse()
     return stack
 
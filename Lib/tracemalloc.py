@@ -2,8 +2,11 @@ from collections.abc import Sequence, Iterable
 from functools import total_ordering
 import fnmatch
 import linecache
+import math
 import os.path
 import pickle
+import sys
+import time
 
 # Import types and functions implemented in C
 from _tracemalloc import *
@@ -117,6 +120,14 @@ class StatisticDiff:
                 self.traceback)
 
 
+def _sample_weight(size, sampling_interval):
+    # Number of memory blocks represented by a sampled memory block of size
+    # bytes: inverse of the probability to sample it
+    if not size:
+        return 1.0
+    return 1.0 / -math.expm1(-size / sampling_interval)
+
+
 def _compare_grouped_stats(old_group, new_group):
     statistics = []
     for traceback, stat in new_group.items():
@@ -417,11 +428,15 @@ class Snapshot:
     Snapshot of traces of memory blocks allocated by Python.
     """
 
-    def __init__(self, traces, traceback_limit):
+    # Snapshots dumped by older Python versions don't have the attribute
+    sampling_interval = 0
+
+    def __init__(self, traces, traceback_limit, sampling_interval=0):
         # traces is a tuple of trace tuples: see _Traces constructor for
         # the exact format
         self.traces = _Traces(traces)
         self.traceback_limit = traceback_limit
+        self.sampling_interval = sampling_interval
 
     def dump(self, filename):
         """
@@ -472,7 +487,8 @@ class Snapshot:
                                                 trace)]
         else:
             new_traces = self.traces._traces.copy()
-        return Snapshot(new_traces, self.traceback_limit)
+        return Snapshot(new_traces, self.traceback_limit,
+                        self.sampling_interval)
 
     def _group_by(self, key_type, cumulative):
         if key_type not in ('traceback', 'filename', 'lineno'):
@@ -483,9 +499,14 @@ class Snapshot:
 
         stats = {}
         tracebacks = {}
+        sampling_interval = self.sampling_interval
+        count = 1
         if not cumulative:
             for trace in self.traces._traces:
                 domain, size, trace_traceback, total_nframe = trace
+                if sampling_interval:
+                    count = _sample_weight(size, sampling_interval)
+                    size *= count
                 try:
                     traceback = tracebacks[trace_traceback]
                 except KeyError:
@@ -500,13 +521,16 @@ class Snapshot:
                 try:
                     stat = stats[traceback]
                     stat.size += size
-                    stat.count += 1
+                    stat.count += count
                 except KeyError:
-                    stats[traceback] = Statistic(traceback, size, 1)
+                    stats[traceback] = Statistic(traceback, size, count)
         else:
             # cumulative statistics
             for trace in self.traces._traces:
                 domain, size, trace_traceback, total_nframe = trace
+                if sampling_interval:
+                    count = _sample_weight(size, sampling_interval)
+                    size *= count
                 for frame in trace_traceback:
                     try:
                         traceback = tracebacks[frame]
@@ -520,9 +544,14 @@ class Snapshot:
                     try:
                         stat = stats[traceback]
                         stat.size += size
-                        stat.count += 1
+                        stat.count += count
                     except KeyError:
-                        stats[traceback] = Statistic(traceback, size, 1)
+                        stats[traceback] = Statistic(traceback, size, count)
+        if sampling_interval:
+            # scaled estimates of the sampled memory blocks
+            for stat in stats.values():
+                stat.size = round(stat.size)
+                stat.count = round(stat.count)
         return stats
 
     def statistics(self, key_type, cumulative=False):
@@ -557,4 +586,111 @@ def take_snapshot():
                            "allocations to take a snapshot")
     traces = _get_traces()
     traceback_limit = get_traceback_limit()
-    return Snapshot(traces, traceback_limit)
+    return Snapshot(traces, traceback_limit, get_sampling_interval())
+
+
+class SnapshotExporter:
+    """
+    Take a snapshot every *interval* seconds in a background thread and
+    export it with the differences to the previous snapshot.
+    """
+
+    def __init__(self, interval, file=None, *, directory=None,
+                 key_type='lineno', cumulative=False, limit=10, filters=None):
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = interval
+        self.file = file
+        self.directory = directory
+        self.key_type = key_type
+        self.cumulative = cumulative
+        self.limit = limit
+        if filters is None:
+            # Ignore the memory held by the snapshots themselves
+            filters = [Filter(False, __file__)]
+        self.filters = filters
+        self.count = 0
+        self.previous = None
+        self._thread = None
+        self._stop = None
+
+    def start(self):
+        """
+        Start exporting snapshots in a background thread.
+        """
+        import threading
+        if not is_tracing():
+            raise RuntimeError("the tracemalloc module must be tracing memory "
+                               "allocations to export snapshots")
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run,
+                                        name='tracemalloc-exporter',
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stop the background thread.
+        """
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not is_tracing():
+                break
+            self.take_snapshot()
+
+    def take_snapshot(self):
+        """
+        Take a snapshot, export it and return it.
+        """
+        snapshot = take_snapshot()
+        if self.filters:
+            snapshot = snapshot.filter_traces(self.filters)
+        self.count += 1
+        previous = self.previous
+        self.previous = snapshot
+        self.export(snapshot, previous)
+        return snapshot
+
+    def export(self, snapshot, previous):
+        """
+        Dump *snapshot* into the directory and write the differences with
+        the *previous* snapshot (``None`` for the first snapshot) into the
+        file.  Override this method to export snapshots elsewhere.
+        """
+        if self.directory is not None:
+            filename = 'tracemalloc-%d-%04d.snapshot' % (os.getpid(),
+                                                         self.count)
+            snapshot.dump(os.path.join(self.directory, filename))
+
+        file = self.file
+        if file is None:
+            if self.directory is not None:
+                return
+            file = sys.stderr
+        if previous is None:
+            previous = Snapshot([], snapshot.traceback_limit)
+        stats = snapshot.compare_to(previous, self.key_type, self.cumulative)
+        current, peak = get_traced_memory()
+        print("[%s] snapshot #%d: traced memory %s (peak %s)"
+              % (time.strftime('%Y-%m-%d %H:%M:%S'), self.count,
+                 _format_size(current, False), _format_size(peak, False)),
+              file=file)
+        for stat in stats[:self.limit]:
+            print("  %s" % stat, file=file)
+        file.flush()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -648,7 +648,7 @@ class _BaseGenericAlias(_Final, _root=True):
         raise AttributeError(attr)
 
     def __setattr__(self, attr, val):
-        if _is_dunder(attr) or attr in ('_name', '_inst', '_nparams'):
+        if _is_dunder(attr) or attr in ('_name', '_inst', '_nparams', '_hash'):
             super().__setattr__(attr, val)
         else:
             setattr(self.__origin__, attr, val)
@@ -691,7 +691,14 @@ class _GenericAlias(_BaseGenericAlias, _root=True):
                 and self.__args__ == other.__args__)
 
     def __hash__(self):
-        return hash((self.__origin__, self.__args__))
+        # Aliases are immutable and are hashed on every lookup in the
+        # subscription cache, so remember the hash.
+        try:
+            return self.__dict__['_hash']
+        except KeyError:
+            pass
+        self._hash = result = hash((self.__origin__, self.__args__))
+        return result
 
     @_tp_cache
     def __getitem__(self, params):
@@ -972,7 +979,8 @@ class _TypingEllipsis:
 
 
 _TYPING_INTERNALS = ['__parameters__', '__orig_bases__',  '__orig_class__',
-                     '_is_protocol', '_is_runtime_protocol']
+                     '_is_protocol', '_is_runtime_protocol',
+                     '__protocol_attrs__']
 
 _SPECIAL_NAMES = ['__abstractmethods__', '__annotations__', '__dict__', '__doc__',
                   '__init__', '__module__', '__new__', '__slots__',
@@ -999,9 +1007,28 @@ def _get_protocol_attrs(cls):
     return attrs
 
 
+def _get_protocol_members(cls):
+    """Return the members of a protocol class and whether they are all callable.
+
+    The members are returned as a tuple of (name, callable) pairs.  The
+    result is cached in the class of protocols and discarded by
+    _ProtocolMeta whenever a member of the class or of a base is changed.
+    """
+    try:
+        return cls.__dict__['__protocol_attrs__']
+    except KeyError:
+        pass
+    members = tuple((attr, callable(getattr(cls, attr, None)))
+                    for attr in _get_protocol_attrs(cls))
+    result = members, all(is_callable for _, is_callable in members)
+    if isinstance(cls, _ProtocolMeta):
+        type.__setattr__(cls, '__protocol_attrs__', result)
+    return result
+
+
 def _is_callable_members_only(cls):
     # PEP 544 prohibits using issubclass() with protocols that have non-method members.
-    return all(callable(getattr(cls, attr, None)) for attr in _get_protocol_attrs(cls))
+    return _get_protocol_members(cls)[1]
 
 
 def _no_init(self, *args, **kwargs):
@@ -1036,19 +1063,41 @@ class _ProtocolMeta(ABCMeta):
     def __instancecheck__(cls, instance):
         # We need this method for situations where attributes are
         # assigned in __init__.
-        if ((not getattr(cls, '_is_protocol', False) or
-                _is_callable_members_only(cls)) and
+        is_protocol = getattr(cls, '_is_protocol', False)
+        if is_protocol:
+            members, callable_only = _get_protocol_members(cls)
+        if ((not is_protocol or callable_only) and
                 issubclass(instance.__class__, cls)):
             return True
-        if cls._is_protocol:
+        if is_protocol:
             if all(hasattr(instance, attr) and
                     # All *methods* can be blocked by setting them to None.
-                    (not callable(getattr(cls, attr, None)) or
+                    (not is_callable or
                      getattr(instance, attr) is not None)
-                    for attr in _get_protocol_attrs(cls)):
+                    for attr, is_callable in members):
                 return True
         return super().__instancecheck__(instance)
 
+    def __setattr__(cls, attr, value):
+        super().__setattr__(attr, value)
+        _ProtocolMeta._clear_members(cls, attr)
+
+    def __delattr__(cls, attr):
+        super().__delattr__(attr)
+        _ProtocolMeta._clear_members(cls, attr)
+
+    def _clear_members(cls, attr):
+        # Discard the cached members of the class and its subclasses
+        # when a possible member changes.
+        if attr.startswith('_abc_') or attr in EXCLUDED_ATTRIBUTES:
+            return
+        classes = [cls]
+        while classes:
+            c = classes.pop()
+            if '__protocol_attrs__' in c.__dict__:
+                type.__delattr__(c, '__protocol_attrs__')
+            classes.extend(type.__subclasses__(c))
+
 
 class Protocol(Generic, metaclass=_ProtocolMeta):
     """Base class for protocol classes.
@@ -1112,7 +1161,7 @@ class Protocol(Generic, metaclass=_ProtocolMeta):
                 raise TypeError('issubclass() arg 1 must be a class')
 
             # Second, perform the actual structural compatibility check.
-            for attr in _get_protocol_attrs(cls):
+            for attr, _ in _get_protocol_members(cls)[0]:
                 for base in other.__mro__:
                     # Check if the members appears in the class dictionary...
                     if attr in base.__dict__:
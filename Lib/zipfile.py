@@ -56,6 +56,10 @@ ZIP64_LIMIT = (1 << 31) - 1
 ZIP_FILECOUNT_LIMIT = (1 << 16) - 1
 ZIP_MAX_COMMENT = (1 << 16) - 1
 
+# Compressed data of up to this size is kept in memory by the worker threads
+# of ZipFile, larger data is spooled to a temporary file.
+_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
 # constants for Zip file compression methods
 ZIP_STORED = 0
 ZIP_DEFLATED = 8
@@ -1125,7 +1129,7 @@ class _ZipWriteFile(io.BufferedIOBase):
         self._crc = crc32(data, self._crc)
         if self._compressor:
             data = self._compressor.compress(data)
-            self._compress_size += len(data)
+        self._compress_size += len(data)
         self._fileobj.write(data)
         return nbytes
 
@@ -1139,9 +1143,7 @@ class _ZipWriteFile(io.BufferedIOBase):
                 buf = self._compressor.flush()
                 self._compress_size += len(buf)
                 self._fileobj.write(buf)
-                self._zinfo.compress_size = self._compress_size
-            else:
-                self._zinfo.compress_size = self._file_size
+            self._zinfo.compress_size = self._compress_size
             self._zinfo.CRC = self._crc
             self._zinfo.file_size = self._file_size
 
@@ -1176,12 +1178,61 @@ class _ZipWriteFile(io.BufferedIOBase):
             self._zipfile._writing = False
 
 
+class _ZipWriteCompressedFile(_ZipWriteFile):
+    """Write the data of a member compressed by _compress_member()."""
+
+    def __init__(self, zf, zinfo, zip64, crc, file_size):
+        self._zinfo = zinfo
+        self._zip64 = zip64
+        self._zipfile = zf
+        self._compressor = None
+        self._file_size = file_size
+        self._compress_size = 0
+        self._crc = crc
+
+    def write(self, data):
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        self._compress_size += len(data)
+        self._fileobj.write(data)
+        return len(data)
+
+
+def _compress_member(compressor, src):
+    """Compress the data of a member in a worker thread of a ZipFile.
+
+    src is the file object to read the data from, it is closed when done.
+    Return the CRC and the size of the data, and a file object holding
+    the compressed data.
+    """
+    import tempfile
+    buf = tempfile.SpooledTemporaryFile(_SPOOL_MAX_SIZE)
+    try:
+        crc = file_size = 0
+        with src:
+            while True:
+                data = src.read(1024 * 1024)
+                if not data:
+                    break
+                file_size += len(data)
+                crc = crc32(data, crc)
+                if compressor:
+                    data = compressor.compress(data)
+                buf.write(data)
+        if compressor:
+            buf.write(compressor.flush())
+        buf.seek(0)
+    except:
+        buf.close()
+        raise
+    return crc, file_size, buf
+
 
 class ZipFile:
     """ Class with methods to open, read, write, close, list zip files.
 
     z = ZipFile(file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                compresslevel=None)
+                compresslevel=None, workers=None)
 
     file: Either the path to the file, or a file-like object.
           If it is a path, the file will be opened and closed by ZipFile.
@@ -1197,6 +1248,9 @@ class ZipFile:
                    When using ZIP_STORED or ZIP_LZMA this keyword has no effect.
                    When using ZIP_DEFLATED integers 0 through 9 are accepted.
                    When using ZIP_BZIP2 integers 1 through 9 are accepted.
+    workers: None or an integer.  If greater than 1, write() and writestr()
+             compress the members in up to that many threads, and the
+             members are added to the archive in order once compressed.
 
     """
 
@@ -1204,7 +1258,7 @@ class ZipFile:
     _windows_illegal_name_trans_table = None
 
     def __init__(self, file, mode="r", compression=ZIP_STORED, allowZip64=True,
-                 compresslevel=None, *, strict_timestamps=True):
+                 compresslevel=None, *, strict_timestamps=True, workers=None):
         """Open the ZIP file with mode read 'r', write 'w', exclusive create 'x',
         or append 'a'."""
         if mode not in ('r', 'w', 'x', 'a'):
@@ -1223,6 +1277,9 @@ class ZipFile:
         self.pwd = None
         self._comment = b''
         self._strict_timestamps = strict_timestamps
+        self._workers = workers if workers is not None and workers > 1 else None
+        self._executor = None
+        self._pending = []      # (zinfo, future) of members being compressed
 
         # Check if we were passed a file-like object
         if isinstance(file, os.PathLike):
@@ -1393,15 +1450,18 @@ class ZipFile:
 
     def namelist(self):
         """Return a list of file names in the archive."""
+        self._write_pending()
         return [data.filename for data in self.filelist]
 
     def infolist(self):
         """Return a list of class ZipInfo instances for files in the
         archive."""
+        self._write_pending()
         return self.filelist
 
     def printdir(self, file=None):
         """Print a table of contents for the zip file."""
+        self._write_pending()
         print("%-46s %19s %12s" % ("File Name", "Modified    ", "Size"),
               file=file)
         for zinfo in self.filelist:
@@ -1424,6 +1484,7 @@ class ZipFile:
 
     def getinfo(self, name):
         """Return the instance of ZipInfo given 'name'."""
+        self._write_pending()
         info = self.NameToInfo.get(name)
         if info is None:
             raise KeyError(
@@ -1488,6 +1549,7 @@ class ZipFile:
         if not self.fp:
             raise ValueError(
                 "Attempt to use ZIP archive that was already closed")
+        self._write_pending()
 
         # Make sure we have an info object
         if isinstance(name, ZipInfo):
@@ -1572,6 +1634,14 @@ class ZipFile:
                              "another write handle open on it. "
                              "Close the first handle before opening another.")
 
+        zip64 = self._write_file_header(zinfo, force_zip64)
+        self._writing = True
+        return _ZipWriteFile(self, zinfo, zip64)
+
+    def _write_file_header(self, zinfo, force_zip64, checked=False):
+        """Write the local header of a member, return whether it uses the
+        ZIP64 format.  If checked is true, the member was already checked
+        by _writecheck() except for its offset."""
         # Size and CRC are overwritten with correct data after processing the file
         zinfo.compress_size = 0
         zinfo.CRC = 0
@@ -1594,13 +1664,46 @@ class ZipFile:
             self.fp.seek(self.start_dir)
         zinfo.header_offset = self.fp.tell()
 
-        self._writecheck(zinfo)
+        if not checked:
+            self._writecheck(zinfo)
+        elif not self._allowZip64 and zinfo.header_offset > ZIP64_LIMIT:
+            raise LargeZipFile("Zipfile size would require ZIP64 extensions")
         self._didModify = True
 
         self.fp.write(zinfo.FileHeader(zip64))
+        return zip64
 
-        self._writing = True
-        return _ZipWriteFile(self, zinfo, zip64)
+    def _submit(self, zinfo, src):
+        """Compress a member read from the file object src in a worker
+        thread.  It is written to the archive by _write_pending().
+
+        The member is checked and its compressor created here, for the
+        errors to be raised by the write() or writestr() call adding it.
+        """
+        with self._lock:
+            self._writecheck(zinfo)
+        compressor = _get_compressor(zinfo.compress_type, zinfo._compresslevel)
+        if self._executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._executor = ThreadPoolExecutor(self._workers)
+        future = self._executor.submit(_compress_member, compressor, src)
+        self._pending.append((zinfo, future))
+        # Bound the amount of compressed data waiting to be written.
+        self._write_pending(2 * self._workers)
+
+    def _write_pending(self, keep=0):
+        """Write the members compressed by the worker threads to the archive,
+        in order.  Wait for them until at most `keep' are pending."""
+        pending = self._pending
+        while pending and (len(pending) > keep or pending[0][1].done()):
+            zinfo, future = pending.pop(0)
+            crc, file_size, buf = future.result()
+            with buf, self._lock:
+                zip64 = self._write_file_header(zinfo, False, checked=True)
+                self._writing = True
+                with _ZipWriteCompressedFile(self, zinfo, zip64,
+                                             crc, file_size) as dest:
+                    shutil.copyfileobj(buf, dest)
 
     def extract(self, member, path=None, pwd=None):
         """Extract a member from the archive to the current working directory,
@@ -1615,11 +1718,15 @@ class ZipFile:
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=None):
         """Extract all members from the archive to the current working
            directory. `path' specifies a different directory to extract to.
            `members' is optional and must be a subset of the list returned
-           by namelist().
+           by namelist(). If `workers' is greater than 1, up to that many
+           members are extracted concurrently, each thread reading the
+           archive through its own file object. This requires an archive
+           opened by name in mode 'r'; otherwise the members are extracted
+           one at a time.
         """
         if members is None:
             members = self.namelist()
@@ -1629,9 +1736,64 @@ class ZipFile:
         else:
             path = os.fspath(path)
 
+        if workers is not None and workers > 1 and self._can_reopen():
+            self._extractall_parallel(members, path, pwd, workers)
+            return
+
         for zipinfo in members:
             self._extract_member(zipinfo, path, pwd)
 
+    def _can_reopen(self):
+        """Return True if the archive can be read through independent file
+           objects, opened by name.
+        """
+        return (self.mode == 'r' and not self._filePassed and
+                isinstance(self.filename, str))
+
+    def _extractall_parallel(self, members, path, pwd, workers):
+        """Extract members in a pool of `workers' threads. Each thread uses
+           a shallow copy of the ZipFile with its own file object. Members
+           with the same name are extracted in archive order.
+        """
+        import copy
+        from concurrent.futures import ThreadPoolExecutor
+
+        local = threading.local()
+        copies = []
+        lock = threading.Lock()
+
+        def extract(member):
+            zf = getattr(local, "zipfile", None)
+            if zf is None:
+                zf = local.zipfile = copy.copy(self)
+                zf.fp = io.open(self.filename, "rb")
+                zf._fileRefCnt = 1
+                zf._lock = threading.RLock()
+                with lock:
+                    copies.append(zf)
+            zf._extract_member(member, path, pwd)
+
+        pending = {}
+        def wait():
+            futures = list(pending.values())
+            pending.clear()
+            for future in futures:
+                future.result()
+
+        executor = ThreadPoolExecutor(workers)
+        try:
+            for member in members:
+                if not isinstance(member, ZipInfo):
+                    member = self.getinfo(member)
+                if member.filename in pending:
+                    wait()
+                pending[member.filename] = executor.submit(extract, member)
+            wait()
+        finally:
+            executor.shutdown()
+            for zf in copies:
+                zf.close()
+
     @classmethod
     def _sanitize_windows_name(cls, arcname, pathsep):
         """Replace bad characters and remove trailing dots from parts."""
@@ -1673,14 +1835,15 @@ class ZipFile:
         targetpath = os.path.join(targetpath, arcname)
         targetpath = os.path.normpath(targetpath)
 
-        # Create all upper directories if necessary.
+        # Create all upper directories if necessary.  Other threads of
+        # extractall() may be creating them too.
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
-            os.makedirs(upperdirs)
+            os.makedirs(upperdirs, exist_ok=True)
 
         if member.is_dir():
             if not os.path.isdir(targetpath):
-                os.mkdir(targetpath)
+                os.makedirs(targetpath, exist_ok=True)
             return targetpath
 
         with self.open(member, pwd=pwd) as source, \
@@ -1691,7 +1854,9 @@ class ZipFile:
 
     def _writecheck(self, zinfo):
         """Check for errors before writing a file to the archive."""
-        if zinfo.filename in self.NameToInfo:
+        if (zinfo.filename in self.NameToInfo or
+            any(pending.filename == zinfo.filename
+                for pending, future in self._pending)):
             import warnings
             warnings.warn('Duplicate name: %r' % zinfo.filename, stacklevel=3)
         if self.mode not in ('w', 'x', 'a'):
@@ -1702,7 +1867,7 @@ class ZipFile:
         _check_compression(zinfo.compress_type)
         if not self._allowZip64:
             requires_zip64 = None
-            if len(self.filelist) >= ZIP_FILECOUNT_LIMIT:
+            if len(self.filelist) + len(self._pending) >= ZIP_FILECOUNT_LIMIT:
                 requires_zip64 = "Files count"
             elif zinfo.file_size > ZIP64_LIMIT:
                 requires_zip64 = "Filesize"
@@ -1742,6 +1907,7 @@ class ZipFile:
                 zinfo._compresslevel = self.compresslevel
 
         if zinfo.is_dir():
+            self._write_pending()
             with self._lock:
                 if self._seekable:
                     self.fp.seek(self.start_dir)
@@ -1757,6 +1923,13 @@ class ZipFile:
                 self.NameToInfo[zinfo.filename] = zinfo
                 self.fp.write(zinfo.FileHeader(False))
                 self.start_dir = self.fp.tell()
+        elif self._workers:
+            src = open(filename, "rb")
+            try:
+                self._submit(zinfo, src)
+            except:
+                src.close()
+                raise
         else:
             with open(filename, "rb") as src, self.open(zinfo, 'w') as dest:
                 shutil.copyfileobj(src, dest, 1024*8)
@@ -1798,6 +1971,9 @@ class ZipFile:
             zinfo._compresslevel = compresslevel
 
         zinfo.file_size = len(data)            # Uncompressed size
+        if self._workers:
+            self._submit(zinfo, io.BytesIO(data))
+            return
         with self._lock:
             with self.open(zinfo, mode='w') as dest:
                 dest.write(data)
@@ -1818,12 +1994,24 @@ class ZipFile:
                              "Close the writing handle before closing the zip.")
 
         try:
-            if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
-                with self._lock:
-                    if self._seekable:
-                        self.fp.seek(self.start_dir)
-                    self._write_end_record()
+            try:
+                self._write_pending()
+            finally:
+                # Members which were appended are kept even if writing
+                # the others failed.
+                if self.mode in ('w', 'x', 'a') and self._didModify: # write ending records
+                    with self._lock:
+                        if self._seekable:
+                            self.fp.seek(self.start_dir)
+                        self._write_end_record()
         finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
+                for zinfo, future in self._pending:
+                    if not future.cancelled() and future.exception() is None:
+                        future.result()[2].close()
+                self._pending.clear()
             fp = self.fp
             self.fp = None
             self._fpclose(fp)
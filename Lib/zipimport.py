@@ -622,7 +622,7 @@ def _unmarshal_code(self, pathname, fullpath, fullname, data):
                     f'bytecode is stale for {fullname!r}')
                 return None
 
-    code = marshal.loads(data[16:])
+    code = marshal.loads(data[16:], lazy=sys.flags.lazy_code)
     if not isinstance(code, _code_type):
         raise TypeError(f'compiled module {pathname!r} is not a code object')
     return code
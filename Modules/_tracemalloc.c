@@ -130,6 +130,20 @@ static _Py_hashtable_t *tracemalloc_traces = NULL;
    Protected by TABLES_LOCK(). */
 static _Py_hashtable_t *tracemalloc_domains = NULL;
 
+/* Average number of bytes between two sampled memory allocations,
+   or 0 to trace all memory allocations. Only modified while tracemalloc
+   is not tracing. */
+static size_t tracemalloc_sampling_interval = 0;
+
+/* Number of bytes to allocate before the next sampled memory allocation.
+   Protected by the GIL: tracemalloc_add_trace() is always called with
+   the GIL held. */
+static size_t tracemalloc_sample_countdown = 0;
+
+/* State of the xorshift64* generator used to draw the countdowns.
+   Protected by the GIL. */
+static uint64_t tracemalloc_sample_state = 0;
+
 
 #ifdef TRACE_DEBUG
 static void
@@ -463,6 +477,63 @@ traceback_new(void)
 }
 
 
+/* In sampling mode, allocations are sampled by a Poisson process over the
+   allocated bytes: a memory block of size bytes is traced with the
+   probability 1 - exp(-size / interval). The countdown to the next sample is
+   drawn from an exponential distribution of mean interval. */
+static void
+tracemalloc_reset_countdown(void)
+{
+    uint64_t x = tracemalloc_sample_state;
+    x ^= x >> 12;
+    x ^= x << 25;
+    x ^= x >> 27;
+    tracemalloc_sample_state = x;
+    x *= UINT64_C(0x2545F4914F6CDD1D);
+
+    /* uniform in (0.0; 1.0] */
+    double u = (double)((x >> 11) + 1) * (1.0 / 9007199254740992.0);
+    double countdown = -log(u) * (double)tracemalloc_sampling_interval;
+    if (countdown < 1.0) {
+        countdown = 1.0;
+    }
+    else if (countdown > (double)(SIZE_MAX / 2)) {
+        countdown = (double)(SIZE_MAX / 2);
+    }
+    tracemalloc_sample_countdown = (size_t)countdown;
+}
+
+
+static int
+tracemalloc_sample(size_t size)
+{
+    if (size < tracemalloc_sample_countdown) {
+        tracemalloc_sample_countdown -= size;
+        return 0;
+    }
+    tracemalloc_reset_countdown();
+    return 1;
+}
+
+
+/* Estimated size of the memory allocated by the allocations which are
+   represented by a trace of size bytes: the size divided by the probability
+   to sample the allocation. */
+static size_t
+tracemalloc_scaled_size(size_t size)
+{
+    if (tracemalloc_sampling_interval == 0 || size == 0) {
+        return size;
+    }
+    double p = -expm1(-(double)size / (double)tracemalloc_sampling_interval);
+    double scaled = (double)size / p;
+    if (scaled >= (double)SIZE_MAX) {
+        return SIZE_MAX;
+    }
+    return (size_t)scaled;
+}
+
+
 static _Py_hashtable_t*
 tracemalloc_create_traces_table(void)
 {
@@ -508,8 +579,9 @@ tracemalloc_remove_trace(unsigned int domain, uintptr_t ptr)
     if (!trace) {
         return;
     }
-    assert(tracemalloc_traced_memory >= trace->size);
-    tracemalloc_traced_memory -= trace->size;
+    size_t size = tracemalloc_scaled_size(trace->size);
+    assert(tracemalloc_traced_memory >= size);
+    tracemalloc_traced_memory -= size;
     raw_free(trace);
 }
 
@@ -523,6 +595,10 @@ tracemalloc_add_trace(unsigned int domain, uintptr_t ptr,
 {
     assert(_Py_tracemalloc_config.tracing);
 
+    if (tracemalloc_sampling_interval != 0 && !tracemalloc_sample(size)) {
+        return 0;
+    }
+
     traceback_t *traceback = traceback_new();
     if (traceback == NULL) {
         return -1;
@@ -544,8 +620,9 @@ tracemalloc_add_trace(unsigned int domain, uintptr_t ptr,
     trace_t *trace = _Py_hashtable_get(traces, TO_PTR(ptr));
     if (trace != NULL) {
         /* the memory block is already tracked */
-        assert(tracemalloc_traced_memory >= trace->size);
-        tracemalloc_traced_memory -= trace->size;
+        size_t old_size = tracemalloc_scaled_size(trace->size);
+        assert(tracemalloc_traced_memory >= old_size);
+        tracemalloc_traced_memory -= old_size;
 
         trace->size = size;
         trace->traceback = traceback;
@@ -565,6 +642,7 @@ tracemalloc_add_trace(unsigned int domain, uintptr_t ptr,
         }
     }
 
+    size = tracemalloc_scaled_size(size);
     assert(tracemalloc_traced_memory <= SIZE_MAX - size);
     tracemalloc_traced_memory += size;
     if (tracemalloc_traced_memory > tracemalloc_peak_traced_memory) {
@@ -620,8 +698,9 @@ tracemalloc_realloc(void *ctx, void *ptr, size_t new_size)
         TABLES_LOCK();
 
         /* tracemalloc_add_trace() updates the trace if there is already
-           a trace at address ptr2 */
-        if (ptr2 != ptr) {
+           a trace at address ptr2. In sampling mode, the resized block is
+           sampled again as a new allocation. */
+        if (ptr2 != ptr || tracemalloc_sampling_interval != 0) {
             REMOVE_TRACE(ptr);
         }
 
@@ -692,7 +771,21 @@ tracemalloc_alloc_gil(int use_calloc, void *ctx, size_t nelem, size_t elsize)
        allocation twice. */
     set_reentrant(1);
 
-    ptr = tracemalloc_alloc(use_calloc, ctx, nelem, elsize);
+    if (tracemalloc_sampling_interval != 0
+        && nelem * elsize < tracemalloc_sample_countdown)
+    {
+        /* Fast path: the memory block is not sampled, it doesn't need
+           a trace */
+        PyMemAllocatorEx *alloc = (PyMemAllocatorEx *)ctx;
+        tracemalloc_sample_countdown -= nelem * elsize;
+        if (use_calloc)
+            ptr = alloc->calloc(alloc->ctx, nelem, elsize);
+        else
+            ptr = alloc->malloc(alloc->ctx, nelem * elsize);
+    }
+    else {
+        ptr = tracemalloc_alloc(use_calloc, ctx, nelem, elsize);
+    }
 
     set_reentrant(0);
     return ptr;
@@ -952,7 +1045,7 @@ tracemalloc_deinit(void)
 
 
 static int
-tracemalloc_start(int max_nframe)
+tracemalloc_start(int max_nframe, Py_ssize_t sampling_interval)
 {
     PyMemAllocatorEx alloc;
     size_t size;
@@ -963,6 +1056,11 @@ tracemalloc_start(int max_nframe)
                      MAX_NFRAME);
         return -1;
     }
+    if (sampling_interval < 0) {
+        PyErr_SetString(PyExc_ValueError,
+                        "the sampling interval must be positive or zero");
+        return -1;
+    }
 
     if (tracemalloc_init() < 0) {
         return -1;
@@ -975,6 +1073,20 @@ tracemalloc_start(int max_nframe)
 
     _Py_tracemalloc_config.max_nframe = max_nframe;
 
+    tracemalloc_sampling_interval = (size_t)sampling_interval;
+    if (sampling_interval != 0) {
+        if (_PyOS_URandomNonblock(&tracemalloc_sample_state,
+                                  sizeof(tracemalloc_sample_state)) < 0) {
+            PyErr_Clear();
+            tracemalloc_sample_state = (uint64_t)_PyTime_GetPerfCounter();
+        }
+        if (tracemalloc_sample_state == 0) {
+            /* xorshift requires a non-zero state */
+            tracemalloc_sample_state = UINT64_C(0x9E3779B97F4A7C15);
+        }
+        tracemalloc_reset_countdown();
+    }
+
     /* allocate a buffer to store a new traceback */
     size = TRACEBACK_SIZE(max_nframe);
     assert(tracemalloc_traceback == NULL);
@@ -1522,18 +1634,24 @@ _tracemalloc.start
 
     nframe: int = 1
     /
+    *
+    sampling_interval: Py_ssize_t = 0
 
 Start tracing Python memory allocations.
 
 Also set the maximum number of frames stored in the traceback of a
 trace to nframe.
+
+If sampling_interval is non-zero, only trace a sample of the memory
+allocations: on average, one allocation every sampling_interval bytes.
 [clinic start generated code]*/
 
 static PyObject *
-_tracemalloc_start_impl(PyObject *module, int nframe)
-/*[clinic end generated code: output=caae05c23c159d3c input=40d849b5b29d1933]*/
+_tracemalloc_start_impl(PyObject *module, int nframe,
+                        Py_ssize_t sampling_interval)
+/*[clinic end generated code: output=f521f11b9fa9943e input=79b80ecb786bc235]*/
 {
-    if (tracemalloc_start(nframe) < 0) {
+    if (tracemalloc_start(nframe, sampling_interval) < 0) {
         return NULL;
     }
     Py_RETURN_NONE;
@@ -1586,6 +1704,22 @@ tracemalloc_get_tracemalloc_memory_cb(_Py_hashtable_t *domains,
 }
 
 
+/*[clinic input]
+_tracemalloc.get_sampling_interval
+
+Get the average number of bytes between two traced memory allocations.
+
+Return 0 if all memory allocations are traced.
+[clinic start generated code]*/
+
+static PyObject *
+_tracemalloc_get_sampling_interval_impl(PyObject *module)
+/*[clinic end generated code: output=5011d3b4ab086319 input=dcb3bcf4ed2b3498]*/
+{
+    return PyLong_FromSize_t(tracemalloc_sampling_interval);
+}
+
+
 /*[clinic input]
 _tracemalloc.get_tracemalloc_memory
 
@@ -1672,6 +1806,7 @@ static PyMethodDef module_methods[] = {
     _TRACEMALLOC_START_METHODDEF
     _TRACEMALLOC_STOP_METHODDEF
     _TRACEMALLOC_GET_TRACEBACK_LIMIT_METHODDEF
+    _TRACEMALLOC_GET_SAMPLING_INTERVAL_METHODDEF
     _TRACEMALLOC_GET_TRACEMALLOC_MEMORY_METHODDEF
     _TRACEMALLOC_GET_TRACED_MEMORY_METHODDEF
     _TRACEMALLOC_RESET_PEAK_METHODDEF
@@ -1715,7 +1850,7 @@ _PyTraceMalloc_Init(int nframe)
     if (nframe == 0) {
         return 0;
     }
-    return tracemalloc_start(nframe);
+    return tracemalloc_start(nframe, 0);
 }
 
 
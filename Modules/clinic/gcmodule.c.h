@@ -220,6 +220,76 @@ gc_get_count(PyObject *module, PyObject *Py_UNUSED(ignored))
     return gc_get_count_impl(module);
 }
 
+PyDoc_STRVAR(gc_set_pause_budget__doc__,
+"set_pause_budget($module, budget, /)\n"
+"--\n"
+"\n"
+"Set the pause budget of the collections of the oldest generation.\n"
+"\n"
+"  budget\n"
+"    The target duration in seconds of each step, or 0.\n"
+"\n"
+"When the budget is not 0, the automatic collections of the oldest\n"
+"generation are done incrementally, in steps which pause the program for\n"
+"about the budget each.  Setting it to 0 (the default) disables incremental\n"
+"collection.");
+
+#define GC_SET_PAUSE_BUDGET_METHODDEF    \
+    {"set_pause_budget", (PyCFunction)gc_set_pause_budget, METH_O, gc_set_pause_budget__doc__},
+
+static PyObject *
+gc_set_pause_budget_impl(PyObject *module, double budget);
+
+static PyObject *
+gc_set_pause_budget(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    double budget;
+
+    if (PyFloat_CheckExact(arg)) {
+        budget = PyFloat_AS_DOUBLE(arg);
+    }
+    else
+    {
+        budget = PyFloat_AsDouble(arg);
+        if (budget == -1.0 && PyErr_Occurred()) {
+            goto exit;
+        }
+    }
+    return_value = gc_set_pause_budget_impl(module, budget);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(gc_get_pause_budget__doc__,
+"get_pause_budget($module, /)\n"
+"--\n"
+"\n"
+"Return the pause budget of the collections of the oldest generation.");
+
+#define GC_GET_PAUSE_BUDGET_METHODDEF    \
+    {"get_pause_budget", (PyCFunction)gc_get_pause_budget, METH_NOARGS, gc_get_pause_budget__doc__},
+
+static double
+gc_get_pause_budget_impl(PyObject *module);
+
+static PyObject *
+gc_get_pause_budget(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+    double _return_value;
+
+    _return_value = gc_get_pause_budget_impl(module);
+    if ((_return_value == -1.0) && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = PyFloat_FromDouble(_return_value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(gc_get_objects__doc__,
 "get_objects($module, /, generation=None)\n"
 "--\n"
@@ -304,25 +374,52 @@ PyDoc_STRVAR(gc_is_finalized__doc__,
     {"is_finalized", (PyCFunction)gc_is_finalized, METH_O, gc_is_finalized__doc__},
 
 PyDoc_STRVAR(gc_freeze__doc__,
-"freeze($module, /)\n"
+"freeze($module, /, *, immortalize=False)\n"
 "--\n"
 "\n"
 "Freeze all current tracked objects and ignore them for future collections.\n"
 "\n"
 "This can be used before a POSIX fork() call to make the gc copy-on-write friendly.\n"
 "Note: collection before a POSIX fork() call may free pages for future allocation\n"
-"which can cause copy-on-write.");
+"which can cause copy-on-write.\n"
+"\n"
+"If immortalize is true, the frozen objects and the objects they refer to are\n"
+"also made immortal: their reference counts are no longer updated, so that\n"
+"child processes don\'t write to the memory holding them, and they are never\n"
+"deallocated.");
 
 #define GC_FREEZE_METHODDEF    \
-    {"freeze", (PyCFunction)gc_freeze, METH_NOARGS, gc_freeze__doc__},
+    {"freeze", (PyCFunction)(void(*)(void))gc_freeze, METH_FASTCALL|METH_KEYWORDS, gc_freeze__doc__},
 
 static PyObject *
-gc_freeze_impl(PyObject *module);
+gc_freeze_impl(PyObject *module, int immortalize);
 
 static PyObject *
-gc_freeze(PyObject *module, PyObject *Py_UNUSED(ignored))
+gc_freeze(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    return gc_freeze_impl(module);
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"immortalize", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "freeze", 0};
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int immortalize = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 0, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    immortalize = PyObject_IsTrue(args[0]);
+    if (immortalize < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = gc_freeze_impl(module, immortalize);
+
+exit:
+    return return_value;
 }
 
 PyDoc_STRVAR(gc_unfreeze__doc__,
@@ -331,7 +428,8 @@ PyDoc_STRVAR(gc_unfreeze__doc__,
 "\n"
 "Unfreeze all objects in the permanent generation.\n"
 "\n"
-"Put all objects in the permanent generation back into oldest generation.");
+"Put all objects in the permanent generation back into oldest generation.\n"
+"Immortal objects stay in the permanent generation.");
 
 #define GC_UNFREEZE_METHODDEF    \
     {"unfreeze", (PyCFunction)gc_unfreeze, METH_NOARGS, gc_unfreeze__doc__},
@@ -372,4 +470,4 @@ gc_get_freeze_count(PyObject *module, PyObject *Py_UNUSED(ignored))
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=61e15f3a549f3ab5 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=1e95dd9cf5083ce9 input=a9049054013a1b77]*/
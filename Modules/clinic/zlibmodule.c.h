@@ -359,7 +359,7 @@ exit:
 }
 
 PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
-"decompress($self, data, /, max_length=0)\n"
+"decompress($self, data, /, max_length=0, *, block=False)\n"
 "--\n"
 "\n"
 "Return a bytes object containing the decompressed version of the data.\n"
@@ -370,6 +370,10 @@ PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
 "    The maximum allowable length of the decompressed data.\n"
 "    Unconsumed input data will be stored in\n"
 "    the unconsumed_tail attribute.\n"
+"  block\n"
+"    Stop at the end of the first deflate block reached.\n"
+"    Unconsumed input data will be stored in\n"
+"    the unconsumed_tail attribute.\n"
 "\n"
 "After calling this function, some of the input data may still be stored in\n"
 "internal buffers for later processing.\n"
@@ -380,18 +384,19 @@ PyDoc_STRVAR(zlib_Decompress_decompress__doc__,
 
 static PyObject *
 zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
-                                Py_ssize_t max_length);
+                                Py_ssize_t max_length, int block);
 
 static PyObject *
 zlib_Decompress_decompress(compobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
-    static const char * const _keywords[] = {"", "max_length", NULL};
+    static const char * const _keywords[] = {"", "max_length", "block", NULL};
     static _PyArg_Parser _parser = {NULL, _keywords, "decompress", 0};
-    PyObject *argsbuf[2];
+    PyObject *argsbuf[3];
     Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     Py_buffer data = {NULL, NULL};
     Py_ssize_t max_length = 0;
+    int block = 0;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 2, 0, argsbuf);
     if (!args) {
@@ -407,20 +412,33 @@ zlib_Decompress_decompress(compobject *self, PyObject *const *args, Py_ssize_t n
     if (!noptargs) {
         goto skip_optional_pos;
     }
-    {
-        Py_ssize_t ival = -1;
-        PyObject *iobj = _PyNumber_Index(args[1]);
-        if (iobj != NULL) {
-            ival = PyLong_AsSsize_t(iobj);
-            Py_DECREF(iobj);
+    if (args[1]) {
+        {
+            Py_ssize_t ival = -1;
+            PyObject *iobj = _PyNumber_Index(args[1]);
+            if (iobj != NULL) {
+                ival = PyLong_AsSsize_t(iobj);
+                Py_DECREF(iobj);
+            }
+            if (ival == -1 && PyErr_Occurred()) {
+                goto exit;
+            }
+            max_length = ival;
         }
-        if (ival == -1 && PyErr_Occurred()) {
-            goto exit;
+        if (!--noptargs) {
+            goto skip_optional_pos;
         }
-        max_length = ival;
     }
 skip_optional_pos:
-    return_value = zlib_Decompress_decompress_impl(self, &data, max_length);
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    block = PyObject_IsTrue(args[2]);
+    if (block < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = zlib_Decompress_decompress_impl(self, &data, max_length, block);
 
 exit:
     /* Cleanup for data */
@@ -551,6 +569,54 @@ zlib_Decompress_copy(compobject *self, PyObject *Py_UNUSED(ignored))
 
 #if defined(HAVE_ZLIB_COPY)
 
+PyDoc_STRVAR(zlib_Decompress_prime__doc__,
+"prime($self, bits, value, /)\n"
+"--\n"
+"\n"
+"Insert bits at the start of the pending input.\n"
+"\n"
+"  bits\n"
+"    The number of bits to insert, from 0 to 16.\n"
+"  value\n"
+"    The bits to insert, as the low-order bits of an integer.\n"
+"\n"
+"Together with a preset dictionary, this allows to resume the decompression\n"
+"of raw deflate data at a block boundary which is not on a byte boundary.");
+
+#define ZLIB_DECOMPRESS_PRIME_METHODDEF    \
+    {"prime", (PyCFunction)(void(*)(void))zlib_Decompress_prime, METH_FASTCALL, zlib_Decompress_prime__doc__},
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, int bits, int value);
+
+static PyObject *
+zlib_Decompress_prime(compobject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    int bits;
+    int value;
+
+    if (!_PyArg_CheckPositional("prime", nargs, 2, 2)) {
+        goto exit;
+    }
+    bits = _PyLong_AsInt(args[0]);
+    if (bits == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    value = _PyLong_AsInt(args[1]);
+    if (value == -1 && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = zlib_Decompress_prime_impl(self, bits, value);
+
+exit:
+    return return_value;
+}
+
+#endif /* defined(HAVE_ZLIB_COPY) */
+
+#if defined(HAVE_ZLIB_COPY)
+
 PyDoc_STRVAR(zlib_Decompress___copy____doc__,
 "__copy__($self, /)\n"
 "--\n"
@@ -750,6 +816,10 @@ exit:
     #define ZLIB_DECOMPRESS_COPY_METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS_COPY_METHODDEF) */
 
+#ifndef ZLIB_DECOMPRESS_PRIME_METHODDEF
+    #define ZLIB_DECOMPRESS_PRIME_METHODDEF
+#endif /* !defined(ZLIB_DECOMPRESS_PRIME_METHODDEF) */
+
 #ifndef ZLIB_DECOMPRESS___COPY___METHODDEF
     #define ZLIB_DECOMPRESS___COPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___COPY___METHODDEF) */
@@ -757,4 +827,4 @@ exit:
 #ifndef ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     #define ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
 #endif /* !defined(ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF) */
-/*[clinic end generated code: output=be34f273564e39a8 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=68468d060aae0078 input=a9049054013a1b77]*/
@@ -69,6 +69,14 @@ module gc
 // most gc_list_* functions for it.
 #define NEXT_MASK_UNREACHABLE  (1)
 
+// Second lowest bit of _gc_next is used for VISITED flag.
+//
+// It is set for the objects of the oldest generation which the incremental
+// collection in progress is done with, and for all objects in the permanent
+// generation.  update_refs() clears it; no other object has this flag.
+// Unlike NEXT_MASK_UNREACHABLE, the gc_list_* functions keep this flag.
+#define NEXT_MASK_VISITED      _PyGC_NEXT_MASK_VISITED
+
 /* Get an object's GC head */
 #define AS_GC(o) ((PyGC_Head *)(o)-1)
 
@@ -87,6 +95,18 @@ gc_clear_collecting(PyGC_Head *g)
     g->_gc_prev &= ~PREV_MASK_COLLECTING;
 }
 
+static inline int
+gc_is_visited(PyGC_Head *g)
+{
+    return (g->_gc_next & NEXT_MASK_VISITED) != 0;
+}
+
+static inline void
+gc_set_visited(PyGC_Head *g)
+{
+    g->_gc_next |= NEXT_MASK_VISITED;
+}
+
 static inline Py_ssize_t
 gc_get_refs(PyGC_Head *g)
 {
@@ -158,6 +178,12 @@ _PyGC_InitState(GCState *gcstate)
            (uintptr_t)&gcstate->permanent_generation.head}, 0, 0
     };
     gcstate->permanent_generation = permanent_generation;
+
+    PyGC_Head *marking = &gcstate->incremental.marking;
+    marking->_gc_next = marking->_gc_prev = (uintptr_t)marking;
+    PyGC_Head *visited = &gcstate->incremental.visited;
+    visited->_gc_next = visited->_gc_prev = (uintptr_t)visited;
+    gcstate->incremental.object_cost = 1e-7;
 }
 
 
@@ -211,7 +237,8 @@ _gc_next takes these values:
 != 0
     Pointer to the next object in the GC list.
     Additionally, lowest bit is used temporary for
-    NEXT_MASK_UNREACHABLE flag described below.
+    NEXT_MASK_UNREACHABLE flag described below, and the second lowest
+    bit for the NEXT_MASK_VISITED flag of incremental collections.
 
 NEXT_MASK_UNREACHABLE
     move_unreachable() then moves objects not reachable (whether directly or
@@ -325,6 +352,21 @@ gc_list_size(PyGC_Head *list)
     return n;
 }
 
+/* Walk the list and set or clear the NEXT_MASK_VISITED flag of all objects */
+static void
+gc_list_set_visited(PyGC_Head *list, int visited)
+{
+    PyGC_Head *gc;
+    for (gc = GC_NEXT(list); gc != list; gc = GC_NEXT(gc)) {
+        if (visited) {
+            gc_set_visited(gc);
+        }
+        else {
+            gc->_gc_next &= ~NEXT_MASK_VISITED;
+        }
+    }
+}
+
 /* Walk the list and mark all objects as non-collecting */
 static inline void
 gc_list_clear_collecting(PyGC_Head *collectable)
@@ -353,6 +395,17 @@ append_objects(PyObject *py_list, PyGC_Head *gc_list)
     return 0;
 }
 
+// Append the objects of the oldest generation which the incremental
+// collection in progress moved out of it.
+static int
+append_incremental_objects(PyObject *py_list, GCState *gcstate)
+{
+    if (append_objects(py_list, &gcstate->incremental.marking)) {
+        return -1;
+    }
+    return append_objects(py_list, &gcstate->incremental.visited);
+}
+
 // Constants for validate_list's flags argument.
 enum flagstates {collecting_clear_unreachable_clear,
                  collecting_clear_unreachable_set,
@@ -395,7 +448,8 @@ validate_list(PyGC_Head *head, enum flagstates flags)
     PyGC_Head *gc = GC_NEXT(head);
     while (gc != head) {
         PyGC_Head *trueprev = GC_PREV(gc);
-        PyGC_Head *truenext = (PyGC_Head *)(gc->_gc_next  & ~NEXT_MASK_UNREACHABLE);
+        PyGC_Head *truenext = (PyGC_Head *)(gc->_gc_next
+            & ~(NEXT_MASK_UNREACHABLE | NEXT_MASK_VISITED));
         assert(truenext != NULL);
         assert(trueprev == prev);
         assert((gc->_gc_prev & PREV_MASK_COLLECTING) == prev_value);
@@ -413,13 +467,17 @@ validate_list(PyGC_Head *head, enum flagstates flags)
 
 
 /* Set all gc_refs = ob_refcnt.  After this, gc_refs is > 0 and
- * PREV_MASK_COLLECTING bit is set for all objects in containers.
+ * PREV_MASK_COLLECTING bit is set for all objects in containers, and
+ * NEXT_MASK_VISITED is clear.  Return the number of objects in containers.
  */
-static void
+static Py_ssize_t
 update_refs(PyGC_Head *containers)
 {
+    Py_ssize_t n = 0;
     PyGC_Head *gc = GC_NEXT(containers);
     for (; gc != containers; gc = GC_NEXT(gc)) {
+        n++;
+        gc->_gc_next &= ~NEXT_MASK_VISITED;
         gc_reset_refs(gc, Py_REFCNT(FROM_GC(gc)));
         /* Python's cyclic gc should never see an incoming refcount
          * of 0:  if something decref'ed to 0, it should have been
@@ -441,6 +499,7 @@ update_refs(PyGC_Head *containers)
          */
         _PyObject_ASSERT(FROM_GC(gc), gc_get_refs(gc) != 0);
     }
+    return n;
 }
 
 /* A traversal callback for subtract_refs. */
@@ -1051,9 +1110,12 @@ show_stats_each_generations(GCState *gcstate)
     size_t pos = 0;
 
     for (int i = 0; i < NUM_GENERATIONS && pos < sizeof(buf); i++) {
-        pos += PyOS_snprintf(buf+pos, sizeof(buf)-pos,
-                             " %zd",
-                             gc_list_size(GEN_HEAD(gcstate, i)));
+        Py_ssize_t size = gc_list_size(GEN_HEAD(gcstate, i));
+        if (i == NUM_GENERATIONS - 1) {
+            size += gc_list_size(&gcstate->incremental.marking);
+            size += gc_list_size(&gcstate->incremental.visited);
+        }
+        pos += PyOS_snprintf(buf+pos, sizeof(buf)-pos, " %zd", size);
     }
 
     PySys_FormatStderr(
@@ -1084,12 +1146,14 @@ Contracts:
     * The "unreachable" list must be uninitialized (this function calls
       gc_list_init over 'unreachable').
 
+    * The number of objects in "base" is returned.
+
 IMPORTANT: This function leaves 'unreachable' with the NEXT_MASK_UNREACHABLE
 flag set but it does not clear it to skip unnecessary iteration. Before the
 flag is cleared (for example, by using 'clear_unreachable_mask' function or
 by a call to 'move_legacy_finalizers'), the 'unreachable' list is not a normal
 list and we can not use most gc_list_* functions for it. */
-static inline void
+static inline Py_ssize_t
 deduce_unreachable(PyGC_Head *base, PyGC_Head *unreachable) {
     validate_list(base, collecting_clear_unreachable_clear);
     /* Using ob_refcnt and gc_refs, calculate which objects in the
@@ -1097,7 +1161,7 @@ deduce_unreachable(PyGC_Head *base, PyGC_Head *unreachable) {
      * refcount greater than 0 when all the references within the
      * set are taken into account).
      */
-    update_refs(base);  // gc_prev is used for gc_refs
+    Py_ssize_t n = update_refs(base);  // gc_prev is used for gc_refs
     subtract_refs(base);
 
     /* Leave everything reachable from outside base in base, and move
@@ -1139,6 +1203,7 @@ deduce_unreachable(PyGC_Head *base, PyGC_Head *unreachable) {
     move_unreachable(base, unreachable);  // gc_prev is pointer again
     validate_list(base, collecting_clear_unreachable_clear);
     validate_list(unreachable, collecting_set_unreachable_set);
+    return n;
 }
 
 /* Handle objects that may have resurrected after a call to 'finalize_garbage', moving
@@ -1173,62 +1238,33 @@ handle_resurrected_objects(PyGC_Head *unreachable, PyGC_Head* still_unreachable,
     gc_list_merge(resurrected, old_generation);
 }
 
-/* This is the main function.  Read this to understand how the
- * collection process works. */
-static Py_ssize_t
-collect(PyThreadState *tstate, int generation,
-        Py_ssize_t *n_collected, Py_ssize_t *n_uncollectable, int nofail)
+/* Find the unreachable objects in young and delete them, moving the
+ * survivors to old (which is young itself when the whole oldest generation is
+ * collected).  The number of objects examined, collected and found
+ * uncollectable is added to stats.
+ */
+static void
+collect_list(PyThreadState *tstate, int generation,
+             PyGC_Head *young, PyGC_Head *old,
+             struct gc_generation_stats *stats)
 {
-    int i;
     Py_ssize_t m = 0; /* # objects collected */
     Py_ssize_t n = 0; /* # unreachable objects that couldn't be collected */
-    PyGC_Head *young; /* the generation we are examining */
-    PyGC_Head *old; /* next older generation */
     PyGC_Head unreachable; /* non-problematic unreachable trash */
     PyGC_Head finalizers;  /* objects with, & reachable from, __del__ */
     PyGC_Head *gc;
-    _PyTime_t t1 = 0;   /* initialize to prevent a compiler warning */
     GCState *gcstate = &tstate->interp->gc;
 
-#ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
-    if (tstate->interp->config._isolated_interpreter) {
-        // bpo-40533: The garbage collector must not be run on parallel on
-        // Python objects shared by multiple interpreters.
-        return 0;
-    }
-#endif
-
-    if (gcstate->debug & DEBUG_STATS) {
-        PySys_WriteStderr("gc: collecting generation %d...\n", generation);
-        show_stats_each_generations(gcstate);
-        t1 = _PyTime_GetMonotonicClock();
-    }
-
-    if (PyDTrace_GC_START_ENABLED())
-        PyDTrace_GC_START(generation);
-
-    /* update collection and allocation counters */
-    if (generation+1 < NUM_GENERATIONS)
-        gcstate->generations[generation+1].count += 1;
-    for (i = 0; i <= generation; i++)
-        gcstate->generations[i].count = 0;
-
-    /* merge younger generations with one we are currently collecting */
-    for (i = 0; i < generation; i++) {
-        gc_list_merge(GEN_HEAD(gcstate, i), GEN_HEAD(gcstate, generation));
-    }
-
-    /* handy references */
-    young = GEN_HEAD(gcstate, generation);
-    if (generation < NUM_GENERATIONS-1)
-        old = GEN_HEAD(gcstate, generation+1);
-    else
-        old = young;
     validate_list(old, collecting_clear_unreachable_clear);
 
-    deduce_unreachable(young, &unreachable);
+    stats->examined += deduce_unreachable(young, &unreachable);
 
     untrack_tuples(young);
+    if (generation == NUM_GENERATIONS - 1) {
+        /* We only un-track dicts in collections of the oldest generation,
+           to avoid quadratic dict build-up. See issue #14775. */
+        untrack_dicts(young);
+    }
     /* Move reachable objects to next generation. */
     if (young != old) {
         if (generation == NUM_GENERATIONS - 2) {
@@ -1237,9 +1273,6 @@ collect(PyThreadState *tstate, int generation,
         gc_list_merge(young, old);
     }
     else {
-        /* We only un-track dicts in full collections, to avoid quadratic
-           dict build-up. See issue #14775. */
-        untrack_dicts(young);
         gcstate->long_lived_pending = 0;
         gcstate->long_lived_total = gc_list_size(young);
     }
@@ -1296,12 +1329,6 @@ collect(PyThreadState *tstate, int generation,
         if (gcstate->debug & DEBUG_UNCOLLECTABLE)
             debug_cycle("uncollectable", FROM_GC(gc));
     }
-    if (gcstate->debug & DEBUG_STATS) {
-        double d = _PyTime_AsSecondsDouble(_PyTime_GetMonotonicClock() - t1);
-        PySys_WriteStderr(
-            "gc: done, %zd unreachable, %zd uncollectable, %.4fs elapsed\n",
-            n+m, n, d);
-    }
 
     /* Append instances in the uncollectable set to a Python
      * reachable list of garbage.  The programmer has to deal with
@@ -1310,11 +1337,16 @@ collect(PyThreadState *tstate, int generation,
     handle_legacy_finalizers(tstate, gcstate, &finalizers, old);
     validate_list(old, collecting_clear_unreachable_clear);
 
-    /* Clear free list only during the collection of the highest
-     * generation */
-    if (generation == NUM_GENERATIONS-1) {
-        clear_freelists(tstate);
-    }
+    stats->collected += m;
+    stats->uncollectable += n;
+}
+
+/* Record the statistics of a collection which started at t0. */
+static void
+update_stats(PyThreadState *tstate, int generation, _PyTime_t t0,
+             struct gc_generation_stats *stats, int nofail)
+{
+    GCState *gcstate = &tstate->interp->gc;
 
     if (_PyErr_Occurred(tstate)) {
         if (nofail) {
@@ -1325,25 +1357,361 @@ collect(PyThreadState *tstate, int generation,
         }
     }
 
-    /* Update stats */
-    if (n_collected) {
-        *n_collected = m;
+    stats->collections = 1;
+    stats->duration = _PyTime_AsSecondsDouble(_PyTime_GetPerfCounter() - t0);
+
+    struct gc_generation_stats *total = &gcstate->generation_stats[generation];
+    total->collections++;
+    total->collected += stats->collected;
+    total->uncollectable += stats->uncollectable;
+    total->examined += stats->examined;
+    total->duration += stats->duration;
+
+    if (gcstate->debug & DEBUG_STATS) {
+        PySys_WriteStderr(
+            "gc: done, %zd unreachable, %zd uncollectable, %.4fs elapsed\n",
+            stats->collected + stats->uncollectable, stats->uncollectable,
+            stats->duration);
     }
-    if (n_uncollectable) {
-        *n_uncollectable = n;
+
+    if (PyDTrace_GC_DONE_ENABLED()) {
+        PyDTrace_GC_DONE(stats->collected + stats->uncollectable);
     }
+}
 
-    struct gc_generation_stats *stats = &gcstate->generation_stats[generation];
-    stats->collections++;
-    stats->collected += m;
-    stats->uncollectable += n;
+/* Incremental collection of the oldest generation
+ * ===============================================
+ *
+ * Collecting the oldest generation in one go pauses the program for a time
+ * proportional to the number of long-lived objects.  When a pause budget is
+ * set with gc.set_pause_budget(), the automatic collections of the oldest
+ * generation are instead spread over many steps, each of which collects the
+ * young generations too and takes about the budget.
+ *
+ * Collecting any subset of the objects is safe: the objects referenced from
+ * outside the subset are reachable.  But a garbage cycle is only found if
+ * all of its objects are collected together, so each increment also takes
+ * in the objects of the oldest generation reachable from it.  To keep the
+ * increments small, the objects reachable from the roots (the modules, the
+ * builtins and the frames of the threads) are first marked as alive.  A
+ * collection goes through the following phases:
+ *
+ * INCREMENTAL_MARK
+ *     The objects of the oldest generation reachable from the roots are
+ *     marked, moving them to the 'visited' list.  'marking' holds the
+ *     objects whose referents remain to be marked.
+ *
+ * INCREMENTAL_SCAN
+ *     Each step collects the young generations together with objects from
+ *     the start of the oldest generation, and the objects of the oldest
+ *     generation reachable from them.  The survivors go to 'visited'.
+ *
+ * INCREMENTAL_RESET
+ *     Once the oldest generation is empty, the visited objects are moved
+ *     back to it.
+ *
+ * The objects in 'marking' and 'visited' have the NEXT_MASK_VISITED flag,
+ * which keeps them from being added to another increment.  Since the
+ * program runs between the steps, an object found alive may become garbage
+ * before the collection completes; it is collected by the next one.
+ */
 
-    if (PyDTrace_GC_DONE_ENABLED()) {
-        PyDTrace_GC_DONE(n + m);
+enum incremental_phases {INCREMENTAL_IDLE,
+                         INCREMENTAL_MARK,
+                         INCREMENTAL_SCAN,
+                         INCREMENTAL_RESET};
+
+/* Check the clock every so many objects while marking or resetting */
+#define INCREMENTAL_CLOCK_INTERVAL 1024
+
+/* Stop the incremental collection in progress, moving the objects it is done
+ * with back to the oldest generation.  Their NEXT_MASK_VISITED flag is
+ * cleared if clear_flags is true; otherwise the caller must collect them.
+ */
+static void
+abandon_incremental(GCState *gcstate, int clear_flags)
+{
+    struct gc_incremental_state *inc = &gcstate->incremental;
+    if (clear_flags) {
+        gc_list_set_visited(&inc->marking, 0);
+        gc_list_set_visited(&inc->visited, 0);
+    }
+    gc_list_merge(&inc->marking, GEN_HEAD(gcstate, NUM_GENERATIONS - 1));
+    gc_list_merge(&inc->visited, GEN_HEAD(gcstate, NUM_GENERATIONS - 1));
+    inc->phase = INCREMENTAL_IDLE;
+}
+
+/* A traversal callback adding the tracked objects which are not yet visited
+ * to the list, marking them as visited. */
+static int
+visit_mark(PyObject *op, PyGC_Head *list)
+{
+    if (_PyObject_IS_GC(op) && _PyObject_GC_IS_TRACKED(op)) {
+        PyGC_Head *gc = AS_GC(op);
+        if (!gc_is_visited(gc)) {
+            gc_list_move(gc, list);
+            gc_set_visited(gc);
+        }
+    }
+    return 0;
+}
+
+/* Start marking the objects reachable from the roots. */
+static void
+mark_roots(PyThreadState *tstate, PyGC_Head *marking)
+{
+    PyInterpreterState *interp = tstate->interp;
+    PyObject *roots[] = {interp->modules, interp->sysdict, interp->builtins};
+    for (size_t i = 0; i < Py_ARRAY_LENGTH(roots); i++) {
+        if (roots[i] != NULL) {
+            visit_mark(roots[i], marking);
+        }
+    }
+
+    _PyRuntimeState *runtime = interp->runtime;
+    PyThread_acquire_lock(runtime->interpreters.mutex, WAIT_LOCK);
+    for (PyThreadState *p = interp->tstate_head; p != NULL; p = p->next) {
+        if (p->frame != NULL) {
+            visit_mark((PyObject *)p->frame, marking);
+        }
+        if (p->dict != NULL) {
+            visit_mark(p->dict, marking);
+        }
+    }
+    PyThread_release_lock(runtime->interpreters.mutex);
+}
+
+/* Mark the referents of the objects in 'marking' until the deadline.
+ * Return the number of objects examined. */
+static Py_ssize_t
+mark_step(GCState *gcstate, _PyTime_t deadline)
+{
+    PyGC_Head *marking = &gcstate->incremental.marking;
+    Py_ssize_t n = 0;
+    while (!gc_list_is_empty(marking)) {
+        PyGC_Head *gc = GC_NEXT(marking);
+        PyObject *op = FROM_GC(gc);
+        gc_list_move(gc, &gcstate->incremental.visited);
+        (void) Py_TYPE(op)->tp_traverse(op, (visitproc)visit_mark, marking);
+        if (++n % INCREMENTAL_CLOCK_INTERVAL == 0
+            && _PyTime_GetPerfCounter() >= deadline) {
+            break;
+        }
+    }
+    return n;
+}
+
+/* Move the visited objects back to the oldest generation until the
+ * deadline.  Return the number of objects moved. */
+static Py_ssize_t
+reset_step(GCState *gcstate, _PyTime_t deadline)
+{
+    PyGC_Head *visited = &gcstate->incremental.visited;
+    PyGC_Head *oldest = GEN_HEAD(gcstate, NUM_GENERATIONS - 1);
+    Py_ssize_t n = 0;
+    while (!gc_list_is_empty(visited)) {
+        PyGC_Head *gc = GC_NEXT(visited);
+        gc->_gc_next &= ~NEXT_MASK_VISITED;
+        gc_list_move(gc, oldest);
+        if (++n % INCREMENTAL_CLOCK_INTERVAL == 0
+            && _PyTime_GetPerfCounter() >= deadline) {
+            break;
+        }
+    }
+    return n;
+}
+
+/* Collect the young generations together with the first 'size' objects of
+ * the oldest generation and the objects of the oldest generation reachable
+ * from them.  The survivors are moved to the 'visited' list.
+ */
+static void
+collect_increment(PyThreadState *tstate, Py_ssize_t size,
+                  struct gc_generation_stats *stats)
+{
+    GCState *gcstate = &tstate->interp->gc;
+    PyGC_Head *oldest = GEN_HEAD(gcstate, NUM_GENERATIONS - 1);
+    PyGC_Head increment, survivors, *gc;
+    int i;
+
+    gc_list_init(&increment);
+    for (i = 0; i < NUM_GENERATIONS - 1; i++) {
+        gc_list_merge(GEN_HEAD(gcstate, i), &increment);
+        gcstate->generations[i].count = 0;
+    }
+    gc_list_set_visited(&increment, 1);
+    while (size-- > 0 && !gc_list_is_empty(oldest)) {
+        gc = GC_NEXT(oldest);
+        gc_list_move(gc, &increment);
+        gc_set_visited(gc);
+    }
+    /* Note that the increment grows during this. */
+    for (gc = GC_NEXT(&increment); gc != &increment; gc = GC_NEXT(gc)) {
+        PyObject *op = FROM_GC(gc);
+        (void) Py_TYPE(op)->tp_traverse(op, (visitproc)visit_mark,
+                                        &increment);
+    }
+
+    gc_list_init(&survivors);
+    collect_list(tstate, NUM_GENERATIONS - 1, &increment, &survivors, stats);
+    gc_list_set_visited(&survivors, 1);
+    gc_list_merge(&survivors, &gcstate->incremental.visited);
+}
+
+/* Perform a step of the incremental collection of the oldest generation,
+ * starting a new collection if none is in progress. */
+static Py_ssize_t
+collect_incremental(PyThreadState *tstate, struct gc_generation_stats *result)
+{
+    const int generation = NUM_GENERATIONS - 1;
+    GCState *gcstate = &tstate->interp->gc;
+    struct gc_incremental_state *inc = &gcstate->incremental;
+    struct gc_generation_stats stats = {0};
+
+#ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
+    if (tstate->interp->config._isolated_interpreter) {
+        // bpo-40533: The garbage collector must not be run on parallel on
+        // Python objects shared by multiple interpreters.
+        return 0;
+    }
+#endif
+
+    if (gcstate->debug & DEBUG_STATS) {
+        PySys_WriteStderr("gc: collecting generation %d incrementally...\n",
+                          generation);
+        show_stats_each_generations(gcstate);
+    }
+    _PyTime_t t0 = _PyTime_GetPerfCounter();
+    _PyTime_t deadline = t0 + _PyTime_FromNanoseconds(
+        (_PyTime_t)(inc->pause_budget * 1e9));
+
+    if (PyDTrace_GC_START_ENABLED())
+        PyDTrace_GC_START(generation);
+
+    if (inc->phase == INCREMENTAL_IDLE) {
+        gcstate->generations[generation].count = 0;
+        inc->phase = INCREMENTAL_MARK;
+        mark_roots(tstate, &inc->marking);
+    }
+
+    if (inc->phase == INCREMENTAL_SCAN) {
+        double size = inc->pause_budget / inc->object_cost;
+        collect_increment(tstate,
+                          size < 1 ? 1 : size < (double)PY_SSIZE_T_MAX
+                                         ? (Py_ssize_t)size : PY_SSIZE_T_MAX,
+                          &stats);
+        double duration = _PyTime_AsSecondsDouble(
+            _PyTime_GetPerfCounter() - t0);
+        if (stats.examined > 0 && duration > 0) {
+            /* exponential moving average of the cost of an object */
+            inc->object_cost = (inc->object_cost
+                                + duration / stats.examined) / 2;
+        }
+        if (gc_list_is_empty(GEN_HEAD(gcstate, generation))) {
+            gcstate->long_lived_total = 0;
+            gcstate->long_lived_pending = 0;
+            inc->phase = INCREMENTAL_RESET;
+        }
+    }
+    else {
+        /* collect the young generations as collect() would do */
+        gc_list_merge(GEN_HEAD(gcstate, 0), GEN_HEAD(gcstate, 1));
+        gcstate->generations[0].count = 0;
+        gcstate->generations[1].count = 0;
+        collect_list(tstate, generation - 1, GEN_HEAD(gcstate, 1),
+                     GEN_HEAD(gcstate, generation), &stats);
+        if (inc->phase == INCREMENTAL_MARK) {
+            stats.examined += mark_step(gcstate, deadline);
+            if (gc_list_is_empty(&inc->marking)) {
+                inc->phase = INCREMENTAL_SCAN;
+            }
+        }
+        else {
+            Py_ssize_t n = reset_step(gcstate, deadline);
+            stats.examined += n;
+            gcstate->long_lived_total += n;
+            if (gc_list_is_empty(&inc->visited)) {
+                inc->phase = INCREMENTAL_IDLE;
+            }
+        }
+    }
+
+    update_stats(tstate, generation, t0, &stats, 0);
+    if (result) {
+        *result = stats;
+    }
+
+    assert(!_PyErr_Occurred(tstate));
+    return stats.collected + stats.uncollectable;
+}
+
+/* This is the main function.  Read this to understand how the
+ * collection process works. */
+static Py_ssize_t
+collect(PyThreadState *tstate, int generation,
+        struct gc_generation_stats *result, int nofail)
+{
+    int i;
+    PyGC_Head *young; /* the generation we are examining */
+    PyGC_Head *old; /* next older generation */
+    struct gc_generation_stats stats = {0};
+    GCState *gcstate = &tstate->interp->gc;
+
+#ifdef EXPERIMENTAL_ISOLATED_SUBINTERPRETERS
+    if (tstate->interp->config._isolated_interpreter) {
+        // bpo-40533: The garbage collector must not be run on parallel on
+        // Python objects shared by multiple interpreters.
+        return 0;
+    }
+#endif
+
+    if (gcstate->debug & DEBUG_STATS) {
+        PySys_WriteStderr("gc: collecting generation %d...\n", generation);
+        show_stats_each_generations(gcstate);
+    }
+    _PyTime_t t0 = _PyTime_GetPerfCounter();
+
+    if (PyDTrace_GC_START_ENABLED())
+        PyDTrace_GC_START(generation);
+
+    /* update collection and allocation counters */
+    if (generation+1 < NUM_GENERATIONS)
+        gcstate->generations[generation+1].count += 1;
+    for (i = 0; i <= generation; i++)
+        gcstate->generations[i].count = 0;
+
+    /* merge younger generations with one we are currently collecting */
+    for (i = 0; i < generation; i++) {
+        gc_list_merge(GEN_HEAD(gcstate, i), GEN_HEAD(gcstate, generation));
+    }
+    if (generation == NUM_GENERATIONS - 1) {
+        /* the objects an incremental collection is done with are collected
+           too, which completes it */
+        abandon_incremental(gcstate, 0);
+    }
+
+    /* handy references */
+    young = GEN_HEAD(gcstate, generation);
+    if (generation < NUM_GENERATIONS-1)
+        old = GEN_HEAD(gcstate, generation+1);
+    else
+        old = young;
+
+    collect_list(tstate, generation, young, old, &stats);
+
+    /* Clear free list only during the collection of the highest
+     * generation */
+    if (generation == NUM_GENERATIONS-1) {
+        clear_freelists(tstate);
+    }
+
+    update_stats(tstate, generation, t0, &stats, nofail);
+    if (result) {
+        *result = stats;
     }
 
     assert(!_PyErr_Occurred(tstate));
-    return n + m;
+    return stats.collected + stats.uncollectable;
 }
 
 /* Invoke progress callbacks to notify clients that garbage collection
@@ -1351,8 +1719,7 @@ collect(PyThreadState *tstate, int generation,
  */
 static void
 invoke_gc_callback(PyThreadState *tstate, const char *phase,
-                   int generation, Py_ssize_t collected,
-                   Py_ssize_t uncollectable)
+                   int generation, struct gc_generation_stats *stats)
 {
     assert(!_PyErr_Occurred(tstate));
 
@@ -1366,10 +1733,12 @@ invoke_gc_callback(PyThreadState *tstate, const char *phase,
     assert(PyList_CheckExact(gcstate->callbacks));
     PyObject *info = NULL;
     if (PyList_GET_SIZE(gcstate->callbacks) != 0) {
-        info = Py_BuildValue("{sisnsn}",
+        info = Py_BuildValue("{sisnsnsnsd}",
             "generation", generation,
-            "collected", collected,
-            "uncollectable", uncollectable);
+            "collected", stats->collected,
+            "uncollectable", stats->uncollectable,
+            "examined", stats->examined,
+            "duration", stats->duration);
         if (info == NULL) {
             PyErr_WriteUnraisable(NULL);
             return;
@@ -1391,17 +1760,24 @@ invoke_gc_callback(PyThreadState *tstate, const char *phase,
     assert(!_PyErr_Occurred(tstate));
 }
 
-/* Perform garbage collection of a generation and invoke
+/* Perform garbage collection of a generation (or a step of the incremental
+ * collection of the oldest generation if incremental is true) and invoke
  * progress callbacks.
  */
 static Py_ssize_t
-collect_with_callback(PyThreadState *tstate, int generation)
+collect_with_callback(PyThreadState *tstate, int generation, int incremental)
 {
     assert(!_PyErr_Occurred(tstate));
-    Py_ssize_t result, collected, uncollectable;
-    invoke_gc_callback(tstate, "start", generation, 0, 0);
-    result = collect(tstate, generation, &collected, &uncollectable, 0);
-    invoke_gc_callback(tstate, "stop", generation, collected, uncollectable);
+    Py_ssize_t result;
+    struct gc_generation_stats stats = {0};
+    invoke_gc_callback(tstate, "start", generation, &stats);
+    if (incremental) {
+        result = collect_incremental(tstate, &stats);
+    }
+    else {
+        result = collect(tstate, generation, &stats, 0);
+    }
+    invoke_gc_callback(tstate, "stop", generation, &stats);
     assert(!_PyErr_Occurred(tstate));
     return result;
 }
@@ -1410,6 +1786,10 @@ static Py_ssize_t
 collect_generations(PyThreadState *tstate)
 {
     GCState *gcstate = &tstate->interp->gc;
+    if (gcstate->incremental.phase != INCREMENTAL_IDLE) {
+        /* Continue the incremental collection in progress. */
+        return collect_with_callback(tstate, NUM_GENERATIONS - 1, 1);
+    }
     /* Find the oldest generation (highest numbered) where the count
      * exceeds the threshold.  Objects in the that generation and
      * generations younger than it will be collected. */
@@ -1455,7 +1835,11 @@ collect_generations(PyThreadState *tstate)
             if (i == NUM_GENERATIONS - 1
                 && gcstate->long_lived_pending < gcstate->long_lived_total / 4)
                 continue;
-            n = collect_with_callback(tstate, i);
+            /* With a pause budget, the oldest generation is collected
+               incrementally. */
+            n = collect_with_callback(
+                tstate, i, i == NUM_GENERATIONS - 1
+                           && gcstate->incremental.pause_budget > 0);
             break;
         }
     }
@@ -1541,7 +1925,7 @@ gc_collect_impl(PyObject *module, int generation)
     }
     else {
         gcstate->collecting = 1;
-        n = collect_with_callback(tstate, generation);
+        n = collect_with_callback(tstate, generation, 0);
         gcstate->collecting = 0;
     }
     return n;
@@ -1644,6 +2028,56 @@ gc_get_count_impl(PyObject *module)
                          gcstate->generations[2].count);
 }
 
+/*[clinic input]
+gc.set_pause_budget
+
+    budget: double
+        The target duration in seconds of each step, or 0.
+    /
+
+Set the pause budget of the collections of the oldest generation.
+
+When the budget is not 0, the automatic collections of the oldest
+generation are done incrementally, in steps which pause the program for
+about the budget each.  Setting it to 0 (the default) disables incremental
+collection.
+[clinic start generated code]*/
+
+static PyObject *
+gc_set_pause_budget_impl(PyObject *module, double budget)
+/*[clinic end generated code: output=6f7f7b925973a47a input=a93eb6b7d40d1433]*/
+{
+    if (!(budget >= 0)) {
+        PyErr_SetString(PyExc_ValueError,
+                        "pause budget must be a non-negative number");
+        return NULL;
+    }
+    if (budget * 1e9 > (double)(_PyTime_MAX / 2)) {
+        PyErr_SetString(PyExc_OverflowError, "pause budget is too large");
+        return NULL;
+    }
+    GCState *gcstate = get_gc_state();
+    if (budget == 0 && gcstate->incremental.phase != INCREMENTAL_IDLE) {
+        abandon_incremental(gcstate, 1);
+    }
+    gcstate->incremental.pause_budget = budget;
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+gc.get_pause_budget -> double
+
+Return the pause budget of the collections of the oldest generation.
+[clinic start generated code]*/
+
+static double
+gc_get_pause_budget_impl(PyObject *module)
+/*[clinic end generated code: output=0ac6600c52706fdb input=80fb048e1d5646b1]*/
+{
+    GCState *gcstate = get_gc_state();
+    return gcstate->incremental.pause_budget;
+}
+
 static int
 referrersvisit(PyObject* obj, PyObject *objs)
 {
@@ -1692,6 +2126,11 @@ gc_get_referrers(PyObject *self, PyObject *args)
             return NULL;
         }
     }
+    if (!gc_referrers_for(args, &gcstate->incremental.marking, result)
+        || !gc_referrers_for(args, &gcstate->incremental.visited, result)) {
+        Py_DECREF(result);
+        return NULL;
+    }
     return result;
 }
 
@@ -1776,6 +2215,10 @@ gc_get_objects_impl(PyObject *module, Py_ssize_t generation)
         if (append_objects(result, GEN_HEAD(gcstate, generation))) {
             goto error;
         }
+        if (generation == NUM_GENERATIONS - 1
+            && append_incremental_objects(result, gcstate)) {
+            goto error;
+        }
 
         return result;
     }
@@ -1786,6 +2229,9 @@ gc_get_objects_impl(PyObject *module, Py_ssize_t generation)
             goto error;
         }
     }
+    if (append_incremental_objects(result, gcstate)) {
+        goto error;
+    }
     return result;
 
 error:
@@ -1820,10 +2266,12 @@ gc_get_stats_impl(PyObject *module)
     for (i = 0; i < NUM_GENERATIONS; i++) {
         PyObject *dict;
         st = &stats[i];
-        dict = Py_BuildValue("{snsnsn}",
+        dict = Py_BuildValue("{snsnsnsnsd}",
                              "collections", st->collections,
                              "collected", st->collected,
-                             "uncollectable", st->uncollectable
+                             "uncollectable", st->uncollectable,
+                             "examined", st->examined,
+                             "duration", st->duration
                             );
         if (dict == NULL)
             goto error;
@@ -1885,25 +2333,130 @@ gc_is_finalized(PyObject *module, PyObject *obj)
     Py_RETURN_FALSE;
 }
 
+/* A traversal callback making an object immortal.  The objects whose
+   referents remain to be made immortal are pushed on the stack; those of the
+   tracked objects are handled by immortalize_frozen(). */
+static int
+visit_immortalize(PyObject *op, PyObject *stack)
+{
+    if (_Py_IsImmortal(op)) {
+        return 0;
+    }
+    _Py_SetImmortal(op);
+    if (_PyObject_IS_GC(op) && _PyObject_GC_IS_TRACKED(op)) {
+        return 0;
+    }
+    if (_PyObject_IS_GC(op) || PyCode_Check(op)) {
+        return PyList_Append(stack, op);
+    }
+    return 0;
+}
+
+/* Make the objects op refers to immortal. */
+static int
+immortalize_referents(PyObject *op, PyObject *stack)
+{
+    if (PyCode_Check(op)) {
+        /* Code objects don't support garbage collection */
+        PyCodeObject *co = (PyCodeObject *)op;
+        PyObject *fields[] = {co->co_code, co->co_consts, co->co_names,
+                              co->co_varnames, co->co_freevars,
+                              co->co_cellvars, co->co_filename,
+                              co->co_name, co->co_lnotab, co->co_lazy};
+        for (size_t i = 0; i < Py_ARRAY_LENGTH(fields); i++) {
+            if (fields[i] != NULL && visit_immortalize(fields[i], stack)) {
+                return -1;
+            }
+        }
+        return 0;
+    }
+    if (Py_TYPE(op)->tp_traverse(op, (visitproc)visit_immortalize, stack)) {
+        return -1;
+    }
+    if (PyDict_Check(op)) {
+        /* The traversal of dicts skips string keys */
+        Py_ssize_t pos = 0;
+        PyObject *key;
+        while (PyDict_Next(op, &pos, &key, NULL)) {
+            if (visit_immortalize(key, stack)) {
+                return -1;
+            }
+        }
+    }
+    return 0;
+}
+
+/* Make the objects of the permanent generation immortal, together with the
+   untracked objects reachable from them. */
+static int
+immortalize_frozen(GCState *gcstate)
+{
+    PyGC_Head *permanent = &gcstate->permanent_generation.head;
+    PyObject *stack = PyList_New(0);
+    if (stack == NULL) {
+        return -1;
+    }
+    for (PyGC_Head *gc = GC_NEXT(permanent); gc != permanent;
+         gc = GC_NEXT(gc)) {
+        PyObject *op = FROM_GC(gc);
+        _Py_SetImmortal(op);
+        if (immortalize_referents(op, stack) < 0) {
+            goto error;
+        }
+    }
+
+    Py_ssize_t n;
+    while ((n = PyList_GET_SIZE(stack)) > 0) {
+        PyObject *op = PyList_GET_ITEM(stack, n - 1);
+        if (PyList_SetSlice(stack, n - 1, n, NULL) < 0
+            || immortalize_referents(op, stack) < 0) {
+            goto error;
+        }
+    }
+    Py_DECREF(stack);
+    return 0;
+
+error:
+    Py_DECREF(stack);
+    return -1;
+}
+
 /*[clinic input]
 gc.freeze
 
+    *
+    immortalize: bool = False
+
 Freeze all current tracked objects and ignore them for future collections.
 
 This can be used before a POSIX fork() call to make the gc copy-on-write friendly.
 Note: collection before a POSIX fork() call may free pages for future allocation
 which can cause copy-on-write.
+
+If immortalize is true, the frozen objects and the objects they refer to are
+also made immortal: their reference counts are no longer updated, so that
+child processes don't write to the memory holding them, and they are never
+deallocated.
 [clinic start generated code]*/
 
 static PyObject *
-gc_freeze_impl(PyObject *module)
-/*[clinic end generated code: output=502159d9cdc4c139 input=b602b16ac5febbe5]*/
+gc_freeze_impl(PyObject *module, int immortalize)
+/*[clinic end generated code: output=db32b5465626796f input=34a5d9b8c2dd735b]*/
 {
     GCState *gcstate = get_gc_state();
+    PyGC_Head frozen;
+    gc_list_init(&frozen);
+    abandon_incremental(gcstate, 0);
     for (int i = 0; i < NUM_GENERATIONS; ++i) {
-        gc_list_merge(GEN_HEAD(gcstate, i), &gcstate->permanent_generation.head);
+        gc_list_merge(GEN_HEAD(gcstate, i), &frozen);
         gcstate->generations[i].count = 0;
     }
+    /* Keep incremental collections away from the permanent generation */
+    gc_list_set_visited(&frozen, 1);
+    gc_list_merge(&frozen, &gcstate->permanent_generation.head);
+    if (immortalize && immortalize_frozen(gcstate) < 0) {
+        return NULL;
+    }
     Py_RETURN_NONE;
 }
 
@@ -1913,15 +2466,25 @@ gc.unfreeze
 Unfreeze all objects in the permanent generation.
 
 Put all objects in the permanent generation back into oldest generation.
+Immortal objects stay in the permanent generation.
 [clinic start generated code]*/
 
 static PyObject *
 gc_unfreeze_impl(PyObject *module)
-/*[clinic end generated code: output=1c15f2043b25e169 input=2dd52b170f4cef6c]*/
+/*[clinic end generated code: output=1c15f2043b25e169 input=86475259914c549b]*/
 {
     GCState *gcstate = get_gc_state();
-    gc_list_merge(&gcstate->permanent_generation.head,
-                  GEN_HEAD(gcstate, NUM_GENERATIONS-1));
+    PyGC_Head *permanent = &gcstate->permanent_generation.head;
+    PyGC_Head *oldest = GEN_HEAD(gcstate, NUM_GENERATIONS-1);
+    PyGC_Head *gc = GC_NEXT(permanent);
+    while (gc != permanent) {
+        PyGC_Head *next = GC_NEXT(gc);
+        if (!_Py_IsImmortal(FROM_GC(gc))) {
+            gc->_gc_next &= ~NEXT_MASK_VISITED;
+            gc_list_move(gc, oldest);
+        }
+        gc = next;
+    }
     Py_RETURN_NONE;
 }
 
@@ -1953,6 +2516,8 @@ PyDoc_STRVAR(gc__doc__,
 "get_debug() -- Get debugging flags.\n"
 "set_threshold() -- Set the collection thresholds.\n"
 "get_threshold() -- Return the current the collection thresholds.\n"
+"set_pause_budget() -- Set the pause budget of incremental collections.\n"
+"get_pause_budget() -- Return the pause budget of incremental collections.\n"
 "get_objects() -- Return a list of all objects tracked by the collector.\n"
 "is_tracked() -- Returns true if a given object is tracked.\n"
 "is_finalized() -- Returns true if a given object has been already finalized.\n"
@@ -1971,6 +2536,8 @@ static PyMethodDef GcMethods[] = {
     GC_GET_COUNT_METHODDEF
     {"set_threshold",  gc_set_threshold, METH_VARARGS, gc_set_thresh__doc__},
     GC_GET_THRESHOLD_METHODDEF
+    GC_SET_PAUSE_BUDGET_METHODDEF
+    GC_GET_PAUSE_BUDGET_METHODDEF
     GC_COLLECT_METHODDEF
     GC_GET_OBJECTS_METHODDEF
     GC_GET_STATS_METHODDEF
@@ -2061,7 +2628,7 @@ PyGC_Collect(void)
         PyObject *exc, *value, *tb;
         gcstate->collecting = 1;
         _PyErr_Fetch(tstate, &exc, &value, &tb);
-        n = collect_with_callback(tstate, NUM_GENERATIONS - 1);
+        n = collect_with_callback(tstate, NUM_GENERATIONS - 1, 0);
         _PyErr_Restore(tstate, exc, value, tb);
         gcstate->collecting = 0;
     }
@@ -2095,7 +2662,7 @@ _PyGC_CollectNoFail(void)
     }
     else {
         gcstate->collecting = 1;
-        n = collect(tstate, NUM_GENERATIONS - 1, NULL, NULL, 1);
+        n = collect(tstate, NUM_GENERATIONS - 1, NULL, 1);
         gcstate->collecting = 0;
     }
     return n;
@@ -19,6 +19,9 @@
 #if defined(ZLIB_VERNUM) && ZLIB_VERNUM >= 0x1221
 #  define AT_LEAST_ZLIB_1_2_2_1
 #endif
+#if defined(ZLIB_VERNUM) && ZLIB_VERNUM >= 0x1234
+#  define AT_LEAST_ZLIB_1_2_3_4
+#endif
 
 /* The following parameters are copied from zutil.h, version 0.95 */
 #define DEFLATED   8
@@ -57,6 +60,7 @@ typedef struct
     PyObject *unconsumed_tail;
     char eof;
     int is_initialised;
+    int boundary_bits;
     PyObject *zdict;
     PyThread_type_lock lock;
 } compobject;
@@ -106,6 +110,7 @@ newcompobject(PyTypeObject *type)
         return NULL;
     self->eof = 0;
     self->is_initialised = 0;
+    self->boundary_bits = -1;
     self->zdict = NULL;
     self->unused_data = PyBytes_FromStringAndSize("", 0);
     if (self->unused_data == NULL) {
@@ -729,6 +734,11 @@ zlib.Decompress.decompress
         The maximum allowable length of the decompressed data.
         Unconsumed input data will be stored in
         the unconsumed_tail attribute.
+    *
+    block: bool = False
+        Stop at the end of the first deflate block reached.
+        Unconsumed input data will be stored in
+        the unconsumed_tail attribute.
 
 Return a bytes object containing the decompressed version of the data.
 
@@ -739,10 +749,11 @@ Call the flush() method to clear these buffers.
 
 static PyObject *
 zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
-                                Py_ssize_t max_length)
-/*[clinic end generated code: output=6e5173c74e710352 input=0a95d05a3bceaeaa]*/
+                                Py_ssize_t max_length, int block)
+/*[clinic end generated code: output=043006aef0261515 input=c56a3ccda26d2e1e]*/
 {
     int err = Z_OK;
+    int flush = Z_SYNC_FLUSH;
     Py_ssize_t ibuflen, obuflen = DEF_BUF_SIZE, hard_limit;
     PyObject *RetVal = NULL;
 
@@ -754,6 +765,16 @@ zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
     else
         hard_limit = max_length;
 
+    if (block) {
+#ifdef Z_BLOCK
+        flush = Z_BLOCK;
+#else
+        PyErr_SetString(PyExc_NotImplementedError,
+                        "block requires zlib 1.2.0.5 or later");
+        return NULL;
+#endif
+    }
+
     self->zst.next_in = data->buf;
     ibuflen = data->len;
 
@@ -780,7 +801,7 @@ zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
             }
 
             Py_BEGIN_ALLOW_THREADS
-            err = inflate(&self->zst, Z_SYNC_FLUSH);
+            err = inflate(&self->zst, flush);
             Py_END_ALLOW_THREADS
 
             switch (err) {
@@ -800,9 +821,18 @@ zlib_Decompress_decompress_impl(compobject *self, Py_buffer *data,
 
         } while (self->zst.avail_out == 0 || err == Z_NEED_DICT);
 
-    } while (err != Z_STREAM_END && ibuflen != 0);
+    } while (err != Z_STREAM_END && ibuflen != 0 && !block);
 
  save:
+    /* The low 3 bits of data_type are the number of unused bits in the last
+       input byte, bit 6 is set in the last block of the stream, and bit 7 is
+       set if inflate() stopped right after the end of a block or after the
+       stream header. */
+    if ((self->zst.data_type & (128 | 64)) == 128)
+        self->boundary_bits = self->zst.data_type & 7;
+    else
+        self->boundary_bits = -1;
+
     if (save_unconsumed_input(self, data, err) < 0)
         goto abort;
 
@@ -1038,6 +1068,7 @@ zlib_Decompress_copy_impl(compobject *self)
     Py_XINCREF(self->zdict);
     Py_XSETREF(retval->zdict, self->zdict);
     retval->eof = self->eof;
+    retval->boundary_bits = self->boundary_bits;
 
     /* Mark it as being initialized */
     retval->is_initialised = 1;
@@ -1051,6 +1082,47 @@ error:
     return NULL;
 }
 
+/*[clinic input]
+zlib.Decompress.prime
+
+    bits: int
+        The number of bits to insert, from 0 to 16.
+    value: int
+        The bits to insert, as the low-order bits of an integer.
+    /
+
+Insert bits at the start of the pending input.
+
+Together with a preset dictionary, this allows to resume the decompression
+of raw deflate data at a block boundary which is not on a byte boundary.
+[clinic start generated code]*/
+
+static PyObject *
+zlib_Decompress_prime_impl(compobject *self, int bits, int value)
+/*[clinic end generated code: output=667944a4574c40d3 input=791f219ba14e0535]*/
+{
+#ifdef AT_LEAST_ZLIB_1_2_3_4
+    int err;
+
+    if (bits < 0 || bits > 16) {
+        PyErr_SetString(PyExc_ValueError, "bits must be between 0 and 16");
+        return NULL;
+    }
+    ENTER_ZLIB(self);
+    err = inflatePrime(&self->zst, bits, value & ((1 << bits) - 1));
+    LEAVE_ZLIB(self);
+    if (err != Z_OK) {
+        zlib_error(self->zst, err, "while priming decompression object");
+        return NULL;
+    }
+    Py_RETURN_NONE;
+#else
+    PyErr_SetString(PyExc_NotImplementedError,
+                    "prime() requires zlib 1.2.3.4 or later");
+    return NULL;
+#endif
+}
+
 /*[clinic input]
 zlib.Decompress.__copy__
 [clinic start generated code]*/
@@ -1187,6 +1259,7 @@ static PyMethodDef Decomp_methods[] =
     ZLIB_DECOMPRESS_DECOMPRESS_METHODDEF
     ZLIB_DECOMPRESS_FLUSH_METHODDEF
     ZLIB_DECOMPRESS_COPY_METHODDEF
+    ZLIB_DECOMPRESS_PRIME_METHODDEF
     ZLIB_DECOMPRESS___COPY___METHODDEF
     ZLIB_DECOMPRESS___DEEPCOPY___METHODDEF
     {NULL, NULL}
@@ -1197,6 +1270,7 @@ static PyMemberDef Decomp_members[] = {
     {"unused_data",     T_OBJECT, COMP_OFF(unused_data), READONLY},
     {"unconsumed_tail", T_OBJECT, COMP_OFF(unconsumed_tail), READONLY},
     {"eof",             T_BOOL,   COMP_OFF(eof), READONLY},
+    {"boundary_bits",   T_INT,    COMP_OFF(boundary_bits), READONLY},
     {NULL},
 };
 
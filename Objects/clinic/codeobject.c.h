@@ -177,15 +177,15 @@ code_replace(PyCodeObject *self, PyObject *const *args, Py_ssize_t nargs, PyObje
     int co_stacksize = self->co_stacksize;
     int co_flags = self->co_flags;
     int co_firstlineno = self->co_firstlineno;
-    PyBytesObject *co_code = (PyBytesObject *)self->co_code;
-    PyObject *co_consts = self->co_consts;
-    PyObject *co_names = self->co_names;
+    PyBytesObject *co_code = NULL;
+    PyObject *co_consts = NULL;
+    PyObject *co_names = NULL;
     PyObject *co_varnames = self->co_varnames;
     PyObject *co_freevars = self->co_freevars;
     PyObject *co_cellvars = self->co_cellvars;
     PyObject *co_filename = self->co_filename;
     PyObject *co_name = self->co_name;
-    PyBytesObject *co_lnotab = (PyBytesObject *)self->co_lnotab;
+    PyBytesObject *co_lnotab = NULL;
 
     args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 0, 0, argsbuf);
     if (!args) {
@@ -354,4 +354,4 @@ skip_optional_kwonly:
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=18c31941ec09e9ca input=a9049054013a1b77]*/
+/*[clinic end generated code: output=b1be314d2cee3639 input=a9049054013a1b77]*/
@@ -268,9 +268,107 @@ PyCode_NewWithPosOnlyArgs(int argcount, int posonlyargcount, int kwonlyargcount,
     co->co_opcache = NULL;
     co->co_opcache_flag = 0;
     co->co_opcache_size = 0;
+    co->co_exec_stats = NULL;
+    co->co_lazy = NULL;
     return co;
 }
 
+/* Create a code object whose body (co_code, co_consts except the first
+   constant, co_names and co_lnotab) is kept as marshal data until it is
+   needed.  body may be NULL if the body is set right away with
+   _PyCode_SetBody(). */
+PyCodeObject *
+_PyCode_NewLazy(int argcount, int posonlyargcount, int kwonlyargcount,
+                int nlocals, int stacksize, int flags, PyObject *first_const,
+                PyObject *varnames, PyObject *freevars, PyObject *cellvars,
+                PyObject *filename, PyObject *name, int firstlineno,
+                PyObject *body)
+{
+    PyCodeObject *co = NULL;
+    PyObject *empty_bytes, *empty_tuple, *consts;
+
+    if (body != NULL && !PyBytes_Check(body)) {
+        PyErr_BadInternalCall();
+        return NULL;
+    }
+    empty_bytes = PyBytes_FromStringAndSize(NULL, 0);
+    empty_tuple = PyTuple_New(0);
+    consts = PyTuple_Pack(1, first_const);
+    if (empty_bytes != NULL && empty_tuple != NULL && consts != NULL) {
+        co = PyCode_NewWithPosOnlyArgs(argcount, posonlyargcount,
+                                       kwonlyargcount, nlocals, stacksize,
+                                       flags, empty_bytes, consts,
+                                       empty_tuple, varnames, freevars,
+                                       cellvars, filename, name, firstlineno,
+                                       empty_bytes);
+    }
+    Py_XDECREF(empty_bytes);
+    Py_XDECREF(empty_tuple);
+    Py_XDECREF(consts);
+    if (co != NULL) {
+        Py_XINCREF(body);
+        co->co_lazy = body;
+    }
+    return co;
+}
+
+/* Install the body of a code object created by _PyCode_NewLazy().  consts
+   doesn't include the first constant.  body is the value of co_lazy the
+   fields were loaded from: nothing is done if the code object was loaded
+   in the meantime, since it might be running. */
+int
+_PyCode_SetBody(PyCodeObject *co, PyObject *body, PyObject *code,
+                PyObject *consts, PyObject *names, PyObject *lnotab)
+{
+    PyObject *all_consts;
+    Py_ssize_t i, n;
+
+    if (code == NULL || !PyBytes_Check(code) ||
+        consts == NULL || !PyTuple_Check(consts) ||
+        names == NULL || !PyTuple_Check(names) ||
+        lnotab == NULL || !PyBytes_Check(lnotab)) {
+        PyErr_BadInternalCall();
+        return -1;
+    }
+    if (PyBytes_GET_SIZE(code) > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "co_code larger than INT_MAX");
+        return -1;
+    }
+
+    if (co->co_lazy != body) {
+        return 0;
+    }
+
+    if (intern_strings(names) < 0) {
+        return -1;
+    }
+    n = PyTuple_GET_SIZE(consts);
+    all_consts = PyTuple_New(n + 1);
+    if (all_consts == NULL) {
+        return -1;
+    }
+    for (i = 0; i <= n; i++) {
+        PyObject *v = i ? PyTuple_GET_ITEM(consts, i - 1)
+                        : PyTuple_GET_ITEM(co->co_consts, 0);
+        Py_INCREF(v);
+        PyTuple_SET_ITEM(all_consts, i, v);
+    }
+    if (intern_string_constants(all_consts, NULL) < 0) {
+        Py_DECREF(all_consts);
+        return -1;
+    }
+
+    Py_INCREF(code);
+    Py_SETREF(co->co_code, code);
+    Py_SETREF(co->co_consts, all_consts);
+    Py_INCREF(names);
+    Py_SETREF(co->co_names, names);
+    Py_INCREF(lnotab);
+    Py_SETREF(co->co_lnotab, lnotab);
+    Py_CLEAR(co->co_lazy);
+    return 0;
+}
+
 PyCodeObject *
 PyCode_New(int argcount, int kwonlyargcount,
            int nlocals, int stacksize, int flags,
@@ -301,8 +399,8 @@ _PyCode_InitOpcache(PyCodeObject *co)
         unsigned char opcode = _Py_OPCODE(opcodes[i]);
         i++;  // 'i' is now aligned to (next_instr - first_instr)
 
-        // TODO: LOAD_METHOD, LOAD_ATTR
-        if (opcode == LOAD_GLOBAL) {
+        if (opcode == LOAD_GLOBAL || opcode == LOAD_ATTR ||
+            opcode == STORE_ATTR || opcode == LOAD_METHOD) {
             opts++;
             co->co_opcache_map[i] = (unsigned char)opts;
             if (opts > 254) {
@@ -387,16 +485,34 @@ static PyMemberDef code_memberlist[] = {
     {"co_nlocals",      T_INT,          OFF(co_nlocals),         READONLY},
     {"co_stacksize",T_INT,              OFF(co_stacksize),       READONLY},
     {"co_flags",        T_INT,          OFF(co_flags),           READONLY},
-    {"co_code",         T_OBJECT,       OFF(co_code),            READONLY},
-    {"co_consts",       T_OBJECT,       OFF(co_consts),          READONLY},
-    {"co_names",        T_OBJECT,       OFF(co_names),           READONLY},
     {"co_varnames",     T_OBJECT,       OFF(co_varnames),        READONLY},
     {"co_freevars",     T_OBJECT,       OFF(co_freevars),        READONLY},
     {"co_cellvars",     T_OBJECT,       OFF(co_cellvars),        READONLY},
     {"co_filename",     T_OBJECT,       OFF(co_filename),        READONLY},
     {"co_name",         T_OBJECT,       OFF(co_name),            READONLY},
     {"co_firstlineno", T_INT,           OFF(co_firstlineno),     READONLY},
-    {"co_lnotab",       T_OBJECT,       OFF(co_lnotab),          READONLY},
+    {NULL}      /* Sentinel */
+};
+
+/* Getter of the fields which are only set once the body is loaded */
+static PyObject *
+code_getbody(PyCodeObject *co, void *closure)
+{
+    PyObject *v;
+
+    if (_PyCode_EnsureBody(co) < 0) {
+        return NULL;
+    }
+    v = *(PyObject **)((char *)co + (Py_ssize_t)closure);
+    Py_INCREF(v);
+    return v;
+}
+
+static PyGetSetDef code_getsetlist[] = {
+    {"co_code",   (getter)code_getbody, NULL, NULL, (void *)OFF(co_code)},
+    {"co_consts", (getter)code_getbody, NULL, NULL, (void *)OFF(co_consts)},
+    {"co_names",  (getter)code_getbody, NULL, NULL, (void *)OFF(co_names)},
+    {"co_lnotab", (getter)code_getbody, NULL, NULL, (void *)OFF(co_lnotab)},
     {NULL}      /* Sentinel */
 };
 
@@ -560,6 +676,9 @@ code_dealloc(PyCodeObject *co)
     }
     co->co_opcache_flag = 0;
     co->co_opcache_size = 0;
+    if (co->co_exec_stats != NULL) {
+        PyMem_Free(co->co_exec_stats);
+    }
 
     if (co->co_extra != NULL) {
         PyInterpreterState *interp = _PyInterpreterState_GET();
@@ -585,6 +704,7 @@ code_dealloc(PyCodeObject *co)
     Py_XDECREF(co->co_filename);
     Py_XDECREF(co->co_name);
     Py_XDECREF(co->co_lnotab);
+    Py_XDECREF(co->co_lazy);
     if (co->co_cell2arg != NULL)
         PyMem_FREE(co->co_cell2arg);
     if (co->co_zombieframe != NULL)
@@ -614,6 +734,9 @@ code_sizeof(PyCodeObject *co, PyObject *Py_UNUSED(args))
         // co_opcache
         res += co->co_opcache_size * sizeof(_PyOpcache);
     }
+    if (co->co_exec_stats != NULL) {
+        res += sizeof(_PyCodeExecStats);
+    }
     return PyLong_FromSsize_t(res);
 }
 
@@ -628,15 +751,15 @@ code.replace
     co_stacksize: int(c_default="self->co_stacksize") = -1
     co_flags: int(c_default="self->co_flags") = -1
     co_firstlineno: int(c_default="self->co_firstlineno") = -1
-    co_code: PyBytesObject(c_default="(PyBytesObject *)self->co_code") = None
-    co_consts: object(subclass_of="&PyTuple_Type", c_default="self->co_consts") = None
-    co_names: object(subclass_of="&PyTuple_Type", c_default="self->co_names") = None
+    co_code: PyBytesObject(c_default="NULL") = None
+    co_consts: object(subclass_of="&PyTuple_Type", c_default="NULL") = None
+    co_names: object(subclass_of="&PyTuple_Type", c_default="NULL") = None
     co_varnames: object(subclass_of="&PyTuple_Type", c_default="self->co_varnames") = None
     co_freevars: object(subclass_of="&PyTuple_Type", c_default="self->co_freevars") = None
     co_cellvars: object(subclass_of="&PyTuple_Type", c_default="self->co_cellvars") = None
     co_filename: unicode(c_default="self->co_filename") = None
     co_name: unicode(c_default="self->co_name") = None
-    co_lnotab: PyBytesObject(c_default="(PyBytesObject *)self->co_lnotab") = None
+    co_lnotab: PyBytesObject(c_default="NULL") = None
 
 Return a copy of the code object with new values for the specified fields.
 [clinic start generated code]*/
@@ -650,7 +773,7 @@ code_replace_impl(PyCodeObject *self, int co_argcount,
                   PyObject *co_varnames, PyObject *co_freevars,
                   PyObject *co_cellvars, PyObject *co_filename,
                   PyObject *co_name, PyBytesObject *co_lnotab)
-/*[clinic end generated code: output=25c8e303913bcace input=d9051bc8f24e6b28]*/
+/*[clinic end generated code: output=25c8e303913bcace input=4421624ac295206a]*/
 {
 #define CHECK_INT_ARG(ARG) \
         if (ARG < 0) { \
@@ -669,6 +792,22 @@ code_replace_impl(PyCodeObject *self, int co_argcount,
 
 #undef CHECK_INT_ARG
 
+    if (_PyCode_EnsureBody(self) < 0) {
+        return NULL;
+    }
+    if (co_code == NULL) {
+        co_code = (PyBytesObject *)self->co_code;
+    }
+    if (co_consts == NULL) {
+        co_consts = self->co_consts;
+    }
+    if (co_names == NULL) {
+        co_names = self->co_names;
+    }
+    if (co_lnotab == NULL) {
+        co_lnotab = (PyBytesObject *)self->co_lnotab;
+    }
+
     if (PySys_Audit("code.__new__", "OOOiiiiii",
                     co_code, co_filename, co_name, co_argcount,
                     co_posonlyargcount, co_kwonlyargcount, co_nlocals,
@@ -848,6 +987,9 @@ code_richcompare(PyObject *self, PyObject *other, int op)
 
     co = (PyCodeObject *)self;
     cp = (PyCodeObject *)other;
+    if (_PyCode_EnsureBody(co) < 0 || _PyCode_EnsureBody(cp) < 0) {
+        return NULL;
+    }
 
     eq = PyObject_RichCompareBool(co->co_name, cp->co_name, Py_EQ);
     if (!eq) goto unequal;
@@ -912,6 +1054,7 @@ static Py_hash_t
 code_hash(PyCodeObject *co)
 {
     Py_hash_t h, h0, h1, h2, h3, h4, h5, h6;
+    if (_PyCode_EnsureBody(co) < 0) return -1;
     h0 = PyObject_Hash(co->co_name);
     if (h0 == -1) return -1;
     h1 = PyObject_Hash(co->co_code);
@@ -971,7 +1114,7 @@ PyTypeObject PyCode_Type = {
     0,                                  /* tp_iternext */
     code_methods,                       /* tp_methods */
     code_memberlist,                    /* tp_members */
-    0,                                  /* tp_getset */
+    code_getsetlist,                    /* tp_getset */
     0,                                  /* tp_base */
     0,                                  /* tp_dict */
     0,                                  /* tp_descr_get */
@@ -989,6 +1132,16 @@ PyTypeObject PyCode_Type = {
 int
 PyCode_Addr2Line(PyCodeObject *co, int addrq)
 {
+    if (co->co_lazy != NULL) {
+        /* Don't clobber the exception being reported, if any */
+        PyObject *exc, *val, *tb;
+        PyErr_Fetch(&exc, &val, &tb);
+        if (_PyMarshal_LoadCodeBody(co) < 0) {
+            PyErr_Clear();
+        }
+        PyErr_Restore(exc, val, tb);
+    }
+
     Py_ssize_t size = PyBytes_Size(co->co_lnotab) / 2;
     unsigned char *p = (unsigned char*)PyBytes_AsString(co->co_lnotab);
     int line = co->co_firstlineno;
@@ -1552,6 +1552,93 @@ _PyDict_LoadGlobal(PyDictObject *globals, PyDictObject *builtins, PyObject *key)
     return value;
 }
 
+/* Look up key in mp, checking first the entry at index hint, as returned by
+ * a previous call.  Used by the opcode cache of LOAD_ATTR and friends.
+ *
+ * Return the index of the entry if the key exists and set *value to a
+ * borrowed reference to its value.  Return -1 if the key doesn't exist, or
+ * -2 if an error occurred.
+ */
+Py_ssize_t
+_PyDict_GetItemHint(PyDictObject *mp, PyObject *key,
+                    Py_ssize_t hint, PyObject **value)
+{
+    Py_hash_t hash;
+    Py_ssize_t ix;
+
+    assert(PyUnicode_CheckExact(key));
+    if (hint >= 0 && hint < mp->ma_keys->dk_nentries) {
+        PyDictKeyEntry *ep = DK_ENTRIES(mp->ma_keys) + hint;
+        if (ep->me_key == key) {
+            PyObject *v;
+            if (mp->ma_values != NULL) {
+                v = mp->ma_values[hint];
+            }
+            else {
+                v = ep->me_value;
+            }
+            if (v != NULL) {
+                *value = v;
+                return hint;
+            }
+        }
+    }
+
+    if ((hash = ((PyASCIIObject *) key)->hash) == -1) {
+        hash = PyObject_Hash(key);
+        if (hash == -1)
+            return -2;
+    }
+    ix = mp->ma_keys->dk_lookup(mp, key, hash, value);
+    if (ix == DKIX_ERROR)
+        return -2;
+    if (ix < 0 || *value == NULL)
+        return -1;
+    return ix;
+}
+
+/* Replace the value of key in mp if it is stored at index hint, as returned
+ * by _PyDict_GetItemHint().  A split table also accepts a key which is the
+ * next one in the order of the shared keys.  Return 1 if the value was set,
+ * and 0 without modifying the dictionary otherwise.
+ */
+int
+_PyDict_SetItemHint(PyDictObject *mp, PyObject *key,
+                    Py_ssize_t hint, PyObject *value)
+{
+    PyDictKeyEntry *ep;
+    PyObject *old_value;
+
+    assert(value != NULL);
+    if (hint < 0 || hint >= mp->ma_keys->dk_nentries)
+        return 0;
+    ep = DK_ENTRIES(mp->ma_keys) + hint;
+    if (ep->me_key != key)
+        return 0;
+    if (mp->ma_values != NULL) {
+        old_value = mp->ma_values[hint];
+        if (old_value == NULL) {
+            if (hint != mp->ma_used)
+                return 0;
+            /* pending state */
+            mp->ma_used++;
+        }
+        mp->ma_values[hint] = value;
+    }
+    else {
+        old_value = ep->me_value;
+        if (old_value == NULL)
+            return 0;
+        ep->me_value = value;
+    }
+    Py_INCREF(value);
+    MAINTAIN_TRACKING(mp, key, value);
+    mp->ma_version_tag = DICT_NEXT_VERSION();
+    Py_XDECREF(old_value);
+    ASSERT_CONSISTENT(mp);
+    return 1;
+}
+
 /* CAUTION: PyDict_SetItem() must guarantee that it won't resize the
  * dictionary if it's merely replacing the value for an existing key.
  * This means that it's safe to loop over a dictionary with PyDict_Next()
@@ -2,6 +2,7 @@
 
 #include "Python.h"
 #include "pycore_object.h"
+#include "pycore_code.h"      // _PyCode_EnsureBody()
 #include "pycore_gc.h"       // _PyObject_GC_IS_TRACKED()
 
 #include "code.h"
@@ -788,6 +789,9 @@ frame_alloc(PyCodeObject *code)
         assert(f->f_code == code);
         return f;
     }
+    if (_PyCode_EnsureBody(code) < 0) {
+        return NULL;
+    }
 
     Py_ssize_t ncells = PyTuple_GET_SIZE(code->co_cellvars);
     Py_ssize_t nfrees = PyTuple_GET_SIZE(code->co_freevars);
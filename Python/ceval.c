@@ -29,6 +29,7 @@
 #include "opcode.h"
 #include "pydtrace.h"
 #include "setobject.h"
+#include "structmember.h"         // struct PyMemberDef, T_OBJECT_EX
 
 #include <ctype.h>
 
@@ -111,16 +112,28 @@ static long dxp[256];
 #else
 #define OPCACHE_MIN_RUNS 1024  /* create opcache when code executed this time */
 #endif
-#define OPCACHE_STATS 0  /* Enable stats */
-
-#if OPCACHE_STATS
-static size_t opcache_code_objects = 0;
-static size_t opcache_code_objects_extra_mem = 0;
-
-static size_t opcache_global_opts = 0;
-static size_t opcache_global_hits = 0;
-static size_t opcache_global_misses = 0;
-#endif
+#define OPCACHE_STATS 0  /* Dump stats at exit */
+
+/* Number of cache misses tolerated by an attribute cache entry before the
+   instruction is deoptimized */
+#define OPCODE_CACHE_MAX_TRIES 20
+
+typedef struct {
+    size_t opts;    /* instructions which filled their cache entry */
+    size_t hits;
+    size_t misses;
+    size_t deopts;  /* instructions which gave up caching */
+} opcache_counters;
+
+/* Opcode cache statistics, see sys._opcache_stats() */
+static struct {
+    size_t code_objects;
+    size_t extra_mem;
+    opcache_counters load_global;
+    opcache_counters load_attr;
+    opcache_counters store_attr;
+    opcache_counters load_method;
+} opcache_stats;
 
 
 #ifndef NDEBUG
@@ -339,33 +352,244 @@ PyEval_InitThreads(void)
     /* Do nothing: kept for backward compatibility */
 }
 
+#if OPCACHE_STATS
+static void
+print_opcache_counters(const char *opname, opcache_counters *counters)
+{
+    size_t total = counters->hits + counters->misses;
+    fprintf(stderr, "-- Opcode cache %-11s hits   = %zd (%d%%)\n",
+            opname, counters->hits,
+            total ? (int) (100.0 * counters->hits / total) : 0);
+    fprintf(stderr, "-- Opcode cache %-11s misses = %zd (%d%%)\n",
+            opname, counters->misses,
+            total ? (int) (100.0 * counters->misses / total) : 0);
+    fprintf(stderr, "-- Opcode cache %-11s opts   = %zd\n",
+            opname, counters->opts);
+    fprintf(stderr, "-- Opcode cache %-11s deopts = %zd\n",
+            opname, counters->deopts);
+    fprintf(stderr, "\n");
+}
+#endif
+
 void
 _PyEval_Fini(void)
 {
 #if OPCACHE_STATS
     fprintf(stderr, "-- Opcode cache number of objects  = %zd\n",
-            opcache_code_objects);
+            opcache_stats.code_objects);
 
     fprintf(stderr, "-- Opcode cache total extra mem    = %zd\n",
-            opcache_code_objects_extra_mem);
+            opcache_stats.extra_mem);
 
     fprintf(stderr, "\n");
 
-    fprintf(stderr, "-- Opcode cache LOAD_GLOBAL hits   = %zd (%d%%)\n",
-            opcache_global_hits,
-            (int) (100.0 * opcache_global_hits /
-                (opcache_global_hits + opcache_global_misses)));
+    print_opcache_counters("LOAD_GLOBAL", &opcache_stats.load_global);
+    print_opcache_counters("LOAD_ATTR", &opcache_stats.load_attr);
+    print_opcache_counters("STORE_ATTR", &opcache_stats.store_attr);
+    print_opcache_counters("LOAD_METHOD", &opcache_stats.load_method);
+#endif
+}
 
-    fprintf(stderr, "-- Opcode cache LOAD_GLOBAL misses = %zd (%d%%)\n",
-            opcache_global_misses,
-            (int) (100.0 * opcache_global_misses /
-                (opcache_global_hits + opcache_global_misses)));
+static int
+add_opcache_counters(PyObject *dict, const char *name,
+                     opcache_counters *counters)
+{
+    PyObject *value = Py_BuildValue("{snsnsnsn}",
+                                    "opts", counters->opts,
+                                    "hits", counters->hits,
+                                    "misses", counters->misses,
+                                    "deopts", counters->deopts);
+    if (value == NULL) {
+        return -1;
+    }
+    int res = PyDict_SetItemString(dict, name, value);
+    Py_DECREF(value);
+    return res;
+}
 
-    fprintf(stderr, "-- Opcode cache LOAD_GLOBAL opts   = %zd\n",
-            opcache_global_opts);
+/* Return the opcode cache statistics as a new dictionary. */
+PyObject *
+_PyEval_GetOpcacheStats(void)
+{
+    PyObject *dict = Py_BuildValue("{snsn}",
+                                   "code_objects", opcache_stats.code_objects,
+                                   "extra_mem", opcache_stats.extra_mem);
+    if (dict == NULL) {
+        return NULL;
+    }
+    if (add_opcache_counters(dict, "LOAD_GLOBAL",
+                             &opcache_stats.load_global) < 0 ||
+        add_opcache_counters(dict, "LOAD_ATTR",
+                             &opcache_stats.load_attr) < 0 ||
+        add_opcache_counters(dict, "STORE_ATTR",
+                             &opcache_stats.store_attr) < 0 ||
+        add_opcache_counters(dict, "LOAD_METHOD",
+                             &opcache_stats.load_method) < 0)
+    {
+        Py_DECREF(dict);
+        return NULL;
+    }
+    return dict;
+}
 
-    fprintf(stderr, "\n");
-#endif
+/* Execution statistics.
+
+   While they are enabled, tracing_possible is incremented so that every
+   instruction goes through fast_next_opcode, where it is counted: the eval
+   loop runs at full speed when they are disabled. */
+
+void
+_PyEval_SetExecStats(PyThreadState *tstate, int enabled)
+{
+    struct _ceval_state *ceval2 = &tstate->interp->ceval;
+    enabled = (enabled != 0);
+    if (enabled != ceval2->exec_stats.enabled) {
+        ceval2->exec_stats.enabled = enabled;
+        ceval2->tracing_possible += enabled ? 1 : -1;
+    }
+}
+
+void
+_PyEval_ClearExecStats(PyThreadState *tstate)
+{
+    struct _ceval_exec_stats *stats = &tstate->interp->ceval.exec_stats;
+    stats->generation++;
+    memset(stats->opcodes, 0, sizeof(stats->opcodes));
+    Py_CLEAR(stats->code_objects);
+}
+
+/* Return the counters of co, resetting and registering them first if they
+   belong to a previous generation.  Return NULL on error. */
+static _PyCodeExecStats *
+code_exec_stats(struct _ceval_exec_stats *stats, PyCodeObject *co)
+{
+    _PyCodeExecStats *cs = co->co_exec_stats;
+    PyObject *ref;
+
+    if (cs == NULL) {
+        cs = PyMem_Malloc(sizeof(_PyCodeExecStats));
+        if (cs == NULL) {
+            PyErr_NoMemory();
+            return NULL;
+        }
+        co->co_exec_stats = cs;
+    }
+    /* Set first: registering can run arbitrary code through the GC */
+    cs->generation = stats->generation;
+    cs->entries = 0;
+    cs->instructions = 0;
+
+    if (stats->code_objects == NULL) {
+        stats->code_objects = PyList_New(0);
+        if (stats->code_objects == NULL) {
+            goto error;
+        }
+        stats->prune_size = 1024;
+    }
+    else if (PyList_GET_SIZE(stats->code_objects) >= stats->prune_size) {
+        /* Drop the references to dead code objects */
+        PyObject *list = stats->code_objects;
+        PyObject *live = PyList_New(0);
+        if (live == NULL) {
+            goto error;
+        }
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+            ref = PyList_GET_ITEM(list, i);
+            if (PyWeakref_GET_OBJECT(ref) != Py_None &&
+                PyList_Append(live, ref) < 0)
+            {
+                Py_DECREF(live);
+                goto error;
+            }
+        }
+        stats->prune_size = Py_MAX(1024, 2 * PyList_GET_SIZE(live));
+        Py_XSETREF(stats->code_objects, live);
+    }
+
+    ref = PyWeakref_NewRef((PyObject *)co, NULL);
+    if (ref == NULL) {
+        goto error;
+    }
+    if (stats->code_objects == NULL ||
+        PyList_Append(stats->code_objects, ref) < 0)
+    {
+        Py_DECREF(ref);
+        goto error;
+    }
+    Py_DECREF(ref);
+    return cs;
+
+error:
+    /* Register again next time */
+    cs->generation = stats->generation - 1;
+    return NULL;
+}
+
+/* Return the execution statistics as a new dictionary, and clear them if
+   clear is true. */
+PyObject *
+_PyEval_GetExecStats(PyThreadState *tstate, int clear)
+{
+    struct _ceval_exec_stats *stats = &tstate->interp->ceval.exec_stats;
+    PyObject *opcodes = NULL, *code_objects = NULL, *result;
+
+    opcodes = PyList_New(256);
+    if (opcodes == NULL) {
+        goto error;
+    }
+    for (int i = 0; i < 256; i++) {
+        PyObject *count = PyLong_FromSize_t(stats->opcodes[i]);
+        if (count == NULL) {
+            goto error;
+        }
+        PyList_SET_ITEM(opcodes, i, count);
+    }
+
+    code_objects = PyList_New(0);
+    if (code_objects == NULL) {
+        goto error;
+    }
+    if (stats->code_objects != NULL) {
+        PyObject *list = stats->code_objects;
+        Py_INCREF(list);
+        for (Py_ssize_t i = 0; i < PyList_GET_SIZE(list); i++) {
+            PyObject *co = PyWeakref_GET_OBJECT(PyList_GET_ITEM(list, i));
+            if (co == Py_None) {
+                continue;
+            }
+            _PyCodeExecStats *cs = ((PyCodeObject *)co)->co_exec_stats;
+            if (cs == NULL || cs->generation != stats->generation) {
+                continue;
+            }
+            Py_INCREF(co);
+            PyObject *item = Py_BuildValue("(Onn)", co,
+                                           (Py_ssize_t)cs->entries,
+                                           (Py_ssize_t)cs->instructions);
+            Py_DECREF(co);
+            if (item == NULL || PyList_Append(code_objects, item) < 0) {
+                Py_XDECREF(item);
+                Py_DECREF(list);
+                goto error;
+            }
+            Py_DECREF(item);
+        }
+        Py_DECREF(list);
+    }
+
+    result = Py_BuildValue("{sOsNsN}",
+                           "enabled",
+                           stats->enabled ? Py_True : Py_False,
+                           "opcodes", opcodes,
+                           "code_objects", code_objects);
+    if (result != NULL && clear) {
+        _PyEval_ClearExecStats(tstate);
+    }
+    return result;
+
+error:
+    Py_XDECREF(opcodes);
+    Py_XDECREF(code_objects);
+    return NULL;
 }
 
 void
@@ -938,6 +1162,168 @@ eval_frame_handle_pending(PyThreadState *tstate)
     return 0;
 }
 
+/* Attribute caches of LOAD_ATTR, STORE_ATTR and LOAD_METHOD.
+
+   An entry records the type of the owner and its tp_version_tag: as long
+   as the tag is valid, the result of the MRO lookup of the name is known.
+   The attribute is either stored in a slot (a T_OBJECT_EX member of the
+   type), or in the instance __dict__ when no descriptor of the type
+   shadows it.  For the latter, the index of the key in the dict is only a
+   hint, which is checked on each access. */
+
+/* Find where the attribute name of owner is stored.  Return 1 and set
+   *hint to its index in the __dict__ of owner or to ~offset of its slot,
+   return 0 if the attribute can't be cached, or -1 on error. */
+static int
+opcache_find_attr(PyObject *owner, PyObject *name, int store,
+                  Py_ssize_t *hint)
+{
+    PyTypeObject *type = Py_TYPE(owner);
+    PyObject *descr, *dict, *value;
+    Py_ssize_t ix;
+
+    if (store) {
+        if (type->tp_setattro != PyObject_GenericSetAttr) {
+            return 0;
+        }
+    }
+    else if (type->tp_getattro != PyObject_GenericGetAttr
+             && type != &PyModule_Type)
+    {
+        /* Modules look up their __dict__ before calling __getattr__ */
+        return 0;
+    }
+    if (!PyUnicode_CheckExact(name) || type->tp_dict == NULL) {
+        return 0;
+    }
+
+    descr = _PyType_Lookup(type, name);
+    if (!_PyType_HasFeature(type, Py_TPFLAGS_VALID_VERSION_TAG)) {
+        return 0;
+    }
+    if (descr != NULL) {
+        if (Py_IS_TYPE(descr, &PyMemberDescr_Type)) {
+            PyMemberDef *dmem = ((PyMemberDescrObject *)descr)->d_member;
+            if (dmem->type == T_OBJECT_EX &&
+                (store ? dmem->flags == 0
+                       : (dmem->flags & READ_RESTRICTED) == 0))
+            {
+                assert(dmem->offset > 0);
+                *hint = ~dmem->offset;
+                return 1;
+            }
+        }
+        return 0;
+    }
+
+    if (type->tp_dictoffset <= 0) {
+        return 0;
+    }
+    dict = *(PyObject **)((char *)owner + type->tp_dictoffset);
+    if (dict == NULL) {
+        return 0;
+    }
+    Py_INCREF(dict);
+    ix = _PyDict_GetItemHint((PyDictObject *)dict, name, -1, &value);
+    Py_DECREF(dict);
+    if (ix == -2) {
+        return -1;
+    }
+    if (ix < 0) {
+        return 0;
+    }
+    *hint = ix;
+    return 1;
+}
+
+/* Get the attribute name of owner stored at *hint, as found by
+   opcache_find_attr().  Return 1 and set *res to a new reference on
+   success, return 0 if the attribute is not there, or -1 on error. */
+static inline int
+opcache_get_attr(PyObject *owner, PyObject *name, Py_ssize_t *hint,
+                 PyObject **res)
+{
+    PyObject *dict, *value;
+    Py_ssize_t ix;
+
+    if (*hint < -1) {
+        value = *(PyObject **)((char *)owner + ~*hint);
+        if (value == NULL) {
+            return 0;
+        }
+        Py_INCREF(value);
+        *res = value;
+        return 1;
+    }
+
+    dict = *(PyObject **)((char *)owner + Py_TYPE(owner)->tp_dictoffset);
+    if (dict == NULL) {
+        return 0;
+    }
+    /* Comparing keys can run arbitrary code */
+    Py_INCREF(dict);
+    ix = _PyDict_GetItemHint((PyDictObject *)dict, name, *hint, &value);
+    if (ix < 0) {
+        Py_DECREF(dict);
+        return ix == -2 ? -1 : 0;
+    }
+    Py_INCREF(value);
+    Py_DECREF(dict);
+    *hint = ix;
+    *res = value;
+    return 1;
+}
+
+/* Set the attribute name of owner stored at hint to value.  Return 1 on
+   success, or 0 if the attribute can't be set there. */
+static inline int
+opcache_set_attr(PyObject *owner, PyObject *name, Py_ssize_t hint,
+                 PyObject *value)
+{
+    PyObject *dict;
+
+    if (hint < -1) {
+        PyObject **addr = (PyObject **)((char *)owner + ~hint);
+        PyObject *old_value = *addr;
+        Py_INCREF(value);
+        *addr = value;
+        Py_XDECREF(old_value);
+        return 1;
+    }
+
+    dict = *(PyObject **)((char *)owner + Py_TYPE(owner)->tp_dictoffset);
+    if (dict == NULL) {
+        return 0;
+    }
+    return _PyDict_SetItemHint((PyDictObject *)dict, name, hint, value);
+}
+
+/* Check that the method descriptor cached by LOAD_METHOD is not shadowed
+   by the attribute name of obj.  Return 1 if it isn't, 0 if it is, or -1
+   on error. */
+static inline int
+opcache_method_unshadowed(PyObject *obj, PyObject *name)
+{
+    Py_ssize_t dictoffset = Py_TYPE(obj)->tp_dictoffset;
+    PyObject *dict, *value;
+    Py_ssize_t ix;
+
+    if (dictoffset == 0) {
+        return 1;
+    }
+    dict = *(PyObject **)((char *)obj + dictoffset);
+    if (dict == NULL) {
+        return 1;
+    }
+    Py_INCREF(dict);
+    ix = _PyDict_GetItemHint((PyDictObject *)dict, name, -1, &value);
+    Py_DECREF(dict);
+    if (ix == -2) {
+        return -1;
+    }
+    return ix < 0;
+}
+
 PyObject* _Py_HOT_FUNCTION
 _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
 {
@@ -1247,31 +1633,54 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
         } \
     } while (0)
 
-#if OPCACHE_STATS
+#define OPCACHE_STAT_HIT(kind) (opcache_stats.kind.hits++)
+#define OPCACHE_STAT_MISS(kind) (opcache_stats.kind.misses++)
+#define OPCACHE_STAT_OPT(kind) (opcache_stats.kind.opts++)
+
+#define OPCACHE_TYPE_VALID(type, version_tag) \
+    (_PyType_HasFeature((type), Py_TPFLAGS_VALID_VERSION_TAG) \
+     && (type)->tp_version_tag == (version_tag))
 
-#define OPCACHE_STAT_GLOBAL_HIT() \
+/* Stop caching the current instruction */
+#define OPCACHE_DEOPT(kind) \
     do { \
-        if (co->co_opcache != NULL) opcache_global_hits++; \
+        if (co_opcache != NULL) { \
+            opcache_stats.kind.deopts++; \
+            co_opcache->optimized = -1; \
+            co->co_opcache_map[next_instr - first_instr] = 0; \
+            co_opcache = NULL; \
+        } \
     } while (0)
 
-#define OPCACHE_STAT_GLOBAL_MISS() \
+#define OPCACHE_MAYBE_DEOPT(kind) \
     do { \
-        if (co->co_opcache != NULL) opcache_global_misses++; \
+        if (co_opcache != NULL && --co_opcache->optimized <= 0) { \
+            OPCACHE_DEOPT(kind); \
+        } \
     } while (0)
 
-#define OPCACHE_STAT_GLOBAL_OPT() \
+/* Fill the cache entry of an attribute instruction after a successful
+   access by the generic path, set err to -1 on error */
+#define OPCACHE_FILL_ATTR(kind, owner, name, store, err) \
     do { \
-        if (co->co_opcache != NULL) opcache_global_opts++; \
+        _PyOpcache_LoadAttr *la = &co_opcache->u.la; \
+        int found = opcache_find_attr((owner), (name), (store), &la->hint); \
+        if (found < 0) { \
+            (err) = -1; \
+        } \
+        else if (found) { \
+            if (co_opcache->optimized <= 0) { \
+                OPCACHE_STAT_OPT(kind); \
+                co_opcache->optimized = OPCODE_CACHE_MAX_TRIES; \
+            } \
+            la->type = Py_TYPE(owner); \
+            la->tp_version_tag = Py_TYPE(owner)->tp_version_tag; \
+        } \
+        else if (co_opcache->optimized <= 0) { \
+            OPCACHE_DEOPT(kind); \
+        } \
     } while (0)
 
-#else /* OPCACHE_STATS */
-
-#define OPCACHE_STAT_GLOBAL_HIT()
-#define OPCACHE_STAT_GLOBAL_MISS()
-#define OPCACHE_STAT_GLOBAL_OPT()
-
-#endif
-
 /* Start of code */
 
     /* push frame */
@@ -1365,15 +1774,24 @@ _PyEval_EvalFrameDefault(PyThreadState *tstate, PyFrameObject *f, int throwflag)
             if (_PyCode_InitOpcache(co) < 0) {
                 goto exit_eval_frame;
             }
-#if OPCACHE_STATS
-            opcache_code_objects_extra_mem +=
+            opcache_stats.extra_mem +=
                 PyBytes_Size(co->co_code) / sizeof(_Py_CODEUNIT) +
                 sizeof(_PyOpcache) * co->co_opcache_size;
-            opcache_code_objects++;
-#endif
+            opcache_stats.code_objects++;
         }
     }
 
+    if (_Py_TracingPossible(ceval2) && ceval2->exec_stats.enabled) {
+        _PyCodeExecStats *cs = co->co_exec_stats;
+        if (cs == NULL || cs->generation != ceval2->exec_stats.generation) {
+            cs = code_exec_stats(&ceval2->exec_stats, co);
+            if (cs == NULL) {
+                goto exit_eval_frame;
+            }
+        }
+        cs->entries++;
+    }
+
 #ifdef LLTRACE
     lltrace = _PyDict_GetItemId(f->f_globals, &PyId___ltrace__) != NULL;
 #endif
@@ -1472,6 +1890,20 @@ main_loop:
         dxp[opcode]++;
 #endif
 
+        if (_Py_TracingPossible(ceval2) && ceval2->exec_stats.enabled) {
+            _PyCodeExecStats *cs = co->co_exec_stats;
+            if (cs == NULL
+                || cs->generation != ceval2->exec_stats.generation)
+            {
+                cs = code_exec_stats(&ceval2->exec_stats, co);
+                if (cs == NULL) {
+                    goto error;
+                }
+            }
+            cs->instructions++;
+            ceval2->exec_stats.opcodes[opcode]++;
+        }
+
 #ifdef LLTRACE
         /* Instruction tracing */
 
@@ -2459,9 +2891,36 @@ main_loop:
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = TOP();
             PyObject *v = SECOND();
+            PyTypeObject *type = Py_TYPE(owner);
             int err;
-            STACK_SHRINK(2);
+
+            OPCACHE_CHECK();
+            if (co_opcache != NULL && co_opcache->optimized > 0) {
+                _PyOpcache_LoadAttr *la = &co_opcache->u.la;
+                if (la->type == type
+                    && OPCACHE_TYPE_VALID(type, la->tp_version_tag))
+                {
+                    if (opcache_set_attr(owner, name, la->hint, v)) {
+                        OPCACHE_STAT_HIT(store_attr);
+                        STACK_SHRINK(2);
+                        Py_DECREF(v);
+                        Py_DECREF(owner);
+                        DISPATCH();
+                    }
+                    /* Missing instance __dict__ or key */
+                    OPCACHE_STAT_MISS(store_attr);
+                }
+                else {
+                    OPCACHE_STAT_MISS(store_attr);
+                    OPCACHE_MAYBE_DEOPT(store_attr);
+                }
+            }
+
             err = PyObject_SetAttr(owner, name, v);
+            if (err == 0 && co_opcache != NULL) {
+                OPCACHE_FILL_ATTR(store_attr, owner, name, 1, err);
+            }
+            STACK_SHRINK(2);
             Py_DECREF(v);
             Py_DECREF(owner);
             if (err != 0)
@@ -2585,7 +3044,7 @@ main_loop:
                            ((PyDictObject *)f->f_builtins)->ma_version_tag)
                     {
                         PyObject *ptr = lg->ptr;
-                        OPCACHE_STAT_GLOBAL_HIT();
+                        OPCACHE_STAT_HIT(load_global);
                         assert(ptr != NULL);
                         Py_INCREF(ptr);
                         PUSH(ptr);
@@ -2612,9 +3071,9 @@ main_loop:
 
                     if (co_opcache->optimized == 0) {
                         /* Wasn't optimized before. */
-                        OPCACHE_STAT_GLOBAL_OPT();
+                        OPCACHE_STAT_OPT(load_global);
                     } else {
-                        OPCACHE_STAT_GLOBAL_MISS();
+                        OPCACHE_STAT_MISS(load_global);
                     }
 
                     co_opcache->optimized = 1;
@@ -3020,11 +3479,47 @@ main_loop:
         case TARGET(LOAD_ATTR): {
             PyObject *name = GETITEM(names, oparg);
             PyObject *owner = TOP();
-            PyObject *res = PyObject_GetAttr(owner, name);
-            Py_DECREF(owner);
-            SET_TOP(res);
+            PyTypeObject *type = Py_TYPE(owner);
+            PyObject *res;
+            int err = 0;
+
+            OPCACHE_CHECK();
+            if (co_opcache != NULL && co_opcache->optimized > 0) {
+                _PyOpcache_LoadAttr *la = &co_opcache->u.la;
+                if (la->type == type
+                    && OPCACHE_TYPE_VALID(type, la->tp_version_tag))
+                {
+                    int found = opcache_get_attr(owner, name, &la->hint, &res);
+                    if (found < 0) {
+                        goto error;
+                    }
+                    if (found) {
+                        OPCACHE_STAT_HIT(load_attr);
+                        SET_TOP(res);
+                        Py_DECREF(owner);
+                        DISPATCH();
+                    }
+                    /* Missing instance __dict__, key or slot value */
+                    OPCACHE_STAT_MISS(load_attr);
+                }
+                else {
+                    OPCACHE_STAT_MISS(load_attr);
+                    OPCACHE_MAYBE_DEOPT(load_attr);
+                }
+            }
+
+            res = PyObject_GetAttr(owner, name);
             if (res == NULL)
                 goto error;
+            if (co_opcache != NULL) {
+                OPCACHE_FILL_ATTR(load_attr, owner, name, 0, err);
+                if (err != 0) {
+                    Py_DECREF(res);
+                    goto error;
+                }
+            }
+            SET_TOP(res);
+            Py_DECREF(owner);
             DISPATCH();
         }
 
@@ -3459,6 +3954,50 @@ main_loop:
             PyObject *name = GETITEM(names, oparg);
             PyObject *obj = TOP();
             PyObject *meth = NULL;
+            PyTypeObject *type = Py_TYPE(obj);
+
+            OPCACHE_CHECK();
+            if (co_opcache != NULL && co_opcache->optimized > 0) {
+                _PyOpcache_LoadMethod *lm = &co_opcache->u.lm;
+                if (lm->type == type
+                    && OPCACHE_TYPE_VALID(type, lm->tp_version_tag))
+                {
+                    int found;
+                    if (lm->meth != NULL) {
+                        found = opcache_method_unshadowed(obj, name);
+                        /* Looking up the instance __dict__ can run arbitrary
+                           code, which can modify the type */
+                        if (found > 0
+                            && OPCACHE_TYPE_VALID(type, lm->tp_version_tag))
+                        {
+                            OPCACHE_STAT_HIT(load_method);
+                            meth = lm->meth;
+                            Py_INCREF(meth);
+                            SET_TOP(meth);
+                            PUSH(obj);  // self
+                            DISPATCH();
+                        }
+                    }
+                    else {
+                        found = opcache_get_attr(obj, name, &lm->hint, &meth);
+                        if (found > 0) {
+                            OPCACHE_STAT_HIT(load_method);
+                            SET_TOP(NULL);
+                            Py_DECREF(obj);
+                            PUSH(meth);
+                            DISPATCH();
+                        }
+                    }
+                    if (found < 0) {
+                        goto error;
+                    }
+                    OPCACHE_STAT_MISS(load_method);
+                }
+                else {
+                    OPCACHE_STAT_MISS(load_method);
+                    OPCACHE_MAYBE_DEOPT(load_method);
+                }
+            }
 
             int meth_found = _PyObject_GetMethod(obj, name, &meth);
 
@@ -3467,6 +4006,41 @@ main_loop:
                 goto error;
             }
 
+            if (co_opcache != NULL) {
+                _PyOpcache_LoadMethod *lm = &co_opcache->u.lm;
+                Py_ssize_t hint = -1;
+                int found;
+                type = Py_TYPE(obj);
+                if (meth_found) {
+                    /* _PyObject_GetMethod() found meth with _PyType_Lookup()
+                       and checked the instance __dict__ */
+                    found = (type->tp_dictoffset >= 0 &&
+                             _PyType_HasFeature(type,
+                                                Py_TPFLAGS_VALID_VERSION_TAG) &&
+                             _PyType_Lookup(type, name) == meth);
+                }
+                else {
+                    found = opcache_find_attr(obj, name, 0, &hint);
+                }
+                if (found < 0) {
+                    Py_DECREF(meth);
+                    goto error;
+                }
+                if (found) {
+                    if (co_opcache->optimized <= 0) {
+                        OPCACHE_STAT_OPT(load_method);
+                        co_opcache->optimized = OPCODE_CACHE_MAX_TRIES;
+                    }
+                    lm->type = type;
+                    lm->tp_version_tag = type->tp_version_tag;
+                    lm->meth = meth_found ? meth : NULL;  /* borrowed */
+                    lm->hint = hint;
+                }
+                else if (co_opcache->optimized <= 0) {
+                    OPCACHE_DEOPT(load_method);
+                }
+            }
+
             if (meth_found) {
                 /* We can bypass temporary bound method object.
                    meth is unbound method and obj is self.
@@ -54,13 +54,15 @@ exit:
 }
 
 PyDoc_STRVAR(marshal_load__doc__,
-"load($module, file, /)\n"
+"load($module, file, /, *, lazy=False)\n"
 "--\n"
 "\n"
 "Read one value from the open file and return it.\n"
 "\n"
 "  file\n"
 "    Must be readable binary file.\n"
+"  lazy\n"
+"    Load the bodies of functions when they are first used.\n"
 "\n"
 "If no valid value is read (e.g. because the data has a different Python\n"
 "version\'s incompatible marshal format), raise EOFError, ValueError or\n"
@@ -70,7 +72,40 @@ PyDoc_STRVAR(marshal_load__doc__,
 "dump(), load() will substitute None for the unmarshallable type.");
 
 #define MARSHAL_LOAD_METHODDEF    \
-    {"load", (PyCFunction)marshal_load, METH_O, marshal_load__doc__},
+    {"load", (PyCFunction)(void(*)(void))marshal_load, METH_FASTCALL|METH_KEYWORDS, marshal_load__doc__},
+
+static PyObject *
+marshal_load_impl(PyObject *module, PyObject *file, int lazy);
+
+static PyObject *
+marshal_load(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", "lazy", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "load", 0};
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *file;
+    int lazy = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    file = args[0];
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    lazy = PyObject_IsTrue(args[1]);
+    if (lazy < 0) {
+        goto exit;
+    }
+skip_optional_kwonly:
+    return_value = marshal_load_impl(module, file, lazy);
+
+exit:
+    return return_value;
+}
 
 PyDoc_STRVAR(marshal_dumps__doc__,
 "dumps($module, value, version=version, /)\n"
@@ -118,34 +153,54 @@ exit:
 }
 
 PyDoc_STRVAR(marshal_loads__doc__,
-"loads($module, bytes, /)\n"
+"loads($module, bytes, /, *, lazy=False)\n"
 "--\n"
 "\n"
 "Convert the bytes-like object to a value.\n"
 "\n"
+"  lazy\n"
+"    Load the bodies of functions when they are first used.\n"
+"\n"
 "If no valid value is found, raise EOFError, ValueError or TypeError.  Extra\n"
 "bytes in the input are ignored.");
 
 #define MARSHAL_LOADS_METHODDEF    \
-    {"loads", (PyCFunction)marshal_loads, METH_O, marshal_loads__doc__},
+    {"loads", (PyCFunction)(void(*)(void))marshal_loads, METH_FASTCALL|METH_KEYWORDS, marshal_loads__doc__},
 
 static PyObject *
-marshal_loads_impl(PyObject *module, Py_buffer *bytes);
+marshal_loads_impl(PyObject *module, Py_buffer *bytes, int lazy);
 
 static PyObject *
-marshal_loads(PyObject *module, PyObject *arg)
+marshal_loads(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"", "lazy", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "loads", 0};
+    PyObject *argsbuf[2];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
     Py_buffer bytes = {NULL, NULL};
+    int lazy = 0;
 
-    if (PyObject_GetBuffer(arg, &bytes, PyBUF_SIMPLE) != 0) {
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (PyObject_GetBuffer(args[0], &bytes, PyBUF_SIMPLE) != 0) {
         goto exit;
     }
     if (!PyBuffer_IsContiguous(&bytes, 'C')) {
-        _PyArg_BadArgument("loads", "argument", "contiguous buffer", arg);
+        _PyArg_BadArgument("loads", "argument 1", "contiguous buffer", args[0]);
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    lazy = PyObject_IsTrue(args[1]);
+    if (lazy < 0) {
         goto exit;
     }
-    return_value = marshal_loads_impl(module, &bytes);
+skip_optional_kwonly:
+    return_value = marshal_loads_impl(module, &bytes, lazy);
 
 exit:
     /* Cleanup for bytes */
@@ -155,4 +210,4 @@ exit:
 
     return return_value;
 }
-/*[clinic end generated code: output=68b78f38bfe0c06d input=a9049054013a1b77]*/
+/*[clinic end generated code: output=968fc2857808ece2 input=a9049054013a1b77]*/
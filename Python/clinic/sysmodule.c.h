@@ -878,6 +878,103 @@ sys__clear_type_cache(PyObject *module, PyObject *Py_UNUSED(ignored))
     return sys__clear_type_cache_impl(module);
 }
 
+PyDoc_STRVAR(sys__opcache_stats__doc__,
+"_opcache_stats($module, /)\n"
+"--\n"
+"\n"
+"Return statistics of the opcode cache of the interpreter loop.\n"
+"\n"
+"The result maps opcode names to dictionaries of counters.  The counters\n"
+"are only updated for code objects run often enough to get a cache.");
+
+#define SYS__OPCACHE_STATS_METHODDEF    \
+    {"_opcache_stats", (PyCFunction)sys__opcache_stats, METH_NOARGS, sys__opcache_stats__doc__},
+
+static PyObject *
+sys__opcache_stats_impl(PyObject *module);
+
+static PyObject *
+sys__opcache_stats(PyObject *module, PyObject *Py_UNUSED(ignored))
+{
+    return sys__opcache_stats_impl(module);
+}
+
+PyDoc_STRVAR(sys__set_exec_stats__doc__,
+"_set_exec_stats($module, enabled, /)\n"
+"--\n"
+"\n"
+"Enable or disable the collection of execution statistics.\n"
+"\n"
+"While enabled, the interpreter counts the instructions it executes, per\n"
+"opcode and per code object.  This slows down the interpreter loop.");
+
+#define SYS__SET_EXEC_STATS_METHODDEF    \
+    {"_set_exec_stats", (PyCFunction)sys__set_exec_stats, METH_O, sys__set_exec_stats__doc__},
+
+static PyObject *
+sys__set_exec_stats_impl(PyObject *module, int enabled);
+
+static PyObject *
+sys__set_exec_stats(PyObject *module, PyObject *arg)
+{
+    PyObject *return_value = NULL;
+    int enabled;
+
+    enabled = PyObject_IsTrue(arg);
+    if (enabled < 0) {
+        goto exit;
+    }
+    return_value = sys__set_exec_stats_impl(module, enabled);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(sys__get_exec_stats__doc__,
+"_get_exec_stats($module, /, clear=False)\n"
+"--\n"
+"\n"
+"Return the execution statistics collected so far.\n"
+"\n"
+"Return a dictionary with the keys \'enabled\', \'opcodes\' (a list of the\n"
+"number of times each opcode was executed) and \'code_objects\' (a list of\n"
+"(code, entries, instructions) tuples).  If clear is true, reset the\n"
+"statistics.");
+
+#define SYS__GET_EXEC_STATS_METHODDEF    \
+    {"_get_exec_stats", (PyCFunction)(void(*)(void))sys__get_exec_stats, METH_FASTCALL|METH_KEYWORDS, sys__get_exec_stats__doc__},
+
+static PyObject *
+sys__get_exec_stats_impl(PyObject *module, int clear);
+
+static PyObject *
+sys__get_exec_stats(PyObject *module, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    static const char * const _keywords[] = {"clear", NULL};
+    static _PyArg_Parser _parser = {NULL, _keywords, "_get_exec_stats", 0};
+    PyObject *argsbuf[1];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    int clear = 0;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 1, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    clear = PyObject_IsTrue(args[0]);
+    if (clear < 0) {
+        goto exit;
+    }
+skip_optional_pos:
+    return_value = sys__get_exec_stats_impl(module, clear);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(sys_is_finalizing__doc__,
 "is_finalizing($module, /)\n"
 "--\n"
@@ -945,4 +1042,4 @@ sys_getandroidapilevel(PyObject *module, PyObject *Py_UNUSED(ignored))
 #ifndef SYS_GETANDROIDAPILEVEL_METHODDEF
     #define SYS_GETANDROIDAPILEVEL_METHODDEF
 #endif /* !defined(SYS_GETANDROIDAPILEVEL_METHODDEF) */
-/*[clinic end generated code: output=87baa3357293ea65 input=a9049054013a1b77]*/
+/*[clinic end generated code: output=49fedf06040ec2c9 input=a9049054013a1b77]*/
@@ -4,6 +4,7 @@
 
 #include "Python-ast.h"
 #undef Yield   /* undefine macro conflicting with <winbase.h> */
+#include "pycore_code.h"          // _PyCode_EnsureBody()
 #include "pycore_initconfig.h"
 #include "pycore_pyerrors.h"
 #include "pycore_pyhash.h"
@@ -1083,40 +1084,50 @@ PyImport_ExecCodeModuleObject(PyObject *name, PyObject *co, PyObject *pathname,
 }
 
 
-static void
+static int
 update_code_filenames(PyCodeObject *co, PyObject *oldname, PyObject *newname)
 {
     PyObject *constants, *tmp;
     Py_ssize_t i, n;
 
     if (PyUnicode_Compare(co->co_filename, oldname))
-        return;
+        return 0;
 
     Py_INCREF(newname);
     Py_XSETREF(co->co_filename, newname);
 
+    /* The code objects nested in a lazily loaded body need to be updated
+       too */
+    if (_PyCode_EnsureBody(co) < 0) {
+        return -1;
+    }
     constants = co->co_consts;
     n = PyTuple_GET_SIZE(constants);
     for (i = 0; i < n; i++) {
         tmp = PyTuple_GET_ITEM(constants, i);
-        if (PyCode_Check(tmp))
+        if (PyCode_Check(tmp) &&
             update_code_filenames((PyCodeObject *)tmp,
-                                  oldname, newname);
+                                  oldname, newname) < 0) {
+            return -1;
+        }
     }
+    return 0;
 }
 
-static void
+static int
 update_compiled_module(PyCodeObject *co, PyObject *newname)
 {
     PyObject *oldname;
+    int res;
 
     if (PyUnicode_Compare(co->co_filename, newname) == 0)
-        return;
+        return 0;
 
     oldname = co->co_filename;
     Py_INCREF(oldname);
-    update_code_filenames(co, oldname, newname);
+    res = update_code_filenames(co, oldname, newname);
     Py_DECREF(oldname);
+    return res;
 }
 
 /*[clinic input]
@@ -1138,7 +1149,9 @@ _imp__fix_co_filename_impl(PyObject *module, PyCodeObject *code,
 /*[clinic end generated code: output=1d002f100235587d input=895ba50e78b82f05]*/
 
 {
-    update_compiled_module(code, path);
+    if (update_compiled_module(code, path) < 0) {
+        return NULL;
+    }
 
     Py_RETURN_NONE;
 }
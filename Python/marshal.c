@@ -4,7 +4,8 @@
    even though dicts, lists, sets and frozensets, not commonly seen in
    code objects, are supported.
    Version 3 of this protocol properly supports circular links
-   and sharing. */
+   and sharing.  Version 5 stores the bodies of functions separately, so
+   that they can be loaded on first use. */
 
 #define PY_SSIZE_T_CLEAN
 
@@ -12,6 +13,7 @@
 #include "longintrepr.h"
 #include "code.h"
 #include "marshal.h"
+#include "pycore_code.h"          // _PyCode_NewLazy()
 #include "pycore_hashtable.h"
 
 /*[clinic input]
@@ -60,6 +62,7 @@ module marshal
 #define TYPE_LIST               '['
 #define TYPE_DICT               '{'
 #define TYPE_CODE               'c'
+#define TYPE_LAZY_CODE          'L'
 #define TYPE_UNICODE            'u'
 #define TYPE_UNKNOWN            '?'
 #define TYPE_SET                '<'
@@ -335,6 +338,12 @@ err:
 static void
 w_complex_object(PyObject *v, char flag, WFILE *p);
 
+static int
+w_init_refs(WFILE *wf, int version);
+
+static void
+w_clear_refs(WFILE *wf);
+
 static void
 w_object(PyObject *v, WFILE *p)
 {
@@ -369,6 +378,85 @@ w_object(PyObject *v, WFILE *p)
     p->depth--;
 }
 
+/* Write the body of a function (co_code, co_consts without the docstring,
+   co_names and co_lnotab) as a separate marshal stream with its own
+   references, which r_object() can copy aside to read it on first use. */
+static void
+w_lazy_code(PyCodeObject *co, char flag, WFILE *p)
+{
+    PyObject *body;
+
+    if (co->co_lazy != NULL) {
+        body = co->co_lazy;
+        Py_INCREF(body);
+    }
+    else {
+        WFILE wf;
+        PyObject *consts;
+
+        memset(&wf, 0, sizeof(wf));
+        wf.str = PyBytes_FromStringAndSize((char *)NULL, 50);
+        if (wf.str == NULL) {
+            p->error = WFERR_NOMEMORY;
+            return;
+        }
+        wf.ptr = wf.buf = PyBytes_AS_STRING(wf.str);
+        wf.end = wf.ptr + PyBytes_GET_SIZE(wf.str);
+        wf.error = WFERR_OK;
+        wf.depth = p->depth;
+        wf.version = p->version;
+        consts = PyTuple_GetSlice(co->co_consts, 1,
+                                  PyTuple_GET_SIZE(co->co_consts));
+        if (consts == NULL || w_init_refs(&wf, wf.version)) {
+            Py_XDECREF(consts);
+            Py_DECREF(wf.str);
+            p->error = WFERR_NOMEMORY;
+            return;
+        }
+        w_object(co->co_code, &wf);
+        w_object(consts, &wf);
+        w_object(co->co_names, &wf);
+        w_object(co->co_lnotab, &wf);
+        w_clear_refs(&wf);
+        Py_DECREF(consts);
+        if (wf.str != NULL) {
+            const char *base = PyBytes_AS_STRING(wf.str);
+            if (_PyBytes_Resize(&wf.str, (Py_ssize_t)(wf.ptr - base)) < 0) {
+                wf.error = WFERR_NOMEMORY;
+            }
+        }
+        if (wf.error != WFERR_OK) {
+            Py_XDECREF(wf.str);
+            p->error = wf.error;
+            return;
+        }
+        body = wf.str;
+    }
+
+    W_TYPE(TYPE_LAZY_CODE, p);
+    w_long(co->co_argcount, p);
+    w_long(co->co_posonlyargcount, p);
+    w_long(co->co_kwonlyargcount, p);
+    w_long(co->co_nlocals, p);
+    w_long(co->co_stacksize, p);
+    w_long(co->co_flags, p);
+    w_object(co->co_varnames, p);
+    w_object(co->co_freevars, p);
+    w_object(co->co_cellvars, p);
+    w_object(co->co_filename, p);
+    w_object(co->co_name, p);
+    w_long(co->co_firstlineno, p);
+    w_object(PyTuple_GET_ITEM(co->co_consts, 0), p);
+    if (PyBytes_GET_SIZE(body) > SIZE32_MAX) {
+        p->error = WFERR_UNMARSHALLABLE;
+    }
+    else {
+        w_long((long)PyBytes_GET_SIZE(body), p);
+        w_string(PyBytes_AS_STRING(body), PyBytes_GET_SIZE(body), p);
+    }
+    Py_DECREF(body);
+}
+
 static void
 w_complex_object(PyObject *v, char flag, WFILE *p)
 {
@@ -508,6 +596,17 @@ w_complex_object(PyObject *v, char flag, WFILE *p)
     }
     else if (PyCode_Check(v)) {
         PyCodeObject *co = (PyCodeObject *)v;
+        if (p->version >= 5 &&
+            (co->co_lazy != NULL ||
+             ((co->co_flags & CO_NEWLOCALS) &&
+              PyTuple_GET_SIZE(co->co_consts) > 0))) {
+            w_lazy_code(co, flag, p);
+            return;
+        }
+        if (_PyCode_EnsureBody(co) < 0) {
+            p->error = WFERR_UNMARSHALLABLE;
+            return;
+        }
         W_TYPE(TYPE_CODE, p);
         w_long(co->co_argcount, p);
         w_long(co->co_posonlyargcount, p);
@@ -618,6 +717,7 @@ typedef struct {
     char *buf;
     Py_ssize_t buf_size;
     PyObject *refs;  /* a list */
+    int lazy;  /* keep the bodies of functions as marshal data */
 } RFILE;
 
 static const char *
@@ -924,6 +1024,10 @@ r_ref(PyObject *o, int flag, RFILE *p)
     return o;
 }
 
+static int
+r_code_body(PyCodeObject *co, const char *s, Py_ssize_t n, int depth,
+            int lazy);
+
 static PyObject *
 r_object(RFILE *p)
 {
@@ -1399,6 +1503,117 @@ r_object(RFILE *p)
         retval = v;
         break;
 
+    case TYPE_LAZY_CODE:
+        {
+            int argcount;
+            int posonlyargcount;
+            int kwonlyargcount;
+            int nlocals;
+            int stacksize;
+            int flags;
+            PyObject *varnames = NULL;
+            PyObject *freevars = NULL;
+            PyObject *cellvars = NULL;
+            PyObject *filename = NULL;
+            PyObject *name = NULL;
+            int firstlineno;
+            PyObject *first_const = NULL;
+            PyObject *body = NULL;
+            const char *ptr;
+
+            idx = r_ref_reserve(flag, p);
+            if (idx < 0)
+                break;
+
+            v = NULL;
+
+            argcount = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            posonlyargcount = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            kwonlyargcount = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            nlocals = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            stacksize = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            flags = (int)r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            varnames = r_object(p);
+            if (varnames == NULL)
+                goto lazy_code_error;
+            freevars = r_object(p);
+            if (freevars == NULL)
+                goto lazy_code_error;
+            cellvars = r_object(p);
+            if (cellvars == NULL)
+                goto lazy_code_error;
+            filename = r_object(p);
+            if (filename == NULL)
+                goto lazy_code_error;
+            name = r_object(p);
+            if (name == NULL)
+                goto lazy_code_error;
+            firstlineno = (int)r_long(p);
+            if (firstlineno == -1 && PyErr_Occurred())
+                goto lazy_code_error;
+            first_const = r_object(p);
+            if (first_const == NULL)
+                goto lazy_code_error;
+            n = r_long(p);
+            if (PyErr_Occurred())
+                goto lazy_code_error;
+            if (n < 0 || n > SIZE32_MAX) {
+                PyErr_SetString(PyExc_ValueError, "bad marshal data (code body size out of range)");
+                goto lazy_code_error;
+            }
+            ptr = r_string(n, p);
+            if (ptr == NULL)
+                goto lazy_code_error;
+            if (p->lazy) {
+                body = PyBytes_FromStringAndSize(ptr, n);
+                if (body == NULL)
+                    goto lazy_code_error;
+            }
+
+            v = (PyObject *)_PyCode_NewLazy(
+                            argcount, posonlyargcount, kwonlyargcount,
+                            nlocals, stacksize, flags, first_const,
+                            varnames, freevars, cellvars, filename, name,
+                            firstlineno, body);
+            if (v != NULL && !p->lazy &&
+                r_code_body((PyCodeObject *)v, ptr, n, p->depth, 0) < 0) {
+                Py_CLEAR(v);
+            }
+            /* Not raised again when a lazy body is loaded: the audit hooks
+               can themselves be lazily loaded functions. */
+            if (v != NULL &&
+                PySys_Audit("code.__new__", "OOOiiiiii",
+                            ((PyCodeObject *)v)->co_code, filename, name,
+                            argcount, posonlyargcount, kwonlyargcount,
+                            nlocals, stacksize, flags) < 0) {
+                Py_CLEAR(v);
+            }
+            v = r_ref_insert(v, idx, flag, p);
+
+          lazy_code_error:
+            Py_XDECREF(varnames);
+            Py_XDECREF(freevars);
+            Py_XDECREF(cellvars);
+            Py_XDECREF(filename);
+            Py_XDECREF(name);
+            Py_XDECREF(first_const);
+            Py_XDECREF(body);
+        }
+        retval = v;
+        break;
+
     case TYPE_REF:
         n = r_long(p);
         if (n < 0 || n >= PyList_GET_SIZE(p->refs)) {
@@ -1427,6 +1642,64 @@ r_object(RFILE *p)
     return retval;
 }
 
+/* Read the body of a function written by w_lazy_code() and set it */
+static int
+r_code_body(PyCodeObject *co, const char *s, Py_ssize_t n, int depth,
+            int lazy)
+{
+    RFILE rf;
+    PyObject *body = co->co_lazy;
+    PyObject *fields[4] = {NULL, NULL, NULL, NULL};
+    int res = -1;
+
+    rf.fp = NULL;
+    rf.readable = NULL;
+    rf.ptr = s;
+    rf.end = s + n;
+    rf.buf = NULL;
+    rf.depth = depth;
+    rf.lazy = lazy;
+    rf.refs = PyList_New(0);
+    if (rf.refs == NULL)
+        return -1;
+    Py_XINCREF(body);
+    for (int i = 0; i < 4; i++) {
+        fields[i] = r_object(&rf);
+        if (fields[i] == NULL) {
+            if (!PyErr_Occurred())
+                PyErr_SetString(PyExc_TypeError,
+                                "NULL object in marshal data for object");
+            goto error;
+        }
+    }
+    res = _PyCode_SetBody(co, body, fields[0], fields[1], fields[2],
+                          fields[3]);
+  error:
+    for (int i = 0; i < 4; i++) {
+        Py_XDECREF(fields[i]);
+    }
+    Py_XDECREF(body);
+    Py_DECREF(rf.refs);
+    return res;
+}
+
+/* Load the body of a code object read lazily */
+int
+_PyMarshal_LoadCodeBody(PyCodeObject *co)
+{
+    PyObject *body = co->co_lazy;
+    int res;
+
+    if (body == NULL)
+        return 0;
+    /* co_lazy is cleared once the body is set */
+    Py_INCREF(body);
+    res = r_code_body(co, PyBytes_AS_STRING(body), PyBytes_GET_SIZE(body),
+                      0, 1);
+    Py_DECREF(body);
+    return res;
+}
+
 static PyObject *
 read_object(RFILE *p)
 {
@@ -1528,6 +1801,7 @@ PyMarshal_ReadObjectFromFile(FILE *fp)
     rf.depth = 0;
     rf.ptr = rf.end = NULL;
     rf.buf = NULL;
+    rf.lazy = 0;
     rf.refs = PyList_New(0);
     if (rf.refs == NULL)
         return NULL;
@@ -1549,6 +1823,7 @@ PyMarshal_ReadObjectFromString(const char *str, Py_ssize_t len)
     rf.end = str + len;
     rf.buf = NULL;
     rf.depth = 0;
+    rf.lazy = 0;
     rf.refs = PyList_New(0);
     if (rf.refs == NULL)
         return NULL;
@@ -1639,6 +1914,9 @@ marshal.load
     file: object
         Must be readable binary file.
     /
+    *
+    lazy: bool = False
+        Load the bodies of functions when they are first used.
 
 Read one value from the open file and return it.
 
@@ -1651,8 +1929,8 @@ dump(), load() will substitute None for the unmarshallable type.
 [clinic start generated code]*/
 
 static PyObject *
-marshal_load(PyObject *module, PyObject *file)
-/*[clinic end generated code: output=f8e5c33233566344 input=c85c2b594cd8124a]*/
+marshal_load_impl(PyObject *module, PyObject *file, int lazy)
+/*[clinic end generated code: output=9dff78c883cc6c32 input=d0dc7118ed75f258]*/
 {
     PyObject *data, *result;
     _Py_IDENTIFIER(read);
@@ -1680,6 +1958,7 @@ marshal_load(PyObject *module, PyObject *file)
         rf.readable = file;
         rf.ptr = rf.end = NULL;
         rf.buf = NULL;
+        rf.lazy = lazy;
         if ((rf.refs = PyList_New(0)) != NULL) {
             result = read_object(&rf);
             Py_DECREF(rf.refs);
@@ -1719,6 +1998,9 @@ marshal.loads
 
     bytes: Py_buffer
     /
+    *
+    lazy: bool = False
+        Load the bodies of functions when they are first used.
 
 Convert the bytes-like object to a value.
 
@@ -1727,8 +2009,8 @@ bytes in the input are ignored.
 [clinic start generated code]*/
 
 static PyObject *
-marshal_loads_impl(PyObject *module, Py_buffer *bytes)
-/*[clinic end generated code: output=9fc65985c93d1bb1 input=6f426518459c8495]*/
+marshal_loads_impl(PyObject *module, Py_buffer *bytes, int lazy)
+/*[clinic end generated code: output=9a1f2325db169b0d input=f145892ac6313629]*/
 {
     RFILE rf;
     char *s = bytes->buf;
@@ -1739,6 +2021,7 @@ marshal_loads_impl(PyObject *module, Py_buffer *bytes)
     rf.ptr = s;
     rf.end = s + n;
     rf.depth = 0;
+    rf.lazy = lazy;
     if ((rf.refs = PyList_New(0)) == NULL)
         return NULL;
     result = read_object(&rf);
@@ -1776,6 +2059,8 @@ version -- indicates the format that the module uses. Version 0 is the\n\
     historical format, version 1 shares interned strings and version 2\n\
     uses a binary format for floating point numbers.\n\
     Version 3 shares common object references (New in version 3.4).\n\
+    Version 5 allows loading the bodies of functions on first use\n\
+    (New in version 3.10).\n\
 \n\
 Functions:\n\
 \n\
@@ -287,6 +287,7 @@ PyInterpreterState_Clear(PyInterpreterState *interp)
     HEAD_UNLOCK(runtime);
 
     Py_CLEAR(interp->audit_hooks);
+    Py_CLEAR(interp->ceval.exec_stats.code_objects);
 
     PyConfig_Clear(&interp->config);
     Py_CLEAR(interp->codec_search_path);
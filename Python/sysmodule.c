@@ -1901,6 +1901,64 @@ sys__clear_type_cache_impl(PyObject *module)
     Py_RETURN_NONE;
 }
 
+/*[clinic input]
+sys._opcache_stats
+
+Return statistics of the opcode cache of the interpreter loop.
+
+The result maps opcode names to dictionaries of counters.  The counters
+are only updated for code objects run often enough to get a cache.
+[clinic start generated code]*/
+
+static PyObject *
+sys__opcache_stats_impl(PyObject *module)
+/*[clinic end generated code: output=1fe3fee386c6402d input=3780aa5a6158a577]*/
+{
+    return _PyEval_GetOpcacheStats();
+}
+
+/*[clinic input]
+sys._set_exec_stats
+
+    enabled: bool
+    /
+
+Enable or disable the collection of execution statistics.
+
+While enabled, the interpreter counts the instructions it executes, per
+opcode and per code object.  This slows down the interpreter loop.
+[clinic start generated code]*/
+
+static PyObject *
+sys__set_exec_stats_impl(PyObject *module, int enabled)
+/*[clinic end generated code: output=09d2cf053fc23780 input=cc04f0fc47e6359a]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    _PyEval_SetExecStats(tstate, enabled);
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+sys._get_exec_stats
+
+    clear: bool = False
+
+Return the execution statistics collected so far.
+
+Return a dictionary with the keys 'enabled', 'opcodes' (a list of the
+number of times each opcode was executed) and 'code_objects' (a list of
+(code, entries, instructions) tuples).  If clear is true, reset the
+statistics.
+[clinic start generated code]*/
+
+static PyObject *
+sys__get_exec_stats_impl(PyObject *module, int clear)
+/*[clinic end generated code: output=b9906562aac923a9 input=f2da0c15cee12aca]*/
+{
+    PyThreadState *tstate = _PyThreadState_GET();
+    return _PyEval_GetExecStats(tstate, clear);
+}
+
 /*[clinic input]
 sys.is_finalizing
 
@@ -1938,6 +1996,9 @@ static PyMethodDef sys_methods[] = {
     {"breakpointhook",  (PyCFunction)(void(*)(void))sys_breakpointhook,
      METH_FASTCALL | METH_KEYWORDS, breakpointhook_doc},
     SYS__CLEAR_TYPE_CACHE_METHODDEF
+    SYS__OPCACHE_STATS_METHODDEF
+    SYS__SET_EXEC_STATS_METHODDEF
+    SYS__GET_EXEC_STATS_METHODDEF
     SYS__CURRENT_FRAMES_METHODDEF
     SYS_DISPLAYHOOK_METHODDEF
     SYS_EXC_INFO_METHODDEF
@@ -2442,6 +2503,7 @@ static PyStructSequence_Field flags_fields[] = {
     {"isolated",                "-I"},
     {"dev_mode",                "-X dev"},
     {"utf8_mode",               "-X utf8"},
+    {"lazy_code",               "-X lazy_code"},
     {0}
 };
 
@@ -2449,7 +2511,7 @@ static PyStructSequence_Desc flags_desc = {
     "sys.flags",        /* name */
     flags__doc__,       /* doc */
     flags_fields,       /* fields */
-    15
+    16
 };
 
 static PyObject*
@@ -2485,6 +2547,7 @@ make_flags(PyThreadState *tstate)
     SetFlag(config->isolated);
     PyStructSequence_SET_ITEM(seq, pos++, PyBool_FromLong(config->dev_mode));
     SetFlag(preconfig->utf8_mode);
+    SetFlag(config->lazy_code);
 #undef SetFlag
 
     if (_PyErr_Occurred(tstate)) {
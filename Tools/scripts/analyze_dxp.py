@@ -6,8 +6,12 @@ in the current process, and, if Python was also built with -DDXPAIRS,
 will tell you which instruction _pairs_ were executed most frequently,
 which may help in choosing new instructions.
 
-If Python was built without -DDYNAMIC_EXECUTION_PROFILE, importing
-this module will raise a RuntimeError.
+If Python was built without -DDYNAMIC_EXECUTION_PROFILE, this module uses
+the execution statistics of sys._set_exec_stats() instead, which count
+opcodes (but not pairs) and the instructions run by each code object; see
+hot_code().  They slow down every instruction of the interpreter, so they
+are only gathered between calls to enable() and disable().  If neither is
+available, importing this module will raise a RuntimeError.
 
 If you're running a script you want to profile, a simple way to get
 the common pairs is:
@@ -16,6 +20,8 @@ $ PYTHONPATH=$PYTHONPATH:<python_srcdir>/Tools/scripts \
 ./python -i -O the_script.py --args
 ...
 > from analyze_dxp import *
+> enable()  # Not needed with -DDYNAMIC_EXECUTION_PROFILE
+> ...
 > s = render_common_pairs()
 > open('/tmp/some_file', 'w').write(s)
 """
@@ -26,13 +32,40 @@ import operator
 import sys
 import threading
 
-if not hasattr(sys, "getdxp"):
+if hasattr(sys, "getdxp"):
+    _getdxp = sys.getdxp
+elif hasattr(sys, "_get_exec_stats"):
+    _last_opcodes = sys._get_exec_stats()["opcodes"]
+
+    def _getdxp():
+        """Like sys.getdxp(), return the opcode counts since the last call."""
+        global _last_opcodes
+        opcodes = sys._get_exec_stats()["opcodes"]
+        profile = [new - old for new, old in zip(opcodes, _last_opcodes)]
+        _last_opcodes = opcodes
+        return profile
+else:
     raise RuntimeError("Can't import analyze_dxp: Python built without"
                        " -DDYNAMIC_EXECUTION_PROFILE.")
 
 
 _profile_lock = threading.RLock()
-_cumulative_profile = sys.getdxp()
+_cumulative_profile = _getdxp()
+
+
+def enable():
+    """Starts gathering the execution statistics of sys._set_exec_stats(),
+    if they are used instead of sys.getdxp(), which is always enabled."""
+    if not hasattr(sys, "getdxp"):
+        sys._set_exec_stats(True)
+
+
+def disable():
+    """Stops gathering the execution statistics of sys._set_exec_stats(),
+    keeping the counts gathered so far."""
+    if not hasattr(sys, "getdxp"):
+        sys._set_exec_stats(False)
+
 
 # If Python was built with -DDXPAIRS, sys.getdxp() returns a list of
 # lists of ints.  Otherwise it returns just a list of ints.
@@ -46,9 +79,9 @@ def has_pairs(profile):
 def reset_profile():
     """Forgets any execution profile that has been gathered so far."""
     with _profile_lock:
-        sys.getdxp()  # Resets the internal profile
+        _getdxp()  # Resets the internal profile
         global _cumulative_profile
-        _cumulative_profile = sys.getdxp()  # 0s out our copy.
+        _cumulative_profile = _getdxp()  # 0s out our copy.
 
 
 def merge_profile():
@@ -57,7 +90,7 @@ def merge_profile():
     We need this because sys.getdxp() 0s itself every time it's called."""
 
     with _profile_lock:
-        new_profile = sys.getdxp()
+        new_profile = _getdxp()
         if has_pairs(new_profile):
             for first_inst in range(len(_cumulative_profile)):
                 for second_inst in range(len(_cumulative_profile[first_inst])):
@@ -127,3 +160,35 @@ def render_common_pairs(profile=None):
         for _, ops, count in common_pairs(profile):
             yield "%s: %s\n" % (count, ops)
     return ''.join(seq())
+
+
+def hot_code(limit=10):
+    """Returns the code objects which executed the most instructions, in
+    order of descending frequency, if the execution statistics of
+    sys._set_exec_stats() are used.
+
+    The result is a list of tuples of the form
+      (code object, # of entries, # of instructions)
+
+    """
+    if not hasattr(sys, "_get_exec_stats"):
+        return []
+    result = sys._get_exec_stats()["code_objects"]
+    result.sort(key=operator.itemgetter(2), reverse=True)
+    return result[:limit]
+
+
+def render_hot_code(limit=10):
+    """Renders the code objects which executed the most instructions to
+    a string in order of descending frequency.
+
+    The result is a series of lines of the form:
+      # of instructions: name (filename:line number)
+
+    """
+    def seq():
+        for code, _, instructions in hot_code(limit):
+            yield "%s: %s (%s:%s)\n" % (instructions, code.co_name,
+                                        code.co_filename,
+                                        code.co_firstlineno)
+    return ''.join(seq())
@@ -0,0 +1,96 @@
+'Show the speed of the operations of the typing module used at runtime.'
+
+# Please leave this code so that it runs under older versions of
+# Python 3 (no f-strings).  That will allow benchmarking for
+# cross-version comparisons.
+
+from typing import (Dict, Generic, List, Optional, Protocol, Tuple, TypeVar,
+                    Union, get_type_hints, runtime_checkable)
+
+T = TypeVar('T')
+
+class Box(Generic[T]):
+    pass
+
+@runtime_checkable
+class SupportsClose(Protocol):
+    def close(self): ...
+
+@runtime_checkable
+class HasName(Protocol):
+    name: str
+
+class Closer:
+    def close(self):
+        pass
+
+class Named:
+    def __init__(self):
+        self.name = 'x'
+
+class Record:
+    x: int
+    y: List[str]
+    z: Optional[Dict[str, Tuple[int, ...]]]
+
+closer = Closer()
+named = Named()
+alias = Dict[str, List[int]]
+same_alias = Dict[str, List[int]]
+
+def subscript_list():
+    List[int]
+
+def subscript_nested():
+    Dict[str, List[Tuple[int, str]]]
+
+def subscript_union():
+    Union[int, str, None]
+
+def subscript_user_generic():
+    Box[int]
+
+def hash_alias():
+    hash(alias)
+
+def compare_aliases():
+    alias == same_alias
+
+def isinstance_protocol_nominal():
+    isinstance(closer, SupportsClose)
+
+def isinstance_protocol_data():
+    isinstance(named, HasName)
+
+def isinstance_protocol_negative():
+    isinstance(named, SupportsClose)
+
+def issubclass_protocol():
+    issubclass(Closer, SupportsClose)
+
+def type_hints():
+    get_type_hints(Record)
+
+
+if __name__=='__main__':
+
+    from timeit import Timer
+
+    for f in [
+            'Subscription:',
+            subscript_list, subscript_nested, subscript_union,
+            subscript_user_generic,
+            '\nAliases:',
+            hash_alias, compare_aliases,
+            '\nProtocols:',
+            isinstance_protocol_nominal, isinstance_protocol_data,
+            isinstance_protocol_negative, issubclass_protocol,
+            '\nAnnotations:',
+            type_hints]:
+        if isinstance(f, str):
+            print(f)
+            continue
+        number = 10000
+        timing = min(Timer(f).repeat(7, number))
+        timing *= 1000000000 / number
+        print('{:8.1f} ns\t{}'.format(timing, f.__name__))